@@ -0,0 +1,4 @@
+"""
+Benchmark suite for the OpenPark engine hot paths
+Run with: python -m benchmarks.run_benchmarks --help
+"""
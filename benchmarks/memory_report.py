@@ -0,0 +1,91 @@
+"""
+Memory footprint of the engine's high-count entities
+
+Builds N instances of each entity type and reports the heap bytes allocated
+per instance (tracemalloc: object, instance dict or slots, and the small
+containers each instance owns, like a guest's path cursor). Walking
+guests share one 40-tile path, as guests sent to the same place share
+the cached path.
+
+Usage:
+    python -m benchmarks.memory_report            # 10000 instances per type
+    python -m benchmarks.memory_report -n 50000
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from themepark_engine.agents import Guest
+from themepark_engine.employees import EmployeeDef, Engineer, MaintenanceWorker, SecurityGuard, Mascot
+from themepark_engine.guest_store import GuestStateStore
+from themepark_engine.litter import Litter
+from themepark_engine.paths import TilePath
+from themepark_engine.queue_v2 import QueueTileV2
+from themepark_engine.weather import WeatherParticle, WeatherType
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'themepark_engine', 'data', 'objects.json')
+
+
+def _employee_defs():
+    with open(DATA, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {e['type']: EmployeeDef(**e) for e in data.get('employees', [])}
+
+
+def entity_factories():
+    """(name, factory(i)) of the measured entity types"""
+    defs = _employee_defs()
+    store = GuestStateStore(capacity=1)
+    shared_path = TilePath.from_coords([(x, 10) for x in range(40)], 64)
+
+    def walking_guest(i):
+        guest = Guest(i % 64, i % 64, store)
+        guest.path = shared_path.cursor(1)
+        return guest
+
+    return [
+        ('Guest', lambda i: Guest(i % 64, i % 64, store)),
+        ('Guest (walking)', walking_guest),
+        ('Engineer', lambda i: Engineer(defs['engineer'], i % 64, i % 64)),
+        ('MaintenanceWorker', lambda i: MaintenanceWorker(defs['maintenance'], i % 64, i % 64)),
+        ('SecurityGuard', lambda i: SecurityGuard(defs['security'], i % 64, i % 64)),
+        ('Mascot', lambda i: Mascot(defs['mascot'], i % 64, i % 64)),
+        ('Litter', lambda i: Litter(i % 64, i % 64, 'soda')),
+        ('QueueTileV2', lambda i: QueueTileV2(i % 64, i % 64)),
+        ('WeatherParticle', lambda i: WeatherParticle(float(i), 0.0, WeatherType.RAIN)),
+    ]
+
+
+def measure(factory, count: int) -> float:
+    """Bytes allocated per instance while `count` instances are alive"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    total -= sys.getsizeof(instances)  # The list holding them
+    del instances
+    return total / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bytes per entity of the OpenPark engine')
+    parser.add_argument('-n', '--count', type=int, default=10000, help='Instances per entity type')
+    args = parser.parse_args(argv)
+
+    print(f"{'entity':<20} {'bytes/instance':>15}")
+    for name, factory in entity_factories():
+        print(f"{name:<20} {measure(factory, args.count):>15.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,285 @@
+"""
+Benchmark runner for the OpenPark engine hot paths
+
+Measures, for each canned scenario (see scenarios.py):
+    - Game.update ticks per second (fixed sim_dt)
+    - pathfinding.astar on routes between path tiles
+    - NavGraph.find_path (guest routing) on the same routes
+    - QueueManagerV2.find_queue_paths (full grid scan)
+    - IsoRenderer.draw_map and the whole Game.draw
+    - Game.save_game / Game.load_game
+    - on open-terrain grids (64x64, 256x256): astar_for_engineers and
+      astar_profile against Jump Point Search, for engineers and grass workers
+
+Runs without a window (SDL dummy driver), prints the results as JSON and
+compares them against a stored baseline.
+
+Usage:
+    python -m benchmarks.run_benchmarks                          # all scenarios, compare with baseline.json
+    python -m benchmarks.run_benchmarks -s small -s medium       # selected scenarios
+    python -m benchmarks.run_benchmarks -s open_64 -s open_256   # A* vs Jump Point Search only
+    python -m benchmarks.run_benchmarks --output results.json    # write the JSON to a file
+    python -m benchmarks.run_benchmarks --save-baseline          # store the results as the new baseline
+    python -m benchmarks.run_benchmarks --fail-on-regression     # exit code 1 on regression (CI)
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Must be set before pygame is initialised
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from themepark_engine import pathfinding
+from themepark_engine.nav_graph import NavGraph
+from themepark_engine.debug import DebugConfig
+from themepark_engine.engine import Game
+from themepark_engine.map import TILE_WALK
+from themepark_engine.save_load import SaveLoadManager
+
+from .scenarios import OPEN_TERRAIN, SCENARIOS, Scenario, build_open_terrain, build_scenario
+
+BASELINE_PATH = Path(__file__).resolve().parent / 'baseline.json'
+RESULTS_VERSION = 1
+DEFAULT_TOLERANCE = 0.25  # Relative change allowed before flagging a regression
+
+
+def _metric(value, unit, higher_is_better=False, samples=None):
+    return {'value': round(value, 4), 'unit': unit, 'higher_is_better': higher_is_better, 'samples': samples}
+
+
+def _time_calls(fn, runs):
+    """Run fn() `runs` times, return the list of durations in seconds"""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _ms(durations):
+    return statistics.median(durations) * 1000.0
+
+
+def bench_update(game, scenario: Scenario):
+    for _ in range(scenario.warmup_ticks):
+        game.update(game.sim_dt)
+    start = time.perf_counter()
+    for _ in range(scenario.update_ticks):
+        game.update(game.sim_dt)
+    elapsed = time.perf_counter() - start
+    return _metric(scenario.update_ticks / elapsed, 'ticks/s', higher_is_better=True, samples=scenario.update_ticks)
+
+
+def _routes(game, scenario: Scenario, seed: int):
+    """Random pairs of walk tiles (same pairs for the same seed and scenario)"""
+    rng = random.Random(seed)
+    walk_tiles = [(x, y) for x in range(game.grid.width) for y in range(game.grid.height)
+                  if game.grid.get(x, y) == TILE_WALK]
+    # Typical routes: from the park entrance to anywhere, and between two points of the park
+    entrance = (int(game.park_entrance[0]), int(game.park_entrance[1]) - 1)
+    routes = []
+    for i in range(scenario.astar_routes):
+        start = entrance if i % 2 == 0 else rng.choice(walk_tiles)
+        routes.append((start, rng.choice(walk_tiles)))
+    return routes
+
+
+def bench_astar(game, scenario: Scenario, seed: int):
+    """Uncached A* between random pairs of walk tiles"""
+    durations = []
+    for start, goal in _routes(game, scenario, seed):
+        t0 = time.perf_counter()
+        pathfinding.astar(game.grid, start, goal)
+        durations.append(time.perf_counter() - t0)
+    return _metric(_ms(durations), 'ms/route', samples=len(durations))
+
+
+def bench_nav_route(game, scenario: Scenario, seed: int):
+    """Uncached navigation graph routing on the A* routes (graph built beforehand)"""
+    nav = NavGraph()
+    nav.sync(game.grid)
+    durations = []
+    for start, goal in _routes(game, scenario, seed):
+        t0 = time.perf_counter()
+        nav.find_path(game.grid, start, goal)
+        durations.append(time.perf_counter() - t0)
+    return _metric(_ms(durations), 'ms/route', samples=len(durations))
+
+
+def bench_queue_scan(game, scenario: Scenario):
+    durations = _time_calls(lambda: game.queue_manager.find_queue_paths(game.grid), scenario.queue_scans)
+    return _metric(_ms(durations), 'ms/scan', samples=len(durations))
+
+
+def bench_draw_map(game, scenario: Scenario):
+    queue_directions = {}
+    for queue_path in game.queue_manager.queue_paths:
+        for tile in queue_path.tiles:
+            queue_directions[(tile.x, tile.y)] = tile.direction.value if hasattr(tile.direction, 'value') else str(tile.direction)
+    durations = _time_calls(lambda: game.renderer.draw_map(game.grid, queue_directions), scenario.draw_frames)
+    return _metric(_ms(durations), 'ms/frame', samples=len(durations))
+
+
+def bench_draw(game, scenario: Scenario):
+    game.draw()  # First frame builds the sprite caches
+    durations = _time_calls(game.draw, scenario.draw_frames)
+    return _metric(_ms(durations), 'ms/frame', samples=len(durations))
+
+
+def bench_save_load(game, scenario: Scenario):
+    with tempfile.TemporaryDirectory() as save_dir:
+        game.save_load_manager = SaveLoadManager(save_dir=save_dir)
+        save_times = _time_calls(lambda: game.save_game('benchmark.json'), scenario.save_load_runs)
+        load_times = _time_calls(lambda: game.load_game('benchmark.json'), scenario.save_load_runs)
+    return (_metric(_ms(save_times), 'ms', samples=len(save_times)),
+            _metric(_ms(load_times), 'ms', samples=len(load_times)))
+
+
+def run_scenario(scenario: Scenario, seed: int):
+    # Windowed game on the dummy driver so that draw() really renders
+    game = Game(seed=seed, map_size=scenario.map_size)
+    start = time.perf_counter()
+    layout = build_scenario(game, scenario, seed=seed)
+    build_time = time.perf_counter() - start
+
+    metrics = {}
+    metrics['update_ticks_per_sec'] = bench_update(game, scenario)
+    metrics['astar_route_ms'] = bench_astar(game, scenario, seed)
+    metrics['nav_route_ms'] = bench_nav_route(game, scenario, seed)
+    metrics['find_queue_paths_ms'] = bench_queue_scan(game, scenario)
+    metrics['draw_map_ms'] = bench_draw_map(game, scenario)
+    metrics['game_draw_ms'] = bench_draw(game, scenario)
+    # Last: loading replaces the game state
+    metrics['save_game_ms'], metrics['load_game_ms'] = bench_save_load(game, scenario)
+
+    layout['build_s'] = round(build_time, 3)
+    layout['map_size'] = list(scenario.map_size)
+    return {'layout': layout, 'metrics': metrics}
+
+
+def _time_routes(route, routes):
+    durations = []
+    for start, goal in routes:
+        t0 = time.perf_counter()
+        route(start, goal)
+        durations.append(time.perf_counter() - t0)
+    return _metric(_ms(durations), 'ms/route', samples=len(durations))
+
+
+def run_open_terrain(size: int, seed: int):
+    """A* and Jump Point Search on the same open-terrain routes (uncached)"""
+    grid, routes, layout = build_open_terrain(size, seed)
+    engineer, groundskeeper = pathfinding.ENGINEER, pathfinding.GROUNDSKEEPER
+    metrics = {
+        'engineer_astar_ms': _time_routes(lambda a, b: pathfinding.astar_for_engineers(grid, a, b), routes),
+        'engineer_jps_ms': _time_routes(lambda a, b: pathfinding.jump_point_path(grid, a, b, engineer), routes),
+        'grass_astar_ms': _time_routes(lambda a, b: pathfinding.astar_profile(grid, a, b, groundskeeper), routes),
+        'grass_jps_ms': _time_routes(lambda a, b: pathfinding.jump_point_path(grid, a, b, groundskeeper), routes),
+    }
+    return {'layout': layout, 'metrics': metrics}
+
+
+def compare(results, baseline, tolerance):
+    """Compare two result sets metric by metric
+
+    Returns:
+        List of (scenario, metric, baseline_value, value, relative_change, status)
+        relative_change > 0 means slower / worse, whatever the unit
+    """
+    rows = []
+    for name, scenario_results in results['scenarios'].items():
+        base_scenario = baseline.get('scenarios', {}).get(name)
+        if not base_scenario:
+            continue
+        for metric, data in scenario_results['metrics'].items():
+            base = base_scenario['metrics'].get(metric)
+            if not base or not base['value']:
+                continue
+            if data['higher_is_better']:
+                change = (base['value'] - data['value']) / base['value']
+            else:
+                change = (data['value'] - base['value']) / base['value']
+            if change > tolerance:
+                status = 'REGRESSION'
+            elif change < -tolerance:
+                status = 'improved'
+            else:
+                status = 'ok'
+            rows.append((name, metric, base['value'], data['value'], change, status))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='OpenPark engine benchmarks')
+    parser.add_argument('-s', '--scenario', action='append', choices=sorted([*SCENARIOS, *OPEN_TERRAIN]),
+                        help='Scenario to run (repeatable, default: all)')
+    parser.add_argument('--seed', type=int, default=1234, help='Simulation and layout seed')
+    parser.add_argument('--output', type=Path, help='Write the JSON results to this file instead of stdout')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH, help='Baseline results to compare with')
+    parser.add_argument('--save-baseline', action='store_true', help='Store the results as the baseline')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='Relative change allowed before a metric is flagged (default: 0.25)')
+    parser.add_argument('--fail-on-regression', action='store_true', help='Exit with code 1 on regression')
+    parser.add_argument('--debug-logs', action='store_true', help='Keep the DebugConfig logs (off by default)')
+    args = parser.parse_args(argv)
+
+    if not args.debug_logs:
+        DebugConfig.disable_all()
+
+    results = {
+        'version': RESULTS_VERSION,
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'seed': args.seed,
+        },
+        'scenarios': {},
+    }
+    for name in args.scenario or [*SCENARIOS, *OPEN_TERRAIN]:
+        print(f"Running scenario '{name}'...", file=sys.stderr)
+        # Keep stdout for the JSON (the engine prints on save/load)
+        with contextlib.redirect_stdout(sys.stderr):
+            if name in OPEN_TERRAIN:
+                results['scenarios'][name] = run_open_terrain(OPEN_TERRAIN[name], args.seed)
+            else:
+                results['scenarios'][name] = run_scenario(SCENARIOS[name], args.seed)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(text, encoding='utf-8')
+    else:
+        print(text)
+
+    regressions = 0
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        print(f"\nComparison with {args.baseline} (tolerance {args.tolerance:.0%}):", file=sys.stderr)
+        for name, metric, base, value, change, status in compare(results, baseline, args.tolerance):
+            print(f"  {name:<10} {metric:<22} {base:>12.3f} -> {value:>12.3f}  {change:+7.1%}  {status}", file=sys.stderr)
+            regressions += status == 'REGRESSION'
+
+    if args.save_baseline:
+        args.baseline.write_text(text, encoding='utf-8')
+        print(f"Baseline saved to {args.baseline}", file=sys.stderr)
+
+    pygame.quit()
+    return 1 if args.fail_on_regression and regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+Canned park scenarios for the benchmark suite
+
+Each scenario builds a park through the same player inputs as the game
+(Game.apply_input), so placements go through the real validation code:
+
+    - one horizontal street every LOT_HEIGHT rows, starting at the row in
+      front of the park entrance, plus a vertical spine joining them
+    - above each street, a row of lots: either a ride (entrance + queue line
+      down to the street, exit + walk path) or a shop + restroom
+    - guests are spawned through Game._spawn_guest() then spread on the paths
+
+Open-terrain grids (no Game) compare A* and Jump Point Search for the
+walkers that cross grass: lawn with scattered ride footprints and a few
+straight walk paths.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from themepark_engine.map import MapGrid, TILE_GRASS, TILE_RIDE_FOOTPRINT, TILE_WALK
+
+LOT_WIDTH = 7    # Ride footprint (up to 5 wide) + 2 columns of grass
+LOT_HEIGHT = 9   # Ride (4) + entrance row + 3 queue tiles + street row
+
+# Rides cycled through the ride lots (all 4 tiles tall so they fit a lot)
+LOT_RIDES = ['ride_bumper', 'ride_ship']
+LOT_SHOPS = ['shop_soda', 'shop_hotdog', 'shop_icecream', 'shop_fries']
+
+
+@dataclass
+class Scenario:
+    name: str
+    guests: int
+    rides: int
+    facilities: int  # Lots with a shop + a restroom
+    map_size: Tuple[int, int] = (64, 64)
+    employees: Dict[str, int] = field(default_factory=dict)
+    # Iterations per measure (kept low on the big scenarios)
+    warmup_ticks: int = 40
+    update_ticks: int = 200
+    draw_frames: int = 30
+    queue_scans: int = 20
+    astar_routes: int = 40
+    save_load_runs: int = 3
+
+
+SCENARIOS = {
+    'small': Scenario('small', guests=50, rides=5, facilities=2,
+                      employees={'employee_engineer': 1, 'employee_maintenance': 1}),
+    'medium': Scenario('medium', guests=500, rides=20, facilities=6,
+                       employees={'employee_engineer': 3, 'employee_maintenance': 4,
+                                  'employee_security': 2, 'employee_mascot': 2},
+                       update_ticks=60, draw_frames=20),
+    'saturated': Scenario('saturated', guests=5000, rides=60, facilities=16, map_size=(96, 96),
+                          employees={'employee_engineer': 8, 'employee_maintenance': 10,
+                                     'employee_security': 4, 'employee_mascot': 4},
+                          warmup_ticks=2, update_ticks=3, draw_frames=5, queue_scans=5,
+                          astar_routes=20, save_load_runs=1),
+}
+
+
+def street_rows(height: int) -> List[int]:
+    """Rows of the horizontal streets (the first one is the row in front of the park entrance)"""
+    rows = []
+    y = height - 4
+    while y - (LOT_HEIGHT - 1) >= 1:
+        rows.append(y)
+        y -= LOT_HEIGHT
+    return rows
+
+
+def lot_origins(width: int, height: int) -> List[Tuple[int, int]]:
+    """(left x, street y) of every lot, nearest to the park entrance first"""
+    spine_x = width // 2
+    lots = []
+    for sy in street_rows(height):
+        lx = 2
+        while lx + LOT_WIDTH - 2 <= width - 2:
+            # Keep the spine column (and one tile around it) free
+            if not (lx - 1 <= spine_x <= lx + LOT_WIDTH - 1):
+                lots.append((lx, sy))
+            lx += LOT_WIDTH
+    return lots
+
+
+def _build_streets(game):
+    width, height = game.grid.width, game.grid.height
+    rows = street_rows(height)
+    for sy in rows:
+        for x in range(1, width - 1):
+            game.apply_input('place', {'tool': 'walk_path', 'x': x, 'y': sy})
+    for y in range(rows[-1], rows[0]):
+        game.apply_input('place', {'tool': 'walk_path', 'x': width // 2, 'y': y})
+
+
+def _build_ride_lot(game, ride_id: str, lx: int, sy: int) -> bool:
+    rd = game.ride_defs[ride_id]
+    w, h = rd.size
+    top = sy - 8
+    # Hover position that puts the ride top-left corner at (lx, top)
+    game.apply_input('place', {'tool': ride_id, 'x': lx + w // 2, 'y': top + h // 2})
+    if game.ride_placement_mode != 'entrance':
+        return False
+    game.apply_input('place', {'tool': 'place_entrance', 'x': lx + 1, 'y': top + h})
+    game.apply_input('place', {'tool': 'place_exit', 'x': lx + 3, 'y': top + h})
+
+    # Queue line dragged from the street up to the ride entrance
+    prev = None
+    for y in range(sy - 1, top + h, -1):
+        if prev is None:
+            game.apply_input('place', {'tool': 'queue_path', 'x': lx + 1, 'y': y})
+        else:
+            game.apply_input('drag_path', {'tool': 'queue_path', 'x': lx + 1, 'y': y, 'prev': prev})
+        prev = (lx + 1, y)
+
+    # Walk path from the exit back down to the street
+    for y in range(top + h + 1, sy):
+        game.apply_input('place', {'tool': 'walk_path', 'x': lx + 3, 'y': y})
+    return True
+
+
+def _build_facility_lot(game, shop_id: str, lx: int, sy: int):
+    sd = game.shop_defs[shop_id]
+    w, h = sd.size
+    game.apply_input('place', {'tool': shop_id, 'x': lx + w // 2, 'y': sy - h + h // 2})
+    game.apply_input('place', {'tool': 'restroom_large', 'x': lx + 5, 'y': sy - 1})
+
+
+def build_scenario(game, scenario: Scenario, seed: int = 1234):
+    """Build the scenario park in a freshly created Game (created with scenario.map_size)"""
+    layout_rng = random.Random(seed)
+    game.economy.cash = 10_000_000  # Never hit the game over while building / benchmarking
+
+    _build_streets(game)
+    lots = lot_origins(game.grid.width, game.grid.height)
+    needed = scenario.rides + scenario.facilities
+    if needed > len(lots):
+        raise ValueError(f"Scenario '{scenario.name}' needs {needed} lots, map {scenario.map_size} has {len(lots)}")
+
+    # Spread the facilities evenly between the rides
+    facility_every = max(1, needed // max(1, scenario.facilities))
+    rides_built = facilities_built = 0
+    for i, (lx, sy) in enumerate(lots[:needed]):
+        is_facility = facilities_built < scenario.facilities and (
+            i % facility_every == facility_every - 1 or rides_built >= scenario.rides)
+        if is_facility:
+            _build_facility_lot(game, LOT_SHOPS[facilities_built % len(LOT_SHOPS)], lx, sy)
+            facilities_built += 1
+        else:
+            if _build_ride_lot(game, LOT_RIDES[rides_built % len(LOT_RIDES)], lx, sy):
+                rides_built += 1
+
+    # Connect the queue lines built after the last ride placement
+    game._update_queue_system()
+    # One queue line per ride lot: QueueManagerV2 must find each line exactly once
+    queue_lines = len(game.queue_manager.queue_paths)
+    if queue_lines != rides_built:
+        raise RuntimeError(f"Scenario '{scenario.name}': {queue_lines} queue paths found for {rides_built} queue lines")
+
+    # Employees on the streets
+    street_tiles = [(x, y) for y in street_rows(game.grid.height) for x in range(1, game.grid.width - 1)]
+    for employee_id, count in scenario.employees.items():
+        for _ in range(count):
+            x, y = layout_rng.choice(street_tiles)
+            game.apply_input('place', {'tool': employee_id, 'x': x, 'y': y})
+
+    game.apply_input('park_open', {'value': True})
+
+    # Guests: real spawn (budget, research bonuses, entrance fee), then spread on the paths
+    walk_tiles = [(x, y) for x in range(game.grid.width) for y in range(game.grid.height)
+                  if game.grid.get(x, y) == TILE_WALK]
+    attempts = 0
+    while len(game.guests) < scenario.guests and attempts < scenario.guests * 10:
+        attempts += 1
+        before = len(game.guests)
+        game._spawn_guest()
+        if len(game.guests) > before:
+            guest = game.guests[-1]
+            x, y = layout_rng.choice(walk_tiles)
+            guest.x, guest.y = float(x), float(y)
+            guest.grid_x, guest.grid_y = x, y
+
+    return {
+        'rides': rides_built,
+        'shops': len(game.shops),
+        'restrooms': len(game.restrooms),
+        'employees': len(game.employees),
+        'guests': len(game.guests),
+        'queues': len(game.queue_manager.ride_queues),
+    }
+
+
+# ==================== OPEN TERRAIN ====================
+
+OPEN_TERRAIN = {'open_64': 64, 'open_256': 256}  # Name -> grid side
+OPEN_TERRAIN_ROUTES = 20
+
+
+def build_open_terrain(size: int, seed: int = 1234):
+    """Grass grid with 3x3 ride footprints on about an eighth of it and a few walk paths
+
+    Returns:
+        (MapGrid, routes between random grass tiles, layout dict)
+    """
+    rng = random.Random(seed)
+    grid = MapGrid(size, size)
+    for _ in range(size * size // 72):
+        x, y = rng.randrange(size - 2), rng.randrange(size - 2)
+        for dy in range(3):
+            for dx in range(3):
+                grid.set(x + dx, y + dy, TILE_RIDE_FOOTPRINT)
+    for _ in range(size // 16):
+        y = rng.randrange(size)
+        for x in range(size):
+            if grid.get(x, y) == TILE_GRASS:
+                grid.set(x, y, TILE_WALK)
+    grass = grid.tiles_of_type(TILE_GRASS)
+    routes = [(rng.choice(grass), rng.choice(grass)) for _ in range(OPEN_TERRAIN_ROUTES)]
+    layout = {'map_size': [size, size], 'grass': len(grass), 'routes': len(routes)}
+    return grid, routes, layout
@@ -1,8 +1,13 @@
 
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
-import random
+from typing import Optional, Tuple
+from .rng import SimRandom
 from .debug import DebugConfig
+from .events import guest_events, GuestEventType
+from .guest_store import guest_store, StoreField
+from .paths import PathCursor
+
+_rng = SimRandom.stream(SimRandom.GUESTS)
 
 @dataclass
 class GuestState:
@@ -51,7 +56,58 @@ class Guest:
         'guests/1F469-1F3FF.png',
     ]
 
-    def __init__(self, x: float, y: float):
+    # Declared layout (no per-instance __dict__): every field is set in __init__
+    __slots__ = (
+        '_store', '_slot', 'active_index',
+        # Position and movement
+        'x', 'y', 'grid_x', 'grid_y', 'sprite', 'path', 'path_request', 'speed', 'move_timer',
+        'target_x', 'target_y', 'is_moving', 'move_progress',
+        'lod_coarse', 'lod_pending_dt', 'move_carry',
+        # State machine
+        'state', '_last_logged_state', 'sleep_entry', 'id', 'game',
+        'current_queue', 'current_queue_tile', 'queue_position', 'tile_position', 'queue_wait_timer',
+        'thrill_preference', 'nausea_tolerance',
+        'target_ride', 'target_queue', 'current_ride', 'ride_exit_pos', 'tried_rides', 'ride_retry_delay',
+        'ride_timer', 'ride_duration', 'waiting_timer', 'waiting_duration',
+        'target_shop', 'current_shop', 'shop_timer', 'shop_duration',
+        # Money
+        'budget', 'money', 'entry_time',
+        # Needs
+        'target_food', 'target_drink', 'target_restroom',
+        'eating_timer', 'eating_duration', 'drinking_timer', 'drinking_duration',
+        'restroom_timer', 'restroom_duration',
+        # Litter
+        'has_litter', 'litter_type', 'target_bin', 'bin_use_timer', 'bin_use_duration',
+        'litter_hold_timer', 'litter_hold_duration',
+        # References from a save file, resolved by Game.load_game()
+        '_save_data',
+    )
+
+    # Needs and mood live in a columnar store (decayed by the engine in one pass per tick)
+    hunger = StoreField('hunger')
+    thirst = StoreField('thirst')
+    bladder = StoreField('bladder')
+    happiness = StoreField('happiness')
+    excitement = StoreField('excitement')
+    satisfaction = StoreField('satisfaction')
+
+    def __init__(self, x: float, y: float, store=None, budget: Optional[int] = None):
+        self._store = store if store is not None else guest_store
+        self._slot = self._store.acquire()  # Row of this guest in the store
+        self.active_index = -1  # Index in Game.guests (swap-remove), -1 when not in the park
+        self.reset(x, y, budget)
+
+    @staticmethod
+    def draw_budget() -> int:
+        """Total budget for a park visit ($75-$300), drawn before building the guest"""
+        return _rng.randint(75, 300)
+
+    def reset(self, x: float, y: float, budget: Optional[int] = None):
+        """(Re)initialize every field as a brand new guest (used by __init__ and GuestPool)
+
+        Args:
+            budget: Budget already drawn with draw_budget() (None = draw it here)
+        """
         # Position réelle (float pour mouvement fluide)
         self.x = float(x)
         self.y = float(y)
@@ -60,18 +116,22 @@ class Guest:
         self.grid_y = int(y)
 
         # Randomly assign a diverse sprite to this guest
-        self.sprite = random.choice(Guest.GUEST_SPRITES)
+        self.sprite = _rng.choice(Guest.GUEST_SPRITES)
         
-        self.path: List[Tuple[int, int]] = []
+        self.path = PathCursor()  # Tiles left to walk, on a path shared with the path cache
+        self.path_request = None  # Key of the path requested from the pathfinding queue, None when not waiting
         self.state = GuestState.WANDERING
+        self._last_logged_state = None  # State seen by the previous tick (debug log of changes)
+        self.game = None  # Optional Game reference (litter drops)
+        self._save_data = None
         self.current_queue = None
         self.current_queue_tile = None
         self.queue_position = -1
         self.tile_position = -1  # Position dans la tuile (0 à capacity-1)
         
         # Guest preferences for ride selection
-        self.thrill_preference = random.uniform(0.0, 1.0)  # 0 = calm rides, 1 = thrilling rides
-        self.nausea_tolerance = random.uniform(0.0, 1.0)   # 0 = no nausea tolerance, 1 = high tolerance
+        self.thrill_preference = _rng.uniform(0.0, 1.0)  # 0 = calm rides, 1 = thrilling rides
+        self.nausea_tolerance = _rng.uniform(0.0, 1.0)   # 0 = no nausea tolerance, 1 = high tolerance
         self.target_ride = None
         self.target_queue = None
         self.current_ride = None  # Ride currently on
@@ -80,32 +140,32 @@ class Guest:
         self.current_shop = None  # Shop currently visiting
         self.shop_timer = 0.0
         self.shop_duration = 2.0  # Time spent in shop
-        self.id = random.randint(1000, 9999)  # Unique ID for debugging
+        self.id = 0  # Entity id, assigned by the game's guest registry
 
         # Queue management - track rides with full queues to avoid retrying immediately
         self.tried_rides = {}  # {ride: timer} - rides tried but queue was full, with countdown timer
         self.ride_retry_delay = 30.0  # Seconds to wait before retrying a full queue
 
         # Money and budget system
-        self.budget = random.randint(75, 300)  # Total budget for park visit ($75-$300)
+        self.budget = budget if budget is not None else Guest.draw_budget()
         self.money = self.budget  # Current money (reduced by entrance fee and purchases)
 
         # Time tracking
         self.entry_time = 0.0  # Game time when guest entered park (set by engine)
 
         # Needs system (0.0 = empty, 1.0 = full)
-        self.hunger = random.uniform(0.7, 1.0)  # Starts mostly satisfied (0.0 = starving, 1.0 = full)
-        self.thirst = random.uniform(0.6, 1.0)  # Starts moderately satisfied (0.0 = parched, 1.0 = hydrated)
-        self.bladder = random.uniform(0.0, 0.2)  # Starts low (0.0 = empty, 1.0 = urgent)
+        self.hunger = _rng.uniform(0.7, 1.0)  # Starts mostly satisfied (0.0 = starving, 1.0 = full)
+        self.thirst = _rng.uniform(0.6, 1.0)  # Starts moderately satisfied (0.0 = parched, 1.0 = hydrated)
+        self.bladder = _rng.uniform(0.0, 0.2)  # Starts low (0.0 = empty, 1.0 = urgent)
         self.target_food = None  # Food shop target
         self.target_drink = None  # Drink shop target
         self.target_restroom = None  # Restroom target
         self.eating_timer = 0.0
-        self.eating_duration = random.uniform(8.0, 12.0)  # Time to eat (8-12 seconds)
+        self.eating_duration = _rng.uniform(8.0, 12.0)  # Time to eat (8-12 seconds)
         self.drinking_timer = 0.0
-        self.drinking_duration = random.uniform(3.0, 5.0)  # Time to drink (3-5 seconds)
+        self.drinking_duration = _rng.uniform(3.0, 5.0)  # Time to drink (3-5 seconds)
         self.restroom_timer = 0.0
-        self.restroom_duration = random.uniform(5.0, 8.0)  # Time in restroom (5-8 seconds)
+        self.restroom_duration = _rng.uniform(5.0, 8.0)  # Time in restroom (5-8 seconds)
 
         # Litter system
         self.has_litter = False  # Has litter to throw away
@@ -130,6 +190,11 @@ class Guest:
         self.is_moving = False
         self.move_progress = 0.0
 
+        # Simulation LOD (set by the engine): off-screen guests tick less often with a larger dt
+        self.lod_coarse = False  # Tile-level movement, no sub-tile interpolation
+        self.lod_pending_dt = 0.0  # Simulation time skipped since the last tick
+        self.move_carry = 0.0  # Progress left over after a coarse step (starts the next one)
+
         # Guest satisfaction and mood
         self.happiness = 0.5  # 0.0 to 1.0, affects guest behavior
         self.excitement = 0.5  # 0.0 to 1.0, increased by mascots and rides
@@ -137,29 +202,26 @@ class Guest:
 
         # Satisfaction tracking
         self.queue_wait_timer = 0.0  # Track time spent in queue for satisfaction penalty
+
+        # Set by the engine's AgentScheduler while the guest sleeps through a timed state
+        self.sleep_entry = None
+        self._store.pending_dt[self._slot] = 0.0
+        self._store.outdoor[self._slot] = 0.0
         
     def tick(self, dt: float):
         # Mise à jour du mouvement fluide
         self._update_smooth_movement(dt)
 
-        # Natural degradation of satisfaction metrics
-        self._apply_natural_degradation(dt)
-
-        # Update needs (hunger decreases, thirst decreases, bladder increases)
-        self._update_needs(dt)
+        # Natural degradation and needs (hunger, thirst, bladder): applied for this dt by the
+        # engine's GuestStateStore.apply_decay() pass, just before the tick
 
         # Update litter hold timer if guest has litter (in ANY state)
         if self.has_litter and self.litter_hold_timer < self.litter_hold_duration:
             self.litter_hold_timer += dt
             if int(self.litter_hold_timer) != int(self.litter_hold_timer - dt):  # Log every second
-                DebugConfig.log('litter', f"Guest {self.id} holding litter: {self.litter_hold_timer:.1f}/{self.litter_hold_duration:.1f}s (state={self.state})")
+                DebugConfig.log('litter', "Guest {} holding litter: {:.1f}/{:.1f}s (state={})", self.id, self.litter_hold_timer, self.litter_hold_duration, self.state)
 
         # Update tried rides timers - decrement and remove expired ones
-        # Ensure tried_rides exists (for backward compatibility with old saves)
-        if not hasattr(self, 'tried_rides'):
-            self.tried_rides = {}
-            self.ride_retry_delay = 30.0
-
         rides_to_remove = []
         for ride, timer in self.tried_rides.items():
             self.tried_rides[ride] = timer - dt
@@ -167,11 +229,11 @@ class Guest:
                 rides_to_remove.append(ride)
         for ride in rides_to_remove:
             del self.tried_rides[ride]
-            DebugConfig.log('guests', f"Guest {self.id} retry timer expired for ride {ride.defn.name}")
+            DebugConfig.log('guests', "Guest {} retry timer expired for ride {}", self.id, ride.defn.name)
 
         # Log state changes
-        if hasattr(self, '_last_logged_state') and self._last_logged_state != self.state:
-            DebugConfig.log('guests', f"Guest {self.id} state changed from {self._last_logged_state} to {self.state}")
+        if self._last_logged_state is not None and self._last_logged_state != self.state:
+            DebugConfig.log('guests', "Guest {} state changed from {} to {}", self.id, self._last_logged_state, self.state)
         self._last_logged_state = self.state
         
         if self.state == GuestState.WANDERING:
@@ -208,7 +270,33 @@ class Guest:
             self._tick_walking_to_restroom(dt)
         elif self.state == GuestState.USING_RESTROOM:
             self._tick_using_restroom(dt)
+
+        # Overshoot of a coarse step only carries into a step started during this tick
+        self.move_carry = 0.0
     
+    # Timed states: (timer attribute, duration attribute)
+    TIMED_STATES = {
+        GuestState.SHOPPING: ('shop_timer', 'shop_duration'),
+        GuestState.USING_BIN: ('bin_use_timer', 'bin_use_duration'),
+        GuestState.EATING: ('eating_timer', 'eating_duration'),
+        GuestState.DRINKING: ('drinking_timer', 'drinking_duration'),
+        GuestState.USING_RESTROOM: ('restroom_timer', 'restroom_duration'),
+    }
+
+    def timed_state_remaining(self) -> Optional[float]:
+        """Seconds before the current state ends on its own (None if it depends on anything else)
+
+        Riding lasts until the ride unloads its visitors (state changed by the ride).
+        """
+        if self.is_moving:
+            return None
+        if self.state == GuestState.RIDING:
+            return float('inf')
+        timer = self.TIMED_STATES.get(self.state)
+        if timer is None:
+            return None
+        return getattr(self, timer[1]) - getattr(self, timer[0])
+
     def _update_smooth_movement(self, dt: float):
         """Update smooth movement interpolation"""
         if self.is_moving:
@@ -221,10 +309,13 @@ class Guest:
                 self.y = self.target_y
                 self.grid_x = int(self.x)
                 self.grid_y = int(self.y)
+                if self.lod_coarse:
+                    # Keep the overshoot so a large dt still walks at self.speed tiles/s
+                    self.move_carry = min(self.move_progress - 1.0, 0.999)
                 self.is_moving = False
                 self.move_progress = 0.0
-                DebugConfig.log('guests', f"Visitor {self.id} movement complete: {old_pos} -> ({self.grid_x}, {self.grid_y})")
-            else:
+                DebugConfig.log('guests', "Visitor {} movement complete: {} -> ({}, {})", self.id, old_pos, self.grid_x, self.grid_y)
+            elif not self.lod_coarse:
                 # Interpolation linéaire
                 self.x = self.x + (self.target_x - self.x) * (dt * self.speed)
                 self.y = self.y + (self.target_y - self.y) * (dt * self.speed)
@@ -235,7 +326,8 @@ class Guest:
             self.target_x = float(target_x)
             self.target_y = float(target_y)
             self.is_moving = True
-            self.move_progress = 0.0
+            self.move_progress = self.move_carry
+            self.move_carry = 0.0
     
     def _move_in_direction(self, direction: str):
         """Move visitor in a specific direction based on tile orientation"""
@@ -270,26 +362,28 @@ class Guest:
             self._move_towards_next()
         elif not self.path:
             # Reached the queue entrance, join the queue
-            DebugConfig.log('guests', f"Guest {self.id} reached queue entrance")
+            DebugConfig.log('guests', "Guest {} reached queue entrance", self.id)
             if self.target_queue and self.target_queue.can_enter():
-                DebugConfig.log('guests', f"Guest {self.id} attempting to join queue")
+                DebugConfig.log('guests', "Guest {} attempting to join queue", self.id)
                 # Add to queue
                 success = self.target_queue.add_visitor(self)
                 if success:
                     self.current_queue = self.target_queue
                     self.state = GuestState.QUEUING
-                    DebugConfig.log('guests', f"Guest {self.id} successfully joined queue at position {self.queue_position}")
+                    guest_events.emit(GuestEventType.QUEUE_JOINED, self, queue=self.current_queue,
+                                      queue_length=len(self.current_queue.visitors))
+                    DebugConfig.log('guests', "Guest {} successfully joined queue at position {}", self.id, self.queue_position)
                 else:
-                    DebugConfig.log('guests', f"Guest {self.id} failed to join queue")
+                    DebugConfig.log('guests', "Guest {} failed to join queue", self.id)
                     self.state = GuestState.WANDERING
                     self.target_queue = None
                     self.target_ride = None
             else:
                 # Queue is full, go back to wandering and mark this ride as tried
-                DebugConfig.log('guests', f"Guest {self.id} queue full or no target queue, returning to wandering")
+                DebugConfig.log('guests', "Guest {} queue full or no target queue, returning to wandering", self.id)
                 if self.target_ride:
                     self.tried_rides[self.target_ride] = self.ride_retry_delay
-                    DebugConfig.log('guests', f"Guest {self.id} marked ride {self.target_ride.defn.name} as full, will retry in {self.ride_retry_delay}s")
+                    DebugConfig.log('guests', "Guest {} marked ride {} as full, will retry in {}s", self.id, self.target_ride.defn.name, self.ride_retry_delay)
                 self.state = GuestState.WANDERING
                 self.target_queue = None
                 self.target_ride = None
@@ -330,7 +424,7 @@ class Guest:
                     self.ride_exit_pos = None
                     self.target_ride = None
                     self.current_ride = None
-                    DebugConfig.log('guests', f"Guest {self.id} exited ride and returned to wandering")
+                    DebugConfig.log('guests', "Guest {} exited ride and returned to wandering", self.id)
     
     def _tick_waiting(self, dt: float):
         """Handle waiting behavior when queue is full"""
@@ -343,9 +437,9 @@ class Guest:
     def _move_towards_next(self):
         """Move towards the next position in path"""
         if self.path:
-            nx, ny = self.path[0]
+            nx, ny = self.path.peek()
             if (self.grid_x, self.grid_y) == (nx, ny):
-                self.path.pop(0)
+                self.path.advance()
             else:
                 self._start_movement_to(nx, ny)
     
@@ -374,6 +468,7 @@ class Guest:
         if self.current_ride and self.current_ride.exit:
             self.ride_exit_pos = (self.current_ride.exit.x, self.current_ride.exit.y)
             self.state = GuestState.EXITING
+            guest_events.emit(GuestEventType.RIDE_COMPLETED, self, ride=self.current_ride)
             self.current_ride = None
     
     def _tick_riding(self, dt: float):
@@ -383,34 +478,33 @@ class Guest:
     
     def _tick_exiting(self, dt: float):
         """Handle exiting state - move to exit and then wander"""
-        DebugConfig.log('guests', f"Visitor {self.id} in exiting state at ({self.grid_x}, {self.grid_y}), target: {self.ride_exit_pos}, moving: {self.is_moving}")
+        DebugConfig.log('guests', "Visitor {} in exiting state at ({}, {}), target: {}, moving: {}", self.id, self.grid_x, self.grid_y, self.ride_exit_pos, self.is_moving)
         if not self.is_moving and self.ride_exit_pos:
             # Check if we're already at the exit position
             if (self.grid_x, self.grid_y) == self.ride_exit_pos:
                 # Already at exit, check if guest should vomit
                 if self.current_ride and self.current_ride.defn.nausea >= 0.7:
                     # High nausea ride - chance to get vomit litter
-                    import random
-                    if random.random() < 0.3:  # 30% chance to vomit
+                    if _rng.random() < 0.3:  # 30% chance to vomit
                         self.has_litter = True
                         self.litter_type = "vomit"
-                        self.litter_hold_duration = random.uniform(3.0, 10.0)
+                        self.litter_hold_duration = _rng.uniform(3.0, 10.0)
                         self.litter_hold_timer = 0.0
-                        DebugConfig.log('litter', f"Guest {self.id} got vomit litter from high nausea ride")
+                        DebugConfig.log('litter', "Guest {} got vomit litter from high nausea ride", self.id)
                 
                 # Start wandering
-                DebugConfig.log('guests', f"Visitor {self.id} already at exit {self.ride_exit_pos}, starting to wander")
+                DebugConfig.log('guests', "Visitor {} already at exit {}, starting to wander", self.id, self.ride_exit_pos)
                 self.state = GuestState.WANDERING
                 self.current_ride = None
                 self.target_ride = None
                 self.ride_exit_pos = None
             else:
                 # Move to exit position
-                DebugConfig.log('guests', f"Visitor {self.id} starting movement to exit {self.ride_exit_pos}")
+                DebugConfig.log('guests', "Visitor {} starting movement to exit {}", self.id, self.ride_exit_pos)
                 self._start_movement_to(self.ride_exit_pos[0], self.ride_exit_pos[1])
         elif not self.is_moving and not self.ride_exit_pos:
             # Exit reached, start wandering
-            DebugConfig.log('guests', f"Visitor {self.id} reached exit, starting to wander")
+            DebugConfig.log('guests', "Visitor {} reached exit, starting to wander", self.id)
             self.state = GuestState.WANDERING
             self.current_ride = None
             self.target_ride = None
@@ -419,20 +513,20 @@ class Guest:
         """Handle visitor walking to shop"""
         if not self.is_moving and self.path:
             # Continue following path
-            next_pos = self.path.pop(0)
+            next_pos = self.path.advance()
             self._start_movement_to(next_pos[0], next_pos[1])
         elif not self.is_moving and not self.path:
             # Reached shop entrance, start shopping
             if self.target_shop and self.target_shop.entrance:
                 entrance_pos = (self.target_shop.entrance.x, self.target_shop.entrance.y)
                 if (self.grid_x, self.grid_y) == entrance_pos:
-                    DebugConfig.log('guests', f"Guest {self.id} reached shop {self.target_shop.defn.name}, starting shopping")
+                    DebugConfig.log('guests', "Guest {} reached shop {}, starting shopping", self.id, self.target_shop.defn.name)
                     self.state = GuestState.SHOPPING
                     self.current_shop = self.target_shop
                     self.shop_timer = 0.0
                 else:
                     # Not at entrance, find path to entrance
-                    DebugConfig.log('guests', f"Guest {self.id} not at shop entrance, finding path")
+                    DebugConfig.log('guests', "Guest {} not at shop entrance, finding path", self.id)
                     self.state = GuestState.WANDERING
                     self.target_shop = None
 
@@ -441,13 +535,13 @@ class Guest:
         self.shop_timer += dt
         if self.shop_timer >= self.shop_duration:
             # Shopping finished, now has litter to throw away
-            DebugConfig.log('litter', f"Guest {self.id} finished shopping at {self.current_shop.defn.name}")
+            DebugConfig.log('litter', "Guest {} finished shopping at {}", self.id, self.current_shop.defn.name)
             
             # If already has litter from previous shop, drop it immediately at current position
             if self.has_litter:
-                DebugConfig.log('litter', f"Guest {self.id} already has litter ({self.litter_type}), dropping it at shop exit")
+                DebugConfig.log('litter', "Guest {} already has litter ({}), dropping it at shop exit", self.id, self.litter_type)
                 # Use litter manager from game
-                if hasattr(self, 'game') and self.game:
+                if self.game:
                     self.game.litter_manager.add_litter(self.grid_x, self.grid_y, self.litter_type)
                 self.has_litter = False
                 self.litter_type = None
@@ -458,9 +552,10 @@ class Guest:
             self.has_litter = True
             self.litter_type = self.current_shop.defn.litter_type
             # Set random hold duration between 3 and 10 seconds
-            self.litter_hold_duration = random.uniform(3.0, 10.0)
+            self.litter_hold_duration = _rng.uniform(3.0, 10.0)
             self.litter_hold_timer = 0.0
-            DebugConfig.log('litter', f"Guest {self.id} got {self.litter_type} litter, will hold for {self.litter_hold_duration:.1f}s")
+            DebugConfig.log('litter', "Guest {} got {} litter, will hold for {:.1f}s", self.id, self.litter_type, self.litter_hold_duration)
+            guest_events.emit(GuestEventType.PURCHASE_COMPLETED, self, shop=self.current_shop, kind='shop')
             self.state = GuestState.WANDERING
             self.current_shop = None
             self.target_shop = None
@@ -470,7 +565,7 @@ class Guest:
         """Handle visitor walking to bin"""
         if not self.is_moving and self.path:
             # Continue following path
-            next_pos = self.path.pop(0)
+            next_pos = self.path.advance()
             self._start_movement_to(next_pos[0], next_pos[1])
         elif not self.is_moving and not self.path:
             # Reached bin, start using it
@@ -478,12 +573,12 @@ class Guest:
                 bin_pos = (self.target_bin.x, self.target_bin.y)
                 distance = abs(self.grid_x - bin_pos[0]) + abs(self.grid_y - bin_pos[1])
                 if distance <= 1:  # Adjacent to bin
-                    DebugConfig.log('guests', f"Guest {self.id} reached bin, using it")
+                    DebugConfig.log('guests', "Guest {} reached bin, using it", self.id)
                     self.state = GuestState.USING_BIN
                     self.bin_use_timer = 0.0
                 else:
                     # Not at bin, give up and drop litter or wander
-                    DebugConfig.log('guests', f"Guest {self.id} couldn't reach bin, giving up")
+                    DebugConfig.log('guests', "Guest {} couldn't reach bin, giving up", self.id)
                     self.state = GuestState.WANDERING
                     self.target_bin = None
             else:
@@ -495,13 +590,14 @@ class Guest:
         if self.bin_use_timer >= self.bin_use_duration:
             # Finished using bin
             if self.target_bin and self.target_bin.add_litter():
-                DebugConfig.log('guests', f"Guest {self.id} successfully used bin")
+                DebugConfig.log('guests', "Guest {} successfully used bin", self.id)
                 self.has_litter = False
                 self.litter_type = None
                 self.litter_hold_timer = 0.0
                 self.litter_hold_duration = 0.0
+                guest_events.emit(GuestEventType.BIN_USED, self, bin=self.target_bin)
             else:
-                DebugConfig.log('guests', f"Guest {self.id} bin was full, dropping litter")
+                DebugConfig.log('guests', "Guest {} bin was full, dropping litter", self.id)
                 # Bin full, will drop litter when wandering
             
             self.state = GuestState.WANDERING
@@ -514,13 +610,12 @@ class Guest:
         # When path is empty, they have reached the entrance and can be removed
         if not self.path:
             # Reached entrance - guest will be removed by engine
-            DebugConfig.log('guests', f"Guest {self.id} reached park entrance and is leaving (satisfaction: {self.satisfaction:.2f})")
+            DebugConfig.log('guests', "Guest {} reached park entrance and is leaving (satisfaction: {:.2f})", self.id, self.satisfaction)
             return
 
         # Continue walking along path
         if not self.is_moving and self.path:
-            next_tile = self.path[0]
-            self.path = self.path[1:]
+            next_tile = self.path.advance()
             self._start_movement_to(next_tile[0], next_tile[1])
 
     def get_bin_search_radius(self) -> int:
@@ -557,69 +652,36 @@ class Guest:
     
     def should_drop_litter_randomly(self) -> bool:
         """Decide if guest should drop litter (80% chance if no bin found)"""
-        return random.random() < 0.8
-
-    # ===== SATISFACTION SYSTEM METHODS =====
-
-    def _apply_natural_degradation(self, dt: float):
-        """Apply natural degradation to satisfaction metrics"""
-        # Happiness decreases slowly (needs constant stimulation)
-        self.happiness = max(0.0, self.happiness - 0.005 * dt)
-
-        # Excitement fades quickly
-        self.excitement = max(0.0, self.excitement - 0.01 * dt)
-
-        # Satisfaction decreases very slowly
-        self.satisfaction = max(0.0, self.satisfaction - 0.002 * dt)
-
-    def _update_needs(self, dt: float):
-        """Update guest needs (hunger, thirst, bladder)
-
-        Rates per in-game hour (30s real time at x1 speed):
-        - Hunger: -0.10/hour → -0.00333/s
-        - Thirst: -0.15/hour → -0.005/s
-        - Bladder: +0.08/hour → +0.00267/s
+        return _rng.random() < 0.8
 
-        Note: These are real-time rates. Game speed is handled by engine's dt scaling.
-        """
-        # Hunger decreases (0.0 = starving, 1.0 = full)
-        self.hunger = max(0.0, self.hunger - 0.00333 * dt)
-
-        # Thirst decreases faster (0.0 = parched, 1.0 = hydrated)
-        self.thirst = max(0.0, self.thirst - 0.005 * dt)
-
-        # Bladder increases (0.0 = empty, 1.0 = urgent)
-        self.bladder = min(1.0, self.bladder + 0.00267 * dt)
+    def release(self):
+        """Free the guest's row in the store (call once the guest has left the game)"""
+        if self._slot is not None:
+            self._store.release(self._slot)
+            self._slot = None
 
-        # Apply satisfaction penalties for unmet needs
-        if self.hunger < 0.3:
-            self.satisfaction = max(0.0, self.satisfaction - 0.02 * dt)
-        if self.thirst < 0.3:
-            self.satisfaction = max(0.0, self.satisfaction - 0.03 * dt)
-        if self.bladder > 0.7:
-            penalty = 0.03 * dt if self.bladder < 0.9 else 0.10 * dt
-            self.satisfaction = max(0.0, self.satisfaction - penalty)
+    # ===== SATISFACTION SYSTEM METHODS =====
 
     def modify_happiness(self, amount: float, reason: str = ""):
         """Modify happiness (capped between 0.0 and 1.0)"""
         old_value = self.happiness
         self.happiness = max(0.0, min(1.0, self.happiness + amount))
         if abs(amount) >= 0.05:  # Only log significant changes
-            DebugConfig.log('guests', f"Guest {self.id} happiness: {old_value:.2f} -> {self.happiness:.2f} ({amount:+.2f}) - {reason}")
+            DebugConfig.log('guests', "Guest {} happiness: {:.2f} -> {:.2f} ({:+.2f}) - {}", self.id, old_value, self.happiness, amount, reason)
 
     def modify_excitement(self, amount: float, reason: str = ""):
         """Modify excitement (capped between 0.0 and 1.0)"""
         old_value = self.excitement
         self.excitement = max(0.0, min(1.0, self.excitement + amount))
         if abs(amount) >= 0.05:  # Only log significant changes
-            DebugConfig.log('guests', f"Guest {self.id} excitement: {old_value:.2f} -> {self.excitement:.2f} ({amount:+.2f}) - {reason}")
+            DebugConfig.log('guests', "Guest {} excitement: {:.2f} -> {:.2f} ({:+.2f}) - {}", self.id, old_value, self.excitement, amount, reason)
 
     def modify_satisfaction(self, amount: float, reason: str = ""):
         """Modify satisfaction (capped between 0.0 and 1.0)"""
         old_value = self.satisfaction
         self.satisfaction = max(0.0, min(1.0, self.satisfaction + amount))
         if abs(amount) >= 0.05:  # Only log significant changes
-            DebugConfig.log('guests', f"Guest {self.id} satisfaction: {old_value:.2f} -> {self.satisfaction:.2f} ({amount:+.2f}) - {reason}")
+            DebugConfig.log('guests', "Guest {} satisfaction: {:.2f} -> {:.2f} ({:+.2f}) - {}", self.id, old_value, self.satisfaction, amount, reason)
 
     def apply_ride_completion_bonus(self):
         """Apply satisfaction boost after completing a ride"""
@@ -662,12 +724,11 @@ class Guest:
             # Reached food shop - start eating
             self.state = GuestState.EATING
             self.eating_timer = 0.0
-            DebugConfig.log('guests', f"Guest {self.id} started eating")
+            DebugConfig.log('guests', "Guest {} started eating", self.id)
             return
 
         if not self.is_moving and self.path:
-            next_tile = self.path[0]
-            self.path = self.path[1:]
+            next_tile = self.path.advance()
             self._start_movement_to(next_tile[0], next_tile[1])
 
     def _tick_eating(self, dt: float):
@@ -688,19 +749,21 @@ class Guest:
                 else:
                     # Can't afford it - apply penalty
                     self.modify_satisfaction(-0.03, "couldn't afford food")
-                    DebugConfig.log('guests', f"Guest {self.id} couldn't afford food (${price})")
+                    DebugConfig.log('guests', "Guest {} couldn't afford food (${})", self.id, price)
 
             # Generate litter (trash) 80% chance
-            if random.random() < 0.8:
+            if _rng.random() < 0.8:
                 self.has_litter = True
                 self.litter_type = "trash"
-                self.litter_hold_duration = random.uniform(3.0, 10.0)
+                self.litter_hold_duration = _rng.uniform(3.0, 10.0)
                 self.litter_hold_timer = 0.0
 
+            if self.target_shop:
+                guest_events.emit(GuestEventType.PURCHASE_COMPLETED, self, shop=self.target_shop, kind='food')
             self.state = GuestState.WANDERING
             self.target_food = None
             self.target_shop = None  # Clear shop target
-            DebugConfig.log('guests', f"Guest {self.id} finished eating (hunger: {self.hunger:.2f})")
+            DebugConfig.log('guests', "Guest {} finished eating (hunger: {:.2f})", self.id, self.hunger)
 
     def _tick_walking_to_drink(self, dt: float):
         """Handle visitor walking to drink stand"""
@@ -708,12 +771,11 @@ class Guest:
             # Reached drink stand - start drinking
             self.state = GuestState.DRINKING
             self.drinking_timer = 0.0
-            DebugConfig.log('guests', f"Guest {self.id} started drinking")
+            DebugConfig.log('guests', "Guest {} started drinking", self.id)
             return
 
         if not self.is_moving and self.path:
-            next_tile = self.path[0]
-            self.path = self.path[1:]
+            next_tile = self.path.advance()
             self._start_movement_to(next_tile[0], next_tile[1])
 
     def _tick_drinking(self, dt: float):
@@ -734,19 +796,21 @@ class Guest:
                 else:
                     # Can't afford it - apply penalty
                     self.modify_satisfaction(-0.02, "couldn't afford drink")
-                    DebugConfig.log('guests', f"Guest {self.id} couldn't afford drink (${price})")
+                    DebugConfig.log('guests', "Guest {} couldn't afford drink (${})", self.id, price)
 
             # Generate litter (soda) 70% chance
-            if random.random() < 0.7:
+            if _rng.random() < 0.7:
                 self.has_litter = True
                 self.litter_type = "soda"
-                self.litter_hold_duration = random.uniform(3.0, 10.0)
+                self.litter_hold_duration = _rng.uniform(3.0, 10.0)
                 self.litter_hold_timer = 0.0
 
+            if self.target_shop:
+                guest_events.emit(GuestEventType.PURCHASE_COMPLETED, self, shop=self.target_shop, kind='drink')
             self.state = GuestState.WANDERING
             self.target_drink = None
             self.target_shop = None  # Clear shop target
-            DebugConfig.log('guests', f"Guest {self.id} finished drinking (thirst: {self.thirst:.2f}, bladder: {self.bladder:.2f})")
+            DebugConfig.log('guests', "Guest {} finished drinking (thirst: {:.2f}, bladder: {:.2f})", self.id, self.thirst, self.bladder)
 
     def _tick_walking_to_restroom(self, dt: float):
         """Handle visitor walking to restroom"""
@@ -755,17 +819,16 @@ class Guest:
             if self.target_restroom and self.target_restroom.add_user(self):
                 self.state = GuestState.USING_RESTROOM
                 self.restroom_timer = 0.0
-                DebugConfig.log('guests', f"Guest {self.id} started using restroom")
+                DebugConfig.log('guests', "Guest {} started using restroom", self.id)
             else:
                 # Restroom full, go back to wandering
-                DebugConfig.log('guests', f"Guest {self.id} can't use restroom (full), going back to wandering")
+                DebugConfig.log('guests', "Guest {} can't use restroom (full), going back to wandering", self.id)
                 self.state = GuestState.WANDERING
                 self.target_restroom = None
             return
 
         if not self.is_moving and self.path:
-            next_tile = self.path[0]
-            self.path = self.path[1:]
+            next_tile = self.path.advance()
             self._start_movement_to(next_tile[0], next_tile[1])
 
     def _tick_using_restroom(self, dt: float):
@@ -783,4 +846,4 @@ class Guest:
 
             self.state = GuestState.WANDERING
             self.target_restroom = None
-            DebugConfig.log('guests', f"Guest {self.id} finished using restroom (bladder: {self.bladder:.2f})")
\ No newline at end of file
+            DebugConfig.log('guests', "Guest {} finished using restroom (bladder: {:.2f})", self.id, self.bladder)
\ No newline at end of file
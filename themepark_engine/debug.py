@@ -1,11 +1,82 @@
 """
 Debug configuration module for OpenPark
 Centralized control of debug logging for different entities
+
+Logging is lazy: pass the format string and its arguments separately
+
+    DebugConfig.log('engine', "Guest {} entered the queue of {}", guest.id, ride.defn.name)
+
+The message is only formatted when the category is enabled. For arguments that are
+expensive to build (lists, sums...), guard the call with DebugConfig.is_enabled().
+Enabled messages go to an in-memory ring buffer, written to stdout by a background
+thread (the game loop never blocks on print).
 """
 
+import atexit
+import sys
+import threading
+from collections import deque
+
+
+class LogRingBuffer:
+    """Bounded buffer of formatted log lines, drained by a background writer thread
+
+    When the writer falls behind, the oldest lines are dropped (and counted)
+    instead of slowing down the game loop.
+    """
+
+    def __init__(self, capacity: int = 10000, flush_interval: float = 0.2, stream=None):
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.stream = stream  # None = sys.stdout at write time
+        self.lines = deque(maxlen=capacity)
+        self.dropped = 0
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def append(self, line: str):
+        if len(self.lines) == self.capacity:
+            self.dropped += 1
+        self.lines.append(line)
+        if self._thread is None:
+            self._start_writer()
+
+    def _start_writer(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._writer_loop, name='debug-log-writer', daemon=True)
+                self._thread.start()
+
+    def _writer_loop(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        """Write every pending line (called by the writer thread, and at exit)"""
+        batch = []
+        try:
+            while True:
+                batch.append(self.lines.popleft())
+        except IndexError:
+            pass
+        if self.dropped:
+            batch.insert(0, f"DEBUG [log]: {self.dropped} lines dropped (ring buffer full)")
+            self.dropped = 0
+        if batch:
+            stream = self.stream or sys.stdout
+            try:
+                stream.write('\n'.join(batch) + '\n')
+                stream.flush()
+            except (ValueError, OSError):
+                pass  # Stream closed during interpreter shutdown
+
+
 class DebugConfig:
     """Centralized debug configuration"""
-    
+
     # Entity-specific debug flags (all disabled by default)
     GUESTS = False          # Guest movement, state changes, pathfinding
     RIDES = False           # Ride operations, boarding, launching
@@ -18,53 +89,81 @@ class DebugConfig:
     RENDERING = False       # Rendering operations
     LITTER = False          # Litter and bin system
 
-    # Global debug flag
-    ENABLED = True          # Master switch for all debug logs
-    
+    CATEGORIES = ['GUESTS', 'RIDES', 'QUEUES', 'ENGINE', 'PATHFINDING', 'UI', 'ECONOMY', 'RENDERING', 'EMPLOYEES', 'LITTER']
+
+    # Global debug flag (toggled from the debug menu)
+    ENABLED = False         # Master switch for all debug logs
+
+    # Lower-case names of the categories that currently log (empty when ENABLED is off)
+    _active = frozenset()
+    buffer = LogRingBuffer()
+
+    @classmethod
+    def _refresh(cls):
+        """Rebuild the active category set (call after changing ENABLED or a category flag)"""
+        if cls.ENABLED:
+            cls._active = frozenset(c.lower() for c in cls.CATEGORIES if getattr(cls, c))
+        else:
+            cls._active = frozenset()
+
+    @classmethod
+    def is_enabled(cls, category: str) -> bool:
+        """Cheap guard for log calls whose arguments are expensive to build"""
+        return category in cls._active
+
     @classmethod
-    def log(cls, category: str, message: str):
-        """Log a debug message if the category is enabled"""
-        if not cls.ENABLED:
+    def log(cls, category: str, message: str, *args):
+        """Log a debug message if the category is enabled
+
+        Args:
+            category: Lower-case category name ('engine', 'employees'...)
+            message: Message, or str.format() template when args are given
+            *args: Template arguments (only formatted if the category is enabled)
+        """
+        if category not in cls._active:
             return
-            
-        category_upper = category.upper()
-        if hasattr(cls, category_upper) and getattr(cls, category_upper):
-            print(f"DEBUG [{category}]: {message}")
-    
+        if args:
+            message = message.format(*args)
+        cls.buffer.append(f"DEBUG [{category}]: {message}")
+
+    @classmethod
+    def set_enabled(cls, enabled: bool):
+        """Master switch, keeps the category flags as they are"""
+        cls.ENABLED = enabled
+        cls._refresh()
+
     @classmethod
     def enable_category(cls, category: str):
         """Enable debug for a specific category"""
         category_upper = category.upper()
         if hasattr(cls, category_upper):
             setattr(cls, category_upper, True)
-            # Removed print to prevent crash
-    
+            cls._refresh()
+
     @classmethod
     def disable_category(cls, category: str):
         """Disable debug for a specific category"""
         category_upper = category.upper()
         if hasattr(cls, category_upper):
             setattr(cls, category_upper, False)
-            # Removed print to prevent crash
-    
+            cls._refresh()
+
     @classmethod
     def enable_all(cls):
         """Enable all debug categories"""
         cls.ENABLED = True
-        debug_categories = ['GUESTS', 'RIDES', 'QUEUES', 'ENGINE', 'PATHFINDING', 'UI', 'ECONOMY', 'RENDERING', 'EMPLOYEES']
-        for category in debug_categories:
+        for category in cls.CATEGORIES:
             setattr(cls, category, True)
-        # Removed print to prevent crash
-    
+        cls._refresh()
+
     @classmethod
     def disable_all(cls):
         """Disable all debug categories"""
         cls.ENABLED = False
-        debug_categories = ['GUESTS', 'RIDES', 'QUEUES', 'ENGINE', 'PATHFINDING', 'UI', 'ECONOMY', 'RENDERING', 'EMPLOYEES']
-        for category in debug_categories:
+        for category in cls.CATEGORIES:
             setattr(cls, category, False)
-        # Removed print to prevent crash
-    
+        cls._refresh()
+
     @classmethod
     def get_status(cls):
         """Get current debug status"""
@@ -72,7 +171,10 @@ class DebugConfig:
             'enabled': cls.ENABLED,
             'categories': {}
         }
-        debug_categories = ['GUESTS', 'RIDES', 'QUEUES', 'ENGINE', 'PATHFINDING', 'UI', 'ECONOMY', 'RENDERING', 'EMPLOYEES']
-        for category in debug_categories:
+        for category in cls.CATEGORIES:
             status['categories'][category.lower()] = getattr(cls, category)
         return status
+
+
+DebugConfig._refresh()
+atexit.register(DebugConfig.buffer.flush)
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from typing import Optional, List, Tuple
-import random
+from .rng import SimRandom
 from .debug import DebugConfig
+from .paths import PathCursor
+
+_rng = SimRandom.stream(SimRandom.EMPLOYEES)
 
 @dataclass
 class EmployeeType:
@@ -19,28 +22,44 @@ class EmployeeDef:
     sprite: str
     efficiency: float = 1.0  # Efficacité du travail
 
-@dataclass
 class Employee:
-    defn: EmployeeDef
-    x: int
-    y: int
-    state: str = "idle"  # idle, working, moving
-    target_object = None  # Attraction, chemin, etc.
-    work_timer: float = 0.0
-    work_duration: float = 0.0
-    salary_timer: float = 0.0
-    id: int = 0
-    
-    def __post_init__(self):
-        if self.id == 0:
-            self.id = random.randint(10000, 99999)
+    # Declared layout (no per-instance __dict__); subclasses add their own fields
+    __slots__ = ('defn', 'x', 'y', 'state', 'target_object', 'work_timer', 'work_duration',
+                 'salary_timer', 'id', 'sleep_entry', 'salary_negotiation_manager')
+
+    def __init__(self, defn: EmployeeDef, x: int, y: int, state: str = "idle", work_timer: float = 0.0,
+                 work_duration: float = 0.0, salary_timer: float = 0.0, id: int = 0):
+        self.defn = defn
+        self.x = x
+        self.y = y
+        self.state = state  # idle, working, moving
+        self.target_object = None  # Attraction, chemin, etc.
+        self.work_timer = work_timer
+        self.work_duration = work_duration
+        self.salary_timer = salary_timer
+        self.id = id  # Entity id (0 until registered by the game)
+        self.sleep_entry = None  # Set by the engine's AgentScheduler during a timed state
+        self.salary_negotiation_manager = None  # Set by engine
+
+    def _work_rate(self, employee_type: str) -> float:
+        """Work speed factor (1.0 = normal, 0.0 = on strike)"""
+        if not self.salary_negotiation_manager:
+            return 1.0
+        return 1.0 - self.salary_negotiation_manager.get_efficiency_penalty(employee_type, self.id)
+
+    def timed_state_remaining(self):
+        """Seconds before the current timed state ends (None when not in a timed state)"""
+        return None
 
 class Engineer(Employee):
+    __slots__ = ('repair_timer', 'repair_duration', 'path', 'speed', 'move_timer', 'move_duration',
+                 'is_moving', 'move_progress', 'target_x', 'target_y')
+
     def __init__(self, defn: EmployeeDef, x: int, y: int):
         super().__init__(defn, x, y)
         self.repair_timer = 0.0
         self.repair_duration = 5.0  # Temps pour réparer une attraction
-        self.path = []  # Chemin vers l'attraction à réparer
+        self.path = PathCursor()  # Chemin vers l'attraction à réparer
         self.speed = 2.0  # Vitesse de déplacement
         self.move_timer = 0.0
         self.move_duration = 0.5  # Temps pour se déplacer d'une tuile à l'autre
@@ -56,8 +75,8 @@ class Engineer(Employee):
         
     def start_repair(self, ride, grid=None):
         """Commencer la réparation d'une attraction"""
-        DebugConfig.log('employees', f"Engineer {self.id} start_repair called for {ride.defn.name}")
-        DebugConfig.log('employees', f"Engineer {self.id} current position: ({self.x}, {self.y})")
+        DebugConfig.log('employees', "Engineer {} start_repair called for {}", self.id, ride.defn.name)
+        DebugConfig.log('employees', "Engineer {} current position: ({}, {})", self.id, self.x, self.y)
         self.state = "moving_to_ride"
         self.target_object = ride
         ride.being_repaired = True
@@ -69,22 +88,22 @@ class Engineer(Employee):
             ride_entrance = (ride.x, ride.y)  # Position de l'attraction
             engineer_pos = (int(self.x), int(self.y))
 
-            DebugConfig.log('employees', f"Engineer {self.id} at {engineer_pos}, trying to reach {ride.defn.name} at {ride_entrance}")
+            DebugConfig.log('employees', "Engineer {} at {}, trying to reach {} at {}", self.id, engineer_pos, ride.defn.name, ride_entrance)
 
-            path = pathfinding.get_path_cached(grid, engineer_pos, ride_entrance, for_engineers=True)
+            path = pathfinding.get_path_cached(grid, engineer_pos, ride_entrance, profile=pathfinding.ENGINEER)
             if path:
-                self.path = path[1:]  # Exclure la position de départ
-                DebugConfig.log('employees', f"Engineer {self.id} found path to {ride.defn.name}: {len(self.path)} steps")
-                DebugConfig.log('employees', f"Engineer {self.id} path: {self.path}")
+                self.path = path.cursor(1)  # Exclure la position de départ
+                DebugConfig.log('employees', "Engineer {} found path to {}: {} steps", self.id, ride.defn.name, len(self.path))
+                DebugConfig.log('employees', "Engineer {} path: {}", self.id, self.path)
             else:
-                DebugConfig.log('employees', f"Engineer {self.id} cannot find path to {ride.defn.name}")
+                DebugConfig.log('employees', "Engineer {} cannot find path to {}", self.id, ride.defn.name)
                 self.state = "idle"
                 ride.being_repaired = False
                 return
         else:
-            DebugConfig.log('employees', f"No grid provided to engineer {self.id}")
+            DebugConfig.log('employees', "No grid provided to engineer {}", self.id)
         
-        DebugConfig.log('employees', f"Engineer {self.id} moving to repair {ride.defn.name}")
+        DebugConfig.log('employees', "Engineer {} moving to repair {}", self.id, ride.defn.name)
         
     def tick(self, dt: float):
         """Mise à jour de l'ingénieur"""
@@ -102,7 +121,7 @@ class Engineer(Employee):
                     if self.target_object:
                         self.target_object.being_repaired = False
                         self.target_object = None
-                    DebugConfig.log('employees', f"Engineer {self.id} on strike, stopped working")
+                    DebugConfig.log('employees', "Engineer {} on strike, stopped working", self.id)
                 return
 
         if self.state == "leaving":
@@ -126,8 +145,17 @@ class Engineer(Employee):
 
                 self.target_object = None
                 self.repair_timer = 0.0
-                DebugConfig.log('employees', f"Engineer {self.id} finished repair and moved to nearby position")
+                DebugConfig.log('employees', "Engineer {} finished repair and moved to nearby position", self.id)
     
+    def timed_state_remaining(self):
+        """Repair in progress: time left at the current work rate"""
+        if self.state != "working" or not self.target_object:
+            return None
+        rate = self._work_rate('engineer')
+        if rate <= 0.0:
+            return None
+        return (self.repair_duration - self.repair_timer) / rate
+
     def _update_movement(self, dt: float):
         """Mise à jour du mouvement de l'ingénieur"""
         if not self.path:
@@ -135,24 +163,24 @@ class Engineer(Employee):
             if self.target_object:
                 self.state = "working"
                 self.repair_timer = 0.0
-                DebugConfig.log('employees', f"Engineer {self.id} arrived at {self.target_object.defn.name}, starting repair")
+                DebugConfig.log('employees', "Engineer {} arrived at {}, starting repair", self.id, self.target_object.defn.name)
             return
         
         # Déplacer vers la prochaine position
         if not self.is_moving:
-            next_pos = self.path.pop(0)
+            next_pos = self.path.advance()
             self.target_x = float(next_pos[0])
             self.target_y = float(next_pos[1])
             self.is_moving = True
             self.move_progress = 0.0
-            if DebugConfig.EMPLOYEES:
-                DebugConfig.log('employees', f"Engineer {self.id} moving to ({self.target_x}, {self.target_y})")
+            if DebugConfig.is_enabled('employees'):
+                DebugConfig.log('employees', "Engineer {} moving to ({}, {})", self.id, self.target_x, self.target_y)
         
         # Mouvement tuile par tuile avec délai
         self.move_progress += dt * self.speed
         if self.move_progress >= self.move_duration:
             # Arrivé à la position cible
-            DebugConfig.log('employees', f"Engineer {self.id} reached target ({self.target_x}, {self.target_y})")
+            DebugConfig.log('employees', "Engineer {} reached target ({}, {})", self.id, self.target_x, self.target_y)
             self.x = self.target_x
             self.y = self.target_y
             self.is_moving = False
@@ -163,24 +191,24 @@ class Engineer(Employee):
         if not self.path:
             # Arrivé à destination
             self.state = "idle"
-            DebugConfig.log('employees', f"Engineer {self.id} arrived at nearby position")
+            DebugConfig.log('employees', "Engineer {} arrived at nearby position", self.id)
             return
         
         # Déplacer vers la prochaine position
         if not self.is_moving:
-            next_pos = self.path.pop(0)
+            next_pos = self.path.advance()
             self.target_x = float(next_pos[0])
             self.target_y = float(next_pos[1])
             self.is_moving = True
             self.move_progress = 0.0
-            if DebugConfig.EMPLOYEES:
-                DebugConfig.log('employees', f"Engineer {self.id} moving to ({self.target_x}, {self.target_y})")
+            if DebugConfig.is_enabled('employees'):
+                DebugConfig.log('employees', "Engineer {} moving to ({}, {})", self.id, self.target_x, self.target_y)
         
         # Mouvement tuile par tuile avec délai
         self.move_progress += dt * self.speed
         if self.move_progress >= self.move_duration:
             # Arrivé à la position cible
-            DebugConfig.log('employees', f"Engineer {self.id} reached target ({self.target_x}, {self.target_y})")
+            DebugConfig.log('employees', "Engineer {} reached target ({}, {})", self.id, self.target_x, self.target_y)
             self.x = self.target_x
             self.y = self.target_y
             self.is_moving = False
@@ -192,15 +220,14 @@ class Engineer(Employee):
             return
         
         # Find a nearby position (2-3 tiles away from the ride)
-        import random
-        from .pathfinding import astar_for_engineers
+        from .pathfinding import manhattan_path
         ride_x, ride_y = self.target_object.x, self.target_object.y
         
         # Try to find a nearby position
         for attempt in range(10):
             # Random offset between 2-4 tiles
-            offset_x = random.randint(-4, 4)
-            offset_y = random.randint(-4, 4)
+            offset_x = _rng.randint(-4, 4)
+            offset_y = _rng.randint(-4, 4)
             
             # Skip if too close or same position
             if abs(offset_x) < 2 and abs(offset_y) < 2:
@@ -215,38 +242,20 @@ class Engineer(Employee):
                 engineer_pos = (int(self.x), int(self.y))
                 target_pos = (new_x, new_y)
                 
-                # We need the grid to calculate path, but we don't have it here
-                # For now, calculate a simple Manhattan path
-                path = []
-                current_x, current_y = int(self.x), int(self.y)
-                
-                # Move horizontally first
-                while current_x != new_x:
-                    if current_x < new_x:
-                        current_x += 1
-                    else:
-                        current_x -= 1
-                    path.append((current_x, current_y))
-                
-                # Then move vertically
-                while current_y != new_y:
-                    if current_y < new_y:
-                        current_y += 1
-                    else:
-                        current_y -= 1
-                    path.append((current_x, current_y))
+                # Engineers cross any tile: the straight path (horizontal then vertical) needs no grid
+                path = PathCursor(manhattan_path(engineer_pos, target_pos), 1)
                 
                 if path:
                     self.state = "moving_to_nearby"
                     self.path = path
                     self.is_moving = False
                     self.move_progress = 0.0
-                    DebugConfig.log('employees', f"Engineer {self.id} starting move to nearby position ({new_x}, {new_y}) with path of {len(path)} steps")
+                    DebugConfig.log('employees', "Engineer {} starting move to nearby position ({}, {}) with path of {} steps", self.id, new_x, new_y, len(path))
                     return
         
         # Fallback: stay at current position
         self.state = "idle"
-        DebugConfig.log('employees', f"Engineer {self.id} stayed at current position after repair")
+        DebugConfig.log('employees', "Engineer {} stayed at current position after repair", self.id)
 
     def _update_movement_leaving(self, dt: float):
         """Update movement when employee is leaving the park"""
@@ -260,16 +269,16 @@ class Engineer(Employee):
                     self.y = self.target_y
                     self.is_moving = False
                     self.move_progress = 0.0
-                    DebugConfig.log('employees', f"Engineer {self.id} reached park entrance and is leaving")
+                    DebugConfig.log('employees', "Engineer {} reached park entrance and is leaving", self.id)
                 return
             else:
                 # Already at entrance and not moving - ready to be removed
-                DebugConfig.log('employees', f"Engineer {self.id} at park entrance, ready to be removed")
+                DebugConfig.log('employees', "Engineer {} at park entrance, ready to be removed", self.id)
                 return
 
         # Continue walking along path (same logic as normal movement)
         if not self.is_moving:
-            next_pos = self.path.pop(0)
+            next_pos = self.path.advance()
             self.target_x = float(next_pos[0])
             self.target_y = float(next_pos[1])
             self.is_moving = True
@@ -290,6 +299,12 @@ class Engineer(Employee):
         self.state = "idle"
 
 class MaintenanceWorker(Employee):
+    __slots__ = ('cleaning_timer', 'cleaning_duration', 'gardening_timer', 'gardening_duration',
+                 'patrol_timer', 'patrol_duration', 'patrol_radius', 'placement_type', 'initial_x', 'initial_y',
+                 'path', 'speed', 'move_duration', 'is_moving', 'move_progress', 'target_x', 'target_y',
+                 'target_litter', 'target_garden_spot', 'mowing_speed', 'lawn_mowing_pattern',
+                 'lawn_mowing_direction', 'lawn_mowing_row', 'lawn_mowing_offset')
+
     def __init__(self, defn: EmployeeDef, x: int, y: int):
         super().__init__(defn, x, y)
         self.cleaning_timer = 0.0
@@ -299,7 +314,7 @@ class MaintenanceWorker(Employee):
         self.patrol_timer = 0.0
         self.patrol_duration = 0.0  # Pas de délai - travail continu immédiat
         self.target_litter = None  # Litter object being cleaned
-        self.path = []
+        self.path = PathCursor()
         self.is_moving = False
         self.move_progress = 0.0
         self.target_x = float(x)
@@ -328,25 +343,30 @@ class MaintenanceWorker(Employee):
             return (lerp_x, lerp_y)
         return (float(self.x), float(self.y))
 
+    def movement_profile(self):
+        """Path workers walk where guests do, grass workers on grass and walk paths"""
+        from .movement import GROUNDSKEEPER, GUEST
+        return GROUNDSKEEPER if self.placement_type == "grass" else GUEST
+
     def set_placement_type(self, tile_type):
         """Définir le type de placement (chemin ou pelouse)"""
         if tile_type == 1:  # TILE_WALK
             self.placement_type = "path"
-            DebugConfig.log('employees', f"Maintenance worker {self.id} assigned to path cleaning")
+            DebugConfig.log('employees', "Maintenance worker {} assigned to path cleaning", self.id)
         elif tile_type == 0:  # TILE_GRASS
             self.placement_type = "grass"
-            DebugConfig.log('employees', f"Maintenance worker {self.id} assigned to garden maintenance")
+            DebugConfig.log('employees', "Maintenance worker {} assigned to garden maintenance", self.id)
         
     def find_nearest_litter(self, litter_manager, grid):
         """Trouver le détritus le plus proche sur un chemin ou file d'attente"""
         if not litter_manager or self.placement_type != "path":
-            DebugConfig.log('employees', f"Maintenance worker {self.id} cannot search for litter - litter_manager: {litter_manager is not None}, placement_type: {self.placement_type}")
+            DebugConfig.log('employees', "Maintenance worker {} cannot search for litter - litter_manager: {}, placement_type: {}", self.id, litter_manager is not None, self.placement_type)
             return None
 
         nearest_litter = None
         min_distance = float('inf')
 
-        DebugConfig.log('employees', f"Maintenance worker {self.id} searching for litter in {len(litter_manager.litters)} litters")
+        DebugConfig.log('employees', "Maintenance worker {} searching for litter in {} litters", self.id, len(litter_manager.litters))
 
         for litter in litter_manager.litters:
             # Vérifier si le détritus est sur un chemin, file d'attente, entrée ou sortie d'attraction
@@ -359,15 +379,14 @@ class MaintenanceWorker(Employee):
                     nearest_litter = litter
 
         if nearest_litter:
-            DebugConfig.log('employees', f"Maintenance worker {self.id} found nearest litter at ({nearest_litter.x}, {nearest_litter.y}), distance: {min_distance:.1f}")
+            DebugConfig.log('employees', "Maintenance worker {} found nearest litter at ({}, {}), distance: {:.1f}", self.id, nearest_litter.x, nearest_litter.y, min_distance)
         else:
-            DebugConfig.log('employees', f"Maintenance worker {self.id} found NO litter within radius {self.patrol_radius}")
+            DebugConfig.log('employees', "Maintenance worker {} found NO litter within radius {}", self.id, self.patrol_radius)
 
         return nearest_litter
     
     def start_cleaning(self, litter, grid):
         """Commencer à se diriger vers un détritus pour le nettoyer"""
-        from .pathfinding import astar
         self.target_litter = litter
         litter_pos = (int(litter.x), int(litter.y))
         worker_pos = (int(self.x), int(self.y))
@@ -378,20 +397,20 @@ class MaintenanceWorker(Employee):
             self.state = "cleaning"
             self.cleaning_timer = 0.0
             self.patrol_timer = 0.0
-            DebugConfig.log('employees', f"Maintenance worker {self.id} already at litter, starting to clean immediately")
+            DebugConfig.log('employees', "Maintenance worker {} already at litter, starting to clean immediately", self.id)
             return True
 
         # Find path to litter
         from . import pathfinding
-        path = pathfinding.get_path_cached(grid, worker_pos, litter_pos)
+        path = pathfinding.get_path_cached(grid, worker_pos, litter_pos, profile=self.movement_profile())
         if path and len(path) > 1:
-            self.path = path[1:]  # Skip current position
+            self.path = path.cursor(1)  # Skip current position
             self.state = "moving_to_litter"
             self.patrol_timer = 0.0  # Reset patrol timer
-            DebugConfig.log('employees', f"Maintenance worker {self.id} moving to clean litter at {litter_pos}")
+            DebugConfig.log('employees', "Maintenance worker {} moving to clean litter at {}", self.id, litter_pos)
             return True
         else:
-            DebugConfig.log('employees', f"Maintenance worker {self.id} couldn't find path to litter at {litter_pos}")
+            DebugConfig.log('employees', "Maintenance worker {} couldn't find path to litter at {}", self.id, litter_pos)
             self.target_litter = None
             return False
         
@@ -403,20 +422,20 @@ class MaintenanceWorker(Employee):
         worker_pos = (int(self.x), int(self.y))
 
         # Find path to garden spot
-        path = pathfinding.get_path_cached(grid, worker_pos, garden_pos)
+        path = pathfinding.get_path_cached(grid, worker_pos, garden_pos, profile=self.movement_profile())
         if path and len(path) > 1:
-            self.path = path[1:]  # Skip current position
+            self.path = path.cursor(1)  # Skip current position
             self.state = "moving_to_garden"
             self.patrol_timer = 0.0  # Reset patrol timer
-            DebugConfig.log('employees', f"Maintenance worker {self.id} moving to garden at {garden_pos}")
+            DebugConfig.log('employees', "Maintenance worker {} moving to garden at {}", self.id, garden_pos)
         elif worker_pos == garden_pos:
             # Already at the spot, start gardening immediately
             self.state = "gardening"
             self.gardening_timer = 0.0
             self.patrol_timer = 0.0  # Reset patrol timer
-            DebugConfig.log('employees', f"Maintenance worker {self.id} started gardening at current position")
+            DebugConfig.log('employees', "Maintenance worker {} started gardening at current position", self.id)
         else:
-            DebugConfig.log('employees', f"Maintenance worker {self.id} couldn't find path to garden at {garden_pos}")
+            DebugConfig.log('employees', "Maintenance worker {} couldn't find path to garden at {}", self.id, garden_pos)
             self.target_garden_spot = None
 
     def start_mowing(self, grid):
@@ -430,7 +449,7 @@ class MaintenanceWorker(Employee):
         # This allows the agent to restart from wherever it finished the last cycle
         self.initial_x = int(self.x)
         self.initial_y = int(self.y)
-        DebugConfig.log('employees', f"Maintenance worker {self.id} starting continuous lawn mowing from ({self.initial_x}, {self.initial_y}) - pattern: {self.lawn_mowing_pattern}")
+        DebugConfig.log('employees', "Maintenance worker {} starting continuous lawn mowing from ({}, {}) - pattern: {}", self.id, self.initial_x, self.initial_y, self.lawn_mowing_pattern)
 
     def _get_next_mowing_position(self, grid):
         """Calcule la prochaine position dans le pattern de tonte (avec gestion d'obstacles)"""
@@ -453,12 +472,12 @@ class MaintenanceWorker(Employee):
                 self.lawn_mowing_direction *= -1
                 self.lawn_mowing_row += 1
 
-                DebugConfig.log('employees', f"Worker {self.id} reached end of row at ({current_x}, {current_y}), moving to next row ({next_x}, {next_y}), direction now: {self.lawn_mowing_direction}")
+                DebugConfig.log('employees', "Worker {} reached end of row at ({}, {}), moving to next row ({}, {}), direction now: {}", self.id, current_x, current_y, next_x, next_y, self.lawn_mowing_direction)
 
                 # Check if we finished all rows (patrol radius OR grid bounds)
                 if abs(next_y - self.initial_y) > self.patrol_radius or not grid.in_bounds(next_x, next_y):
                     # Finished horizontal pattern, switch to vertical for NEXT cycle
-                    DebugConfig.log('employees', f"Worker {self.id} finished horizontal pattern, will switch to vertical on next cycle")
+                    DebugConfig.log('employees', "Worker {} finished horizontal pattern, will switch to vertical on next cycle", self.id)
                     self.lawn_mowing_pattern = 'vertical'
                     self.lawn_mowing_row = 0
                     self.lawn_mowing_direction = 1
@@ -481,12 +500,12 @@ class MaintenanceWorker(Employee):
                 self.lawn_mowing_direction *= -1
                 self.lawn_mowing_row += 1
 
-                DebugConfig.log('employees', f"Worker {self.id} reached end of column at ({current_x}, {current_y}), moving to next column ({next_x}, {next_y}), direction now: {self.lawn_mowing_direction}")
+                DebugConfig.log('employees', "Worker {} reached end of column at ({}, {}), moving to next column ({}, {}), direction now: {}", self.id, current_x, current_y, next_x, next_y, self.lawn_mowing_direction)
 
                 # Check if we finished all columns (patrol radius OR grid bounds)
                 if abs(next_x - self.initial_x) > self.patrol_radius or not grid.in_bounds(next_x, next_y):
                     # Finished vertical pattern, switch to horizontal for NEXT cycle
-                    DebugConfig.log('employees', f"Worker {self.id} finished vertical pattern, will switch to horizontal on next cycle")
+                    DebugConfig.log('employees', "Worker {} finished vertical pattern, will switch to horizontal on next cycle", self.id)
                     self.lawn_mowing_pattern = 'horizontal'
                     self.lawn_mowing_row = 0
                     self.lawn_mowing_direction = 1
@@ -495,7 +514,7 @@ class MaintenanceWorker(Employee):
 
         # Check if next position is valid
         if not grid.in_bounds(next_x, next_y):
-            DebugConfig.log('employees', f"Worker {self.id} next position ({next_x}, {next_y}) out of bounds")
+            DebugConfig.log('employees', "Worker {} next position ({}, {}) out of bounds", self.id, next_x, next_y)
             return None
 
         tile_type = grid.get(next_x, next_y)
@@ -505,7 +524,7 @@ class MaintenanceWorker(Employee):
             return (next_x, next_y)
 
         # If it's an obstacle, try to go around
-        DebugConfig.log('employees', f"Worker {self.id} found obstacle at ({next_x}, {next_y}), trying to go around")
+        DebugConfig.log('employees', "Worker {} found obstacle at ({}, {}), trying to go around", self.id, next_x, next_y)
 
         if self.lawn_mowing_pattern == 'horizontal':
             # Try moving to next row
@@ -513,7 +532,7 @@ class MaintenanceWorker(Employee):
             alt_next_y = current_y + 1
             self.lawn_mowing_direction *= -1
             if grid.in_bounds(alt_next_x, alt_next_y) and grid.get(alt_next_x, alt_next_y) == 0:
-                DebugConfig.log('employees', f"Worker {self.id} going around obstacle to ({alt_next_x}, {alt_next_y})")
+                DebugConfig.log('employees', "Worker {} going around obstacle to ({}, {})", self.id, alt_next_x, alt_next_y)
                 return (alt_next_x, alt_next_y)
         else:  # vertical
             # Try moving to next column
@@ -521,15 +540,14 @@ class MaintenanceWorker(Employee):
             alt_next_y = current_y
             self.lawn_mowing_direction *= -1
             if grid.in_bounds(alt_next_x, alt_next_y) and grid.get(alt_next_x, alt_next_y) == 0:
-                DebugConfig.log('employees', f"Worker {self.id} going around obstacle to ({alt_next_x}, {alt_next_y})")
+                DebugConfig.log('employees', "Worker {} going around obstacle to ({}, {})", self.id, alt_next_x, alt_next_y)
                 return (alt_next_x, alt_next_y)
 
-        DebugConfig.log('employees', f"Worker {self.id} cannot find valid next position")
+        DebugConfig.log('employees', "Worker {} cannot find valid next position", self.id)
         return None
 
     def find_next_lawn_mowing_spot(self, grid):
         """Trouve le prochain spot pour la tonte en ligne (gauche-droite ou haut-bas)"""
-        import random
 
         # Alternate between horizontal and vertical mowing patterns
         if self.lawn_mowing_offset >= self.patrol_radius * 2:
@@ -563,8 +581,8 @@ class MaintenanceWorker(Employee):
 
         # Fallback: random grass spot
         for attempt in range(10):
-            offset_x = random.randint(-self.patrol_radius, self.patrol_radius)
-            offset_y = random.randint(-self.patrol_radius, self.patrol_radius)
+            offset_x = _rng.randint(-self.patrol_radius, self.patrol_radius)
+            offset_y = _rng.randint(-self.patrol_radius, self.patrol_radius)
             target_x = int(self.initial_x + offset_x)
             target_y = int(self.initial_y + offset_y)
 
@@ -577,14 +595,12 @@ class MaintenanceWorker(Employee):
 
     def start_patrol(self, grid):
         """Commencer une patrouille aléatoire dans le rayon"""
-        from .pathfinding import astar
-        import random
 
         # Essayer de trouver une position accessible dans le rayon de patrouille
         for attempt in range(10):
             # Choisir une position aléatoire dans le rayon
-            offset_x = random.randint(-self.patrol_radius, self.patrol_radius)
-            offset_y = random.randint(-self.patrol_radius, self.patrol_radius)
+            offset_x = _rng.randint(-self.patrol_radius, self.patrol_radius)
+            offset_y = _rng.randint(-self.patrol_radius, self.patrol_radius)
 
             target_x = int(self.initial_x + offset_x)
             target_y = int(self.initial_y + offset_y)
@@ -594,38 +610,45 @@ class MaintenanceWorker(Employee):
                 continue
 
             # Vérifier que la position est accessible selon le type de placement
-            tile_type = grid.get(target_x, target_y)
-            valid_tile = False
-
-            if self.placement_type == "path":
-                # Path workers can walk on paths
-                valid_tile = grid.walkable(target_x, target_y)
-            elif self.placement_type == "grass":
-                # Grass workers can walk on grass and paths
-                valid_tile = tile_type in [0, 1]  # TILE_GRASS or TILE_WALK
-
-            if not valid_tile:
+            # (path workers: paths, grass workers: grass and paths)
+            if self.placement_type not in ("path", "grass"):
+                continue
+            profile = self.movement_profile()
+            if not grid.has_flag(target_x, target_y, profile.flag):
                 continue
 
             # Trouver un chemin vers cette position
             from . import pathfinding
             worker_pos = (int(self.x), int(self.y))
             target_pos = (target_x, target_y)
-            path = pathfinding.get_path_cached(grid, worker_pos, target_pos)
+            path = pathfinding.get_path_cached(grid, worker_pos, target_pos, profile=profile)
 
             if path and len(path) > 1:
-                self.path = path[1:]
+                self.path = path.cursor(1)
                 self.state = "patrolling"
                 self.is_moving = False
                 self.move_progress = 0.0
                 self.patrol_timer = 0.0  # Reset patrol timer
-                DebugConfig.log('employees', f"Maintenance worker {self.id} starting patrol to ({target_x}, {target_y})")
+                DebugConfig.log('employees', "Maintenance worker {} starting patrol to ({}, {})", self.id, target_x, target_y)
                 return True
 
         # Si aucun chemin trouvé après 10 tentatives, rester en idle
-        DebugConfig.log('employees', f"Maintenance worker {self.id} couldn't find patrol path, staying idle")
+        DebugConfig.log('employees', "Maintenance worker {} couldn't find patrol path, staying idle", self.id)
         return False
         
+    def timed_state_remaining(self):
+        """Cleaning or gardening in progress: time left at the current work rate"""
+        if self.state == "cleaning":
+            left = self.cleaning_duration - self.cleaning_timer
+        elif self.state == "gardening":
+            left = self.gardening_duration - self.gardening_timer
+        else:
+            return None
+        rate = self._work_rate('maintenance')
+        if rate <= 0.0:
+            return None
+        return left / rate
+
     def tick(self, dt: float):
         """Mise à jour de l'employé de maintenance"""
         self.salary_timer += dt
@@ -641,7 +664,7 @@ class MaintenanceWorker(Employee):
                     self.state = "idle"
                     self.target_litter = None
                     self.target_garden_spot = None
-                    DebugConfig.log('employees', f"Maintenance worker {self.id} on strike, stopped working")
+                    DebugConfig.log('employees', "Maintenance worker {} on strike, stopped working", self.id)
                 return
 
         if self.state == "leaving":
@@ -668,7 +691,7 @@ class MaintenanceWorker(Employee):
             self.cleaning_timer += effective_dt
             if self.cleaning_timer >= self.cleaning_duration:
                 # Cleaning finished
-                DebugConfig.log('employees', f"Maintenance worker {self.id} finished cleaning, going idle, patrol_timer: {self.patrol_timer:.2f}")
+                DebugConfig.log('employees', "Maintenance worker {} finished cleaning, going idle, patrol_timer: {:.2f}", self.id, self.patrol_timer)
                 self.state = "idle"
                 self.target_litter = None
                 self.cleaning_timer = 0.0
@@ -682,7 +705,7 @@ class MaintenanceWorker(Employee):
                 self.state = "idle"
                 self.gardening_timer = 0.0
                 self.target_garden_spot = None
-                DebugConfig.log('employees', f"Maintenance worker {self.id} finished gardening")
+                DebugConfig.log('employees', "Maintenance worker {} finished gardening", self.id)
 
         elif self.state == "mowing":
             # Apply efficiency penalty to mowing
@@ -696,14 +719,14 @@ class MaintenanceWorker(Employee):
             if self.target_litter:
                 self.state = "cleaning"
                 self.cleaning_timer = 0.0
-                DebugConfig.log('employees', f"Maintenance worker {self.id} arrived at litter, starting to clean")
+                DebugConfig.log('employees', "Maintenance worker {} arrived at litter, starting to clean", self.id)
             else:
                 self.state = "idle"
             return
 
         # Move to next position
         if not self.is_moving:
-            next_pos = self.path.pop(0)
+            next_pos = self.path.advance()
             self.target_x = float(next_pos[0])
             self.target_y = float(next_pos[1])
             self.is_moving = True
@@ -724,14 +747,14 @@ class MaintenanceWorker(Employee):
             if self.target_garden_spot:
                 self.state = "gardening"
                 self.gardening_timer = 0.0
-                DebugConfig.log('employees', f"Maintenance worker {self.id} arrived at garden spot, starting to garden")
+                DebugConfig.log('employees', "Maintenance worker {} arrived at garden spot, starting to garden", self.id)
             else:
                 self.state = "idle"
             return
 
         # Move to next position
         if not self.is_moving:
-            next_pos = self.path.pop(0)
+            next_pos = self.path.advance()
             self.target_x = float(next_pos[0])
             self.target_y = float(next_pos[1])
             self.is_moving = True
@@ -752,7 +775,7 @@ class MaintenanceWorker(Employee):
 
         # Log timer value for debugging
         if self.gardening_timer >= self.mowing_speed:
-            DebugConfig.log('employees', f"Maintenance worker {self.id} timer reached {self.gardening_timer:.3f}s (threshold: {self.mowing_speed:.3f}s) at tile ({int(self.x)}, {int(self.y)})")
+            DebugConfig.log('employees', "Maintenance worker {} timer reached {:.3f}s (threshold: {:.3f}s) at tile ({}, {})", self.id, self.gardening_timer, self.mowing_speed, int(self.x), int(self.y))
 
         # DO NOT RESET TIMER HERE! The engine will reset it after moving the worker.
         # The timer needs to stay >= mowing_speed so the engine can detect it.
@@ -763,12 +786,12 @@ class MaintenanceWorker(Employee):
             # Arrived at patrol destination, immediately trigger next patrol
             self.state = "idle"
             self.patrol_timer = self.patrol_duration  # Set timer to trigger immediate patrol
-            DebugConfig.log('employees', f"Maintenance worker {self.id} finished patrol, triggering next patrol immediately")
+            DebugConfig.log('employees', "Maintenance worker {} finished patrol, triggering next patrol immediately", self.id)
             return
 
         # Move to next position
         if not self.is_moving:
-            next_pos = self.path.pop(0)
+            next_pos = self.path.advance()
             self.target_x = float(next_pos[0])
             self.target_y = float(next_pos[1])
             self.is_moving = True
@@ -794,16 +817,16 @@ class MaintenanceWorker(Employee):
                     self.y = self.target_y
                     self.is_moving = False
                     self.move_progress = 0.0
-                    DebugConfig.log('employees', f"Maintenance worker {self.id} reached park entrance and is leaving")
+                    DebugConfig.log('employees', "Maintenance worker {} reached park entrance and is leaving", self.id)
                 return
             else:
                 # Already at entrance and not moving - ready to be removed
-                DebugConfig.log('employees', f"Maintenance worker {self.id} at park entrance, ready to be removed")
+                DebugConfig.log('employees', "Maintenance worker {} at park entrance, ready to be removed", self.id)
                 return
 
         # Continue walking along path
         if not self.is_moving:
-            next_pos = self.path.pop(0)
+            next_pos = self.path.advance()
             self.target_x = float(next_pos[0])
             self.target_y = float(next_pos[1])
             self.is_moving = True
@@ -818,6 +841,10 @@ class MaintenanceWorker(Employee):
             self.move_progress = 0.0
 
 class SecurityGuard(Employee):
+    __slots__ = ('patrol_timer', 'patrol_duration', 'patrol_radius', 'security_radius', 'nearby_guests',
+                 'initial_x', 'initial_y', 'path', 'speed', 'move_duration', 'is_moving', 'move_progress',
+                 'target_x', 'target_y')
+
     def __init__(self, defn: EmployeeDef, x: int, y: int):
         super().__init__(defn, x, y)
         self.patrol_timer = 0.0
@@ -826,7 +853,7 @@ class SecurityGuard(Employee):
         self.patrol_radius = 15  # Rayon de patrouille
         self.initial_x = x  # Position initiale
         self.initial_y = y
-        self.path = []
+        self.path = PathCursor()
         self.is_moving = False
         self.move_progress = 0.0
         self.target_x = float(x)
@@ -838,25 +865,18 @@ class SecurityGuard(Employee):
 
     def start_patrol(self, grid):
         """Commencer une patrouille sur les chemins"""
-        from .pathfinding import astar
-        import random
 
         # Essayer de trouver une position accessible sur les chemins
+        center_x, center_y = int(self.initial_x), int(self.initial_y)
+        radius = self.patrol_radius
         for attempt in range(10):
-            # Choisir une position aléatoire dans le rayon
-            offset_x = random.randint(-self.patrol_radius, self.patrol_radius)
-            offset_y = random.randint(-self.patrol_radius, self.patrol_radius)
-
-            target_x = int(self.initial_x + offset_x)
-            target_y = int(self.initial_y + offset_y)
-
-            # Vérifier que la position est dans les limites
-            if not grid.in_bounds(target_x, target_y):
-                continue
-
-            # Security guards can ONLY walk on paths
-            if not grid.walkable(target_x, target_y):
-                continue
+            # Choisir une case de chemin aléatoire dans le rayon
+            # (Security guards can ONLY walk on paths)
+            target = grid.random_walkable_in(_rng, center_x - radius, center_y - radius,
+                                             center_x + radius, center_y + radius)
+            if target is None:
+                break
+            target_x, target_y = target
 
             # Trouver un chemin vers cette position
             from . import pathfinding
@@ -865,16 +885,16 @@ class SecurityGuard(Employee):
             path = pathfinding.get_path_cached(grid, guard_pos, target_pos)
 
             if path and len(path) > 1:
-                self.path = path[1:]
+                self.path = path.cursor(1)
                 self.state = "patrolling"
                 self.is_moving = False
                 self.move_progress = 0.0
                 self.patrol_timer = 0.0
-                DebugConfig.log('employees', f"Security guard {self.id} starting patrol to ({target_x}, {target_y})")
+                DebugConfig.log('employees', "Security guard {} starting patrol to ({}, {})", self.id, target_x, target_y)
                 return True
 
         # Si aucun chemin trouvé, rester en idle
-        DebugConfig.log('employees', f"Security guard {self.id} couldn't find patrol path, staying idle")
+        DebugConfig.log('employees', "Security guard {} couldn't find patrol path, staying idle", self.id)
         return False
 
     def update_nearby_guests(self, guests):
@@ -906,8 +926,8 @@ class SecurityGuard(Employee):
             if efficiency_penalty >= 1.0:
                 if self.state == "patrolling":
                     self.state = "idle"
-                    self.path = []
-                    DebugConfig.log('employees', f"Security guard {self.id} on strike, stopped patrolling")
+                    self.path = PathCursor()
+                    DebugConfig.log('employees', "Security guard {} on strike, stopped patrolling", self.id)
                 return
 
         if self.state == "idle":
@@ -925,12 +945,12 @@ class SecurityGuard(Employee):
             # Arrivé à destination, recommencer immédiatement
             self.state = "idle"
             self.patrol_timer = self.patrol_duration  # Trigger immediate next patrol
-            DebugConfig.log('employees', f"Security guard {self.id} finished patrol, triggering next patrol immediately")
+            DebugConfig.log('employees', "Security guard {} finished patrol, triggering next patrol immediately", self.id)
             return
 
         # Move to next position
         if not self.is_moving:
-            next_pos = self.path.pop(0)
+            next_pos = self.path.advance()
             self.target_x = float(next_pos[0])
             self.target_y = float(next_pos[1])
             self.is_moving = True
@@ -945,17 +965,22 @@ class SecurityGuard(Employee):
             self.move_progress = 0.0
 
 class Mascot(Employee):
+    __slots__ = ('entertainment_timer', 'entertainment_duration', 'entertainment_radius', 'detection_radius',
+                 'excitement_boost', 'happiness_boost', 'search_timer', 'search_duration', 'target_hotspot',
+                 'nearby_guests', 'initial_x', 'initial_y', 'path', 'speed', 'move_duration', 'is_moving',
+                 'move_progress', 'target_x', 'target_y')
+
     def __init__(self, defn: EmployeeDef, x: int, y: int):
         super().__init__(defn, x, y)
         self.entertainment_timer = 0.0
-        self.entertainment_duration = random.uniform(5.0, 8.0)  # Temps d'animation variable
+        self.entertainment_duration = _rng.uniform(5.0, 8.0)  # Temps d'animation variable
         self.excitement_boost = 0.10  # Boost d'excitation pour les visiteurs (+10%)
         self.happiness_boost = 0.03  # Boost de bonheur pour les visiteurs (+3%)
         self.entertainment_radius = 3  # Rayon d'animation
         self.detection_radius = 20  # Rayon pour détecter les visiteurs
         self.initial_x = x
         self.initial_y = y
-        self.path = []
+        self.path = PathCursor()
         self.is_moving = False
         self.move_progress = 0.0
         self.target_x = float(x)
@@ -970,12 +995,11 @@ class Mascot(Employee):
 
     def find_best_crowd_location(self, guests, queue_manager):
         """Trouver le meilleur endroit avec des visiteurs (priorise les files d'attente)"""
-        import random
 
-        DebugConfig.log('employees', f"Mascot {self.id} searching for crowds - {len(guests)} guests, queue_manager: {queue_manager is not None}")
+        DebugConfig.log('employees', "Mascot {} searching for crowds - {} guests, queue_manager: {}", self.id, len(guests), queue_manager is not None)
 
         # 70% chance de chercher dans les files d'attente
-        if random.random() < 0.7 and queue_manager:
+        if _rng.random() < 0.7 and queue_manager:
             # Chercher les files d'attente avec le plus de visiteurs
             best_queue = None
             max_visitors = 0
@@ -991,7 +1015,7 @@ class Mascot(Employee):
                 # Choisir une position au milieu de la file
                 middle_idx = len(best_queue.tiles) // 2
                 target_tile = best_queue.tiles[middle_idx]
-                DebugConfig.log('employees', f"Mascot {self.id} found queue with {max_visitors} visitors")
+                DebugConfig.log('employees', "Mascot {} found queue with {} visitors", self.id, max_visitors)
                 return (target_tile.x, target_tile.y)
 
         # 30% chance ou fallback: chercher sur les chemins avec beaucoup de visiteurs
@@ -1010,92 +1034,42 @@ class Mascot(Employee):
                 # Convertir la zone en position réelle
                 target_x = best_zone[0][0] * 2
                 target_y = best_zone[0][1] * 2
-                DebugConfig.log('employees', f"Mascot {self.id} found crowd at ({target_x}, {target_y}) with {best_zone[1]} visitors")
+                DebugConfig.log('employees', "Mascot {} found crowd at ({}, {}) with {} visitors", self.id, target_x, target_y, best_zone[1])
                 return (target_x, target_y)
 
-        DebugConfig.log('employees', f"Mascot {self.id} found NO crowds")
+        DebugConfig.log('employees', "Mascot {} found NO crowds", self.id)
         return None
 
     def start_moving_to_crowd(self, target_pos, grid):
         """Se déplacer vers une foule"""
-        from .pathfinding import astar
+        from . import pathfinding
+        from .movement import MASCOT
 
         mascot_pos = (int(self.x), int(self.y))
 
-        DebugConfig.log('employees', f"Mascot {self.id} at {mascot_pos} trying to reach crowd at {target_pos}")
+        DebugConfig.log('employees', "Mascot {} at {} trying to reach crowd at {}", self.id, mascot_pos, target_pos)
 
         # Mascots can walk on paths (TILE_WALK=1) and queue paths (TILE_QUEUE_PATH=5)
-        # We need custom pathfinding for this
-        path = self._find_path_for_mascot(grid, mascot_pos, target_pos)
+        path = pathfinding.get_path_cached(grid, mascot_pos, target_pos, profile=MASCOT)
 
         if path and len(path) > 1:
-            self.path = path[1:]
+            self.path = path.cursor(1)
             self.state = "moving_to_crowd"
             self.is_moving = False
             self.move_progress = 0.0
             self.target_hotspot = target_pos
-            DebugConfig.log('employees', f"Mascot {self.id} moving to crowd at {target_pos} - path length: {len(self.path)}")
+            DebugConfig.log('employees', "Mascot {} moving to crowd at {} - path length: {}", self.id, target_pos, len(self.path))
             return True
 
-        DebugConfig.log('employees', f"Mascot {self.id} couldn't find path to crowd at {target_pos} from {mascot_pos}")
+        DebugConfig.log('employees', "Mascot {} couldn't find path to crowd at {} from {}", self.id, target_pos, mascot_pos)
         return False
 
-    def _find_path_for_mascot(self, grid, start, goal):
-        """Pathfinding pour mascotte (chemins + files d'attente)"""
-        from .pathfinding import astar
-        import heapq
-
-        # A* modifié pour accepter TILE_WALK (1) et TILE_QUEUE_PATH (5)
-        open_set = []
-        heapq.heappush(open_set, (0, start))
-        came_from = {}
-        g_score = {start: 0}
-        f_score = {start: self._heuristic(start, goal)}
-
-        while open_set:
-            current = heapq.heappop(open_set)[1]
-
-            if current == goal:
-                # Reconstruct path
-                path = []
-                while current in came_from:
-                    path.append(current)
-                    current = came_from[current]
-                path.append(start)
-                return list(reversed(path))
-
-            # Check neighbors
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-
-                if not grid.in_bounds(neighbor[0], neighbor[1]):
-                    continue
-
-                tile_type = grid.get(neighbor[0], neighbor[1])
-                # Mascots can walk on paths (1) and queue paths (5)
-                if tile_type not in [1, 5]:
-                    continue
-
-                tentative_g = g_score[current] + 1
-
-                if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g
-                    f_score[neighbor] = tentative_g + self._heuristic(neighbor, goal)
-                    heapq.heappush(open_set, (f_score[neighbor], neighbor))
-
-        return None
-
-    def _heuristic(self, a, b):
-        """Manhattan distance heuristic"""
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
     def start_entertaining(self):
         """Commencer l'animation pour divertir les visiteurs"""
         self.state = "entertaining"
         self.entertainment_timer = 0.0
-        self.entertainment_duration = random.uniform(5.0, 8.0)
-        DebugConfig.log('employees', f"Mascot {self.id} started entertaining for {self.entertainment_duration:.1f}s")
+        self.entertainment_duration = _rng.uniform(5.0, 8.0)
+        DebugConfig.log('employees', "Mascot {} started entertaining for {:.1f}s", self.id, self.entertainment_duration)
 
     def update_nearby_guests(self, guests):
         """Mettre à jour la liste des visiteurs à proximité"""
@@ -1110,6 +1084,15 @@ class Mascot(Employee):
 
         return len(self.nearby_guests)
 
+    def timed_state_remaining(self):
+        """Animation in progress: time left at the current work rate"""
+        if self.state != "entertaining":
+            return None
+        rate = self._work_rate('mascot')
+        if rate <= 0.0:
+            return None
+        return (self.entertainment_duration - self.entertainment_timer) / rate
+
     def tick(self, dt: float):
         """Mise à jour de la mascotte"""
         self.salary_timer += dt
@@ -1123,16 +1106,16 @@ class Mascot(Employee):
             if efficiency_penalty >= 1.0:
                 if self.state in ["entertaining", "moving_to_crowd"]:
                     self.state = "idle"
-                    self.path = []
+                    self.path = PathCursor()
                     self.target_hotspot = None
-                    DebugConfig.log('employees', f"Mascot {self.id} on strike, stopped entertaining")
+                    DebugConfig.log('employees', "Mascot {} on strike, stopped entertaining", self.id)
                 return
 
         if self.state == "idle":
             self.search_timer += dt
             # Log only once per second to avoid spam
             if int(self.search_timer) != int(self.search_timer - dt):
-                DebugConfig.log('employees', f"Mascot {self.id} idle, search_timer: {self.search_timer:.2f}")
+                DebugConfig.log('employees', "Mascot {} idle, search_timer: {:.2f}", self.id, self.search_timer)
 
         elif self.state == "moving_to_crowd":
             self._update_movement_to_crowd(dt)
@@ -1144,7 +1127,7 @@ class Mascot(Employee):
             self.entertainment_timer += effective_dt
             if self.entertainment_timer >= self.entertainment_duration:
                 # Animation terminée, chercher une nouvelle foule
-                DebugConfig.log('employees', f"Mascot {self.id} finished entertaining")
+                DebugConfig.log('employees', "Mascot {} finished entertaining", self.id)
                 self.state = "idle"
                 self.entertainment_timer = 0.0
                 self.target_hotspot = None
@@ -1159,7 +1142,7 @@ class Mascot(Employee):
 
         # Move to next position
         if not self.is_moving:
-            next_pos = self.path.pop(0)
+            next_pos = self.path.advance()
             self.target_x = float(next_pos[0])
             self.target_y = float(next_pos[1])
             self.is_moving = True
@@ -1,10 +1,15 @@
 
-import json, pygame, math
+import json, os, pygame, math
 from pathlib import Path
 from . import assets
-from .map import MapGrid, TILE_WALK, TILE_GRASS, TILE_RIDE_ENTRANCE, TILE_RIDE_EXIT, TILE_RIDE_FOOTPRINT, TILE_QUEUE_PATH, TILE_SHOP_ENTRANCE, TILE_SHOP_FOOTPRINT, TILE_PARK_ENTRANCE, TILE_RESTROOM_FOOTPRINT, TILE_BIN
+from .map import MapGrid, TILE_WALK, TILE_GRASS, TILE_RIDE_ENTRANCE, TILE_RIDE_EXIT, TILE_RIDE_FOOTPRINT, TILE_QUEUE_PATH, TILE_SHOP_ENTRANCE, TILE_SHOP_FOOTPRINT, TILE_PARK_ENTRANCE, TILE_RESTROOM_FOOTPRINT, TILE_BIN, FLAG_BIN_PLACEABLE
 from . import pathfinding
+from .paths import PathCursor
 from .agents import Guest
+from .guest_store import GuestStateStore
+from .guest_pool import GuestPool
+from .entity_ids import EntityIdAllocator, EntityRegistry
+from .flow_fields import FlowFieldService, NearestFacilityField
 from .rides import Ride, RideDef, RideEntrance, RideExit
 from .shops import Shop, ShopDef, ShopEntrance
 from .restrooms import Restroom, RestroomDef
@@ -18,10 +23,16 @@ from .ui_parts.loan_modal import LoanModal
 from .ui_parts.stats_modal import StatsModal
 from .ui_parts.research_modal import ResearchBureauModal
 from .renderers.iso import IsoRenderer
+from .renderers.null import NullRenderer
 from .ui_parts.debug_menu import DebugMenu
 from .queue_v2 import QueueManagerV2
 from .serpent_queue import SerpentQueueManager, Direction, Movement, MovementType
 from .debug import DebugConfig
+from .rng import SimRandom
+from .events import guest_events, GuestEventType
+from .replay import InputRecorder, InputReplayer
+from .profiler import FrameProfiler
+from .scheduler import AgentScheduler
 from .litter import LitterManager, BinDef, DEFAULT_BIN, Litter
 from .salary_negotiation import SalaryNegotiationManager
 from .inventory import InventoryManager, ProductDef
@@ -34,15 +45,37 @@ from .ui_parts.notification_toast import NotificationToast
 from .ui_parts.notification_panel import NotificationPanel
 from .save_load import (SaveLoadManager, serialize_grid, serialize_ride, serialize_shop,
                          serialize_employee, serialize_guest, serialize_bin, serialize_litter,
-                         serialize_restroom)
+                         serialize_restroom, GUEST_REFERENCES)
 
 DATA = Path(__file__).resolve().parent / 'data'
 
+_rng = SimRandom.stream(SimRandom.ENGINE)
+
 class Game:
-    def __init__(self, save_slot: str = None, park_name: str = None):
+    # Guest states exposed to the weather
+    OUTDOOR_GUEST_STATES = frozenset(["wandering", "walking_to_queue", "walking_to_shop", "walking_to_ride",
+                                      "walking_to_bin", "walking_to_exit", "queuing"])
+
+    def __init__(self, save_slot: str = None, park_name: str = None, headless: bool = False, seed=None,
+                 map_size=(64, 64)):
+        # Headless mode: no window, no drawing - the simulation is driven with step(dt)
+        self.headless = headless
+
+        # Deterministic simulation: reseed every subsystem stream and start from empty path caches
+        self.seed = SimRandom.seed(seed)
+        pathfinding.clear_pathfinding_cache()
+        pathfinding.clear_pathfinding_queue()
+        self._subscribe_guest_events()
+        if headless:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
         pygame.init()
-        self.screen = pygame.display.set_mode((1280, 800))
-        pygame.display.set_caption('OpenPark — Oblique Mode')
+        if headless:
+            # Off-screen surface: keeps screen sizes valid for camera / particles code
+            self.screen = pygame.Surface((1280, 800))
+        else:
+            self.screen = pygame.display.set_mode((1280, 800))
+            pygame.display.set_caption('OpenPark — Oblique Mode')
         self.clock = pygame.time.Clock()
 
         # Save slot management
@@ -53,9 +86,13 @@ class Game:
         self.font = pygame.font.SysFont('Arial', 14)
 
         # Load HUD icons (16x16px miniature sprites)
-        self.hud_icons = self._load_hud_icons()
+        self.hud_icons = {} if headless else self._load_hud_icons()
 
-        self.grid = MapGrid(64, 64); self.economy = Economy()
+        self.grid = MapGrid(*map_size); self.economy = Economy()
+        self.flow_fields = FlowFieldService(self.grid)  # BFS distance / next-hop fields per destination
+        # Nearest facility of each category from every tile (multi-source BFS, updated incrementally)
+        self.facility_fields = {category: NearestFacilityField(self.grid) for category in ('food', 'drink', 'restroom')}
+        pathfinding.start_batch_solver(self.grid)  # Workers ready before the first burst of path requests
         self.queue_manager = QueueManagerV2()
         self.litter_manager = LitterManager(self.grid)  # Add litter management system with grid reference
         self.salary_negotiation_manager = SalaryNegotiationManager()  # Salary negotiation system
@@ -84,13 +121,24 @@ class Game:
 
         self.rides = []; self.shops = []; self.employees = []; self.restrooms = []; self.decorations = []
         # Guests will be spawned at park entrance
-        import random
         self.guests = []
+        self.guest_store = GuestStateStore()  # Needs / mood columns of the guests (vectorized decay)
+        self.guest_pool = GuestPool(self.guest_store)  # Recycled Guest instances
+        # Entity ids (monotonic, saved with the park) and id -> object registries
+        self.entity_ids = EntityIdAllocator()
+        self.guest_registry = EntityRegistry(self.entity_ids)
+        self.ride_registry = EntityRegistry(self.entity_ids)
+        self.shop_registry = EntityRegistry(self.entity_ids)
+        self.restroom_registry = EntityRegistry(self.entity_ids)
+        self.employee_registry = EntityRegistry(self.entity_ids)
         self.spr_cache = {}  # Sprite cache with zoom levels
         # Oblique tilt default at 10°
-        self.renderer = IsoRenderer(self.screen, self.font, default_proj[0], default_proj[1], oblique_tilt=default_tilt)
+        renderer_cls = NullRenderer if headless else IsoRenderer
+        self.renderer = renderer_cls(self.screen, self.font, default_proj[0], default_proj[1], oblique_tilt=default_tilt)
         self.proj_index = max(0, self.proj_presets.index(default_proj) if default_proj in self.proj_presets else 0)
-        self.debug_menu = DebugMenu(self.font, self.proj_presets, self.proj_index, oblique_tilt=default_tilt)
+        self.agent_scheduler = AgentScheduler()  # Guests / employees sleeping through timed states
+        self.profiler = FrameProfiler()  # Per-phase timers for update()/draw() (toggled from the debug menu)
+        self.debug_menu = DebugMenu(self.font, self.proj_presets, self.proj_index, oblique_tilt=default_tilt, profiler=self.profiler)
         self.toolbar = Toolbar(self.font, self.ride_defs, self.shop_defs, self.employee_defs, self.bin_defs, self.restroom_defs, self.decoration_defs)
 
         # Negotiation modal
@@ -131,7 +179,11 @@ class Game:
         self.notified_broken_rides = set()  # Track which rides we've notified about
 
         # Load HUD sprites (20x20)
-        self._load_hud_sprites()
+        if headless:
+            self.weather_sprites = {}
+            self.rd_sprite = None
+        else:
+            self._load_hud_sprites()
 
         self.dragging=False; self.drag_start=(0,0); self.cam_start=(0,0)
         self.path_dragging=False; self.last_path_pos=None
@@ -169,6 +221,35 @@ class Game:
         self.game_speed = 1.0  # Current game speed (0=paused, 1=normal, 2=fast, 3=very fast)
         self.game_speed_before_modal = None  # Saved game speed before modal pause
 
+        # Fixed-timestep simulation clock (logic runs at sim_tick_rate Hz, rendering at display rate)
+        self.sim_tick_rate = time_config.get('sim_tick_rate', 20)  # Logic updates per game-second
+        self.sim_dt = 1.0 / self.sim_tick_rate  # Game seconds simulated by one update()
+        self.sim_accumulator = 0.0  # Game seconds waiting to be simulated
+        self.sim_tick = 0  # Number of fixed steps simulated since game start
+        self.max_sim_steps_per_frame = 8  # Spiral-of-death guard for slow frames
+        self.turbo_speed_threshold = 10.0  # game_speed from which turbo mode kicks in (x10-x100)
+        self.turbo_frame_budget = 0.05  # Real seconds of simulation allowed per displayed frame in turbo
+        self.turbo_draw_interval = 0.25  # Real seconds between two drawn frames in turbo
+        self._turbo_draw_timer = 0.0
+        self.render_alpha = 1.0  # Interpolation factor between the last two simulated states
+        self._prev_render_positions = {}  # id(entity) -> (x, y) before the last simulated step
+
+        # Simulation level of detail: guests outside the camera view tick every sim_lod_interval
+        # steps (with the whole skipped time) and move tile by tile without interpolation
+        self.sim_lod_enabled = True
+        self.sim_lod_interval = 4  # Fixed steps between two ticks of an off-screen guest
+        self.sim_lod_margin = 2  # Tiles around the viewport still simulated at full detail
+        self.sim_view_box = None  # (x0, y0, x1, y1) grid box simulated at full detail, None = everything
+
+        # Input recording / replay (player inputs logged with the sim tick they apply to)
+        self.input_recorder = InputRecorder(self.seed)
+        self.input_replayer = None
+        self._recorded_speed = self.game_speed
+
+        # Path requests (wandering guests) solved within a time budget per tick
+        self.path_budget_ms = 2.0
+        self.path_replay_count = None  # Count recorded for the current tick when replaying
+
         # Calendar constants - loaded from objects.json
         self.DAYS_IN_MONTH = time_config.get('days_in_month', [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
         self.MONTH_NAMES = time_config.get('month_names', ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
@@ -208,7 +289,8 @@ class Game:
             self.renderer.camera.x = entrance_world_x + self.renderer.origin[0] - screen_center_x
             self.renderer.camera.y = entrance_world_y + self.renderer.origin[1] - screen_entrance_y
 
-            DebugConfig.log('engine', f"Camera centered on park entrance at grid ({gx}, {gy})")
+            DebugConfig.log('engine', "Camera centered on park entrance at grid ({}, {})", gx, gy)
+        self.sim_view_box = self._camera_view_box()
 
         # No test objects - let the game start normally
 
@@ -423,28 +505,28 @@ class Game:
         self.queue_manager.update_queue_system(self.grid)
         
         # Connect queues to rides based on proximity to entrances
-        DebugConfig.log('engine', f"Connecting queues to rides, found {len(self.rides)} rides")
+        DebugConfig.log('engine', "Connecting queues to rides, found {} rides", len(self.rides))
         for queue_path in self.queue_manager.queue_paths:
             # Always check connections (even if already connected, to handle ride moves/deletions)
             if queue_path.connected_ride:
-                DebugConfig.log('engine', f"Queue path already connected to {queue_path.connected_ride.defn.name}, verifying connection")
+                DebugConfig.log('engine', "Queue path already connected to {}, verifying connection", queue_path.connected_ride.defn.name)
             else:
-                DebugConfig.log('engine', f"Checking unconnected queue path with {len(queue_path.tiles)} tiles")
+                DebugConfig.log('engine', "Checking unconnected queue path with {} tiles", len(queue_path.tiles))
 
             # Clear existing connection to re-establish
             queue_path.connected_ride = None
 
             # Find the closest ride entrance
             for ride in self.rides:
-                DebugConfig.log('engine', f"Checking ride {ride.defn.name}")
+                DebugConfig.log('engine', "Checking ride {}", ride.defn.name)
                 if ride.entrance:
                     entrance_pos = (ride.entrance.x, ride.entrance.y)
-                    DebugConfig.log('engine', f"Ride {ride.defn.name} has entrance at {entrance_pos}")
+                    DebugConfig.log('engine', "Ride {} has entrance at {}", ride.defn.name, entrance_pos)
                     # Check if queue path is connected to ride entrance
                     for tile in queue_path.tiles:
                         tile_pos = (tile.x, tile.y)
                         if tile_pos == entrance_pos:
-                            DebugConfig.log('engine', f"Connecting queue at {tile_pos} to ride {ride.defn.name} (exact match)")
+                            DebugConfig.log('engine', "Connecting queue at {} to ride {} (exact match)", tile_pos, ride.defn.name)
                             self.queue_manager.connect_queue_to_ride(queue_path, ride)
                             break
 
@@ -454,7 +536,7 @@ class Game:
                             tile_pos = (tile.x, tile.y)
                             distance = abs(tile_pos[0] - entrance_pos[0]) + abs(tile_pos[1] - entrance_pos[1])
                             if distance == 1:  # Adjacent
-                                DebugConfig.log('engine', f"Connecting queue at {tile_pos} to ride {ride.defn.name} (adjacent)")
+                                DebugConfig.log('engine', "Connecting queue at {} to ride {} (adjacent)", tile_pos, ride.defn.name)
                                 self.queue_manager.connect_queue_to_ride(queue_path, ride)
                                 break
 
@@ -462,36 +544,34 @@ class Game:
                     if queue_path.connected_ride:
                         break
                 else:
-                    DebugConfig.log('engine', f"Ride {ride.defn.name} has no entrance")
+                    DebugConfig.log('engine', "Ride {} has no entrance", ride.defn.name)
     
     def _find_ride_for_guest(self, guest):
         """Find a ride for a guest to queue for"""
-        DebugConfig.log('engine', f"Looking for ride for guest {guest.id}")
+        DebugConfig.log('engine', "Looking for ride for guest {}", guest.id)
         # Look for rides with available queue space and connected queues
         # Randomize ride selection to avoid always choosing the same ride
-        import random
         available_rides = []
         for ride in self.rides:
             # Skip rides that the guest recently tried but found full
             if ride in guest.tried_rides:
-                DebugConfig.log('engine', f"Skipping ride {ride.defn.name} - guest {guest.id} tried recently (retry in {guest.tried_rides[ride]:.1f}s)")
+                DebugConfig.log('engine', "Skipping ride {} - guest {} tried recently (retry in {:.1f}s)", ride.defn.name, guest.id, guest.tried_rides[ride])
                 continue
 
-            DebugConfig.log('engine', f"Checking ride {ride.defn.name}")
+            DebugConfig.log('engine', "Checking ride {}", ride.defn.name)
             if ride.entrance and ride.exit:
-                DebugConfig.log('engine', f"Ride {ride.defn.name} has entrance and exit")
+                DebugConfig.log('engine', "Ride {} has entrance and exit", ride.defn.name)
                 queue_path = self.queue_manager.get_queue_for_ride(ride)
                 if queue_path and queue_path.can_enter():
                     DebugConfig.log('engine', "Queue found and can accept visitor")
                     # Pathfind to the entrance of the queue
                     queue_entrance = queue_path.get_entrance_position()
                     if queue_entrance:
-                        DebugConfig.log('engine', f"Queue entrance at {queue_entrance}")
-                        path = pathfinding.get_path_cached(self.grid, (guest.grid_x, guest.grid_y), queue_entrance)
-                        if path:
+                        DebugConfig.log('engine', "Queue entrance at {}", queue_entrance)
+                        if self.flow_fields.distance((guest.grid_x, guest.grid_y), queue_entrance) >= 0:
                             # Add this ride to available rides list
-                            available_rides.append((ride, queue_path, queue_entrance, path))
-                            DebugConfig.log('engine', f"Ride {ride.defn.name} added to available rides")
+                            available_rides.append((ride, queue_path, queue_entrance))
+                            DebugConfig.log('engine', "Ride {} added to available rides", ride.defn.name)
                         else:
                             DebugConfig.log('engine', "No path found to queue entrance")
                     else:
@@ -499,51 +579,51 @@ class Game:
                 else:
                     DebugConfig.log('engine', "No queue or queue cannot accept visitor")
             else:
-                DebugConfig.log('engine', f"Ride {ride.defn.name} missing entrance or exit")
+                DebugConfig.log('engine', "Ride {} missing entrance or exit", ride.defn.name)
         
         # Select ride based on guest preferences and availability
         if available_rides:
             # Score rides based on guest preferences
             scored_rides = []
-            for ride, queue_path, queue_entrance, path in available_rides:
+            for ride, queue_path, queue_entrance in available_rides:
                 # Calculate preference score (0-1, higher is better)
                 thrill_score = 1.0 - abs(guest.thrill_preference - ride.defn.thrill)
                 nausea_score = 1.0 - abs(guest.nausea_tolerance - ride.defn.nausea)
                 preference_score = (thrill_score + nausea_score) / 2.0
                 
                 # Add some randomness to avoid always choosing the same ride
-                random_factor = random.uniform(0.8, 1.2)
+                random_factor = _rng.uniform(0.8, 1.2)
                 final_score = preference_score * random_factor
                 
-                scored_rides.append((final_score, ride, queue_path, queue_entrance, path))
-                DebugConfig.log('engine', f"Ride {ride.defn.name} scored {final_score:.2f} for guest {guest.id} (thrill: {thrill_score:.2f}, nausea: {nausea_score:.2f})")
+                scored_rides.append((final_score, ride, queue_path, queue_entrance))
+                DebugConfig.log('engine', "Ride {} scored {:.2f} for guest {} (thrill: {:.2f}, nausea: {:.2f})", ride.defn.name, final_score, guest.id, thrill_score, nausea_score)
             
             # Select the ride with the highest score
             scored_rides.sort(key=lambda x: x[0], reverse=True)
-            selected_score, selected_ride, queue_path, queue_entrance, path = scored_rides[0]
+            selected_score, selected_ride, queue_path, queue_entrance = scored_rides[0]
             
-            guest.path = path[1:]
+            guest.path = self.flow_fields.path((guest.grid_x, guest.grid_y), queue_entrance).cursor(1)
             guest.target_ride = selected_ride
             guest.target_queue = queue_path
             guest.state = "walking_to_queue"
-            DebugConfig.log('engine', f"Guest {guest.id} selected ride {selected_ride.defn.name} (score: {selected_score:.2f}), walking to queue entrance at {queue_entrance}")
+            DebugConfig.log('engine', "Guest {} selected ride {} (score: {:.2f}), walking to queue entrance at {}", guest.id, selected_ride.defn.name, selected_score, queue_entrance)
         else:
-            DebugConfig.log('engine', f"No available rides found for guest {guest.id}")
+            DebugConfig.log('engine', "No available rides found for guest {}", guest.id)
     
     def _handle_guest_boarding(self, guest):
         """Handle guest boarding a ride"""
-        DebugConfig.log('engine', f"Handling boarding for guest {guest.id}")
+        DebugConfig.log('engine', "Handling boarding for guest {}", guest.id)
         if self.queue_manager.can_visitor_board_ride(guest):
-            DebugConfig.log('engine', f"Guest {guest.id} can board ride")
+            DebugConfig.log('engine', "Guest {} can board ride", guest.id)
             # Board the ride
             if self.queue_manager.board_visitor_on_ride(guest):
-                DebugConfig.log('engine', f"Guest {guest.id} successfully boarded ride")
+                DebugConfig.log('engine', "Guest {} successfully boarded ride", guest.id)
                 guest.state = "riding"
                 # The ride will launch automatically when it reaches capacity
             else:
-                DebugConfig.log('engine', f"Guest {guest.id} failed to board ride")
+                DebugConfig.log('engine', "Guest {} failed to board ride", guest.id)
         else:
-            DebugConfig.log('engine', f"Guest {guest.id} cannot board ride")
+            DebugConfig.log('engine', "Guest {} cannot board ride", guest.id)
 
     def handle_events(self):
         placing = self.toolbar.active
@@ -557,11 +637,11 @@ class Game:
                 if result:
                     action, offer = result
                     if action == 'accept':
-                        self._handle_negotiation_response(offer, accept=True)
+                        self._input('negotiation', offer=offer, accept=True)
                     elif action == 'counter':
-                        self._handle_negotiation_response(offer, accept=False)
+                        self._input('negotiation', offer=offer, accept=False)
                     elif action == 'reject':
-                        self._handle_negotiation_response(0, accept=False)
+                        self._input('negotiation', offer=0, accept=False)
                 continue  # Don't process other events while modal is open
 
             # Inventory modal handling (priority over other inputs)
@@ -570,7 +650,9 @@ class Game:
                 continue  # Event consumed by inventory modal
 
             # Price modal handling (priority over other inputs)
+            prices_before = dict(self.pricing_manager.prices)
             if self.price_modal.handle_event(e, self.inventory_manager, self.pricing_manager, self.shops):
+                self._record_price_changes(prices_before)
                 continue  # Event consumed by price modal
 
             # Loan modal handling (priority over other inputs)
@@ -638,7 +720,7 @@ class Game:
                 elif e.key==pygame.K_SPACE:
                     # Toggle pause
                     self.game_speed = 1.0 if self.game_speed == 0 else 0
-                    DebugConfig.log('engine', f"Game speed: {'PAUSED' if self.game_speed == 0 else 'x1'}")
+                    DebugConfig.log('engine', "Game speed: {}", 'PAUSED' if self.game_speed == 0 else 'x1')
                 elif e.key==pygame.K_1:
                     self.game_speed = 1.0
                     DebugConfig.log('engine', "Game speed: x1")
@@ -648,19 +730,21 @@ class Game:
                 elif e.key==pygame.K_3:
                     self.game_speed = 3.0
                     DebugConfig.log('engine', "Game speed: x3")
+                elif e.key==pygame.K_4:
+                    self.game_speed = 10.0
+                    DebugConfig.log('engine', "Game speed: x10 (turbo)")
+                elif e.key==pygame.K_5:
+                    self.game_speed = 100.0
+                    DebugConfig.log('engine', "Game speed: x100 (turbo)")
 
                 # Park open/close toggle
                 elif e.key==pygame.K_o:
-                    self.park_open = not self.park_open
-                    if not self.park_open:
-                        self.park_just_closed = True  # Trigger evacuation
-                    status = "OPEN" if self.park_open else "CLOSED"
-                    DebugConfig.log('engine', f"Park is now {status}")
+                    self._input('park_open', value=not self.park_open)
 
                 # Inventory modal toggle
                 elif e.key==pygame.K_i:
                     self.inventory_modal.toggle()
-                    DebugConfig.log('engine', f"Inventory modal {'opened' if self.inventory_modal.visible else 'closed'}")
+                    DebugConfig.log('engine', "Inventory modal {}", 'opened' if self.inventory_modal.visible else 'closed')
 
                 # Save/Load controls
                 elif e.key==pygame.K_F5:
@@ -769,7 +853,7 @@ class Game:
                                 click_ratio = (e.pos[0] - slider_x) / slider_width
                                 click_ratio = max(0.0, min(1.0, click_ratio))
                                 new_fee = int(self.entrance_fee_slider_min + click_ratio * (self.entrance_fee_slider_max - self.entrance_fee_slider_min))
-                                self.set_entrance_fee(new_fee)
+                                self._input('entrance_fee', value=new_fee)
                                 continue
                             # Click outside panel closes it
                             else:
@@ -846,224 +930,13 @@ class Game:
                             # Fermer les sous-menus si clic ailleurs
                             self.toolbar.expanded_group = None
                             if self.grid.in_bounds(gx,gy):
-                                if placing=='walk_path':
-                                    if not self._is_on_ride(gx, gy):
-                                        self.grid.set(gx,gy,TILE_WALK)
-                                        self.path_dragging=True; self.last_path_pos=(gx,gy)
-                                        # Check shop and restroom connections when placing walk paths
-                                        self._update_shop_connections()
-                                        self._update_restroom_connections()
-                                elif placing=='queue_path':
-                                    if not self._is_on_ride(gx, gy):
-                                        # Place the queue tile
-                                        self.grid.set(gx,gy,TILE_QUEUE_PATH)
-
-                                        # Record the placement (no previous tile on initial click)
-                                        self.queue_manager.record_tile_placement(gx, gy)
-
-                                        self.path_dragging=True; self.last_path_pos=(gx,gy)
-                                        self.last_mouse_pos = e.pos
-                                elif placing.startswith('ride_') and self.ride_placement_mode is None:
-                                    rd=self.ride_defs.get(placing)
-                                    if rd:
-                                        # Calculate top-left position for centered placement
-                                        place_x, place_y = self._get_placement_position(gx, gy, rd.size[0], rd.size[1])
-                                        if self._can_place_ride(rd, place_x, place_y):
-                                            new_ride = Ride(rd, place_x, place_y)
-                                            self.rides.append(new_ride)
-                                            self.economy.add_expense(rd.build_cost)
-                                            # Mark the ride footprint on the map
-                                            self._mark_ride_footprint(new_ride)
-                                            # Force queue system update to connect nearby queues
-                                            self._update_queue_system()
-                                            # Enter entrance placement mode
-                                            self.ride_placement_mode = 'entrance'
-                                            self.selected_ride = new_ride
-                                            placing = 'place_entrance'
-                                elif placing.startswith('shop_'):
-                                    sd=self.shop_defs.get(placing)
-                                    if sd:
-                                        # Calculate top-left position for centered placement
-                                        place_x, place_y = self._get_placement_position(gx, gy, sd.size[0], sd.size[1])
-                                        if self._can_place_shop(sd, place_x, place_y):
-                                            new_shop = Shop(sd, place_x, place_y)
-                                            self.shops.append(new_shop)
-                                            self.economy.add_expense(sd.build_cost)
-                                            # Mark the shop footprint on the map
-                                            self._mark_shop_footprint(new_shop)
-                                            # Auto-create entrance on middle south tile
-                                            width, height = sd.size
-                                            entrance_x = place_x + width // 2
-                                            entrance_y = place_y + height - 1
-                                            entrance = ShopEntrance(sd.id, entrance_x, entrance_y, 'S')
-                                            new_shop.entrance = entrance
-                                            # Mark shop as connected since we validated walk path in _can_place_shop
-                                            new_shop.connected_to_path = True
-                                            DebugConfig.log('engine', f"Placed {sd.name} at ({place_x}, {place_y}) with auto south entrance at ({entrance_x}, {entrance_y})")
-                                elif self.ride_placement_mode == 'entrance' and self.selected_ride:
-                                    if self.selected_ride.can_place_entrance(gx, gy):
-                                        self.selected_ride.place_entrance(gx, gy)
-                                        self.grid.set(gx, gy, TILE_RIDE_ENTRANCE)
-                                        self.economy.add_expense(self.selected_ride.defn.entrance_cost)
-                                        # Update queue system to connect to this entrance
-                                        self._update_queue_system()
-                                        # Enter exit placement mode
-                                        self.ride_placement_mode = 'exit'
-                                elif self.ride_placement_mode == 'exit' and self.selected_ride:
-                                    if self.selected_ride.can_place_exit(gx, gy):
-                                        self.selected_ride.place_exit(gx, gy)
-                                        self.grid.set(gx, gy, TILE_RIDE_EXIT)
-                                        self.economy.add_expense(self.selected_ride.defn.exit_cost)
-                                        # Exit placement mode
-                                        self.ride_placement_mode = None
-                                        self.selected_ride = None
-                                elif placing.startswith('restroom_'):
-                                    # Handle restroom placement (like bins - adjacent to walk paths)
-                                    rd = self.restroom_defs.get(placing)
-                                    if rd:
-                                        # Calculate top-left position for centered placement
-                                        place_x, place_y = self._get_placement_position(gx, gy, rd.size[0], rd.size[1])
-                                        if self._can_place_restroom(rd, place_x, place_y):
-                                            # Check if restroom is adjacent to a walk path
-                                            if self._is_restroom_adjacent_to_path(rd, place_x, place_y):
-                                                new_restroom = Restroom(rd, place_x, place_y)
-                                                self.restrooms.append(new_restroom)
-                                                self.economy.add_expense(rd.build_cost)
-                                                # Mark the restroom footprint on the map
-                                                self._mark_restroom_footprint(new_restroom)
-                                                # Check path connection
-                                                self._check_restroom_path_connection(new_restroom)
-                                                DebugConfig.log('engine', f"Placed {rd.name} at ({place_x}, {place_y})")
-                                elif placing.startswith('deco_'):
-                                    # Handle decoration placement (only on grass)
-                                    dd = self.decoration_defs.get(placing)
-                                    if dd:
-                                        # Decorations are simple 1x1 objects placed only on grass
-                                        if self.grid.get(gx, gy) == TILE_GRASS:
-                                            new_deco = Decoration(dd, gx, gy)
-                                            self.decorations.append(new_deco)
-                                            self.economy.add_expense(dd.cost)
-                                            DebugConfig.log('engine', f"Placed {dd.name} decoration at ({gx}, {gy})")
-                                elif placing.startswith('employee_'):
-                                    # Handle employee placement
-                                    employee_def = self.employee_defs.get(placing)
-                                    if employee_def:
-                                        # Check placement restrictions based on employee type
-                                        can_place = False
-                                        if employee_def.type == 'security':
-                                            # Security guards can only be placed on paths
-                                            can_place = self.grid.get(gx, gy) == TILE_WALK
-                                        elif employee_def.type == 'maintenance':
-                                            # Maintenance workers can be placed on paths or grass
-                                            can_place = self.grid.get(gx, gy) in [TILE_WALK, TILE_GRASS]
-                                        elif employee_def.type == 'mascot':
-                                            # Mascots can be placed on paths or queue paths
-                                            can_place = self.grid.get(gx, gy) in [TILE_WALK, TILE_QUEUE_PATH]
-                                        else:  # engineer
-                                            # Engineers can be placed anywhere
-                                            can_place = True
-                                        
-                                        if can_place:
-                                            # Create appropriate employee type
-                                            if employee_def.type == 'engineer':
-                                                employee = Engineer(employee_def, gx, gy)
-                                            elif employee_def.type == 'maintenance':
-                                                employee = MaintenanceWorker(employee_def, gx, gy)
-                                                # Set placement type for maintenance worker
-                                                employee.set_placement_type(self.grid.get(gx, gy))
-                                            elif employee_def.type == 'security':
-                                                employee = SecurityGuard(employee_def, gx, gy)
-                                            elif employee_def.type == 'mascot':
-                                                employee = Mascot(employee_def, gx, gy)
-                                            else:
-                                                continue
-
-                                            # Set negotiation manager reference
-                                            employee.salary_negotiation_manager = self.salary_negotiation_manager
-
-                                            self.employees.append(employee)
-                                            self.economy.add_expense(employee_def.salary)  # Pay first hour
-                                            DebugConfig.log('engine', f"Placed {employee_def.name} at ({gx}, {gy})")
-                                elif placing.startswith('bin_'):
-                                    # Handle bin placement
-                                    bin_def = self.bin_defs.get(placing)
-                                    if bin_def:
-                                        # Bins must be placed on GRASS adjacent to WALK
-                                        if self.grid.get(gx, gy) == TILE_GRASS:
-                                            # Check if adjacent to a walk path
-                                            adjacent_to_walk = False
-                                            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                                                nx, ny = gx + dx, gy + dy
-                                                if self.grid.in_bounds(nx, ny) and self.grid.get(nx, ny) == TILE_WALK:
-                                                    adjacent_to_walk = True
-                                                    break
-                                            
-                                            if adjacent_to_walk:
-                                                # Check if there's already a bin here
-                                                existing_bin = self.litter_manager.get_bin_at(gx, gy)
-                                                if not existing_bin:
-                                                    bin_obj = self.litter_manager.add_bin(bin_def, gx, gy)
-                                                    if bin_obj:
-                                                        self.grid.set(gx, gy, TILE_BIN)
-                                                        self.economy.add_expense(bin_def.cost)
-                                                        DebugConfig.log('engine', f"Placed {bin_def.name} at ({gx}, {gy}) for ${bin_def.cost}")
-                                                else:
-                                                    DebugConfig.log('engine', f"Bin already exists at ({gx}, {gy})")
-                                            else:
-                                                DebugConfig.log('engine', f"Cannot place bin at ({gx}, {gy}) - not adjacent to walk path")
-                                        else:
-                                            DebugConfig.log('engine', f"Cannot place bin at ({gx}, {gy}) - must be on grass")
+                                placing = self._input('place', tool=placing, x=gx, y=gy)
+                                if placing=='queue_path':
+                                    self.last_mouse_pos = e.pos
                     elif e.button==3:
                         gx,gy=self.renderer.screen_to_grid(*e.pos); hover=(gx,gy)
                         if self.grid.in_bounds(gx,gy):
-                            # Check if clicking on a ride
-                            ride = self._get_ride_at_position(gx, gy)
-                            if ride:
-                                # Remove the ride and clear its footprint
-                                self._clear_ride_footprint(ride)
-                                self.rides.remove(ride)
-                                # Clear entrance and exit tiles
-                                if ride.entrance:
-                                    self.grid.set(ride.entrance.x, ride.entrance.y, TILE_GRASS)
-                                if ride.exit:
-                                    self.grid.set(ride.exit.x, ride.exit.y, TILE_GRASS)
-                                # Reset placement mode if this was the selected ride
-                                if self.selected_ride == ride:
-                                    self.ride_placement_mode = None
-                                    self.selected_ride = None
-                            # Check if clicking on a shop
-                            shop = self._get_shop_at_position(gx, gy)
-                            if shop:
-                                # Remove shop footprint
-                                self._clear_shop_footprint(shop)
-                                # Remove from shops list
-                                self.shops.remove(shop)
-                            # Check if clicking on a restroom
-                            restroom = self._get_restroom_at_position(gx, gy)
-                            if restroom:
-                                # Remove restroom footprint
-                                self._clear_restroom_footprint(restroom)
-                                # Remove from list
-                                self.restrooms.remove(restroom)
-                            # Check if clicking on an employee
-                            employee = self._get_employee_at_position(gx, gy)
-                            if employee:
-                                self.employees.remove(employee)
-                            # Check if clicking on a bin
-                            bin_obj = self.litter_manager.get_bin_at(gx, gy)
-                            if bin_obj:
-                                self.litter_manager.remove_bin(bin_obj)
-                                self.grid.set(gx, gy, TILE_GRASS)
-                                DebugConfig.log('engine', f"Removed bin at ({gx}, {gy})")
-                            else:
-                                # Check if clicking on a queue tile
-                                if self.grid.get(gx, gy) == TILE_QUEUE_PATH:
-                                    # Remove queue waypoint and reorient adjacent waypoints
-                                    self.queue_manager.remove_queue_waypoint(self.grid, gx, gy)
-                                    self.grid.set(gx,gy,TILE_GRASS)
-                                else:
-                                    # Regular tile clearing
-                                    self.grid.set(gx,gy,TILE_GRASS)
+                            self._input('remove', x=gx, y=gy)
                 elif e.type==pygame.MOUSEBUTTONUP:
                     if e.button==2: self.dragging=False
                     elif e.button==1:
@@ -1080,7 +953,8 @@ class Game:
                         drag_ratio = (e.pos[0] - slider_x) / slider_width
                         drag_ratio = max(0.0, min(1.0, drag_ratio))
                         new_fee = int(self.entrance_fee_slider_min + drag_ratio * (self.entrance_fee_slider_max - self.entrance_fee_slider_min))
-                        self.set_entrance_fee(new_fee)
+                        if new_fee != self.economy.park_entrance_fee:
+                            self._input('entrance_fee', value=new_fee)
                     elif self.dragging:
                         dx=e.pos[0]-self.drag_start[0]
                         dy=e.pos[1]-self.drag_start[1]
@@ -1089,22 +963,8 @@ class Game:
                     elif self.path_dragging and (placing=='walk_path' or placing=='queue_path'):
                         gx,gy=self.renderer.screen_to_grid(*e.pos)
                         if self.grid.in_bounds(gx,gy) and (gx,gy) != self.last_path_pos and not self._is_on_ride(gx, gy):
-                            if placing=='walk_path': 
-                                self.grid.set(gx,gy,TILE_WALK)
-                                self.last_path_pos=(gx,gy)
-                            elif placing=='queue_path':
-                                # Place queue tile during drag
-                                prev_pos = self.last_path_pos
-                                self.grid.set(gx,gy,TILE_QUEUE_PATH)
-
-                                # Record the placement and link to previous tile if dragging
-                                if prev_pos and self.grid.get(prev_pos[0], prev_pos[1]) == TILE_QUEUE_PATH:
-                                    self.queue_manager.record_tile_placement(gx, gy, prev_pos[0], prev_pos[1])
-                                else:
-                                    self.queue_manager.record_tile_placement(gx, gy)
-
-                                self.last_path_pos=(gx,gy)
-                                self.last_mouse_pos = e.pos
+                            self._input('drag_path', tool=placing, x=gx, y=gy, prev=self.last_path_pos)
+                            self.last_mouse_pos = e.pos
         # keyboard pan
         keys=pygame.key.get_pressed(); sp=600*self.clock.get_time()/1000.0
         if keys[pygame.K_a] or keys[pygame.K_LEFT]: self.renderer.camera.pan(-sp,0)
@@ -1114,6 +974,316 @@ class Game:
         mx,my=pygame.mouse.get_pos(); hover=self.renderer.screen_to_grid(mx,my)
         return True, placing, hover
 
+    # ==================== PLAYER INPUTS (recorded for replay) ====================
+
+    def _input(self, action, **params):
+        """Record a player input for the current sim tick and apply it"""
+        self._record_input(action, **params)
+        return self.apply_input(action, params)
+
+    def _record_input(self, action, **params):
+        """Record a player input that has already been applied"""
+        self.input_recorder.record(self.sim_tick, action, params)
+
+    def _record_price_changes(self, prices_before):
+        """Record the prices changed by the price modal"""
+        for product_id, price in self.pricing_manager.prices.items():
+            if prices_before.get(product_id) != price:
+                self._record_input('price', product_id=product_id, value=price)
+
+    def apply_input(self, action, params):
+        """Apply a player input (live or replayed)
+
+        Recorded actions: place, drag_path, remove, speed, view, path_budget, park_open,
+        entrance_fee, price, negotiation. Inventory orders, loans and research are not recorded yet.
+        """
+        if action == 'place':
+            return self._place_at(params['tool'], params['x'], params['y'])
+        elif action == 'drag_path':
+            prev = params.get('prev')
+            self._drag_path_to(params['tool'], params['x'], params['y'], tuple(prev) if prev else None)
+        elif action == 'remove':
+            self._remove_at(params['x'], params['y'])
+        elif action == 'speed':
+            self.game_speed = params['value']
+            self._recorded_speed = self.game_speed
+        elif action == 'view':
+            # Camera view box: decides which guests are simulated at full detail
+            box = params['box']
+            self.sim_view_box = tuple(box) if box is not None else None
+        elif action == 'path_budget':
+            # Path requests solved within the frame budget at this tick (replays solve the same number)
+            self.path_replay_count = params['count']
+        elif action == 'park_open':
+            self.park_open = params['value']
+            if not self.park_open:
+                self.park_just_closed = True  # Trigger evacuation
+            status = "OPEN" if self.park_open else "CLOSED"
+            DebugConfig.log('engine', "Park is now {}", status)
+        elif action == 'entrance_fee':
+            self.set_entrance_fee(params['value'])
+        elif action == 'price':
+            self.pricing_manager.set_price(params['product_id'], params['value'])
+        elif action == 'negotiation':
+            self._handle_negotiation_response(params['offer'], accept=params['accept'])
+        else:
+            DebugConfig.log('engine', "Unknown input action: {}", action)
+        return None
+
+    def start_replay(self, replayer: InputReplayer):
+        """Replay recorded inputs (the game must have been created with replayer.seed)"""
+        if replayer.seed != self.seed:
+            raise ValueError(f"Replay seed {replayer.seed} does not match game seed {self.seed}")
+        self.input_replayer = replayer
+
+    def save_input_recording(self, path):
+        """Save the inputs recorded since the start of the game"""
+        return self.input_recorder.save(path)
+
+    def _place_at(self, placing, gx, gy):
+        """Apply a left click of the active tool on a grid tile (player input)
+
+        Returns:
+            The active placing mode (may switch to 'place_entrance' after placing a ride)
+        """
+        if placing=='walk_path':
+            if not self._is_on_ride(gx, gy):
+                self.grid.set(gx,gy,TILE_WALK)
+                self.path_dragging=True; self.last_path_pos=(gx,gy)
+                # Check shop and restroom connections when placing walk paths
+                self._update_shop_connections()
+                self._update_restroom_connections()
+        elif placing=='queue_path':
+            if not self._is_on_ride(gx, gy):
+                # Place the queue tile
+                self.grid.set(gx,gy,TILE_QUEUE_PATH)
+
+                # Record the placement (no previous tile on initial click)
+                self.queue_manager.record_tile_placement(gx, gy)
+
+                self.path_dragging=True; self.last_path_pos=(gx,gy)
+        elif placing.startswith('ride_') and self.ride_placement_mode is None:
+            rd=self.ride_defs.get(placing)
+            if rd:
+                # Calculate top-left position for centered placement
+                place_x, place_y = self._get_placement_position(gx, gy, rd.size[0], rd.size[1])
+                if self._can_place_ride(rd, place_x, place_y):
+                    new_ride = Ride(rd, place_x, place_y)
+                    self.rides.append(new_ride)
+                    self.ride_registry.add(new_ride)
+                    self.economy.add_expense(rd.build_cost)
+                    # Mark the ride footprint on the map
+                    self._mark_ride_footprint(new_ride)
+                    # Force queue system update to connect nearby queues
+                    self._update_queue_system()
+                    # Enter entrance placement mode
+                    self.ride_placement_mode = 'entrance'
+                    self.selected_ride = new_ride
+                    placing = 'place_entrance'
+        elif placing.startswith('shop_'):
+            sd=self.shop_defs.get(placing)
+            if sd:
+                # Calculate top-left position for centered placement
+                place_x, place_y = self._get_placement_position(gx, gy, sd.size[0], sd.size[1])
+                if self._can_place_shop(sd, place_x, place_y):
+                    new_shop = Shop(sd, place_x, place_y)
+                    self.shops.append(new_shop)
+                    self.shop_registry.add(new_shop)
+                    self.economy.add_expense(sd.build_cost)
+                    # Mark the shop footprint on the map
+                    self._mark_shop_footprint(new_shop)
+                    # Auto-create entrance on middle south tile
+                    width, height = sd.size
+                    entrance_x = place_x + width // 2
+                    entrance_y = place_y + height - 1
+                    entrance = ShopEntrance(sd.id, entrance_x, entrance_y, 'S')
+                    new_shop.entrance = entrance
+                    # Mark shop as connected since we validated walk path in _can_place_shop
+                    new_shop.connected_to_path = True
+                    DebugConfig.log('engine', "Placed {} at ({}, {}) with auto south entrance at ({}, {})", sd.name, place_x, place_y, entrance_x, entrance_y)
+        elif self.ride_placement_mode == 'entrance' and self.selected_ride:
+            if self.selected_ride.can_place_entrance(gx, gy):
+                self.selected_ride.place_entrance(gx, gy)
+                self.grid.set(gx, gy, TILE_RIDE_ENTRANCE)
+                self.economy.add_expense(self.selected_ride.defn.entrance_cost)
+                # Update queue system to connect to this entrance
+                self._update_queue_system()
+                # Enter exit placement mode
+                self.ride_placement_mode = 'exit'
+        elif self.ride_placement_mode == 'exit' and self.selected_ride:
+            if self.selected_ride.can_place_exit(gx, gy):
+                self.selected_ride.place_exit(gx, gy)
+                self.grid.set(gx, gy, TILE_RIDE_EXIT)
+                self.economy.add_expense(self.selected_ride.defn.exit_cost)
+                # Exit placement mode
+                self.ride_placement_mode = None
+                self.selected_ride = None
+        elif placing.startswith('restroom_'):
+            # Handle restroom placement (like bins - adjacent to walk paths)
+            rd = self.restroom_defs.get(placing)
+            if rd:
+                # Calculate top-left position for centered placement
+                place_x, place_y = self._get_placement_position(gx, gy, rd.size[0], rd.size[1])
+                if self._can_place_restroom(rd, place_x, place_y):
+                    # Check if restroom is adjacent to a walk path
+                    if self._is_restroom_adjacent_to_path(rd, place_x, place_y):
+                        new_restroom = Restroom(rd, place_x, place_y)
+                        self.restrooms.append(new_restroom)
+                        self.restroom_registry.add(new_restroom)
+                        self.economy.add_expense(rd.build_cost)
+                        # Mark the restroom footprint on the map
+                        self._mark_restroom_footprint(new_restroom)
+                        # Check path connection
+                        self._check_restroom_path_connection(new_restroom)
+                        DebugConfig.log('engine', "Placed {} at ({}, {})", rd.name, place_x, place_y)
+        elif placing.startswith('deco_'):
+            # Handle decoration placement (only on grass)
+            dd = self.decoration_defs.get(placing)
+            if dd:
+                # Decorations are simple 1x1 objects placed only on grass
+                if self.grid.get(gx, gy) == TILE_GRASS:
+                    new_deco = Decoration(dd, gx, gy)
+                    self.decorations.append(new_deco)
+                    self.economy.add_expense(dd.cost)
+                    DebugConfig.log('engine', "Placed {} decoration at ({}, {})", dd.name, gx, gy)
+        elif placing.startswith('employee_'):
+            # Handle employee placement
+            employee_def = self.employee_defs.get(placing)
+            if employee_def:
+                # Check placement restrictions based on employee type
+                can_place = False
+                if employee_def.type == 'security':
+                    # Security guards can only be placed on paths
+                    can_place = self.grid.get(gx, gy) == TILE_WALK
+                elif employee_def.type == 'maintenance':
+                    # Maintenance workers can be placed on paths or grass
+                    can_place = self.grid.get(gx, gy) in [TILE_WALK, TILE_GRASS]
+                elif employee_def.type == 'mascot':
+                    # Mascots can be placed on paths or queue paths
+                    can_place = self.grid.get(gx, gy) in [TILE_WALK, TILE_QUEUE_PATH]
+                else:  # engineer
+                    # Engineers can be placed anywhere
+                    can_place = True
+
+                if can_place:
+                    # Create appropriate employee type
+                    if employee_def.type == 'engineer':
+                        employee = Engineer(employee_def, gx, gy)
+                    elif employee_def.type == 'maintenance':
+                        employee = MaintenanceWorker(employee_def, gx, gy)
+                        # Set placement type for maintenance worker
+                        employee.set_placement_type(self.grid.get(gx, gy))
+                    elif employee_def.type == 'security':
+                        employee = SecurityGuard(employee_def, gx, gy)
+                    elif employee_def.type == 'mascot':
+                        employee = Mascot(employee_def, gx, gy)
+                    else:
+                        return placing
+
+                    # Set negotiation manager reference
+                    employee.salary_negotiation_manager = self.salary_negotiation_manager
+
+                    self.employees.append(employee)
+                    self.employee_registry.add(employee)
+                    self.economy.add_expense(employee_def.salary)  # Pay first hour
+                    DebugConfig.log('engine', "Placed {} at ({}, {})", employee_def.name, gx, gy)
+        elif placing.startswith('bin_'):
+            # Handle bin placement
+            bin_def = self.bin_defs.get(placing)
+            if bin_def:
+                # Bins must be placed on GRASS adjacent to WALK
+                if self.grid.get(gx, gy) == TILE_GRASS:
+                    # Adjacency to a walk path is kept in the tile flags
+                    if self.grid.has_flag(gx, gy, FLAG_BIN_PLACEABLE):
+                        # Check if there's already a bin here
+                        existing_bin = self.litter_manager.get_bin_at(gx, gy)
+                        if not existing_bin:
+                            bin_obj = self.litter_manager.add_bin(bin_def, gx, gy)
+                            if bin_obj:
+                                self.grid.set(gx, gy, TILE_BIN)
+                                self.economy.add_expense(bin_def.cost)
+                                DebugConfig.log('engine', "Placed {} at ({}, {}) for ${}", bin_def.name, gx, gy, bin_def.cost)
+                        else:
+                            DebugConfig.log('engine', "Bin already exists at ({}, {})", gx, gy)
+                    else:
+                        DebugConfig.log('engine', "Cannot place bin at ({}, {}) - not adjacent to walk path", gx, gy)
+                else:
+                    DebugConfig.log('engine', "Cannot place bin at ({}, {}) - must be on grass", gx, gy)
+        return placing
+
+    def _remove_at(self, gx, gy):
+        """Apply a right click (demolish) on a grid tile (player input)"""
+        # Check if clicking on a ride
+        ride = self._get_ride_at_position(gx, gy)
+        if ride:
+            # Remove the ride and clear its footprint
+            self._clear_ride_footprint(ride)
+            self.rides.remove(ride)
+            self.ride_registry.remove(ride)
+            # Clear entrance and exit tiles
+            if ride.entrance:
+                self.grid.set(ride.entrance.x, ride.entrance.y, TILE_GRASS)
+            if ride.exit:
+                self.grid.set(ride.exit.x, ride.exit.y, TILE_GRASS)
+            # Reset placement mode if this was the selected ride
+            if self.selected_ride == ride:
+                self.ride_placement_mode = None
+                self.selected_ride = None
+        # Check if clicking on a shop
+        shop = self._get_shop_at_position(gx, gy)
+        if shop:
+            # Remove shop footprint
+            self._clear_shop_footprint(shop)
+            # Remove from shops list
+            self.shops.remove(shop)
+            self.shop_registry.remove(shop)
+        # Check if clicking on a restroom
+        restroom = self._get_restroom_at_position(gx, gy)
+        if restroom:
+            # Remove restroom footprint
+            self._clear_restroom_footprint(restroom)
+            # Remove from list
+            self.restrooms.remove(restroom)
+            self.restroom_registry.remove(restroom)
+        # Check if clicking on an employee
+        employee = self._get_employee_at_position(gx, gy)
+        if employee:
+            self.agent_scheduler.wake(employee)
+            self.employees.remove(employee)
+            self.employee_registry.remove(employee)
+        # Check if clicking on a bin
+        bin_obj = self.litter_manager.get_bin_at(gx, gy)
+        if bin_obj:
+            self.litter_manager.remove_bin(bin_obj)
+            self.grid.set(gx, gy, TILE_GRASS)
+            DebugConfig.log('engine', "Removed bin at ({}, {})", gx, gy)
+        else:
+            # Check if clicking on a queue tile
+            if self.grid.get(gx, gy) == TILE_QUEUE_PATH:
+                # Remove queue waypoint and reorient adjacent waypoints
+                self.queue_manager.remove_queue_waypoint(self.grid, gx, gy)
+                self.grid.set(gx,gy,TILE_GRASS)
+            else:
+                # Regular tile clearing
+                self.grid.set(gx,gy,TILE_GRASS)
+
+    def _drag_path_to(self, placing, gx, gy, prev_pos=None):
+        """Extend a walk/queue path being dragged from prev_pos to a new tile (player input)"""
+        if placing=='walk_path': 
+            self.grid.set(gx,gy,TILE_WALK)
+            self.last_path_pos=(gx,gy)
+        elif placing=='queue_path':
+            # Place queue tile during drag
+            self.grid.set(gx,gy,TILE_QUEUE_PATH)
+
+            # Record the placement and link to previous tile if dragging
+            if prev_pos and self.grid.get(prev_pos[0], prev_pos[1]) == TILE_QUEUE_PATH:
+                self.queue_manager.record_tile_placement(gx, gy, prev_pos[0], prev_pos[1])
+            else:
+                self.queue_manager.record_tile_placement(gx, gy)
+
+            self.last_path_pos=(gx,gy)
+
     def _get_placement_position(self, hover_x, hover_y, width, height):
         """
         Calculate top-left corner position for centered placement
@@ -1190,7 +1360,7 @@ class Game:
             if self.grid.in_bounds(x, entrance_y - 1):
                 self.grid.set(x, entrance_y - 1, TILE_WALK)
 
-        DebugConfig.log('engine', f"Park entrance created at {self.park_entrance} (width: {self.entrance_width} tiles)")
+        DebugConfig.log('engine', "Park entrance created at {} (width: {} tiles)", self.park_entrance, self.entrance_width)
 
     def _calculate_spawn_rate(self):
         """Calculate guest spawn rate based on entrance fee (progressive system)
@@ -1214,7 +1384,7 @@ class Game:
         """Set park entrance fee and recalculate spawn rate"""
         self.economy.set_entrance_fee(amount)
         self.guest_spawn_rate = self._calculate_spawn_rate()
-        DebugConfig.log('engine', f"Entrance fee set to ${amount}, spawn rate: {self.guest_spawn_rate:.1f}s")
+        DebugConfig.log('engine', "Entrance fee set to ${}, spawn rate: {:.1f}s", amount, self.guest_spawn_rate)
 
     def _spawn_guests_at_entrance(self, dt):
         """Spawn guests at park entrance at regular intervals"""
@@ -1233,50 +1403,94 @@ class Game:
         combined_multiplier = weather_multiplier * research_spawn_mult
         effective_spawn_rate = self.guest_spawn_rate / combined_multiplier if combined_multiplier > 0 else self.guest_spawn_rate
 
-        # Spawn a new guest when timer exceeds spawn rate
-        if self.guest_spawn_timer >= effective_spawn_rate:
-            self.guest_spawn_timer = 0.0  # Reset timer
+        # Spawn new guests while the timer exceeds spawn rate (catch up on large dt)
+        while self.guest_spawn_timer >= effective_spawn_rate:
+            self.guest_spawn_timer -= effective_spawn_rate  # Keep the remainder for the next spawn
+            self._spawn_guest()
 
-            # Spawn guest at entrance position (with slight random offset for variety)
-            import random
-            offset_x = random.uniform(-1.5, 1.5)  # Spread guests across entrance width
-            spawn_x = self.park_entrance[0] + offset_x
-            spawn_y = self.park_entrance[1]
+    def _spawn_guest(self):
+        """Spawn one guest at the park entrance (if they can afford the entrance fee)"""
+        # Spawn guest at entrance position (with slight random offset for variety)
+        offset_x = _rng.uniform(-1.5, 1.5)  # Spread guests across entrance width
+        spawn_x = self.park_entrance[0] + offset_x
+        spawn_y = self.park_entrance[1]
 
-            # Create potential guest and check if they can afford entrance fee
-            new_guest = Guest(spawn_x, spawn_y)
+        # Apply research bonuses
+        base_satisfaction_bonus = self.research_bureau.get_modifier('base_satisfaction')
+        visitor_budget_mult = self.research_bureau.get_modifier('visitor_budget_multiplier')
 
-            # Apply research bonuses
-            base_satisfaction_bonus = self.research_bureau.get_modifier('base_satisfaction')
-            visitor_budget_mult = self.research_bureau.get_modifier('visitor_budget_multiplier')
+        # Check if guest can afford entrance fee before building them (a refused arrival costs one draw)
+        budget = int(Guest.draw_budget() * visitor_budget_mult)
+        entrance_fee = self.economy.park_entrance_fee
 
+        if budget >= entrance_fee:
+            # Guest can afford - deduct entrance fee and spawn them
+            new_guest = self.guest_pool.acquire(spawn_x, spawn_y, budget)
             new_guest.satisfaction += base_satisfaction_bonus
-            new_guest.budget = int(new_guest.budget * visitor_budget_mult)
-            new_guest.money = new_guest.budget  # Update money too
-
-            entrance_fee = self.economy.park_entrance_fee
-
-            # Check if guest can afford entrance fee
-            if new_guest.budget >= entrance_fee:
-                # Guest can afford - deduct entrance fee and spawn them
-                new_guest.money -= entrance_fee
-                new_guest.entry_time = self.game_time  # Record entry time for stay limit
-                self.economy.collect_entrance_fee(entrance_fee)
-                self.guests.append(new_guest)
-                self.guests_entered += 1
-
-                # Notify visitor milestones
-                if self.guests_entered in [1, 10, 25, 50, 100, 200, 500, 1000]:
-                    self._add_notification(
-                        NotificationType.SUCCESS,
-                        f"🎉 {self.guests_entered}ème visiteur ! Nouveau record"
-                    )
+            new_guest.money = budget - entrance_fee
+            new_guest.entry_time = self.game_time  # Record entry time for stay limit
+            self.economy.collect_entrance_fee(entrance_fee)
+            self._add_guest(new_guest)
+            self.guests_entered += 1
+
+            # Notify visitor milestones
+            if self.guests_entered in [1, 10, 25, 50, 100, 200, 500, 1000]:
+                self._add_notification(
+                    NotificationType.SUCCESS,
+                    f"🎉 {self.guests_entered}ème visiteur ! Nouveau record"
+                )
 
-                DebugConfig.log('engine', f"Guest {new_guest.id} entered park (paid ${entrance_fee}, has ${new_guest.money} left). Total entered: {self.guests_entered}")
-            else:
-                # Guest cannot afford - refuse entry
-                self.economy.guests_refused += 1
-                DebugConfig.log('engine', f"Guest refused entry (budget ${new_guest.budget} < fee ${entrance_fee}). Total refused: {self.economy.guests_refused}")
+            DebugConfig.log('engine', "Guest {} entered park (paid ${}, has ${} left). Total entered: {}", new_guest.id, entrance_fee, new_guest.money, self.guests_entered)
+        else:
+            # Guest cannot afford - refuse entry
+            self.economy.guests_refused += 1
+            DebugConfig.log('engine', "Guest refused entry (budget ${} < fee ${}). Total refused: {}", budget, entrance_fee, self.economy.guests_refused)
+
+    def _add_guest(self, guest):
+        """Add a guest to the park (keeps guest.active_index for the O(1) removal)"""
+        guest.active_index = len(self.guests)
+        self.guests.append(guest)
+        self.guest_registry.add(guest)
+
+    def _process_path_requests(self):
+        """Solve queued path requests within the tick budget (deterministic for replays)
+
+        The number of requests answered depends on the machine when the budget
+        runs out or a batch is still on the workers: it is then recorded as an
+        input, and replays answer exactly that many requests at that tick (all
+        of them at other ticks).
+        """
+        if self.input_replayer is not None:
+            count, self.path_replay_count = self.path_replay_count, None
+            if count is None:
+                count = pathfinding.get_queue_size()
+            pathfinding.process_pathfinding_queue(self.grid, max_requests=count)
+            return
+        count = pathfinding.process_pathfinding_queue(self.grid, budget_ms=self.path_budget_ms)
+        if pathfinding.get_queue_size():
+            self._record_input('path_budget', count=count)
+
+    def _on_wander_path(self, guest, path):
+        """Path to a random destination for a wandering guest (from the pathfinding queue)"""
+        if guest.path_request is None:
+            return  # Left the park since the request
+        if path and (path[0], path[-1]) != guest.path_request[:2]:
+            return  # Recycled by the guest pool: waiting for another path
+        guest.path_request = None
+        if path and guest.state == "wandering" and not guest.path and (guest.grid_x, guest.grid_y) == path[0]:
+            guest.path = path.cursor(1)
+
+    def _remove_guest(self, guest):
+        """Remove a guest from the park in O(1) (the last guest takes its place) and recycle it"""
+        index = guest.active_index
+        last = self.guests.pop()
+        if last is not guest:
+            self.guests[index] = last
+            last.active_index = index
+        if guest.sleep_entry is not None:
+            self.agent_scheduler.wake(guest)
+        self.guest_registry.remove(guest)
+        self.guest_pool.release(guest)
 
     def _evacuate_park(self):
         """Force all guests to leave the park when it closes"""
@@ -1291,17 +1505,17 @@ class Game:
                 entrance_pos = self.park_entrance
 
                 # Find path to park entrance
-                path = pathfinding.get_path_cached(self.grid, guest_pos, entrance_pos)
+                path = self.flow_fields.path(guest_pos, entrance_pos)
 
                 if path and len(path) > 1:
-                    guest.path = path[1:]  # Skip current position
+                    guest.path = path.cursor(1)  # Skip current position
                 else:
                     # Can't find path, teleport to entrance
                     guest.x = float(entrance_pos[0])
                     guest.y = float(entrance_pos[1])
                     guest.grid_x = entrance_pos[0]
                     guest.grid_y = entrance_pos[1]
-                    guest.path = []
+                    guest.path = PathCursor()
 
                 # Set guest to leaving state
                 guest.state = "leaving"
@@ -1312,7 +1526,7 @@ class Game:
                 evacuation_count += 1
 
         if evacuation_count > 0:
-            DebugConfig.log('engine', f"Park closed - evacuating {evacuation_count} guests")
+            DebugConfig.log('engine', "Park closed - evacuating {} guests", evacuation_count)
 
     def _on_day_changed(self):
         """Called when game day changes - advance pending orders, process loans, track finances, update weather"""
@@ -1327,7 +1541,7 @@ class Game:
         self.weather_system.tick_day(self.game_day, self.game_month)
         new_weather = self.weather_system.current_weather
         weather_name = self.weather_system.get_weather_name()
-        DebugConfig.log('engine', f"Weather: {weather_name} (Spawn rate: {self.weather_system.get_spawn_rate_multiplier()*100:.0f}%)")
+        DebugConfig.log('engine', "Weather: {} (Spawn rate: {:.0f}%)", weather_name, self.weather_system.get_spawn_rate_multiplier()*100)
 
         # Notify weather change if different
         if new_weather != old_weather:
@@ -1353,7 +1567,7 @@ class Game:
             # Deduct monthly budget if it was the 1st of the month
             if self.game_day == 1 and self.research_bureau.monthly_budget > 0:
                 self.economy.add_expense(self.research_bureau.monthly_budget)
-                DebugConfig.log('engine', f"R&D Budget deducted: ${self.research_bureau.monthly_budget}")
+                DebugConfig.log('engine', "R&D Budget deducted: ${}", self.research_bureau.monthly_budget)
 
             # Check for categories that reached their points cap
             for category in self.research_bureau.categories.values():
@@ -1372,7 +1586,7 @@ class Game:
             success, payment = self.loan_manager.process_daily_payment()
             if success and payment > 0:
                 self.economy.add_expense(payment)
-                DebugConfig.log('engine', f"Loan payment: ${payment:.2f} (Days remaining: {self.loan_manager.active_loan.days_remaining})")
+                DebugConfig.log('engine', "Loan payment: ${:.2f} (Days remaining: {})", payment, self.loan_manager.active_loan.days_remaining)
 
         # Check if loan was just repaid
         if loan_was_active and not self.loan_manager.has_active_loan():
@@ -1383,7 +1597,7 @@ class Game:
 
         # Check for game over (90 consecutive days with negative cash)
         if self.economy.should_game_over():
-            DebugConfig.log('engine', f"GAME OVER: Cash has been negative for {self.economy.negative_cash_days} consecutive days")
+            DebugConfig.log('engine', "GAME OVER: Cash has been negative for {} consecutive days", self.economy.negative_cash_days)
             self._show_game_over()
 
         # Warn about prolonged negative cash
@@ -1418,7 +1632,7 @@ class Game:
             for order in delivered_orders:
                 product = self.inventory_manager.products.get(order.product_id)
                 product_name = product.name if product else order.product_id
-                DebugConfig.log('engine', f"Order delivered: {order.quantity}x {product_name} (${order.total_cost:.2f})")
+                DebugConfig.log('engine', "Order delivered: {}x {} (${:.2f})", order.quantity, product_name, order.total_cost)
                 self._add_notification(
                     NotificationType.SUCCESS,
                     f"Livraison : {order.quantity}x {product_name}"
@@ -1440,7 +1654,7 @@ class Game:
         if self.game_month == 1:  # January
             self.inventory_manager.apply_annual_inflation(self.game_year)
             inflation_percent = (self.inventory_manager.inflation_rate - 1.0) * 100
-            DebugConfig.log('engine', f"Annual inflation applied: {inflation_percent:.1f}% total")
+            DebugConfig.log('engine', "Annual inflation applied: {:.1f}% total", inflation_percent)
 
     def _handle_leaving_guests(self):
         """Handle guests wanting to leave the park (unhappy or satisfied)"""
@@ -1486,15 +1700,15 @@ class Game:
                     )
 
                 # Find path to park entrance
-                path = pathfinding.get_path_cached(self.grid, guest_pos, entrance_pos)
+                path = self.flow_fields.path(guest_pos, entrance_pos)
 
                 if path and len(path) > 1:
-                    guest.path = path[1:]  # Skip current position
+                    guest.path = path.cursor(1)  # Skip current position
                     guest.state = "leaving"
                     guest.target_ride = None
                     guest.target_shop = None
                     guest.target_queue = None
-                    DebugConfig.log('engine', f"Guest {guest.id} is leaving ({leave_reason})")
+                    DebugConfig.log('engine', "Guest {} is leaving ({})", guest.id, leave_reason)
                 else:
                     # Can't find path to entrance, teleport to entrance
                     guest.x = float(entrance_pos[0])
@@ -1502,28 +1716,30 @@ class Game:
                     guest.grid_x = entrance_pos[0]
                     guest.grid_y = entrance_pos[1]
                     guest.state = "leaving"
-                    guest.path = []
-                    DebugConfig.log('engine', f"Guest {guest.id} teleported to entrance (no path found)")
+                    guest.path = PathCursor()
+                    DebugConfig.log('engine', "Guest {} teleported to entrance (no path found)", guest.id)
 
             # Remove guests who have reached the entrance
             if guest.state == "leaving" and not guest.path and not guest.is_moving:
                 guests_to_remove.append(guest)
                 self.guests_left += 1
-                DebugConfig.log('engine', f"Guest {guest.id} left the park. Total left: {self.guests_left}")
+                DebugConfig.log('engine', "Guest {} left the park. Total left: {}", guest.id, self.guests_left)
 
         # Remove guests who have left
         for guest in guests_to_remove:
-            self.guests.remove(guest)
+            self._remove_guest(guest)
 
     def update(self, dt):
         # Calculate scaled delta time based on game speed
         # When paused (game_speed = 0), scaled_dt = 0, so entities don't move
         scaled_dt = dt * self.game_speed
+        prof = self.profiler
+        prof.begin()
 
-        # Update pathfinding system (cache aging and queue processing)
+        # Update pathfinding system (queue processing; the path cache follows the grid version)
         from . import pathfinding
-        pathfinding.tick_pathfinding()  # Age cache entries
-        pathfinding.process_pathfinding_queue(self.grid)  # Process queued path requests
+        self._process_path_requests()
+        prof.lap('update.pathfinding')
 
         # Update game time based on speed (calendar system)
         # 1 in-game month = MONTH_DURATION_MINUTES real minutes at speed x1
@@ -1560,7 +1776,7 @@ class Game:
 
             # Detect day change for inventory system (orders, inflation)
             if self.game_day != self._prev_game_day:
-                DebugConfig.log('engine', f"DAY CHANGED: {self._prev_game_day} → {self.game_day} ({self.MONTH_NAMES[self.game_month-1]} {self.game_year})")
+                DebugConfig.log('engine', "DAY CHANGED: {} → {} ({} {})", self._prev_game_day, self.game_day, self.MONTH_NAMES[self.game_month-1], self.game_year)
                 self._on_day_changed()
                 self._prev_game_day = self.game_day
 
@@ -1568,213 +1784,103 @@ class Game:
             if self.game_year != self._prev_game_year:
                 self._on_year_changed()
                 self._prev_game_year = self.game_year
+        prof.lap('update.calendar')
 
         # Handle park closure evacuation
         if self.park_just_closed:
             self._evacuate_park()
             self.park_just_closed = False
 
-        # Update weather particles (always use real dt, not scaled)
-        screen_w, screen_h = self.screen.get_size()
-        self.weather_particles.update(dt, self.weather_system.current_weather, screen_w, screen_h)
-
-        # Update notification toasts (always use real dt, not scaled)
-        self.notification_toast.update(dt)
-
         # Spawn guests at park entrance (only if park is open and not paused)
+        # Uses game time so that fast-forwarding does not change the number of visitors
         if self.game_speed > 0:
-            self._spawn_guests_at_entrance(dt)
+            self._spawn_guests_at_entrance(scaled_dt)
 
         # Handle unhappy guests leaving the park
         self._handle_leaving_guests()
+        prof.lap('update.spawn_leave')
 
         # Update queue system (with visitor preservation enabled, it's safe to call every frame)
         # This ensures queues stay connected to rides and visitor data is preserved
         self._update_queue_system()
+        prof.lap('update.queue_system')
 
         # Update litter manager
         self.litter_manager.tick(scaled_dt)
+        prof.lap('update.litter')
 
         # Update guests
-        pts=[(x,y) for y in range(self.grid.height) for x in range(self.grid.width) if self.grid.walkable(x,y)]
-        import random
         # DebugConfig.log('engine', f"Processing {len(self.guests)} guests")  # Too frequent
+        sched = self.agent_scheduler
+        sched.advance(scaled_dt)
+        lod_interval = self.sim_lod_interval
+        outdoor_states = self.OUTDOOR_GUEST_STATES
+        store = self.guest_store
+        pending_dt, outdoor = store.pending_dt, store.outdoor
+        lod_step = self.sim_tick % lod_interval
+        to_tick = []
         for g in self.guests:
-            # Track guest state before tick
-            previous_state = g.state
-            previous_shop = g.current_shop
-            previous_target_shop = g.target_shop
-
-            g.tick(scaled_dt)
-
-            # Apply weather satisfaction penalty for outdoor guests
-            # Only apply penalty if guest is in outdoor states (not in shops, rides, or restrooms)
-            outdoor_states = ["wandering", "walking_to_queue", "walking_to_shop", "walking_to_ride",
-                            "walking_to_bin", "walking_to_exit", "queuing"]
-            if g.state in outdoor_states:
-                weather_penalty = self.weather_system.get_satisfaction_penalty()
-                if weather_penalty < 0:  # Only apply if it's actually a penalty
-                    g.satisfaction += weather_penalty * (scaled_dt / 60.0)  # Convert per-minute to per-second
-
-            # Check if guest just finished shopping (state changed from SHOPPING to something else)
-            if previous_state == "shopping" and g.state != "shopping" and previous_shop:
-                # Guest finished shopping - check inventory and price acceptance
-                product_id = self.inventory_manager.get_product_for_shop(previous_shop.defn.id)
-
-                if product_id and self.inventory_manager.has_stock(product_id):
-                    # Stock available - check if guest accepts the price
-                    cost = self.inventory_manager.get_current_cost(product_id)
-                    purchase_probability = self.pricing_manager.get_purchase_probability(product_id, cost)
-
-                    import random
-                    if random.random() <= purchase_probability:
-                        # Guest accepts the price - complete sale
-                        self.inventory_manager.consume_stock(product_id)
-                        shop_price = self.pricing_manager.get_price(product_id, cost)
-                        self.economy.add_income(shop_price)
-                        remaining_stock = self.inventory_manager.get_stock(product_id)
-                        DebugConfig.log('engine', f"Guest {g.id} bought at {previous_shop.defn.name}, price: ${shop_price:.2f}, acceptance: {purchase_probability*100:.0f}%, stock: {remaining_stock}")
-
-                        # Check for low stock warning
-                        if remaining_stock == 0:
-                            product = self.inventory_manager.products.get(product_id)
-                            self._add_notification(
-                                NotificationType.CRITICAL,
-                                f"Stock épuisé : {product.name}",
-                                cooldown_key=f"stock_out_{product_id}",
-                                play_sound=True
-                            )
-                        elif remaining_stock <= 10:
-                            product = self.inventory_manager.products.get(product_id)
-                            self._add_notification(
-                                NotificationType.WARNING,
-                                f"Stock bas : {product.name} ({remaining_stock} restants)",
-                                cooldown_key=f"low_stock_{product_id}"
-                            )
-
-                        # Apply shopping satisfaction bonus
-                        g.apply_shopping_bonus()
-                    else:
-                        # Guest refuses - price too high
-                        g.satisfaction -= 15  # More penalty than out of stock
-                        shop_price = self.pricing_manager.get_price(product_id, cost)
-                        DebugConfig.log('engine', f"Guest {g.id} REFUSED to buy at {previous_shop.defn.name}, price ${shop_price:.2f} too high (acceptance: {purchase_probability*100:.0f}%), satisfaction -{15}")
-                elif product_id:
-                    # Out of stock - guest gets nothing, loses satisfaction
-                    g.satisfaction -= 10
-                    DebugConfig.log('engine', f"Guest {g.id} found {previous_shop.defn.name} OUT OF STOCK, satisfaction -{10}")
-                    product = self.inventory_manager.products.get(product_id)
-                    self._add_notification(
-                        NotificationType.CRITICAL,
-                        f"Stock épuisé : {product.name}",
-                        cooldown_key=f"stock_out_{product_id}",
-                        play_sound=True
-                    )
-                else:
-                    # Shop has no linked product (shouldn't happen, but handle gracefully)
-                    shop_price = previous_shop.defn.base_price
-                    self.economy.add_income(shop_price)
-                    DebugConfig.log('engine', f"Guest {g.id} finished shopping at {previous_shop.defn.name} (no product tracking), revenue: ${shop_price}")
-                    # Apply shopping satisfaction bonus
-                    g.apply_shopping_bonus()
+            if g.sleep_entry is not None:
+                if sched.is_asleep(g):
+                    continue  # Timed state (eating, shopping, riding...): nothing to do until wake-up
+                # Timer expired or state changed from outside: catch up the whole sleep at once
+                guest_dt = sched.wake(g)
+            elif self._guest_in_view(g):
+                g.lod_coarse = False
+                guest_dt = scaled_dt + g.lod_pending_dt
+                g.lod_pending_dt = 0.0
+            else:
+                # Off-screen: one tick every lod_interval steps (staggered by id) with the skipped time
+                g.lod_pending_dt += scaled_dt
+                if g.id % lod_interval != lod_step:
+                    continue
+                g.lod_coarse = True
+                guest_dt = g.lod_pending_dt
+                g.lod_pending_dt = 0.0
+            pending_dt[g._slot] = guest_dt
+            # Weather satisfaction penalty only for outdoor guests (not in shops, rides, or restrooms)
+            outdoor[g._slot] = 1.0 if g.state in outdoor_states else 0.0
+            to_tick.append((g, guest_dt))
+
+        # Needs, mood decay and weather penalty of every guest about to tick, in one pass:
+        # their decisions below read up-to-date needs
+        store.apply_decay(self.weather_system.get_satisfaction_penalty())
+
+        for g, guest_dt in to_tick:
+            g.tick(guest_dt)
+            sched.maybe_sleep(g, scaled_dt)
+
+        # Purchases, finished rides, joined queues, used bins (emitted by guests and rides)
+        guest_events.dispatch()
+        prof.lap('update.guests')
 
-            # Check if guest just finished eating (state changed from EATING to something else)
-            if previous_state == "eating" and g.state != "eating" and previous_target_shop:
-                # Guest finished eating - check inventory and price acceptance
-                product_id = self.inventory_manager.get_product_for_shop(previous_target_shop.defn.id)
-
-                if product_id and self.inventory_manager.has_stock(product_id):
-                    # Stock available - check if guest accepts the price
-                    cost = self.inventory_manager.get_current_cost(product_id)
-                    purchase_probability = self.pricing_manager.get_purchase_probability(product_id, cost)
-
-                    import random
-                    if random.random() <= purchase_probability:
-                        # Guest accepts the price - complete sale
-                        self.inventory_manager.consume_stock(product_id)
-                        food_price = self.pricing_manager.get_price(product_id, cost)
-                        self.economy.add_income(food_price)
-                        DebugConfig.log('engine', f"Guest {g.id} bought food at {previous_target_shop.defn.name}, price: ${food_price:.2f}, acceptance: {purchase_probability*100:.0f}%, stock: {self.inventory_manager.get_stock(product_id)}")
-                    else:
-                        # Guest refuses - price too high
-                        g.satisfaction -= 15
-                        food_price = self.pricing_manager.get_price(product_id, cost)
-                        DebugConfig.log('engine', f"Guest {g.id} REFUSED to buy food at {previous_target_shop.defn.name}, price ${food_price:.2f} too high (acceptance: {purchase_probability*100:.0f}%), satisfaction -{15}")
-                elif product_id:
-                    # Out of stock - guest gets nothing, loses satisfaction
-                    g.satisfaction -= 10
-                    DebugConfig.log('engine', f"Guest {g.id} found {previous_target_shop.defn.name} OUT OF STOCK (food), satisfaction -{10}")
-                else:
-                    # Shop has no linked product (shouldn't happen, but handle gracefully)
-                    food_price = previous_target_shop.defn.base_price
-                    self.economy.add_income(food_price)
-                    DebugConfig.log('engine', f"Guest {g.id} finished eating at {previous_target_shop.defn.name} (no product tracking), revenue: ${food_price}")
-
-            # Check if guest just finished drinking (state changed from DRINKING to something else)
-            if previous_state == "drinking" and g.state != "drinking" and previous_target_shop:
-                # Guest finished drinking - check inventory and price acceptance
-                product_id = self.inventory_manager.get_product_for_shop(previous_target_shop.defn.id)
-
-                if product_id and self.inventory_manager.has_stock(product_id):
-                    # Stock available - check if guest accepts the price
-                    cost = self.inventory_manager.get_current_cost(product_id)
-                    purchase_probability = self.pricing_manager.get_purchase_probability(product_id, cost)
-
-                    import random
-                    if random.random() <= purchase_probability:
-                        # Guest accepts the price - complete sale
-                        self.inventory_manager.consume_stock(product_id)
-                        drink_price = self.pricing_manager.get_price(product_id, cost)
-                        self.economy.add_income(drink_price)
-                        DebugConfig.log('engine', f"Guest {g.id} bought drink at {previous_target_shop.defn.name}, price: ${drink_price:.2f}, acceptance: {purchase_probability*100:.0f}%, stock: {self.inventory_manager.get_stock(product_id)}")
-                    else:
-                        # Guest refuses - price too high
-                        g.satisfaction -= 15
-                        drink_price = self.pricing_manager.get_price(product_id, cost)
-                        DebugConfig.log('engine', f"Guest {g.id} REFUSED to buy drink at {previous_target_shop.defn.name}, price ${drink_price:.2f} too high (acceptance: {purchase_probability*100:.0f}%), satisfaction -{15}")
-                elif product_id:
-                    # Out of stock - guest gets nothing, loses satisfaction
-                    g.satisfaction -= 10
-                    DebugConfig.log('engine', f"Guest {g.id} found {previous_target_shop.defn.name} OUT OF STOCK (drink), satisfaction -{10}")
-                else:
-                    # Shop has no linked product (shouldn't happen, but handle gracefully)
-                    drink_price = previous_target_shop.defn.base_price
-                    self.economy.add_income(drink_price)
-                    DebugConfig.log('engine', f"Guest {g.id} finished drinking at {previous_target_shop.defn.name} (no product tracking), revenue: ${drink_price}")
-
-            # Check if guest just finished riding (state changed from RIDING to EXITING)
-            if previous_state == "riding" and g.state == "exiting":
-                # Apply ride completion bonus
-                g.apply_ride_completion_bonus()
-
-            # Check if guest just joined a queue (state changed to QUEUING)
-            if g.state == "queuing" and previous_state != "queuing" and g.current_queue:
-                queue_length = len(g.current_queue.visitors)
-                g.apply_short_queue_bonus(queue_length)
-                g.apply_long_queue_penalty(queue_length)
-
-            # Check if guest successfully used bin (state changed from USING_BIN to WANDERING)
-            if previous_state == "using_bin" and g.state == "wandering" and not g.has_litter:
-                g.apply_bin_use_bonus()
-        
         # Update employees
         employees_to_remove = []
         for employee in self.employees:
-            employee.tick(scaled_dt)
+            if employee.sleep_entry is not None:
+                if sched.is_asleep(employee):
+                    continue  # Repairing, cleaning, entertaining: wakes up when the work is done
+                employee.tick(sched.wake(employee))
+            else:
+                employee.tick(scaled_dt)
+            sched.maybe_sleep(employee, scaled_dt)
             # Pay salary every hour (3600 seconds)
             if employee.salary_timer >= 3600.0:
                 self.economy.cash -= employee.defn.salary
                 employee.salary_timer = 0.0
-                DebugConfig.log('engine', f"Paid salary to {employee.defn.name}: ${employee.defn.salary}")
+                DebugConfig.log('engine', "Paid salary to {}: ${}", employee.defn.name, employee.defn.salary)
 
             # Check if employee has left the park
             if employee.state == "leaving" and not employee.path and not employee.is_moving:
                 employees_to_remove.append(employee)
-                DebugConfig.log('engine', f"Employee {employee.id} ({employee.defn.type}) left the park")
+                DebugConfig.log('engine', "Employee {} ({}) left the park", employee.id, employee.defn.type)
 
         # Remove employees who have left
         for employee in employees_to_remove:
+            self.agent_scheduler.wake(employee)
             self.employees.remove(employee)
+            self.employee_registry.remove(employee)
+        prof.lap('update.employees')
 
         # Assign maintenance workers to litter and gardening
         self._assign_maintenance_workers_to_litter()
@@ -1785,6 +1891,7 @@ class Game:
 
         # Assign mascots to crowds
         self._assign_mascots_to_crowds()
+        prof.lap('update.staff_assignment')
 
         # Apply employee effects on guests
         self._apply_employee_effects_on_guests()
@@ -1794,6 +1901,7 @@ class Game:
 
         # Apply park cleanliness bonus
         self._apply_park_cleanliness_bonus()
+        prof.lap('update.guest_effects')
 
         # Update rides
         for ride in self.rides:
@@ -1802,6 +1910,7 @@ class Game:
         # Update queue paths (check visitor movement)
         for queue_path in self.queue_manager.queue_paths:
             queue_path.tick(scaled_dt)
+        prof.lap('update.rides')
 
         # Assign engineers to broken rides
         self._assign_engineers_to_broken_rides()
@@ -1812,68 +1921,74 @@ class Game:
         # Check for salary negotiations
         # New negotiations start in March, but we check every month for ongoing ones
         self._check_and_trigger_salary_negotiations()
-        
+        prof.lap('update.breakdowns')
+
         # Debug: Check for stuck visitors in rides
-        for ride in self.rides:
-            if len(ride.current_visitors) > 0:
-                DebugConfig.log('engine', f"Ride {ride.defn.name} has {len(ride.current_visitors)} visitors: {[v.id for v in ride.current_visitors]}")
+        if DebugConfig.is_enabled('engine'):
+            for ride in self.rides:
+                if len(ride.current_visitors) > 0:
+                    DebugConfig.log('engine', "Ride {} has {} visitors: {}", ride.defn.name, len(ride.current_visitors), [v.id for v in ride.current_visitors])
         
         # Debug: Check rides status (only if debug enabled)
-        if DebugConfig.RIDES and len(self.rides) > 0:
-            DebugConfig.log('engine', f"Found {len(self.rides)} rides: {[r.defn.name for r in self.rides]}")
+        if DebugConfig.is_enabled('rides') and len(self.rides) > 0:
+            DebugConfig.log('engine', "Found {} rides: {}", len(self.rides), [r.defn.name for r in self.rides])
             for ride in self.rides:
-                DebugConfig.log('engine', f"Ride {ride.defn.name} at ({ride.x}, {ride.y}), broken: {ride.is_broken}, being_repaired: {ride.being_repaired}")
-        
+                DebugConfig.log('engine', "Ride {} at ({}, {}), broken: {}, being_repaired: {}", ride.defn.name, ride.x, ride.y, ride.is_broken, ride.being_repaired)
+        prof.lap('update.debug_logs')
+
         for g in self.guests:
             # PRIORITY: Handle litter first if timer expired and guest is in a "free" state
             # Allow litter dropping in wandering, walking_to_queue, walking_to_shop states
             if (g.has_litter and 
                 g.litter_hold_timer >= g.litter_hold_duration and
                 g.state in ["wandering", "walking_to_queue", "walking_to_shop"]):
-                DebugConfig.log('litter', f"Guest {g.id} litter hold timer expired ({g.litter_hold_timer:.1f}/{g.litter_hold_duration:.1f}), handling litter at ({g.grid_x}, {g.grid_y}) in state {g.state}")
+                DebugConfig.log('litter', "Guest {} litter hold timer expired ({:.1f}/{:.1f}), handling litter at ({}, {}) in state {}", g.id, g.litter_hold_timer, g.litter_hold_duration, g.grid_x, g.grid_y, g.state)
                 self._handle_guest_litter(g)
                 # After handling litter, skip other processing this tick to avoid immediate redirection
                 continue
             
-            if g.state == "wandering" and not g.path and pts:
-                goal=random.choice(pts); p=pathfinding.get_path_cached(self.grid,(g.grid_x,g.grid_y),goal)
-                if p: g.path=p[1:]
+            if g.state == "wandering" and not g.path and self.grid.walkable_index:
+                # Random destination: the path comes back from the queue, the guest waits for it meanwhile
+                if g.path_request is None:
+                    goal=self.grid.random_walkable(_rng)
+                    g.path_request=pathfinding.request_path_async(g,(g.grid_x,g.grid_y),goal,self._on_wander_path)
             elif g.state == "walking_to_queue":
                 # Guest is walking to queue, no additional pathfinding needed
-                DebugConfig.log('engine', f"Engine processing guest {g.id} walking to queue")
+                DebugConfig.log('engine', "Engine processing guest {} walking to queue", g.id)
                 pass
             elif g.state == "walking_to_shop":
                 # Guest is walking to shop, no additional pathfinding needed
-                DebugConfig.log('engine', f"Engine processing guest {g.id} walking to shop")
+                DebugConfig.log('engine', "Engine processing guest {} walking to shop", g.id)
                 pass
             elif g.state == "shopping":
                 # Guest is shopping, no additional processing needed
-                DebugConfig.log('engine', f"Engine processing guest {g.id} shopping")
+                DebugConfig.log('engine', "Engine processing guest {} shopping", g.id)
                 pass
             elif g.state == "wandering":
                 # Look for rides or shops to visit (only if not handling litter)
-                DebugConfig.log('engine', f"Engine processing wandering guest {g.id}")
+                DebugConfig.log('engine', "Engine processing wandering guest {}", g.id)
                 self._find_attraction_for_guest(g)
             elif g.state == "queuing":
                 # Check if guest can board the ride
-                DebugConfig.log('engine', f"Engine processing queuing guest {g.id}")
+                DebugConfig.log('engine', "Engine processing queuing guest {}", g.id)
                 # Check if guest is actually in a queue
-                DebugConfig.log('engine', f"Guest {g.id} queuing state check - current_queue: {g.current_queue}, visitors in queue: {len(g.current_queue.visitors) if g.current_queue else 'None'}, queue_position: {g.queue_position}")
+                DebugConfig.log('engine', "Guest {} queuing state check - current_queue: {}, visitors in queue: {}, queue_position: {}", g.id, g.current_queue, len(g.current_queue.visitors) if g.current_queue else 'None', g.queue_position)
                 if not g.current_queue:
-                    DebugConfig.log('engine', f"Guest {g.id} is in queuing state but has no current_queue, resetting to wandering")
+                    DebugConfig.log('engine', "Guest {} is in queuing state but has no current_queue, resetting to wandering", g.id)
                     g.state = "wandering"
                     g.current_queue = None
                     g.target_queue = None
                     g.target_ride = None
                 elif g not in g.current_queue.visitors:
-                    DebugConfig.log('engine', f"Guest {g.id} is in queuing state but not in queue visitors list, resetting to wandering")
+                    DebugConfig.log('engine', "Guest {} is in queuing state but not in queue visitors list, resetting to wandering", g.id)
                     g.state = "wandering"
                     g.current_queue = None
                     g.target_queue = None
                     g.target_ride = None
                 else:
                     self._handle_guest_boarding(g)
-        
+        prof.lap('update.guest_decisions')
+
         # Update rides
         for r in self.rides: r.tick(dt)
 
@@ -1885,6 +2000,205 @@ class Game:
                 f"R&D débloqué : {upgrade.name} ({upgrade.category})"
             )
             self.research_modal.last_unlocked_upgrade = None  # Clear after notification
+        prof.lap('update.rides_2')
+
+    # ==================== GUEST EVENTS ====================
+
+    def _subscribe_guest_events(self):
+        """Register the engine handlers on the shared guest event bus (new game)"""
+        guest_events.reset()
+        guest_events.subscribe(GuestEventType.PURCHASE_COMPLETED, self._on_purchase_completed)
+        guest_events.subscribe(GuestEventType.RIDE_COMPLETED, self._on_ride_completed)
+        guest_events.subscribe(GuestEventType.QUEUE_JOINED, self._on_queue_joined)
+        guest_events.subscribe(GuestEventType.BIN_USED, self._on_bin_used)
+
+    def _on_purchase_completed(self, event):
+        """Guest finished shopping, eating or drinking - check inventory and price acceptance"""
+        g = event.guest
+        shop = event.data['shop']
+        kind = event.data['kind']  # 'shop', 'food' or 'drink'
+        label = '' if kind == 'shop' else f" {kind}"
+        product_id = self.inventory_manager.get_product_for_shop(shop.defn.id)
+
+        if product_id and self.inventory_manager.has_stock(product_id):
+            # Stock available - check if guest accepts the price
+            cost = self.inventory_manager.get_current_cost(product_id)
+            purchase_probability = self.pricing_manager.get_purchase_probability(product_id, cost)
+
+            if _rng.random() <= purchase_probability:
+                # Guest accepts the price - complete sale
+                self.inventory_manager.consume_stock(product_id)
+                price = self.pricing_manager.get_price(product_id, cost)
+                self.economy.add_income(price)
+                remaining_stock = self.inventory_manager.get_stock(product_id)
+                DebugConfig.log('engine', "Guest {} bought{} at {}, price: ${:.2f}, acceptance: {:.0f}%, stock: {}", g.id, label, shop.defn.name, price, purchase_probability*100, remaining_stock)
+
+                if kind == 'shop':
+                    # Check for low stock warning
+                    if remaining_stock == 0:
+                        product = self.inventory_manager.products.get(product_id)
+                        self._add_notification(
+                            NotificationType.CRITICAL,
+                            f"Stock épuisé : {product.name}",
+                            cooldown_key=f"stock_out_{product_id}",
+                            play_sound=True
+                        )
+                    elif remaining_stock <= 10:
+                        product = self.inventory_manager.products.get(product_id)
+                        self._add_notification(
+                            NotificationType.WARNING,
+                            f"Stock bas : {product.name} ({remaining_stock} restants)",
+                            cooldown_key=f"low_stock_{product_id}"
+                        )
+
+                    # Apply shopping satisfaction bonus
+                    g.apply_shopping_bonus()
+            else:
+                # Guest refuses - price too high
+                g.satisfaction -= 15  # More penalty than out of stock
+                price = self.pricing_manager.get_price(product_id, cost)
+                DebugConfig.log('engine', "Guest {} REFUSED to buy{} at {}, price ${:.2f} too high (acceptance: {:.0f}%), satisfaction -{}", g.id, label, shop.defn.name, price, purchase_probability*100, 15)
+        elif product_id:
+            # Out of stock - guest gets nothing, loses satisfaction
+            g.satisfaction -= 10
+            DebugConfig.log('engine', "Guest {} found {} OUT OF STOCK{}, satisfaction -{}", g.id, shop.defn.name, f" ({kind})" if label else '', 10)
+            if kind == 'shop':
+                product = self.inventory_manager.products.get(product_id)
+                self._add_notification(
+                    NotificationType.CRITICAL,
+                    f"Stock épuisé : {product.name}",
+                    cooldown_key=f"stock_out_{product_id}",
+                    play_sound=True
+                )
+        else:
+            # Shop has no linked product (shouldn't happen, but handle gracefully)
+            price = shop.defn.base_price
+            self.economy.add_income(price)
+            DebugConfig.log('engine', "Guest {} finished {} at {} (no product tracking), revenue: ${}", g.id, {'shop': 'shopping', 'food': 'eating', 'drink': 'drinking'}[kind], shop.defn.name, price)
+            if kind == 'shop':
+                # Apply shopping satisfaction bonus
+                g.apply_shopping_bonus()
+
+    def _on_ride_completed(self, event):
+        event.guest.apply_ride_completion_bonus()
+
+    def _on_queue_joined(self, event):
+        queue_length = event.data['queue_length']
+        event.guest.apply_short_queue_bonus(queue_length)
+        event.guest.apply_long_queue_penalty(queue_length)
+
+    def _on_bin_used(self, event):
+        event.guest.apply_bin_use_bonus()
+
+    def is_turbo(self):
+        """True when fast-forwarding (x10-x100): many sim steps per frame, few drawn frames"""
+        return self.game_speed >= self.turbo_speed_threshold
+
+    def advance(self, frame_dt, max_steps=None):
+        """Advance the simulation by frame_dt real seconds using fixed steps
+
+        Real time is converted to game time (x game_speed) and consumed in
+        fixed sim_dt steps, so the cost of update() no longer depends on the
+        display frame rate and large speed multipliers do not make guests skip tiles.
+
+        Args:
+            frame_dt: Real seconds elapsed since the previous call
+            max_steps: Maximum number of fixed steps to run (None = self.max_sim_steps_per_frame,
+                       or as many as fit in turbo_frame_budget when in turbo mode)
+
+        Returns:
+            Number of fixed steps simulated
+        """
+        import time
+        deadline = None
+        if max_steps is None:
+            if self.is_turbo():
+                # Turbo: run as many fixed steps as the real-time budget allows
+                max_steps = float('inf')
+                deadline = time.perf_counter() + self.turbo_frame_budget
+            else:
+                max_steps = self.max_sim_steps_per_frame
+        # When paused the logic still runs at the tick rate (scaled_dt will be 0)
+        speed = max(self.game_speed, 1.0)
+        self.sim_accumulator += frame_dt * speed
+
+        steps = min(int(self.sim_accumulator / self.sim_dt + 1e-9), max_steps)
+        if deadline is not None:
+            # Unknown final step: render current positions without interpolation
+            self._prev_render_positions = {}
+        done = 0
+        while done < steps:
+            if self.input_replayer:
+                self.input_replayer.apply_due(self)
+            # Speed changes come from keys, dialogs and modals: record them when a step sees them
+            if self.game_speed != self._recorded_speed:
+                self._record_input('speed', value=self.game_speed)
+                self._recorded_speed = self.game_speed
+            # The camera changes which guests get the full simulation: same rule as the speed
+            if self.input_replayer is None:
+                view_box = self._camera_view_box()
+                if view_box != self.sim_view_box:
+                    self._input('view', box=list(view_box) if view_box else None)
+            if done == steps - 1 and deadline is None and not self.headless:
+                self._snapshot_render_positions()
+            # update() expects real seconds, game_speed scales them back to sim_dt
+            self.update(self.sim_dt / max(self.game_speed, 1.0))
+            self.sim_tick += 1
+            done += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        steps = done
+        self.sim_accumulator = max(0.0, self.sim_accumulator - steps * self.sim_dt)
+
+        # Drop the backlog if we could not keep up (avoid the spiral of death)
+        if self.sim_accumulator >= self.sim_dt:
+            self.sim_accumulator = self.sim_accumulator % self.sim_dt
+
+        self.render_alpha = self.sim_accumulator / self.sim_dt
+        return steps
+
+    def _camera_view_box(self):
+        """Grid box simulated at full detail (camera view + margin), None when the LOD is off"""
+        if not self.sim_lod_enabled:
+            return None
+        return self.renderer.visible_grid_bounds(self.sim_lod_margin)
+
+    def _guest_in_view(self, guest):
+        box = self.sim_view_box
+        return box is None or (box[0] <= guest.grid_x <= box[2] and box[1] <= guest.grid_y <= box[3])
+
+    def update_presentation(self, dt):
+        """Update purely visual systems once per displayed frame (real dt, not scaled)"""
+        # Update weather particles
+        screen_w, screen_h = self.screen.get_size()
+        self.weather_particles.update(dt, self.weather_system.current_weather, screen_w, screen_h)
+
+        # Update notification toasts
+        self.notification_toast.update(dt)
+
+    def _entity_render_position(self, entity):
+        """Current (non interpolated) render position of a guest or employee"""
+        if isinstance(entity, MaintenanceWorker):
+            return entity.get_render_position()
+        return (float(entity.x), float(entity.y))
+
+    def _snapshot_render_positions(self):
+        """Remember guest/employee positions before a simulation step (for interpolation)"""
+        positions = {}
+        for g in self.guests:
+            positions[id(g)] = (g.x, g.y)
+        for employee in self.employees:
+            positions[id(employee)] = self._entity_render_position(employee)
+        self._prev_render_positions = positions
+
+    def _interpolated_position(self, entity):
+        """Render position blended between the last two simulated states"""
+        cur_x, cur_y = self._entity_render_position(entity)
+        prev = self._prev_render_positions.get(id(entity))
+        if prev is None:
+            return (cur_x, cur_y)
+        a = self.render_alpha
+        return (prev[0] + (cur_x - prev[0]) * a, prev[1] + (cur_y - prev[1]) * a)
 
     def _is_in_toolbar_area(self, pos, screen_height):
         """Vérifier si la position est dans la zone de la toolbar ou ses sous-menus"""
@@ -1917,7 +2231,7 @@ class Game:
         if self.game_speed_before_modal is None:
             self.game_speed_before_modal = self.game_speed
             self.game_speed = 0  # Pause
-            DebugConfig.log('engine', f"Game paused for save dialog (was at speed {self.game_speed_before_modal})")
+            DebugConfig.log('engine', "Game paused for save dialog (was at speed {})", self.game_speed_before_modal)
 
         self.save_load_dialog_open = True
         self.save_load_mode = 'save'
@@ -1933,7 +2247,7 @@ class Game:
         if self.game_speed_before_modal is None:
             self.game_speed_before_modal = self.game_speed
             self.game_speed = 0  # Pause
-            DebugConfig.log('engine', f"Game paused for load dialog (was at speed {self.game_speed_before_modal})")
+            DebugConfig.log('engine', "Game paused for load dialog (was at speed {})", self.game_speed_before_modal)
 
         self.save_load_dialog_open = True
         self.save_load_mode = 'load'
@@ -1961,7 +2275,7 @@ class Game:
         if resume_game and self.game_speed_before_modal is not None and not self.negotiation_modal.visible:
             self.game_speed = self.game_speed_before_modal
             self.game_speed_before_modal = None
-            DebugConfig.log('engine', f"Game resumed at speed {self.game_speed}")
+            DebugConfig.log('engine', "Game resumed at speed {}", self.game_speed)
 
     def _can_place_shop(self, shop_def, x, y):
         """Vérifier si un shop peut être placé à la position donnée"""
@@ -2117,7 +2431,6 @@ class Game:
 
     def _find_attraction_for_guest(self, guest):
         """Trouver une attraction (ride ou shop) pour un visiteur"""
-        import random
 
         # ========== NEEDS-BASED PRIORITY SYSTEM ==========
         # Check if guest has urgent needs (prioritize over attractions)
@@ -2130,11 +2443,11 @@ class Game:
                 guest.target_restroom = restroom
                 guest.state = "walking_to_restroom"
                 urgency = "CRITICAL" if guest.bladder > 0.85 else "urgent"
-                DebugConfig.log('engine', f"Guest {guest.id} has {urgency} bladder need ({guest.bladder:.2f}), walking to restroom")
+                DebugConfig.log('engine', "Guest {} has {} bladder need ({:.2f}), walking to restroom", guest.id, urgency, guest.bladder)
                 return
             else:
                 # No restroom available, apply penalty
-                DebugConfig.log('engine', f"Guest {guest.id} needs restroom but none available!")
+                DebugConfig.log('engine', "Guest {} needs restroom but none available!", guest.id)
                 guest.modify_satisfaction(-0.05, "no restroom available")
 
         # Priority 2: Thirst (urgent if < 0.3)
@@ -2145,11 +2458,11 @@ class Game:
                 guest.target_shop = drink_shop
                 guest.state = "walking_to_drink"
                 urgency = "CRITICAL" if guest.thirst < 0.15 else "urgent"
-                DebugConfig.log('engine', f"Guest {guest.id} has {urgency} thirst ({guest.thirst:.2f}), walking to drink shop")
+                DebugConfig.log('engine', "Guest {} has {} thirst ({:.2f}), walking to drink shop", guest.id, urgency, guest.thirst)
                 return
             else:
                 # No drink shop available, apply penalty
-                DebugConfig.log('engine', f"Guest {guest.id} needs drink but none available!")
+                DebugConfig.log('engine', "Guest {} needs drink but none available!", guest.id)
                 guest.modify_satisfaction(-0.03, "no drink shop available")
 
         # Priority 3: Hunger (urgent if < 0.3)
@@ -2160,23 +2473,23 @@ class Game:
                 guest.target_shop = food_shop
                 guest.state = "walking_to_food"
                 urgency = "CRITICAL" if guest.hunger < 0.15 else "urgent"
-                DebugConfig.log('engine', f"Guest {guest.id} has {urgency} hunger ({guest.hunger:.2f}), walking to food shop")
+                DebugConfig.log('engine', "Guest {} has {} hunger ({:.2f}), walking to food shop", guest.id, urgency, guest.hunger)
                 return
             else:
                 # No food shop available, apply penalty
-                DebugConfig.log('engine', f"Guest {guest.id} needs food but none available!")
+                DebugConfig.log('engine', "Guest {} needs food but none available!", guest.id)
                 guest.modify_satisfaction(-0.03, "no food shop available")
 
         # ========== NORMAL ATTRACTION FINDING ==========
         # No urgent needs, proceed with normal behavior
 
         # 20% chance to just wander without targeting anything
-        if random.random() < 0.2:
-            DebugConfig.log('engine', f"Guest {guest.id} chose to just wander")
+        if _rng.random() < 0.2:
+            DebugConfig.log('engine', "Guest {} chose to just wander", guest.id)
             return
 
         # Probabilité de choisir un shop vs une attraction (30% shops, 70% rides)
-        if random.random() < 0.3:
+        if _rng.random() < 0.3:
             # Chercher un shop
             available_shops = []
             for shop in self.shops:
@@ -2186,17 +2499,16 @@ class Game:
                     entrance_x = shop.x + width // 2
                     entrance_y = shop.y + height - 1
                     shop_entrance = (entrance_x, entrance_y)
-                    path = pathfinding.get_path_cached(self.grid, (guest.grid_x, guest.grid_y), shop_entrance)
-                    if path:
-                        available_shops.append((shop, shop_entrance, path))
+                    if self.flow_fields.distance((guest.grid_x, guest.grid_y), shop_entrance) >= 0:
+                        available_shops.append((shop, shop_entrance))
             
             if available_shops:
                 # Choisir un shop au hasard
-                selected_shop, shop_entrance, path = random.choice(available_shops)
-                guest.path = path[1:]
+                selected_shop, shop_entrance = _rng.choice(available_shops)
+                guest.path = self.flow_fields.path((guest.grid_x, guest.grid_y), shop_entrance).cursor(1)
                 guest.target_shop = selected_shop
                 guest.state = "walking_to_shop"
-                DebugConfig.log('engine', f"Guest {guest.id} selected shop {selected_shop.defn.name}, walking to entrance at {shop_entrance}")
+                DebugConfig.log('engine', "Guest {} selected shop {}, walking to entrance at {}", guest.id, selected_shop.defn.name, shop_entrance)
                 return
         
         # Chercher une attraction
@@ -2207,122 +2519,75 @@ class Game:
                 if queue_path and queue_path.can_enter():
                     queue_entrance = queue_path.get_entrance_position()
                     if queue_entrance:
-                        path = pathfinding.get_path_cached(self.grid, (guest.grid_x, guest.grid_y), queue_entrance)
-                        if path:
-                            available_rides.append((ride, queue_path, queue_entrance, path))
+                        if self.flow_fields.distance((guest.grid_x, guest.grid_y), queue_entrance) >= 0:
+                            available_rides.append((ride, queue_path, queue_entrance))
         
         if available_rides:
             # Calculer les scores basés sur les préférences du visiteur
             scored_rides = []
-            for ride, queue_path, queue_entrance, path in available_rides:
+            for ride, queue_path, queue_entrance in available_rides:
                 thrill_score = 1.0 - abs(guest.thrill_preference - ride.defn.thrill)
                 nausea_score = 1.0 - abs(guest.nausea_tolerance - ride.defn.nausea)
                 preference_score = (thrill_score + nausea_score) / 2.0
-                random_factor = random.uniform(0.8, 1.2)
+                random_factor = _rng.uniform(0.8, 1.2)
                 final_score = preference_score * random_factor
-                scored_rides.append((final_score, ride, queue_path, queue_entrance, path))
+                scored_rides.append((final_score, ride, queue_path, queue_entrance))
             
             scored_rides.sort(key=lambda x: x[0], reverse=True)
-            selected_score, selected_ride, queue_path, queue_entrance, path = scored_rides[0]
+            selected_score, selected_ride, queue_path, queue_entrance = scored_rides[0]
             
-            guest.path = path[1:]
+            guest.path = self.flow_fields.path((guest.grid_x, guest.grid_y), queue_entrance).cursor(1)
             guest.target_ride = selected_ride
             guest.target_queue = queue_path
             guest.state = "walking_to_queue"
-            DebugConfig.log('engine', f"Guest {guest.id} selected ride {selected_ride.defn.name} (score: {selected_score:.2f}), walking to queue entrance at {queue_entrance}")
+            DebugConfig.log('engine', "Guest {} selected ride {} (score: {:.2f}), walking to queue entrance at {}", guest.id, selected_ride.defn.name, selected_score, queue_entrance)
         else:
-            DebugConfig.log('engine', f"No available attractions found for guest {guest.id}")
+            DebugConfig.log('engine', "No available attractions found for guest {}", guest.id)
+
+    def _facility_sources(self, category):
+        """{entity id: source tiles} of the facilities of a category guests can go to right now"""
+        if category == 'restroom':
+            sources = {}
+            for restroom in self.restrooms:
+                # Only restrooms that are connected to paths and not full, reached from the WALK tiles around them
+                if restroom.connected_to_path and not restroom.is_full():
+                    width, height = restroom.defn.size
+                    tiles = []
+                    for dx in range(width):
+                        for dy in range(height):
+                            rx, ry = restroom.x + dx, restroom.y + dy
+                            for nx, ny in ((rx, ry + 1), (rx, ry - 1), (rx + 1, ry), (rx - 1, ry)):
+                                if self.grid.in_bounds(nx, ny) and self.grid.get(nx, ny) == TILE_WALK:
+                                    tiles.append((nx, ny))
+                    if tiles:
+                        sources[restroom.id] = tuple(tiles)
+            return sources
+        # Shops connected to paths, reached at their entrance (middle south tile)
+        return {shop.id: ((shop.x + shop.defn.size[0] // 2, shop.y + shop.defn.size[1] - 1),)
+                for shop in self.shops if shop.defn.shop_type == category and shop.connected_to_path}
+
+    def _find_nearest_facility(self, guest, category):
+        """Nearest food / drink shop or restroom of a guest and the path to it (current position excluded)"""
+        field = self.facility_fields[category]
+        field.update(self._facility_sources(category))
+        found = field.nearest(guest.grid_x, guest.grid_y)
+        if found is None:
+            return None, None
+        facility_id, path = found
+        registry = self.restroom_registry if category == 'restroom' else self.shop_registry
+        return registry.get(facility_id), path.cursor(1)
 
     def _find_nearest_food_shop(self, guest):
         """Trouver le food shop le plus proche pour un visiteur"""
-        nearest_shop = None
-        nearest_path = None
-        shortest_distance = float('inf')
-
-        for shop in self.shops:
-            # Only consider food shops that are connected to paths
-            if shop.defn.shop_type == "food" and shop.connected_to_path:
-                # Calculate shop entrance position (middle south tile)
-                width, height = shop.defn.size
-                entrance_x = shop.x + width // 2
-                entrance_y = shop.y + height - 1
-                shop_entrance = (entrance_x, entrance_y)
-                path = pathfinding.get_path_cached(self.grid, (guest.grid_x, guest.grid_y), shop_entrance)
-                if path:
-                    distance = len(path)
-                    if distance < shortest_distance:
-                        shortest_distance = distance
-                        nearest_shop = shop
-                        nearest_path = path[1:]  # Exclude current position
-
-        if nearest_shop:
-            return nearest_shop, nearest_path
-        return None, None
+        return self._find_nearest_facility(guest, 'food')
 
     def _find_nearest_drink_shop(self, guest):
         """Trouver le drink shop le plus proche pour un visiteur"""
-        nearest_shop = None
-        nearest_path = None
-        shortest_distance = float('inf')
-
-        for shop in self.shops:
-            # Only consider drink shops that are connected to paths
-            if shop.defn.shop_type == "drink" and shop.connected_to_path:
-                # Calculate shop entrance position (middle south tile)
-                width, height = shop.defn.size
-                entrance_x = shop.x + width // 2
-                entrance_y = shop.y + height - 1
-                shop_entrance = (entrance_x, entrance_y)
-                path = pathfinding.get_path_cached(self.grid, (guest.grid_x, guest.grid_y), shop_entrance)
-                if path:
-                    distance = len(path)
-                    if distance < shortest_distance:
-                        shortest_distance = distance
-                        nearest_shop = shop
-                        nearest_path = path[1:]  # Exclude current position
-
-        if nearest_shop:
-            return nearest_shop, nearest_path
-        return None, None
+        return self._find_nearest_facility(guest, 'drink')
 
     def _find_nearest_restroom(self, guest):
         """Trouver le restroom le plus proche pour un visiteur"""
-        nearest_restroom = None
-        nearest_path = None
-        shortest_distance = float('inf')
-
-        for restroom in self.restrooms:
-            # Only consider restrooms that are connected to paths and not full
-            if restroom.connected_to_path and not restroom.is_full():
-                # Find the nearest walkable tile adjacent to the restroom
-                width, height = restroom.defn.size
-                best_target = None
-                best_path = None
-                best_dist = float('inf')
-
-                # Check all tiles around the restroom perimeter
-                for dx in range(width):
-                    for dy in range(height):
-                        rx, ry = restroom.x + dx, restroom.y + dy
-                        # Check adjacent tiles (WALK tiles only)
-                        for nx_offset, ny_offset in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                            nx, ny = rx + nx_offset, ry + ny_offset
-                            if self.grid.in_bounds(nx, ny) and self.grid.get(nx, ny) == TILE_WALK:
-                                # Try pathfinding to this tile
-                                path = pathfinding.get_path_cached(self.grid, (guest.grid_x, guest.grid_y), (nx, ny))
-                                if path and len(path) < best_dist:
-                                    best_dist = len(path)
-                                    best_target = (nx, ny)
-                                    best_path = path[1:]  # Exclude current position
-
-                if best_path and best_dist < shortest_distance:
-                    shortest_distance = best_dist
-                    nearest_restroom = restroom
-                    nearest_path = best_path
-
-        if nearest_restroom:
-            return nearest_restroom, nearest_path
-        return None, None
+        return self._find_nearest_facility(guest, 'restroom')
 
     def _draw_entrance_fee_panel(self):
         """Draw entrance fee configuration panel"""
@@ -2906,6 +3171,10 @@ class Game:
                 break  # Only show one tooltip at a time
 
     def draw(self, hover=None):
+        if self.headless:
+            return
+        prof = self.profiler
+        prof.begin()
         self.screen.fill((20,60,90))
         # Supprimer l'ancienne barre en haut
         # pygame.draw.rect(self.screen,(30,30,30),(0,0,self.screen.get_width(),48))
@@ -2919,7 +3188,8 @@ class Game:
                 queue_directions[(tile.x, tile.y)] = direction_str
 
         self.renderer.draw_map(self.grid, queue_directions)
-        
+        prof.lap('draw.map')
+
         objs=[]
         for r in self.rides:
             # Centrer le sprite du ride sur son empreinte (comme pour les shops)
@@ -2986,32 +3256,26 @@ class Game:
 
         # Render guests with satisfaction indicators
         for g in self.guests:
-            objs.append((self.sprite(g.sprite),(g.x,g.y)))  # Utiliser les positions flottantes pour le rendu avec sprite diversifié
+            gx_r, gy_r = self._interpolated_position(g)
+            objs.append((self.sprite(g.sprite),(gx_r,gy_r)))  # Utiliser les positions flottantes (interpolées) pour le rendu avec sprite diversifié
 
             # Add satisfaction indicator above guest
             satisfaction_color = self._get_satisfaction_color(g.satisfaction)
             indicator_surf = pygame.Surface((10, 10), pygame.SRCALPHA)
             pygame.draw.circle(indicator_surf, satisfaction_color, (5, 5), 4)
             pygame.draw.circle(indicator_surf, (255, 255, 255), (5, 5), 4, 1)  # White border
-            indicator_x = g.x + 0.5
-            indicator_y = g.y - 0.6
+            indicator_x = gx_r + 0.5
+            indicator_y = gy_r - 0.6
             objs.append((indicator_surf,(indicator_x,indicator_y)))
 
         for employee in self.employees:
             employee_sprite = self.sprite(employee.defn.sprite)
-            # Use render position for smooth movement (MaintenanceWorker has interpolation)
-            from .employees import MaintenanceWorker
-            if isinstance(employee, MaintenanceWorker):
-                render_pos = employee.get_render_position()
-                objs.append((employee_sprite, render_pos))
-                # Use render position for indicator too
-                indicator_x = render_pos[0] + 0.5
-                indicator_y = render_pos[1] - 0.5
-            else:
-                objs.append((employee_sprite,(employee.x,employee.y)))
-                # Indicateur visuel si l'employé travaille ou se déplace
-                indicator_x = employee.x + 0.5
-                indicator_y = employee.y - 0.5
+            # Use interpolated render position for smooth movement between simulation steps
+            render_pos = self._interpolated_position(employee)
+            objs.append((employee_sprite, render_pos))
+            # Use render position for indicator too
+            indicator_x = render_pos[0] + 0.5
+            indicator_y = render_pos[1] - 0.5
 
             if employee.state == "working":
                 # Dessiner un indicateur vert pour montrer que l'employé travaille
@@ -3119,7 +3383,9 @@ class Game:
             # Use the random offset stored in the litter object
             objs.append((litter_surf,(litter.x + litter.offset_x, litter.y + litter.offset_y)))
         
+        prof.lap('draw.build_objects')
         self.renderer.draw_objects(objs)
+        prof.lap('draw.objects')
         if hover and self.grid.in_bounds(*hover):
             ok=True
             if self.toolbar.active.startswith('shop_'):
@@ -3156,16 +3422,7 @@ class Game:
                 ok = not self._is_on_ride(*hover) and (self.last_queue_pos is None or self._can_connect_queue_tile(*hover))
             elif self.toolbar.active.startswith('bin_'):
                 # Check if bin can be placed here (GRASS adjacent to WALK)
-                if self.grid.get(*hover) == TILE_GRASS:
-                    adjacent_to_walk = False
-                    for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                        nx, ny = hover[0] + dx, hover[1] + dy
-                        if self.grid.in_bounds(nx, ny) and self.grid.get(nx, ny) == TILE_WALK:
-                            adjacent_to_walk = True
-                            break
-                    ok = adjacent_to_walk and not self.litter_manager.get_bin_at(*hover)
-                else:
-                    ok = False
+                ok = self.grid.has_flag(*hover, FLAG_BIN_PLACEABLE) and not self.litter_manager.get_bin_at(*hover)
             
             # Only draw single-tile highlight if not drawing multi-tile preview
             if not ((self.toolbar.active.startswith('ride_') and self.ride_defs.get(self.toolbar.active)) or
@@ -3225,6 +3482,7 @@ class Game:
         num_food_shops = len([s for s in self.shops if s.defn.shop_type == "food"])
         num_drink_shops = len([s for s in self.shops if s.defn.shop_type == "drink"])
         num_restrooms = len(self.restrooms)
+        prof.lap('draw.hud_stats')
 
         # Dessiner la toolbar et ses sous-menus au premier plan
         self.toolbar.draw(self.screen, self.research_bureau)
@@ -3275,8 +3533,10 @@ class Game:
 
         # Draw weather effects (overlay + particles)
         self._draw_weather_effects()
+        prof.lap('draw.ui')
 
         pygame.display.flip()
+        prof.lap('draw.flip')
 
     def _add_notification(self, notif_type: NotificationType, message: str,
                           clickable: bool = False, click_action: str = None,
@@ -3388,19 +3648,19 @@ class Game:
         idle_engineers = [emp for emp in self.employees if emp.defn.type == 'engineer' and emp.state == 'idle']
 
         # Debug logging
-        if DebugConfig.EMPLOYEES:
-            DebugConfig.log('engine', f"Found {len(broken_rides)} broken rides, {len(idle_engineers)} idle engineers")
-            DebugConfig.log('engine', f"Total employees: {len(self.employees)}")
+        if DebugConfig.is_enabled('engine'):
+            DebugConfig.log('engine', "Found {} broken rides, {} idle engineers", len(broken_rides), len(idle_engineers))
+            DebugConfig.log('engine', "Total employees: {}", len(self.employees))
             if self.employees:
-                DebugConfig.log('engine', f"Employee types: {[emp.defn.type for emp in self.employees]}")
-                DebugConfig.log('engine', f"Employee states: {[emp.state for emp in self.employees]}")
+                DebugConfig.log('engine', "Employee types: {}", [emp.defn.type for emp in self.employees])
+                DebugConfig.log('engine', "Employee states: {}", [emp.state for emp in self.employees])
 
         # Assign engineers to broken rides
         for i, ride in enumerate(broken_rides):
             if i < len(idle_engineers):
                 engineer = idle_engineers[i]
                 engineer.start_repair(ride, self.grid)
-                DebugConfig.log('engine', f"Assigned engineer {engineer.id} to repair {ride.defn.name}")
+                DebugConfig.log('engine', "Assigned engineer {} to repair {}", engineer.id, ride.defn.name)
 
     def _assign_maintenance_workers_to_litter(self):
         """Assign available maintenance workers to clean litter or patrol/garden"""
@@ -3430,26 +3690,26 @@ class Game:
                 if not already_targeted:
                     success = worker.start_cleaning(nearest_litter, self.grid)
                     if success:
-                        DebugConfig.log('engine', f"Assigned maintenance worker {worker.id} to clean litter at ({nearest_litter.x}, {nearest_litter.y})")
+                        DebugConfig.log('engine', "Assigned maintenance worker {} to clean litter at ({}, {})", worker.id, nearest_litter.x, nearest_litter.y)
                     else:
-                        DebugConfig.log('engine', f"Maintenance worker {worker.id} failed to start cleaning, will try patrol")
+                        DebugConfig.log('engine', "Maintenance worker {} failed to start cleaning, will try patrol", worker.id)
                 elif should_patrol:
                     # Litter already targeted by someone else, start patrol instead
                     success = worker.start_patrol(self.grid)
                     if success:
-                        DebugConfig.log('engine', f"Maintenance worker {worker.id} started patrol (no available litter)")
+                        DebugConfig.log('engine', "Maintenance worker {} started patrol (no available litter)", worker.id)
                     else:
                         # Patrol failed, reset timer to retry
-                        DebugConfig.log('engine', f"Maintenance worker {worker.id} patrol failed (litter targeted), will retry")
+                        DebugConfig.log('engine', "Maintenance worker {} patrol failed (litter targeted), will retry", worker.id)
                         worker.patrol_timer = 0.0
             elif should_patrol:
                 # No litter found and timer expired, start patrol
                 success = worker.start_patrol(self.grid)
                 if success:
-                    DebugConfig.log('engine', f"Maintenance worker {worker.id} started patrol (no litter found)")
+                    DebugConfig.log('engine', "Maintenance worker {} started patrol (no litter found)", worker.id)
                 else:
                     # Patrol failed, reset timer to 0 to retry immediately
-                    DebugConfig.log('engine', f"Maintenance worker {worker.id} patrol failed, will retry")
+                    DebugConfig.log('engine', "Maintenance worker {} patrol failed, will retry", worker.id)
                     worker.patrol_timer = 0.0  # Reset to 0, not negative!
 
         # Handle cleaning completion - remove litter
@@ -3460,12 +3720,11 @@ class Game:
                 if worker.cleaning_timer >= worker.cleaning_duration - 0.05:  # Just before completion
                     if worker.target_litter in self.litter_manager.litters:
                         self.litter_manager.remove_litter(worker.target_litter)
-                        DebugConfig.log('engine', f"Maintenance worker {worker.id} removed litter at ({worker.target_litter.x}, {worker.target_litter.y})")
+                        DebugConfig.log('engine', "Maintenance worker {} removed litter at ({}, {})", worker.id, worker.target_litter.x, worker.target_litter.y)
 
     def _assign_maintenance_workers_to_gardening(self):
         """Assign available grass maintenance workers to gardening tasks"""
         from .employees import MaintenanceWorker
-        import random
 
         # Find idle maintenance workers on grass
         idle_grass_workers = [emp for emp in self.employees
@@ -3479,38 +3738,38 @@ class Game:
             if worker.patrol_timer >= worker.patrol_duration:
                 # Start continuous lawn mowing (worker will move tile by tile)
                 worker.start_mowing(self.grid)
-                DebugConfig.log('engine', f"Assigned maintenance worker {worker.id} to start continuous lawn mowing - pattern: {worker.lawn_mowing_pattern}")
+                DebugConfig.log('engine', "Assigned maintenance worker {} to start continuous lawn mowing - pattern: {}", worker.id, worker.lawn_mowing_pattern)
 
         # Update mowing workers - move them to next tile when ready
         mowing_workers = [emp for emp in self.employees
                          if isinstance(emp, MaintenanceWorker)
                          and emp.state == 'mowing']
 
-        DebugConfig.log('engine', f"Found {len(mowing_workers)} workers in mowing state")
+        DebugConfig.log('engine', "Found {} workers in mowing state", len(mowing_workers))
 
         for worker in mowing_workers:
-            DebugConfig.log('engine', f"Worker {worker.id} gardening_timer: {worker.gardening_timer:.3f}, mowing_speed: {worker.mowing_speed:.3f}")
+            DebugConfig.log('engine', "Worker {} gardening_timer: {:.3f}, mowing_speed: {:.3f}", worker.id, worker.gardening_timer, worker.mowing_speed)
 
             # Check if worker finished mowing current tile
             if worker.gardening_timer >= worker.mowing_speed:
-                DebugConfig.log('engine', f"Worker {worker.id} timer expired, getting next position")
+                DebugConfig.log('engine', "Worker {} timer expired, getting next position", worker.id)
 
                 # Get next position in mowing pattern
                 next_pos = worker._get_next_mowing_position(self.grid)
 
                 if next_pos:
                     # Move worker to next position instantly (simulate mowing)
-                    DebugConfig.log('engine', f"Worker {worker.id} moving from ({int(worker.x)}, {int(worker.y)}) to ({next_pos[0]}, {next_pos[1]})")
+                    DebugConfig.log('engine', "Worker {} moving from ({}, {}) to ({}, {})", worker.id, int(worker.x), int(worker.y), next_pos[0], next_pos[1])
                     worker.x = float(next_pos[0])
                     worker.y = float(next_pos[1])
                     worker.gardening_timer = 0.0
-                    DebugConfig.log('engine', f"Maintenance worker {worker.id} moved to next mowing position ({next_pos[0]}, {next_pos[1]})")
+                    DebugConfig.log('engine', "Maintenance worker {} moved to next mowing position ({}, {})", worker.id, next_pos[0], next_pos[1])
                 else:
                     # No more grass to mow, go back to idle
-                    DebugConfig.log('engine', f"Worker {worker.id} no next position found, going idle")
+                    DebugConfig.log('engine', "Worker {} no next position found, going idle", worker.id)
                     worker.state = "idle"
                     worker.patrol_timer = worker.patrol_duration  # Trigger immediate restart
-                    DebugConfig.log('engine', f"Maintenance worker {worker.id} finished mowing pattern, restarting")
+                    DebugConfig.log('engine', "Maintenance worker {} finished mowing pattern, restarting", worker.id)
 
     def _assign_security_guards_to_patrol(self):
         """Assign idle security guards to patrol and update nearby guests"""
@@ -3526,7 +3785,7 @@ class Game:
             if guard.patrol_timer >= guard.patrol_duration:
                 success = guard.start_patrol(self.grid)
                 if success:
-                    DebugConfig.log('engine', f"Security guard {guard.id} started patrol")
+                    DebugConfig.log('engine', "Security guard {} started patrol", guard.id)
                 else:
                     # Failed to find patrol path, retry soon (set to small value, not negative)
                     guard.patrol_timer = 0.0  # Reset to 0 to retry immediately next frame
@@ -3535,7 +3794,7 @@ class Game:
         for guard in [emp for emp in self.employees if isinstance(emp, SecurityGuard)]:
             nearby_count = guard.update_nearby_guests(self.guests)
             if nearby_count > 0:
-                DebugConfig.log('engine', f"Security guard {guard.id} protecting {nearby_count} guests")
+                DebugConfig.log('engine', "Security guard {} protecting {} guests", guard.id, nearby_count)
 
     def _assign_mascots_to_crowds(self):
         """Assign idle mascots to find and entertain crowds"""
@@ -3555,21 +3814,21 @@ class Game:
                 if crowd_location:
                     success = mascot.start_moving_to_crowd(crowd_location, self.grid)
                     if success:
-                        DebugConfig.log('engine', f"Mascot {mascot.id} moving to crowd at {crowd_location}")
+                        DebugConfig.log('engine', "Mascot {} moving to crowd at {}", mascot.id, crowd_location)
                         mascot.search_timer = 0.0  # Reset timer on success
                     else:
                         # Failed to find path, reset timer to retry (don't go negative!)
                         mascot.search_timer = 0.0  # Reset to 0 to retry immediately next frame
                 else:
                     # No crowd found, reset timer to retry (don't go negative!)
-                    DebugConfig.log('engine', f"Mascot {mascot.id} found no crowd, will retry")
+                    DebugConfig.log('engine', "Mascot {} found no crowd, will retry", mascot.id)
                     mascot.search_timer = 0.0  # Reset to 0 to retry immediately next frame
 
         # Update all mascots' nearby guest detection
         for mascot in [emp for emp in self.employees if isinstance(emp, Mascot)]:
             nearby_count = mascot.update_nearby_guests(self.guests)
             if nearby_count > 0 and mascot.state == "entertaining":
-                DebugConfig.log('engine', f"Mascot {mascot.id} entertaining {nearby_count} guests")
+                DebugConfig.log('engine', "Mascot {} entertaining {} guests", mascot.id, nearby_count)
 
     def _apply_employee_effects_on_guests(self):
         """Apply effects from SecurityGuards and Mascots to nearby guests"""
@@ -3581,7 +3840,7 @@ class Game:
                 for guest in guard.nearby_guests:
                     # Apply satisfaction boost (capped at 1.0)
                     guest.satisfaction = min(1.0, guest.satisfaction + 0.05)
-                DebugConfig.log('engine', f"Security guard {guard.id} boosted satisfaction for {len(guard.nearby_guests)} guests")
+                DebugConfig.log('engine', "Security guard {} boosted satisfaction for {} guests", guard.id, len(guard.nearby_guests))
 
         # Apply Mascot effects (+10% excitement for guests in entertainment radius)
         for mascot in [emp for emp in self.employees if isinstance(emp, Mascot)]:
@@ -3591,7 +3850,7 @@ class Game:
                     guest.excitement = min(1.0, guest.excitement + 0.10)
                     # Also small happiness boost (+3%)
                     guest.happiness = min(1.0, guest.happiness + 0.03)
-                DebugConfig.log('engine', f"Mascot {mascot.id} boosted excitement for {len(mascot.nearby_guests)} guests")
+                DebugConfig.log('engine', "Mascot {} boosted excitement for {} guests", mascot.id, len(mascot.nearby_guests))
 
     def _check_and_trigger_salary_negotiations(self):
         """Check if salary negotiations should trigger (once per year in March)
@@ -3616,7 +3875,7 @@ class Game:
         current_date = (self.game_year, self.game_month, self.game_day)
         has_active = any(self.salary_negotiation_manager.get_active_negotiation(et) for et in ['engineer', 'maintenance', 'security', 'mascot'])
         if (self.game_month == 3 or has_active) and current_date != self._last_negotiation_log_date:
-            DebugConfig.log('engine', f"Negotiation check: {self.MONTH_NAMES[self.game_month-1]} {self.game_day}, {self.game_year}, Profit ${park_profit}")
+            DebugConfig.log('engine', "Negotiation check: {} {}, {}, Profit ${}", self.MONTH_NAMES[self.game_month-1], self.game_day, self.game_year, park_profit)
             self._last_negotiation_log_date = current_date
 
         # FIRST: Check for ongoing negotiations that need to resume
@@ -3642,7 +3901,7 @@ class Game:
                         if employees_of_type:
                             self._show_negotiation_modal(negotiation, employee_type, len(employees_of_type))
                             self._last_negotiation_check_date[employee_type] = (self.game_year, self.game_month, self.game_day)
-                            DebugConfig.log('engine', f"Resuming negotiation for {employee_type}s at stage {negotiation.current_stage.name}")
+                            DebugConfig.log('engine', "Resuming negotiation for {}s at stage {}", employee_type, negotiation.current_stage.name)
 
                 # Active negotiation exists - don't start a new one
                 return  # Only one negotiation at a time
@@ -3672,13 +3931,12 @@ class Game:
             return
 
         # Weighted random selection based on employee counts
-        import random
         weighted_list = []
         for emp_type, count in employee_counts.items():
             weighted_list.extend([emp_type] * count)
 
-        selected_type = random.choice(weighted_list)
-        DebugConfig.log('engine', f"Selected {selected_type} for negotiation (out of {total_employees} total employees)")
+        selected_type = _rng.choice(weighted_list)
+        DebugConfig.log('engine', "Selected {} for negotiation (out of {} total employees)", selected_type, total_employees)
 
         # Check profit-based probability
         if park_profit > 10000:
@@ -3690,13 +3948,13 @@ class Game:
         else:
             chance = 0.1
 
-        if random.random() >= chance:
-            DebugConfig.log('engine', f"Negotiation chance failed ({chance*100:.0f}% chance)")
+        if _rng.random() >= chance:
+            DebugConfig.log('engine', "Negotiation chance failed ({:.0f}% chance)", chance*100)
             return
 
         # Start negotiation for selected type
         employees_of_type = [emp for emp in self.employees if emp.defn.type == selected_type]
-        affected_ids = [id(emp) for emp in employees_of_type]
+        affected_ids = [emp.id for emp in employees_of_type]
         current_salary = employees_of_type[0].defn.salary
 
         negotiation = self.salary_negotiation_manager.start_negotiation(
@@ -3711,7 +3969,7 @@ class Game:
         self._show_negotiation_modal(negotiation, selected_type, len(employees_of_type))
         self._last_negotiation_year = self.game_year
 
-        DebugConfig.log('engine', f"Started negotiation for {selected_type}s: ${negotiation.current_salary} -> ${negotiation.demanded_salary}")
+        DebugConfig.log('engine', "Started negotiation for {}s: ${} -> ${}", selected_type, negotiation.current_salary, negotiation.demanded_salary)
 
         # Notify salary negotiation started
         type_names = {
@@ -3743,7 +4001,7 @@ class Game:
         if self.game_speed_before_modal is None:
             self.game_speed_before_modal = self.game_speed
             self.game_speed = 0  # Pause
-            DebugConfig.log('engine', f"Game paused for negotiation (was at speed {self.game_speed_before_modal})")
+            DebugConfig.log('engine', "Game paused for negotiation (was at speed {})", self.game_speed_before_modal)
 
         self.negotiation_modal.show(negotiation, employee_type, employee_count)
 
@@ -3755,7 +4013,17 @@ class Game:
         if self.game_speed_before_modal is not None:
             self.game_speed = self.game_speed_before_modal
             self.game_speed_before_modal = None
-            DebugConfig.log('engine', f"Game resumed at speed {self.game_speed}")
+            DebugConfig.log('engine', "Game resumed at speed {}", self.game_speed)
+
+    def _wake_employees_of_type(self, employee_type):
+        """Wake sleeping employees of a type and tick them with the time they slept
+
+        Their wake-up time was computed with the current work rate: they go
+        back to sleep on the next update, at the new rate.
+        """
+        for emp in self.employees:
+            if emp.defn.type == employee_type and emp.sleep_entry is not None:
+                emp.tick(self.agent_scheduler.wake(emp))
 
     def _handle_negotiation_response(self, player_offer, accept=False):
         """Handle player's response to salary negotiation"""
@@ -3768,6 +4036,9 @@ class Game:
         if accept and self.negotiation_modal.negotiation:
             player_offer = self.negotiation_modal.negotiation.demanded_salary
 
+        # The response changes the work rate: settle sleeping employees at the old one first
+        self._wake_employees_of_type(employee_type)
+
         # Process the response
         accepted, message, resigned = self.salary_negotiation_manager.process_negotiation_response(
             employee_type,
@@ -3777,14 +4048,14 @@ class Game:
             self.game_day
         )
 
-        DebugConfig.log('engine', f"Negotiation response for {employee_type}s: offer ${player_offer}, result: {message}")
+        DebugConfig.log('engine', "Negotiation response for {}s: offer ${}, result: {}", employee_type, player_offer, message)
 
         if accepted:
             # Update salary for all affected employees
             employees_of_type = [emp for emp in self.employees if emp.defn.type == employee_type]
             for emp in employees_of_type:
                 emp.defn.salary = player_offer
-            DebugConfig.log('engine', f"Updated {len(employees_of_type)} {employee_type}s to salary ${player_offer}/day")
+            DebugConfig.log('engine', "Updated {} {}s to salary ${}/day", len(employees_of_type), employee_type, player_offer)
 
             # Notification: negotiation accepted
             type_names = {
@@ -3806,7 +4077,6 @@ class Game:
             removed_count = len(employees_of_type)
 
             # Set employees to "leaving" state and pathfind to entrance
-            from .pathfinding import astar_for_engineers
             for emp in employees_of_type:
                 emp.state = "leaving"
                 emp.target_object = None
@@ -3814,18 +4084,18 @@ class Game:
 
                 # Pathfind to park entrance
                 emp_pos = (int(emp.x), int(emp.y))
-                path = pathfinding.get_path_cached(self.grid, emp_pos, self.park_entrance, for_engineers=True)
+                path = pathfinding.get_path_cached(self.grid, emp_pos, self.park_entrance, profile=pathfinding.ENGINEER)
 
                 if path:
-                    emp.path = path
-                    DebugConfig.log('engine', f"Employee {emp.id} ({employee_type}) is leaving the park (path length: {len(path)})")
+                    emp.path = path.cursor()
+                    DebugConfig.log('engine', "Employee {} ({}) is leaving the park (path length: {})", emp.id, employee_type, len(path))
                 else:
                     # No path found - teleport to entrance
                     emp.x, emp.y = self.park_entrance
-                    emp.path = []
-                    DebugConfig.log('engine', f"Employee {emp.id} ({employee_type}) teleported to entrance (no path found)")
+                    emp.path = PathCursor()
+                    DebugConfig.log('engine', "Employee {} ({}) teleported to entrance (no path found)", emp.id, employee_type)
 
-            DebugConfig.log('engine', f"RESIGNATION: {removed_count} {employee_type}s are leaving the park")
+            DebugConfig.log('engine', "RESIGNATION: {} {}s are leaving the park", removed_count, employee_type)
 
             # Notification: employees resigned
             type_names = {
@@ -3867,13 +4137,13 @@ class Game:
                 employees_of_type = [emp for emp in self.employees if emp.defn.type == employee_type]
                 if employees_of_type:
                     self.negotiation_modal.show(negotiation, employee_type, len(employees_of_type))
-                    DebugConfig.log('engine', f"IMMEDIATE: Reopening modal for {employee_type}s at stage {negotiation.current_stage.name}")
+                    DebugConfig.log('engine', "IMMEDIATE: Reopening modal for {}s at stage {}", employee_type, negotiation.current_stage.name)
             else:
                 # Hide modal and wait for next_negotiation_date (year/month/day)
                 # The modal will reopen automatically when the next negotiation date arrives
                 self._hide_negotiation_modal()
                 next_date = f"{negotiation.next_negotiation_year}-{negotiation.next_negotiation_month:02d}-{negotiation.next_negotiation_day:02d}" if negotiation else 'N/A'
-                DebugConfig.log('engine', f"Modal closed, will reopen on {next_date}")
+                DebugConfig.log('engine', "Modal closed, will reopen on {}", next_date)
 
     def _apply_litter_proximity_penalties(self):
         """Apply satisfaction penalties to guests near litter"""
@@ -3912,10 +4182,10 @@ class Game:
     def _handle_broken_rides(self):
         """Handle broken rides - evacuate queues and prevent new visitors"""
         for ride in self.rides:
-            if ride.is_broken and not hasattr(ride, '_queue_evacuated'):
+            if ride.is_broken and not ride.queue_evacuated:
                 # Evacuate queue for this broken ride (only once)
                 self.queue_manager.evacuate_queue_for_broken_ride(ride)
-                ride._queue_evacuated = True
+                ride.queue_evacuated = True
                 
                 # Prevent new visitors from targeting this ride and apply penalty
                 for guest in self.guests:
@@ -3924,15 +4194,14 @@ class Game:
                         guest.target_queue = None
                         guest.state = "wandering"
                         guest.apply_broken_ride_penalty()  # Apply satisfaction penalty
-                        DebugConfig.log('engine', f"Guest {guest.id} redirected from broken ride {ride.defn.name}")
+                        DebugConfig.log('engine', "Guest {} redirected from broken ride {}", guest.id, ride.defn.name)
             
             # Reset evacuation flag when ride is repaired
-            if not ride.is_broken and hasattr(ride, '_queue_evacuated'):
-                delattr(ride, '_queue_evacuated')
+            if not ride.is_broken and ride.queue_evacuated:
+                ride.queue_evacuated = False
     
     def _handle_guest_litter(self, guest):
         """Handle guest with litter - try to find bin or drop it"""
-        import random
         # Calculate search radius based on guest's state
         search_radius = guest.get_bin_search_radius()
         
@@ -3943,17 +4212,17 @@ class Game:
             # Bin found! Try to go to it
             # Check if bin is on path to target
             # For simplicity, just go to bin (70% chance)
-            if random.random() < 0.7:
+            if _rng.random() < 0.7:
                 # Find path to bin
                 bin_pos = (nearest_bin.x, nearest_bin.y)
                 guest_pos = (guest.grid_x, guest.grid_y)
 
                 path = pathfinding.get_path_cached(self.grid, guest_pos, bin_pos)
                 if path and len(path) > 1:
-                    guest.path = path[1:]  # Skip current position
+                    guest.path = path.cursor(1)  # Skip current position
                     guest.target_bin = nearest_bin
                     guest.state = "walking_to_bin"
-                    DebugConfig.log('guests', f"Guest {guest.id} found bin at {bin_pos}, going there")
+                    DebugConfig.log('guests', "Guest {} found bin at {}, going there", guest.id, bin_pos)
                 else:
                     # Can't reach bin, drop litter
                     if guest.should_drop_litter_randomly():
@@ -3963,7 +4232,7 @@ class Game:
                         guest.litter_hold_timer = 0.0
                         guest.litter_hold_duration = 0.0
                         guest.apply_litter_drop_penalty()  # Apply satisfaction penalty
-                        DebugConfig.log('guests', f"Guest {guest.id} dropped litter (couldn't reach bin)")
+                        DebugConfig.log('guests', "Guest {} dropped litter (couldn't reach bin)", guest.id)
             else:
                 # Decided not to go to bin, drop litter
                 if guest.should_drop_litter_randomly():
@@ -3973,7 +4242,7 @@ class Game:
                     guest.litter_hold_timer = 0.0
                     guest.litter_hold_duration = 0.0
                     guest.apply_litter_drop_penalty()  # Apply satisfaction penalty
-                    DebugConfig.log('guests', f"Guest {guest.id} dropped litter (chose not to go to bin)")
+                    DebugConfig.log('guests', "Guest {} dropped litter (chose not to go to bin)", guest.id)
         else:
             # No bin found, drop litter
             if guest.should_drop_litter_randomly():
@@ -3983,7 +4252,7 @@ class Game:
                 guest.litter_hold_timer = 0.0
                 guest.litter_hold_duration = 0.0
                 guest.apply_litter_drop_penalty()  # Apply satisfaction penalty
-                DebugConfig.log('guests', f"Guest {guest.id} dropped litter (no bin found)")
+                DebugConfig.log('guests', "Guest {} dropped litter (no bin found)", guest.id)
 
     def save_game(self, save_name: str = None) -> str:
         """
@@ -4012,6 +4281,7 @@ class Game:
             'employees': [serialize_employee(emp) for emp in self.employees],
             'guests': [serialize_guest(guest) for guest in self.guests],
             'restrooms': [serialize_restroom(restroom) for restroom in self.restrooms],
+            'next_entity_id': self.entity_ids.next_id,  # Entity ids are never reused
 
             # Litter system
             'bins': [serialize_bin(bin_obj) for bin_obj in self.litter_manager.bins],
@@ -4074,6 +4344,16 @@ class Game:
         print(f"Game saved to: {save_path}")
         return save_path
 
+    @staticmethod
+    def _saved_reference(data, key, registry, by_position):
+        """Entity referenced by <key>_id in save data (<key>_x/_y position in older saves)"""
+        entity_id = data.get(key + '_id')
+        if entity_id is not None:
+            return registry.get(entity_id)
+        if key + '_x' in data and key + '_y' in data:
+            return by_position.get((data[key + '_x'], data[key + '_y']))
+        return None
+
     def load_game(self, save_name: str) -> bool:
         """
         Load a saved game state
@@ -4088,13 +4368,22 @@ class Game:
             game_state = self.save_load_manager.load_game(save_name)
 
             # Clear current state
+            self.agent_scheduler.clear()
+            pathfinding.clear_pathfinding_queue()
             self.rides.clear()
             self.shops.clear()
             self.employees.clear()
             self.guests.clear()
+            self.guest_pool.clear()
+            self.guest_store.clear()
             self.restrooms.clear()
             self.litter_manager.bins.clear()
             self.litter_manager.litters.clear()
+            for registry in (self.guest_registry, self.ride_registry, self.shop_registry,
+                             self.restroom_registry, self.employee_registry):
+                registry.clear()
+            # Older saves have no counter: ids found in the save are observed as they are registered
+            self.entity_ids.reset(game_state.get('next_entity_id', 1))
 
             # Restore grid
             grid_data = game_state['grid']
@@ -4103,10 +4392,12 @@ class Game:
                     self.grid.set(x, y, grid_data['tiles'][x][y])
 
             # Restore rides
+            restored_rides = []  # (ride, save data) for the visitor lists, restored after the guests
             for ride_data in game_state['rides']:
                 rd = self.ride_defs.get(ride_data['id'])
                 if rd:
                     ride = Ride(rd, ride_data['x'], ride_data['y'])
+                    ride.id = ride_data.get('entity_id', 0)
                     ride.operational = ride_data.get('operational', True)
                     ride.ride_timer = ride_data.get('ride_timer', 0.0)
                     ride.ride_duration = ride_data.get('ride_duration', 3.0)
@@ -4122,21 +4413,29 @@ class Game:
                     if ride_data['exit']:
                         ride.exit = RideExit(ride_data['exit']['x'], ride_data['exit']['y'])
                     self.rides.append(ride)
+                    self.ride_registry.add(ride)
+                    restored_rides.append((ride, ride_data))
 
             # Restore shops
             for shop_data in game_state['shops']:
                 sd = self.shop_defs.get(shop_data['id'])
                 if sd:
                     shop = Shop(sd, shop_data['x'], shop_data['y'])
+                    shop.id = shop_data.get('entity_id', 0)
                     if shop_data['entrance']:
                         shop.entrance = ShopEntrance(shop_data['id'], shop_data['entrance']['x'], shop_data['entrance']['y'], 'S')
                     shop.connected_to_path = shop_data['connected_to_path']
                     self.shops.append(shop)
+                    self.shop_registry.add(shop)
+
+            # Older saves reference entities by position: index them once instead of scanning lists
+            rides_by_pos = {(ride.x, ride.y): ride for ride in reversed(self.rides)}
 
             # Restore employees
             for emp_data in game_state['employees']:
                 emp_def = self.employee_defs.get(emp_data['id'])
                 if emp_def:
+                    target_restored = False  # Engineer: target ride found again
                     if emp_def.type == 'engineer':
                         emp = Engineer(emp_def, emp_data['x'], emp_data['y'])
                         if 'target_x' in emp_data:
@@ -4145,25 +4444,17 @@ class Game:
                         if 'repair_timer' in emp_data:
                             emp.repair_timer = emp_data.get('repair_timer', 0.0)
                         # Restore target ride reference
-                        target_restored = False
-                        if 'target_ride_x' in emp_data and 'target_ride_y' in emp_data:
-                            target_x = emp_data['target_ride_x']
-                            target_y = emp_data['target_ride_y']
-                            # Find the ride at this position
-                            for ride in self.rides:
-                                if ride.x == target_x and ride.y == target_y:
-                                    emp.target_object = ride
-                                    target_restored = True
-                                    # If engineer was moving to ride, recalculate path
-                                    if emp_data.get('state') == 'moving_to_ride':
-                                        engineer_pos = (int(emp_data['x']), int(emp_data['y']))
-                                        ride_pos = (ride.x, ride.y)
-                                        path = pathfinding.get_path_cached(self.grid, engineer_pos, ride_pos, for_engineers=True)
-                                        if path:
-                                            emp.path = path[1:]  # Exclude starting position
-                                    break
-                        # Store flag for later validation
-                        emp._target_restored = target_restored
+                        ride = self._saved_reference(emp_data, 'target_ride', self.ride_registry, rides_by_pos)
+                        if ride is not None:
+                            emp.target_object = ride
+                            target_restored = True
+                            # If engineer was moving to ride, recalculate path
+                            if emp_data.get('state') == 'moving_to_ride':
+                                engineer_pos = (int(emp_data['x']), int(emp_data['y']))
+                                ride_pos = (ride.x, ride.y)
+                                path = pathfinding.get_path_cached(self.grid, engineer_pos, ride_pos, profile=pathfinding.ENGINEER)
+                                if path:
+                                    emp.path = path.cursor(1)  # Exclude starting position
                     elif emp_def.type == 'maintenance':
                         emp = MaintenanceWorker(emp_def, emp_data['x'], emp_data['y'])
                         if 'placement_type' in emp_data:
@@ -4187,19 +4478,17 @@ class Game:
                         emp.state = 'idle'
                     # If engineer is in "working" or "moving_to_ride" state but has no target restored, reset to idle
                     if emp_def.type == 'engineer' and emp.state in ['working', 'moving_to_ride']:
-                        if not getattr(emp, '_target_restored', False):
+                        if not target_restored:
                             emp.state = 'idle'
-                            DebugConfig.log('employees', f"Engineer {emp.id} had state '{emp_data.get('state')}' but no target ride - reset to idle")
-                        # Clean up temporary flag
-                        if hasattr(emp, '_target_restored'):
-                            delattr(emp, '_target_restored')
+                            DebugConfig.log('employees', "Engineer {} had state '{}' but no target ride - reset to idle", emp.id, emp_data.get('state'))
                     if 'employee_id' in emp_data:
                         emp.id = emp_data['employee_id']
                     self.employees.append(emp)
+                    self.employee_registry.add(emp)
 
             # Restore guests
             for guest_data in game_state['guests']:
-                guest = Guest(guest_data['x'], guest_data['y'])
+                guest = self.guest_pool.acquire(guest_data['x'], guest_data['y'])
                 guest.id = guest_data.get('id', guest.id)
                 guest.grid_x = guest_data.get('grid_x', int(guest_data['x']))
                 guest.grid_y = guest_data.get('grid_y', int(guest_data['y']))
@@ -4225,17 +4514,19 @@ class Game:
                 # Store guest data for reference restoration after all entities are loaded
                 guest._save_data = guest_data
 
-                self.guests.append(guest)
+                self._add_guest(guest)
 
             # Restore restrooms
             for restroom_data in game_state['restrooms']:
                 rd = self.restroom_defs.get(restroom_data['id'])
                 if rd:
                     restroom = Restroom(rd, restroom_data['x'], restroom_data['y'])
+                    restroom.id = restroom_data.get('entity_id', 0)
                     restroom.connected_to_path = restroom_data.get('connected_to_path', False)
                     # Note: current_occupancy is saved but cannot be restored without guest references
                     # Guests will re-enter restrooms through normal gameplay after load
                     self.restrooms.append(restroom)
+                    self.restroom_registry.add(restroom)
 
             # Restore bins
             for bin_data in game_state['bins']:
@@ -4311,75 +4602,55 @@ class Game:
             # Restore weather system
             if 'weather' in game_state:
                 self.weather_system.from_dict(game_state['weather'])
-                DebugConfig.log('engine', f"Weather system restored: {self.weather_system.get_weather_name()}")
+                DebugConfig.log('engine', "Weather system restored: {}", self.weather_system.get_weather_name())
 
             # Restore research bureau
             if 'research' in game_state:
                 self.research_bureau.from_dict(game_state['research'])
-                DebugConfig.log('engine', f"Research bureau restored: {len(self.research_bureau.unlocked_ids)} upgrades unlocked")
+                DebugConfig.log('engine', "Research bureau restored: {} upgrades unlocked", len(self.research_bureau.unlocked_ids))
 
             # Restore guest references to shops, rides, restrooms
+            shops_by_pos = {(shop.x, shop.y): shop for shop in reversed(self.shops)}
+            restrooms_by_pos = {(restroom.x, restroom.y): restroom for restroom in reversed(self.restrooms)}
+            shop_source = (self.shop_registry, shops_by_pos)
+            ride_source = (self.ride_registry, rides_by_pos)
+            reference_sources = {
+                'current_shop': shop_source, 'target_shop': shop_source,
+                'target_food': shop_source, 'target_drink': shop_source,
+                'current_ride': ride_source, 'target_ride': ride_source,
+                'target_restroom': (self.restroom_registry, restrooms_by_pos),
+            }
             for guest in self.guests:
-                if hasattr(guest, '_save_data'):
+                if guest._save_data is not None:
                     guest_data = guest._save_data
-
-                    # Restore shop references
-                    if 'current_shop_x' in guest_data and 'current_shop_y' in guest_data:
-                        for shop in self.shops:
-                            if shop.x == guest_data['current_shop_x'] and shop.y == guest_data['current_shop_y']:
-                                guest.current_shop = shop
-                                break
-                    if 'target_shop_x' in guest_data and 'target_shop_y' in guest_data:
-                        for shop in self.shops:
-                            if shop.x == guest_data['target_shop_x'] and shop.y == guest_data['target_shop_y']:
-                                guest.target_shop = shop
-                                break
-                    if 'target_food_x' in guest_data and 'target_food_y' in guest_data:
-                        for shop in self.shops:
-                            if shop.x == guest_data['target_food_x'] and shop.y == guest_data['target_food_y']:
-                                guest.target_food = shop
-                                break
-                    if 'target_drink_x' in guest_data and 'target_drink_y' in guest_data:
-                        for shop in self.shops:
-                            if shop.x == guest_data['target_drink_x'] and shop.y == guest_data['target_drink_y']:
-                                guest.target_drink = shop
-                                break
-
-                    # Restore ride references
-                    if 'current_ride_x' in guest_data and 'current_ride_y' in guest_data:
-                        for ride in self.rides:
-                            if ride.x == guest_data['current_ride_x'] and ride.y == guest_data['current_ride_y']:
-                                guest.current_ride = ride
-                                break
-                    if 'target_ride_x' in guest_data and 'target_ride_y' in guest_data:
-                        for ride in self.rides:
-                            if ride.x == guest_data['target_ride_x'] and ride.y == guest_data['target_ride_y']:
-                                guest.target_ride = ride
-                                break
-
-                    # Restore restroom reference
-                    if 'target_restroom_x' in guest_data and 'target_restroom_y' in guest_data:
-                        for restroom in self.restrooms:
-                            if restroom.x == guest_data['target_restroom_x'] and restroom.y == guest_data['target_restroom_y']:
-                                guest.target_restroom = restroom
-                                break
+                    for key in GUEST_REFERENCES:
+                        registry, by_position = reference_sources[key]
+                        target = self._saved_reference(guest_data, key, registry, by_position)
+                        if target is not None:
+                            setattr(guest, key, target)
 
                     # Clean up temporary save data
-                    delattr(guest, '_save_data')
+                    guest._save_data = None
 
                 # Reset guest state if references couldn't be restored
                 if guest.state == 'shopping' and not guest.current_shop:
                     guest.state = 'wandering'
-                    DebugConfig.log('guests', f"Guest {guest.id} was shopping but shop not found - reset to wandering")
+                    DebugConfig.log('guests', "Guest {} was shopping but shop not found - reset to wandering", guest.id)
                 if guest.state == 'riding' and not guest.current_ride:
                     guest.state = 'wandering'
-                    DebugConfig.log('guests', f"Guest {guest.id} was riding but ride not found - reset to wandering")
+                    DebugConfig.log('guests', "Guest {} was riding but ride not found - reset to wandering", guest.id)
                 if guest.state in ['walking_to_shop', 'eating', 'drinking'] and not guest.target_shop and not guest.target_food and not guest.target_drink:
                     guest.state = 'wandering'
-                    DebugConfig.log('guests', f"Guest {guest.id} was walking to shop but target not found - reset to wandering")
+                    DebugConfig.log('guests', "Guest {} was walking to shop but target not found - reset to wandering", guest.id)
                 if guest.state in ['walking_to_restroom', 'using_restroom'] and not guest.target_restroom:
                     guest.state = 'wandering'
-                    DebugConfig.log('guests', f"Guest {guest.id} was using restroom but target not found - reset to wandering")
+                    DebugConfig.log('guests', "Guest {} was using restroom but target not found - reset to wandering", guest.id)
+
+            # Restore ride visitor lists (saved as guest ids)
+            for ride, ride_data in restored_rides:
+                ride.current_visitors = [guest for guest in self.guest_registry.resolve(ride_data.get('current_visitors', ()))
+                                         if guest.current_ride is ride and guest.state == 'riding']
+                ride.waiting_visitors = self.guest_registry.resolve(ride_data.get('waiting_visitors', ()))
 
             # Update queue system
             self._update_queue_system()
@@ -4397,45 +4668,45 @@ class Game:
                             if success:
                                 guest.current_queue = queue_path
                                 guest.target_queue = queue_path
-                                DebugConfig.log('queues', f"Restored guest {guest.id} to queue for {guest.target_ride.defn.name}")
+                                DebugConfig.log('queues', "Restored guest {} to queue for {}", guest.id, guest.target_ride.defn.name)
                             else:
                                 # Queue full, reset to wandering
                                 guest.state = 'wandering'
                                 guest.target_ride = None
                                 guest.current_queue = None
                                 guest.target_queue = None
-                                DebugConfig.log('queues', f"Guest {guest.id} was queuing but queue full - reset to wandering")
+                                DebugConfig.log('queues', "Guest {} was queuing but queue full - reset to wandering", guest.id)
                         else:
                             # No queue found, reset to wandering
                             guest.state = 'wandering'
                             guest.target_ride = None
                             guest.current_queue = None
                             guest.target_queue = None
-                            DebugConfig.log('queues', f"Guest {guest.id} was queuing but no queue found - reset to wandering")
+                            DebugConfig.log('queues', "Guest {} was queuing but no queue found - reset to wandering", guest.id)
                     else:
                         # No target ride, reset to wandering
                         guest.state = 'wandering'
                         guest.current_queue = None
                         guest.target_queue = None
-                        DebugConfig.log('queues', f"Guest {guest.id} was queuing but no target ride - reset to wandering")
+                        DebugConfig.log('queues', "Guest {} was queuing but no target ride - reset to wandering", guest.id)
                 elif guest.state == 'walking_to_queue':
                     # Guest was walking to a queue - restore queue reference
                     if guest.target_ride:
                         queue_path = self.queue_manager.get_queue_for_ride(guest.target_ride)
                         if queue_path:
                             guest.target_queue = queue_path
-                            DebugConfig.log('queues', f"Restored target_queue for guest {guest.id} walking to {guest.target_ride.defn.name}")
+                            DebugConfig.log('queues', "Restored target_queue for guest {} walking to {}", guest.id, guest.target_ride.defn.name)
                         else:
                             # No queue found, reset to wandering
                             guest.state = 'wandering'
                             guest.target_ride = None
                             guest.target_queue = None
-                            DebugConfig.log('queues', f"Guest {guest.id} was walking_to_queue but no queue found - reset to wandering")
+                            DebugConfig.log('queues', "Guest {} was walking_to_queue but no queue found - reset to wandering", guest.id)
                     else:
                         # No target ride, reset to wandering
                         guest.state = 'wandering'
                         guest.target_queue = None
-                        DebugConfig.log('queues', f"Guest {guest.id} was walking_to_queue but no target ride - reset to wandering")
+                        DebugConfig.log('queues', "Guest {} was walking_to_queue but no target ride - reset to wandering", guest.id)
 
             print(f"Game loaded successfully from: {save_name}")
             return True
@@ -4446,9 +4717,44 @@ class Game:
             traceback.print_exc()
             return False
 
+    def step(self, dt=None):
+        """Advance the simulation without handling input or drawing
+
+        Args:
+            dt: Real seconds to simulate (consumed in fixed steps), or None for exactly one fixed step
+
+        Returns:
+            Number of fixed steps simulated
+        """
+        if dt is None:
+            dt = self.sim_dt / max(self.game_speed, 1.0)
+        return self.advance(dt, max_steps=float('inf'))
+
+    def run_headless(self, ticks):
+        """Run a number of fixed simulation steps as fast as possible (no display)
+
+        Returns:
+            Number of ticks simulated per real second
+        """
+        import time
+        start = time.perf_counter()
+        for _ in range(ticks):
+            self.step()
+        elapsed = time.perf_counter() - start
+        return ticks / elapsed if elapsed > 0 else float('inf')
+
     def run(self):
         running=True
         while running:
             dt=self.clock.tick(60)/1000.0
-            running,_,hover=self.handle_events(); self.update(dt); self.draw(hover)
+            running,_,hover=self.handle_events()
+            self.advance(dt); self.update_presentation(dt)
+            if self.is_turbo():
+                # Turbo: only draw a frame every turbo_draw_interval seconds
+                self._turbo_draw_timer += dt
+                if self._turbo_draw_timer < self.turbo_draw_interval:
+                    continue
+                self._turbo_draw_timer = 0.0
+            self.draw(hover)
+            self.profiler.end_frame()
         pygame.quit()
@@ -0,0 +1,67 @@
+"""
+Entity IDs for OpenPark
+One monotonic counter hands out the ids of every guest, employee, ride, shop
+and restroom (never reused, saved with the park), and one registry per kind
+maps id -> object so that references can be resolved without scanning lists.
+"""
+
+from typing import Dict, Iterable, Optional
+
+
+class EntityIdAllocator:
+    """Monotonic id counter shared by every entity kind"""
+
+    def __init__(self, next_id: int = 1):
+        self.next_id = next_id
+
+    def allocate(self) -> int:
+        entity_id = self.next_id
+        self.next_id += 1
+        return entity_id
+
+    def observe(self, entity_id: int):
+        """Make sure an id restored from a save is never handed out again"""
+        if entity_id >= self.next_id:
+            self.next_id = entity_id + 1
+
+    def reset(self, next_id: int = 1):
+        self.next_id = next_id
+
+
+class EntityRegistry:
+    """id -> entity map of one entity kind (entities keep their id in entity.id)"""
+
+    def __init__(self, ids: EntityIdAllocator):
+        self.ids = ids
+        self.by_id: Dict[int, object] = {}
+
+    def add(self, entity):
+        """Register an entity, giving it a new id if it has none (or a duplicate one)"""
+        entity_id = entity.id
+        if not entity_id or self.by_id.get(entity_id, entity) is not entity:
+            entity.id = entity_id = self.ids.allocate()
+        else:
+            self.ids.observe(entity_id)
+        self.by_id[entity_id] = entity
+        return entity
+
+    def remove(self, entity):
+        if self.by_id.get(entity.id) is entity:
+            del self.by_id[entity.id]
+
+    def get(self, entity_id) -> Optional[object]:
+        return self.by_id.get(entity_id)
+
+    def resolve(self, entity_ids: Iterable[int]):
+        """Objects of the given ids (unknown ids are skipped)"""
+        by_id = self.by_id
+        return [by_id[i] for i in entity_ids if i in by_id]
+
+    def clear(self):
+        self.by_id.clear()
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __contains__(self, entity_id):
+        return entity_id in self.by_id
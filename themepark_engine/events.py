@@ -0,0 +1,63 @@
+"""
+Guest lifecycle events for OpenPark
+Guests (and rides) emit typed events at the moment something happens; the engine
+dispatches them in one batch per tick instead of diffing every guest's state
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List
+
+
+class GuestEventType:
+    PURCHASE_COMPLETED = "purchase_completed"  # data: shop, kind ('shop', 'food' or 'drink')
+    RIDE_COMPLETED = "ride_completed"          # data: ride
+    QUEUE_JOINED = "queue_joined"              # data: queue, queue_length
+    BIN_USED = "bin_used"                      # data: bin
+
+
+@dataclass
+class GuestEvent:
+    type: str
+    guest: object
+    data: Dict = field(default_factory=dict)
+
+
+class GuestEventBus:
+    """Collects guest events during a tick and hands them to the subscribed handlers"""
+
+    def __init__(self):
+        self.pending: List[GuestEvent] = []
+        self.handlers: Dict[str, List[Callable[[GuestEvent], None]]] = {}
+
+    def subscribe(self, event_type: str, handler: Callable[[GuestEvent], None]):
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def emit(self, event_type: str, guest, **data):
+        """Queue an event (processed at the next dispatch)"""
+        self.pending.append(GuestEvent(event_type, guest, data))
+
+    def dispatch(self) -> int:
+        """Process every pending event in emission order
+
+        Events emitted by handlers are processed in the same batch.
+
+        Returns:
+            Number of events processed
+        """
+        processed = 0
+        while processed < len(self.pending):
+            event = self.pending[processed]
+            processed += 1
+            for handler in self.handlers.get(event.type, ()):
+                handler(event)
+        self.pending.clear()
+        return processed
+
+    def reset(self):
+        """Drop pending events and handlers (new game)"""
+        self.pending.clear()
+        self.handlers.clear()
+
+
+# Shared bus (guests and rides have no reference to the game)
+guest_events = GuestEventBus()
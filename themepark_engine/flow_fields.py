@@ -0,0 +1,308 @@
+"""
+Flow fields for OpenPark
+One breadth-first search from a destination (queue entrance, shop entrance,
+park entrance) gives every tile its walking distance to it and the next tile
+to step on. Guests read distances and follow next hops in O(1) per tile
+instead of running A* from their own position: N guests x K destinations
+becomes K searches, redone only after the grid changes.
+
+NearestFacilityField is the multi-source version: one field per facility
+category (food, drink, restrooms) holding, for every tile, the nearest
+facility of the category. It is updated incrementally when facilities
+appear or go away (built, removed, full, disconnected).
+
+Paths match pathfinding.astar: 4-directional, over walkable tiles, the
+destination itself may be a non-walkable tile (entrances) and so may the
+start tile.
+"""
+
+from array import array
+from collections import OrderedDict
+from heapq import heappush, heappop
+from typing import Dict, Optional, Tuple
+
+from .map import FLAG_WALKABLE
+from .paths import TilePath
+
+
+def walkable_mask(grid) -> bytearray:
+    """1 per walkable tile of the grid (flat index y*width+x)"""
+    return grid.mask(FLAG_WALKABLE)
+
+
+class FlowField:
+    """BFS distance and next-hop field towards one destination tile"""
+
+    __slots__ = ('goal', 'width', 'dist', 'next_hop')
+
+    def __init__(self, goal: Tuple[int, int], width: int, dist: array, next_hop: array):
+        self.goal = goal
+        self.width = width
+        self.dist = dist          # Steps to the goal, -1 when unreachable (flat index y*width+x)
+        self.next_hop = next_hop  # Flat index of the next tile towards the goal, -1 at the goal
+
+    def _entry(self, x: int, y: int, height: int) -> int:
+        """Flat index of the first field tile from (x, y), -1 if none (start tile may be outside the field)"""
+        width = self.width
+        i = y * width + x
+        if self.dist[i] >= 0:
+            return i
+        # Start tile not reached (not walkable): step onto the closest reached neighbour,
+        # in the neighbour order of pathfinding.astar
+        best, best_dist = -1, -1
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < width and 0 <= ny < height:
+                d = self.dist[ny * width + nx]
+                if d >= 0 and (best < 0 or d < best_dist):
+                    best, best_dist = ny * width + nx, d
+        return best
+
+    def distance(self, x: int, y: int, height: int) -> int:
+        """Steps from (x, y) to the goal, -1 when unreachable"""
+        d = self.dist[y * self.width + x]
+        if d >= 0:
+            return d
+        entry = self._entry(x, y, height)
+        return self.dist[entry] + 1 if entry >= 0 else -1
+
+    def path(self, x: int, y: int, height: int) -> Optional[TilePath]:
+        """Tiles from (x, y) to the goal included (same tiles as astar), None when unreachable"""
+        width = self.width
+        i = self._entry(x, y, height)
+        if i < 0:
+            return None
+        tiles = array('i') if i == y * width + x else array('i', [y * width + x])
+        next_hop = self.next_hop
+        while i >= 0:
+            tiles.append(i)
+            i = next_hop[i]
+        return TilePath(tiles, width)
+
+
+class FlowFieldService:
+    """Flow fields of one grid, built on demand and dropped when the grid changes"""
+
+    def __init__(self, grid, max_fields: int = 256):
+        self.grid = grid
+        self.max_fields = max_fields
+        self.fields = OrderedDict()  # {goal: FlowField}, least recently used first
+        self.grid_version = None
+        self.walkable = None  # bytearray of walkable flags for the current grid version
+        self.builds = 0
+
+    def _sync(self):
+        grid = self.grid
+        if grid.version != self.grid_version:
+            self.grid_version = grid.version
+            self.fields.clear()
+            self.walkable = walkable_mask(grid)
+
+    def field(self, goal: Tuple[int, int]) -> FlowField:
+        """Flow field towards goal (built if missing or out of date)"""
+        self._sync()
+        fields = self.fields
+        field = fields.get(goal)
+        if field is not None:
+            fields.move_to_end(goal)
+            return field
+        field = self._build(goal)
+        if len(fields) >= self.max_fields:
+            fields.popitem(last=False)
+        fields[goal] = field
+        return field
+
+    def _build(self, goal: Tuple[int, int]) -> FlowField:
+        w, h = self.grid.width, self.grid.height
+        n = w * h
+        walkable = self.walkable
+        dist = array('i', [-1]) * n
+        next_hop = array('i', [-1]) * n
+        gx, gy = goal
+        start = gy * w + gx
+        dist[start] = 0
+        frontier = [start]
+        head = 0
+        while head < len(frontier):
+            i = frontier[head]
+            head += 1
+            d = dist[i] + 1
+            x = i % w
+            if x + 1 < w:
+                j = i + 1
+                if dist[j] < 0 and walkable[j]:
+                    dist[j] = d; next_hop[j] = i; frontier.append(j)
+            if x > 0:
+                j = i - 1
+                if dist[j] < 0 and walkable[j]:
+                    dist[j] = d; next_hop[j] = i; frontier.append(j)
+            j = i + w
+            if j < n and dist[j] < 0 and walkable[j]:
+                dist[j] = d; next_hop[j] = i; frontier.append(j)
+            j = i - w
+            if j >= 0 and dist[j] < 0 and walkable[j]:
+                dist[j] = d; next_hop[j] = i; frontier.append(j)
+        self.builds += 1
+        return FlowField(goal, w, dist, next_hop)
+
+    def distance(self, start: Tuple[int, int], goal: Tuple[int, int]) -> int:
+        """Walking steps from start to goal, -1 when unreachable"""
+        if not self.grid.in_bounds(*start):
+            return -1
+        return self.field(goal).distance(start[0], start[1], self.grid.height)
+
+    def path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[TilePath]:
+        """Path from start to goal (both included), None when unreachable"""
+        if not self.grid.in_bounds(*start):
+            return None
+        return self.field(goal).path(start[0], start[1], self.grid.height)
+
+    def clear(self):
+        self.fields.clear()
+        self.grid_version = None
+
+
+class NearestFacilityField(FlowField):
+    """Multi-source BFS field: nearest facility of one category from every tile
+
+    Facilities are identified by their entity id and reached through source
+    tiles (shop entrance, walk tiles around a restroom). update() diffs the
+    current facilities against the field: new ones relax the tiles they are
+    now closest to, removed ones clear the region they owned and refill it
+    from its border. Grid changes rebuild the whole field.
+    """
+
+    __slots__ = ('grid', 'grid_version', 'walkable', 'sources', 'owner', 'rebuilds', 'updates')
+
+    def __init__(self, grid):
+        super().__init__(None, grid.width, None, None)
+        self.grid = grid
+        self.grid_version = None
+        self.walkable = None
+        self.sources: Dict[int, Tuple[Tuple[int, int], ...]] = {}  # {facility id: source tiles}
+        self.owner = None  # Facility id of the nearest facility per tile, 0 when none is reachable
+        self.rebuilds = 0
+        self.updates = 0
+
+    def update(self, sources: Dict[int, Tuple[Tuple[int, int], ...]]):
+        """Bring the field in line with the current {facility id: source tiles}"""
+        if self.grid.version != self.grid_version:
+            self.sources = dict(sources)
+            self._rebuild()
+            return
+        current = self.sources
+        if current == sources:
+            return
+        for facility_id in [f for f, tiles in current.items() if sources.get(f) != tiles]:
+            self._remove(facility_id)
+        for facility_id, tiles in sources.items():
+            if facility_id not in current:
+                self._add(facility_id, tiles)
+        self.updates += 1
+
+    def nearest(self, x: int, y: int):
+        """(facility id, path to it including (x, y)) of the nearest facility, None when none is reachable"""
+        height = self.grid.height
+        if not (0 <= x < self.width and 0 <= y < height):
+            return None
+        entry = self._entry(x, y, height)
+        if entry < 0:
+            return None
+        return self.owner[entry], self.path(x, y, height)
+
+    def _rebuild(self):
+        grid = self.grid
+        self.grid_version = grid.version
+        self.width = w = grid.width
+        n = w * grid.height
+        self.walkable = walkable_mask(grid)
+        self.dist = array('i', [-1]) * n
+        self.next_hop = array('i', [-1]) * n
+        self.owner = array('i', [0]) * n
+        frontier = []
+        for facility_id, tiles in self.sources.items():
+            frontier.extend(self._seed(facility_id, tiles))
+        self._spread(frontier)
+        self.rebuilds += 1
+
+    def _seed(self, facility_id, tiles):
+        """Make the tiles sources of a facility (tiles already used by another one are kept)"""
+        w = self.width
+        dist, owner, next_hop = self.dist, self.owner, self.next_hop
+        seeded = []
+        for x, y in tiles:
+            i = y * w + x
+            if dist[i] != 0:
+                dist[i] = 0; owner[i] = facility_id; next_hop[i] = -1
+                seeded.append(i)
+        return seeded
+
+    def _spread(self, frontier):
+        """BFS from tiles sorted by distance, taking over every tile it gets strictly closer to"""
+        w = self.width
+        n = len(self.dist)
+        dist, owner, next_hop, walkable = self.dist, self.owner, self.next_hop, self.walkable
+        head = 0
+        while head < len(frontier):
+            i = frontier[head]
+            head += 1
+            d = dist[i] + 1
+            o = owner[i]
+            x = i % w
+            for j in (i + 1 if x + 1 < w else -1, i - 1 if x > 0 else -1, i + w if i + w < n else -1, i - w):
+                if j >= 0 and walkable[j] and (dist[j] < 0 or dist[j] > d):
+                    dist[j] = d; owner[j] = o; next_hop[j] = i
+                    frontier.append(j)
+
+    def _add(self, facility_id, tiles):
+        self.sources[facility_id] = tiles
+        self._spread(self._seed(facility_id, tiles))
+
+    def _remove(self, facility_id):
+        tiles = self.sources.pop(facility_id)
+        w = self.width
+        n = len(self.dist)
+        dist, owner, next_hop, walkable = self.dist, self.owner, self.next_hop, self.walkable
+
+        # Region the facility was nearest to (connected through its next-hop tree)
+        region = [y * w + x for x, y in tiles if owner[y * w + x] == facility_id]
+        for i in region:
+            owner[i] = -1  # Marked while collecting
+        head = 0
+        while head < len(region):
+            i = region[head]
+            head += 1
+            x = i % w
+            for j in (i + 1 if x + 1 < w else -1, i - 1 if x > 0 else -1, i + w if i + w < n else -1, i - w):
+                if j >= 0 and owner[j] == facility_id:
+                    owner[j] = -1
+                    region.append(j)
+        for i in region:
+            dist[i] = -1; owner[i] = 0; next_hop[i] = -1
+
+        # Refill it: source tiles it shared with other facilities first, then from
+        # the tiles around it that other facilities still reach
+        heap = []
+        for other_id, other_tiles in self.sources.items():
+            for i in self._seed(other_id, other_tiles):
+                heappush(heap, (0, i))
+        for i in region:
+            if not walkable[i] or dist[i] == 0:
+                continue
+            x = i % w
+            for j in (i + 1 if x + 1 < w else -1, i - 1 if x > 0 else -1, i + w if i + w < n else -1, i - w):
+                if j >= 0 and dist[j] >= 0 and (dist[i] < 0 or dist[j] + 1 < dist[i]):
+                    dist[i] = dist[j] + 1; owner[i] = owner[j]; next_hop[i] = j
+            if dist[i] >= 0:
+                heappush(heap, (dist[i], i))
+        ordered = []
+        while heap:
+            d, i = heappop(heap)
+            if d == dist[i]:
+                ordered.append(i)
+        # Border tiles are ordered by distance: a plain BFS pass finishes the job
+        # (a tile may be relaxed again by a closer one popped later)
+        self._spread(ordered)
+
+    def clear(self):
+        self.sources = {}
+        self.grid_version = None
@@ -0,0 +1,55 @@
+"""
+Guest object pool for OpenPark
+Guests leaving the park are kept (with their row in the GuestStateStore) and
+re-initialized through Guest.reset() for the next arrivals, instead of
+building and dropping a large object for every visit.
+"""
+
+from typing import List, Optional
+
+from .agents import Guest
+from .paths import PathCursor
+
+
+class GuestPool:
+    """Free list of Guest instances bound to one GuestStateStore"""
+
+    def __init__(self, store, max_size: int = 2048):
+        self.store = store
+        self.max_size = max_size  # Guests beyond this are dropped (and their store row freed)
+        self.free: List[Guest] = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, x: float, y: float, budget: Optional[int] = None) -> Guest:
+        """A guest initialized exactly like Guest(x, y, store, budget)"""
+        if self.free:
+            guest = self.free.pop()
+            guest.reset(x, y, budget)
+            self.reused += 1
+            return guest
+        self.created += 1
+        return Guest(x, y, self.store, budget)
+
+    def release(self, guest: Guest):
+        """Take back a guest that left the game (it must not be referenced anymore)"""
+        if len(self.free) >= self.max_size:
+            guest.release()
+            return
+        self.store.pending_dt[guest._slot] = 0.0
+        # Drop references now so the pool does not keep rides, shops or paths alive
+        guest.path = PathCursor()
+        guest.path_request = None  # A path still in the queue is ignored when it comes back
+        guest.tried_rides = {}
+        guest.current_queue = guest.current_queue_tile = guest.target_queue = None
+        guest.target_ride = guest.current_ride = None
+        guest.target_shop = guest.current_shop = None
+        guest.target_food = guest.target_drink = guest.target_restroom = guest.target_bin = None
+        guest.sleep_entry = None
+        guest._save_data = None
+        guest.active_index = -1
+        self.free.append(guest)
+
+    def clear(self):
+        """Forget the pooled guests (their store is being cleared)"""
+        self.free.clear()
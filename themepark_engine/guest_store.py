@@ -0,0 +1,212 @@
+"""
+Columnar guest state store for OpenPark
+Needs and mood values of every guest live in one array per field, indexed by
+the guest's slot. Guest objects read and write them through StoreField
+descriptors, and the engine runs the per-tick decay (natural degradation,
+needs, unmet-need penalties, outdoor weather penalty) as one vectorized pass.
+
+NumPy is a requirement (requirements.txt) and the vectorized pass the
+normal one. Environments without it still run: the columns are then
+array('d') and the pass is a plain Python loop over the slots to update.
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+# Natural degradation (per second)
+HAPPINESS_DECAY = 0.005     # Needs constant stimulation
+EXCITEMENT_DECAY = 0.01     # Fades quickly
+SATISFACTION_DECAY = 0.002  # Decreases very slowly
+
+# Needs (per second; 1 in-game hour = 30s real time at x1 speed)
+HUNGER_RATE = 0.00333    # -0.10/hour (0.0 = starving, 1.0 = full)
+THIRST_RATE = 0.005      # -0.15/hour (0.0 = parched, 1.0 = hydrated)
+BLADDER_RATE = 0.00267   # +0.08/hour (0.0 = empty, 1.0 = urgent)
+
+# Satisfaction penalties for unmet needs (per second)
+HUNGER_PENALTY = 0.02       # hunger < 0.3
+THIRST_PENALTY = 0.03       # thirst < 0.3
+BLADDER_PENALTY = 0.03      # bladder > 0.7
+BLADDER_URGENT_PENALTY = 0.10  # bladder >= 0.9
+
+
+class StoreField:
+    """Guest attribute stored in a column of the guest's GuestStateStore"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, guest, owner):
+        if guest is None:
+            return self
+        return float(guest._store.columns[self.name][guest._slot])
+
+    def __set__(self, guest, value):
+        guest._store.columns[self.name][guest._slot] = value
+
+
+class GuestStateStore:
+    """Struct-of-arrays storage of the guests' needs and mood"""
+
+    FIELDS = ('hunger', 'thirst', 'bladder', 'happiness', 'excitement', 'satisfaction')
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = 0
+        self.size = 0  # Slots in use or freed (high-water mark)
+        self.free_slots = []
+        self.columns = {}
+        self.pending_dt = None  # Simulation time to decay each slot by at the next apply_decay()
+        self.outdoor = None     # 1 when the guest ended its tick outdoors (weather penalty)
+        self._allocate(capacity)
+
+    def _new_column(self, capacity, old=None):
+        if np is not None:
+            column = np.zeros(capacity, dtype=np.float64)
+            if old is not None:
+                column[:len(old)] = old
+            return column
+        column = array('d', bytes(8 * capacity))
+        if old is not None:
+            column[:len(old)] = old
+        return column
+
+    @staticmethod
+    def _zero(column):
+        if np is not None:
+            column[:] = 0.0
+        else:
+            column[:] = array('d', bytes(8 * len(column)))
+
+    def _allocate(self, capacity):
+        for name in self.FIELDS:
+            self.columns[name] = self._new_column(capacity, self.columns.get(name))
+        self.pending_dt = self._new_column(capacity, self.pending_dt)
+        self.outdoor = self._new_column(capacity, self.outdoor)
+        self.capacity = capacity
+
+    def acquire(self) -> int:
+        """Reserve a slot for a new guest (values and pending decay start at 0)"""
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            if self.size == self.capacity:
+                self._allocate(self.capacity * 2)
+            slot = self.size
+            self.size += 1
+        for name in self.FIELDS:
+            self.columns[name][slot] = 0.0
+        self.pending_dt[slot] = 0.0
+        self.outdoor[slot] = 0.0
+        return slot
+
+    def release(self, slot: int):
+        """Give a slot back (guest removed from the park)"""
+        self.pending_dt[slot] = 0.0
+        self.outdoor[slot] = 0.0
+        self.free_slots.append(slot)
+
+    def clear(self):
+        """Forget every slot (new game / load)"""
+        self.size = 0
+        self.free_slots.clear()
+        self._zero(self.pending_dt)
+        self._zero(self.outdoor)
+
+    @property
+    def active(self) -> int:
+        return self.size - len(self.free_slots)
+
+    def apply_decay(self, weather_penalty: float = 0.0) -> int:
+        """Decay every slot by its pending dt, then reset the pending dt
+
+        Args:
+            weather_penalty: Satisfaction change per in-game minute for guests flagged outdoor
+                             (only applied when negative)
+
+        Returns:
+            Number of guests updated
+        """
+        if np is not None:
+            return self._apply_decay_numpy(weather_penalty)
+        return self._apply_decay_python(weather_penalty)
+
+    def _apply_decay_numpy(self, weather_penalty):
+        n = self.size
+        idx = np.flatnonzero(self.pending_dt[:n])
+        if idx.size == 0:
+            return 0
+        dt = self.pending_dt[idx]
+        c = self.columns
+
+        c['happiness'][idx] = np.maximum(0.0, c['happiness'][idx] - HAPPINESS_DECAY * dt)
+        c['excitement'][idx] = np.maximum(0.0, c['excitement'][idx] - EXCITEMENT_DECAY * dt)
+        satisfaction = np.maximum(0.0, c['satisfaction'][idx] - SATISFACTION_DECAY * dt)
+
+        hunger = np.maximum(0.0, c['hunger'][idx] - HUNGER_RATE * dt)
+        thirst = np.maximum(0.0, c['thirst'][idx] - THIRST_RATE * dt)
+        bladder = np.minimum(1.0, c['bladder'][idx] + BLADDER_RATE * dt)
+        c['hunger'][idx] = hunger
+        c['thirst'][idx] = thirst
+        c['bladder'][idx] = bladder
+
+        # Penalties only subtract: one clamp is the same as clamping after each of them
+        penalty = np.where(hunger < 0.3, HUNGER_PENALTY, 0.0)
+        penalty += np.where(thirst < 0.3, THIRST_PENALTY, 0.0)
+        penalty += np.where(bladder > 0.7, np.where(bladder < 0.9, BLADDER_PENALTY, BLADDER_URGENT_PENALTY), 0.0)
+        satisfaction = np.maximum(0.0, satisfaction - penalty * dt)
+
+        # Weather is not clamped (same as the per-guest code it replaces)
+        if weather_penalty < 0:
+            satisfaction += self.outdoor[idx] * (weather_penalty * dt / 60.0)
+        c['satisfaction'][idx] = satisfaction
+
+        self.pending_dt[idx] = 0.0
+        self.outdoor[idx] = 0.0
+        return int(idx.size)
+
+    def _apply_decay_python(self, weather_penalty):
+        pending = self.pending_dt
+        outdoor = self.outdoor
+        c = self.columns
+        hunger_c, thirst_c, bladder_c = c['hunger'], c['thirst'], c['bladder']
+        happiness_c, excitement_c, satisfaction_c = c['happiness'], c['excitement'], c['satisfaction']
+        weather = weather_penalty / 60.0 if weather_penalty < 0 else 0.0
+        updated = 0
+        for slot in range(self.size):
+            dt = pending[slot]
+            if not dt:
+                continue
+            updated += 1
+            happiness_c[slot] = max(0.0, happiness_c[slot] - HAPPINESS_DECAY * dt)
+            excitement_c[slot] = max(0.0, excitement_c[slot] - EXCITEMENT_DECAY * dt)
+            satisfaction = max(0.0, satisfaction_c[slot] - SATISFACTION_DECAY * dt)
+
+            hunger = hunger_c[slot] = max(0.0, hunger_c[slot] - HUNGER_RATE * dt)
+            thirst = thirst_c[slot] = max(0.0, thirst_c[slot] - THIRST_RATE * dt)
+            bladder = bladder_c[slot] = min(1.0, bladder_c[slot] + BLADDER_RATE * dt)
+
+            penalty = 0.0
+            if hunger < 0.3:
+                penalty += HUNGER_PENALTY
+            if thirst < 0.3:
+                penalty += THIRST_PENALTY
+            if bladder > 0.7:
+                penalty += BLADDER_PENALTY if bladder < 0.9 else BLADDER_URGENT_PENALTY
+            if penalty:
+                satisfaction = max(0.0, satisfaction - penalty * dt)
+
+            if outdoor[slot]:
+                satisfaction += weather * dt
+                outdoor[slot] = 0.0
+            satisfaction_c[slot] = satisfaction
+            pending[slot] = 0.0
+        return updated
+
+
+# Store of the guests created without one (each Game owns its own store)
+guest_store = GuestStateStore()
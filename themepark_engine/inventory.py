@@ -6,7 +6,9 @@ Handles global stock, ordering, delivery, and inflation for theme park shops
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from datetime import datetime
-import random
+from .rng import SimRandom
+
+_rng = SimRandom.stream(SimRandom.ECONOMY)
 
 
 @dataclass
@@ -101,19 +103,19 @@ class InventoryManager:
 
         if quantity <= 50:
             discount = 0.0
-            delivery_days = random.randint(1, 3)
+            delivery_days = _rng.randint(1, 3)
         elif quantity <= 100:
             discount = 0.10
-            delivery_days = random.randint(4, 7)
+            delivery_days = _rng.randint(4, 7)
         elif quantity <= 200:
             discount = 0.15
-            delivery_days = random.randint(8, 14)
+            delivery_days = _rng.randint(8, 14)
         elif quantity <= 500:
             discount = 0.20
-            delivery_days = random.randint(15, 21)
+            delivery_days = _rng.randint(15, 21)
         else:
             discount = 0.25
-            delivery_days = random.randint(22, 30)
+            delivery_days = _rng.randint(22, 30)
 
         discounted_cost = base_cost * (1.0 - discount)
         total_cost = discounted_cost * quantity
@@ -183,7 +185,7 @@ class InventoryManager:
             return  # Already applied this year
 
         # Random inflation between 1% and 3%
-        annual_increase = random.uniform(0.01, 0.03)
+        annual_increase = _rng.uniform(0.01, 0.03)
         self.inflation_rate *= (1.0 + annual_increase)
         self.last_inflation_year = year
 
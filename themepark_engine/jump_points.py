@@ -0,0 +1,138 @@
+"""
+Jump Point Search for OpenPark
+4-directional, uniform cost variant of Jump Point Search for walkers of
+mostly open terrain (grass maintenance workers, engineers). On open ground
+plain A* pushes every tile of the start-goal rectangle: all its paths have
+the same length. JPS only stops on jump points (the goal, and tiles where
+an obstacle ends beside the line being followed, so that a turn there may
+be needed) and pushes those to the heap; straight runs in between are
+scanned without touching the heap.
+
+Pruning rules (horizontal moves first, vertical moves look sideways):
+    - moving horizontally, a tile is a jump point when the tile above or
+      below it is passable but was blocked beside the previous tile;
+    - moving vertically, same test on the tiles left and right, and a
+      tile is also a jump point when a horizontal scan from it finds one;
+    - from a jump point, search goes straight on and turns 90 degrees
+      both ways (every direction from the start).
+
+Same rules as pathfinding.astar_profile: the start tile may be
+impassable, the goal too when enter_goal is set. Paths have the same
+length as A*'s, the tiles of equal-length paths may differ.
+"""
+
+from array import array
+from heapq import heappush, heappop
+
+from .map import FLAG_WALKABLE, flag_mask_table
+
+
+def jps_flat(flags, width: int, height: int, start: int, goal: int,
+             flag: int = FLAG_WALKABLE, enter_goal: bool = True):
+    """Shortest path on flat tile indices (array('i') from start to goal, or None)
+
+    Args:
+        flags: MapGrid.flags (or a copy of it), one byte per tile
+        flag: Tile flag of the passable tiles
+        enter_goal: The goal tile may be impassable
+    """
+    if start == goal:
+        return array('i', [start])
+    n = width * height
+    passable = bytearray(flags).translate(flag_mask_table(flag))
+    if not (passable[goal] or enter_goal):
+        return None
+    passable[goal] = 1
+    passable[start] = 1  # Only left: no shortest path comes back through it
+
+    def jump_horizontal(i, dx):
+        """Next jump point from tile i going left (-1) or right (+1), -1 if none
+
+        Rows are scanned with bytearray searches: the run ends on the first
+        impassable tile, and a forced tile shows as a blocked/passable pair
+        in the row above or below.
+        """
+        row = i - i % width
+        if dx > 0:
+            end = passable.find(0, i + 1, row + width)  # First tile the run cannot enter
+            if end < 0:
+                end = row + width
+            best = goal if i < goal < end else end
+            if row >= width:
+                k = passable.find(b'\x00\x01', i - width, best - width)
+                if k >= 0:
+                    best = k + 1 + width
+            if row + width < n:
+                k = passable.find(b'\x00\x01', i + width, best + width)
+                if k >= 0:
+                    best = k + 1 - width
+            return best if best < end else -1
+        end = passable.rfind(0, row, i)  # Same, to the left
+        if end < 0:
+            end = row - 1
+        best = goal if end < goal < i else end
+        if row >= width:
+            k = passable.rfind(b'\x01\x00', best + 1 - width, i + 1 - width)
+            if k >= 0:
+                best = k + width
+        if row + width < n:
+            k = passable.rfind(b'\x01\x00', best + 1 + width, i + 1 + width)
+            if k >= 0:
+                best = k - width
+        return best if best > end else -1
+
+    def jump_vertical(i, step):
+        """Next jump point from tile i going up (-width) or down (+width), -1 if none"""
+        while True:
+            i += step
+            if not 0 <= i < n or not passable[i]:
+                return -1
+            if i == goal:
+                return i
+            x = i % width
+            if x > 0 and passable[i - 1] and not passable[i - 1 - step]:
+                return i
+            if x + 1 < width and passable[i + 1] and not passable[i + 1 - step]:
+                return i
+            if jump_horizontal(i, 1) >= 0 or jump_horizontal(i, -1) >= 0:
+                return i
+
+    gx, gy = goal % width, goal // width
+    open_list = [(0, start)]
+    came = {start: -1}
+    g = {start: 0}
+    while open_list:
+        _, cur = heappop(open_list)
+        if cur == goal:
+            path = array('i', [goal])
+            while came[cur] >= 0:
+                prev = came[cur]
+                step = 1 if prev > cur else -1
+                if prev // width != cur // width:  # Vertical run
+                    step *= width
+                path.extend(range(cur + step, prev + step, step))
+                cur = prev
+            path.reverse()
+            return path
+        cost = g[cur]
+        x, y = cur % width, cur // width
+        prev = came[cur]
+        if prev < 0:
+            moves = ((1, 0), (-1, 0), (0, 1), (0, -1))
+        elif prev // width == y:  # Came horizontally: go on, or turn
+            dx = 1 if x > prev % width else -1
+            moves = ((dx, 0), (0, 1), (0, -1))
+        else:  # Came vertically
+            dy = 1 if y > prev // width else -1
+            moves = ((0, dy), (1, 0), (-1, 0))
+        for dx, dy in moves:
+            nxt = jump_horizontal(cur, dx) if dx else jump_vertical(cur, dy * width)
+            if nxt < 0:
+                continue
+            nx, ny = nxt % width, nxt // width
+            d = cost + abs(nx - x) + abs(ny - y)
+            if d < g.get(nxt, 1 << 30):
+                g[nxt] = d
+                came[nxt] = cur
+                heappush(open_list, (d + abs(nx - gx) + abs(ny - gy), nxt))
+    return None
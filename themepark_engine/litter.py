@@ -5,7 +5,9 @@ Handles litter generation, bins placement, and cleanliness management
 
 from dataclasses import dataclass
 from typing import Tuple, List, Optional
-import random
+from .rng import SimRandom
+
+_rng = SimRandom.stream(SimRandom.LITTER)
 
 
 @dataclass
@@ -20,6 +22,7 @@ class BinDef:
 
 class Litter:
     """Represents a piece of litter on the ground"""
+    __slots__ = ('x', 'y', 'type', 'age', 'offset_x', 'offset_y')
     
     # Define litter types with their colors (RGB)
     LITTER_TYPES = {
@@ -34,8 +37,8 @@ class Litter:
         self.type = litter_type  # soda, trash, vomit
         self.age = 0.0  # How long it's been there
         # Random offset within the tile for visual variety (0.1 to 0.9 of tile size)
-        self.offset_x = random.uniform(0.1, 0.9)
-        self.offset_y = random.uniform(0.1, 0.9)
+        self.offset_x = _rng.uniform(0.1, 0.9)
+        self.offset_y = _rng.uniform(0.1, 0.9)
     
     def get_colors(self):
         """Get the colors for this litter type"""
@@ -100,13 +103,13 @@ class LitterManager:
             # If no grid available, use original position (backward compatibility)
             return (x, y)
 
-        # TILE_WALK = 1, TILE_QUEUE_PATH = 5
+        # FLAG_LITTER_VALID: TILE_WALK and TILE_QUEUE_PATH only
         # Explicitly NOT including TILE_RIDE_ENTRANCE (2) or TILE_RIDE_EXIT (3)
         # to avoid visual issues with litter appearing on top of ride sprites
-        VALID_TILES = [1, 5]  # Walk paths and Queue paths only
+        from .map import FLAG_LITTER_VALID
 
         # Check current position first
-        if self.grid.in_bounds(x, y) and self.grid.get(x, y) in VALID_TILES:
+        if self.grid.in_bounds(x, y) and self.grid.has_flag(x, y, FLAG_LITTER_VALID):
             return (x, y)
 
         # Search in expanding radius (1, then 2, then 3 tiles away)
@@ -119,7 +122,7 @@ class LitterManager:
                         continue
 
                     check_x, check_y = x + dx, y + dy
-                    if self.grid.in_bounds(check_x, check_y) and self.grid.get(check_x, check_y) in VALID_TILES:
+                    if self.grid.in_bounds(check_x, check_y) and self.grid.has_flag(check_x, check_y, FLAG_LITTER_VALID):
                         return (check_x, check_y)
 
         # No valid position found within 3 tiles
@@ -143,7 +146,7 @@ class LitterManager:
         # If no type specified, choose randomly
         if litter_type is None:
             # Weight the probabilities: 50% soda, 40% trash, 10% vomit
-            rand = random.random()
+            rand = _rng.random()
             if rand < 0.5:
                 litter_type = "soda"
             elif rand < 0.9:
@@ -1,3 +1,10 @@
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
 
 TILE_GRASS = 0
 TILE_WALK  = 1
@@ -10,13 +17,161 @@ TILE_SHOP_FOOTPRINT = 7
 TILE_PARK_ENTRANCE = 8  # Fixed park entrance at south of map
 TILE_RESTROOM_FOOTPRINT = 9  # Restroom building tiles
 TILE_BIN = 10  # Trash bin placement
+CHANGE_LOG_SIZE = 4096  # Tile changes kept for the caches catching up with the grid
+
+# Tile flags (one byte per tile, kept in MapGrid.flags next to the tile types)
+FLAG_WALKABLE = 1            # Guests
+FLAG_ENGINEER_WALKABLE = 2   # Engineers go anywhere
+FLAG_MASCOT_WALKABLE = 4     # Walk paths and queue paths
+FLAG_LITTER_VALID = 8        # Walk paths and queue paths (entrances/exits are covered by ride sprites)
+FLAG_BIN_PLACEABLE = 16      # Grass next to a walk path (depends on the neighbours)
+FLAG_GRASS_WALKABLE = 32     # Grass maintenance workers: grass and walk paths
+
+WALKABLE_TILES = (TILE_WALK, TILE_RIDE_ENTRANCE, TILE_RIDE_EXIT, TILE_QUEUE_PATH, TILE_SHOP_ENTRANCE, TILE_PARK_ENTRANCE)
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))  # Bit order of MapGrid.neighbour_mask (same as pathfinding.astar)
+
+
+def _tile_flags(tile):
+    flags = FLAG_ENGINEER_WALKABLE
+    if tile in WALKABLE_TILES: flags |= FLAG_WALKABLE
+    if tile in (TILE_WALK, TILE_QUEUE_PATH): flags |= FLAG_MASCOT_WALKABLE | FLAG_LITTER_VALID
+    if tile in (TILE_GRASS, TILE_WALK): flags |= FLAG_GRASS_WALKABLE
+    return flags
+
+TILE_FLAGS = bytes(_tile_flags(t) for t in range(256))  # Flags of a tile type, apart from FLAG_BIN_PLACEABLE
+_FLAG_MASKS = {}  # {flag: bytes.translate table giving 1 for flag values holding it}
+
+
+def flag_mask_table(flag):
+    """bytes.translate table turning flag bytes into 1 (holding the flag) or 0"""
+    table=_FLAG_MASKS.get(flag)
+    if table is None: table=_FLAG_MASKS[flag]=bytes(1 if v&flag else 0 for v in range(256))
+    return table
+
+
 class MapGrid:
+    """Tile types and tile flags of the park, one byte each (flat index y*width+x)
+
+    Scalar access (get/set/walkable) stays on the bytearrays; with NumPy,
+    tile_array and flag_array are (height, width) read-only views of the
+    same memory for whole-grid queries. Walkable tiles are also kept in an
+    unordered index (swap-remove) for O(1) random picks.
+    """
     def __init__(self,w,h):
         self.width=w; self.height=h
-        self.tiles=[TILE_GRASS]*(w*h)
+        self.tiles=bytearray([TILE_GRASS])*(w*h)  # Write through set() only: flags follow the tiles
+        self.flags=bytearray([TILE_FLAGS[TILE_GRASS]])*(w*h)
+        self.version=0  # Incremented on every tile change (caches compare it to theirs)
+        self.changes=deque(maxlen=CHANGE_LOG_SIZE)  # (x, y) of the last changed tiles, oldest first
+        self.walkable_index=array('i')  # Flat indices of the walkable tiles, in no particular order
+        self.walkable_slot=array('i',[-1])*(w*h)  # Position of each tile in walkable_index, -1 if not walkable
+        self.tile_array=self.flag_array=None
+        if np is not None:
+            self.tile_array=np.frombuffer(self.tiles,dtype=np.uint8).reshape(h,w)
+            self.flag_array=np.frombuffer(self.flags,dtype=np.uint8).reshape(h,w)
+            self.tile_array.flags.writeable=False; self.flag_array.flags.writeable=False
     def idx(self,x,y): return y*self.width+x
     def in_bounds(self,x,y): return 0<=x<self.width and 0<=y<self.height
-    def get(self,x,y): return self.tiles[self.idx(x,y)]
-    def set(self,x,y,v): self.tiles[self.idx(x,y)]=v
-    def walkable(self,x,y): return self.get(x,y) in (TILE_WALK, TILE_RIDE_ENTRANCE, TILE_RIDE_EXIT, TILE_QUEUE_PATH, TILE_SHOP_ENTRANCE, TILE_PARK_ENTRANCE)
+    def get(self,x,y): return self.tiles[y*self.width+x]
+    def set(self,x,y,v):
+        i=y*self.width+x
+        if self.tiles[i]!=v:
+            self.tiles[i]=v; self.version+=1; self.changes.append((x,y))
+            self._update_flags(x,y)
+            for dx,dy in DIRECTIONS:
+                if 0<=x+dx<self.width and 0<=y+dy<self.height: self._update_flags(x+dx,y+dy)
+    def _update_flags(self,x,y):
+        i=y*self.width+x
+        flags=TILE_FLAGS[self.tiles[i]]
+        if self.tiles[i]==TILE_GRASS:
+            for dx,dy in DIRECTIONS:
+                nx,ny=x+dx,y+dy
+                if 0<=nx<self.width and 0<=ny<self.height and self.tiles[ny*self.width+nx]==TILE_WALK:
+                    flags|=FLAG_BIN_PLACEABLE; break
+        if (flags^self.flags[i])&FLAG_WALKABLE:
+            index,slot=self.walkable_index,self.walkable_slot
+            if flags&FLAG_WALKABLE:
+                slot[i]=len(index); index.append(i)
+            else:  # Swap-remove: the last tile takes the freed position
+                pos=slot[i]; last=index.pop()
+                if last!=i: index[pos]=last; slot[last]=pos
+                slot[i]=-1
+        self.flags[i]=flags
+    def changes_since(self,version):
+        """Tiles changed since `version` (None when the log no longer goes back that far)"""
+        n=self.version-version
+        if n<=0: return []
+        if n>len(self.changes): return None
+        return list(self.changes)[-n:]
+    def has_flag(self,x,y,flag): return bool(self.flags[y*self.width+x]&flag)
+    def walkable(self,x,y): return bool(self.flags[y*self.width+x]&FLAG_WALKABLE)
     def walkable_for_engineers(self,x,y): return True  # Engineers can walk on any tile
+    def walkable_count(self): return len(self.walkable_index)
+    def random_walkable(self,rng):
+        """Uniformly random walkable tile (x, y), None when there is none"""
+        index=self.walkable_index
+        if not index: return None
+        i=index[rng.randrange(len(index))]
+        return (i%self.width,i//self.width)
+    def random_walkable_in(self,rng,x0,y0,x1,y1,tries=8):
+        """Uniformly random walkable tile of the rectangle x0..x1, y0..y1 (inclusive), None when there is none
+
+        A few random tiles of the rectangle are tried first (uniform among the
+        walkable ones); sparse rectangles fall back to listing their walkable tiles.
+        """
+        x0,y0=max(x0,0),max(y0,0); x1,y1=min(x1,self.width-1),min(y1,self.height-1)
+        if x0>x1 or y0>y1: return None
+        flags,w=self.flags,self.width
+        for _ in range(tries):
+            x=rng.randint(x0,x1); y=rng.randint(y0,y1)
+            if flags[y*w+x]&FLAG_WALKABLE: return (x,y)
+        coords=[(x,y) for y in range(y0,y1+1) for x in range(x0,x1+1) if flags[y*w+x]&FLAG_WALKABLE]
+        return rng.choice(coords) if coords else None
+
+    # ----- Whole-grid queries -----
+
+    def mask(self,flag):
+        """bytearray with 1 per tile holding the flag (flat index y*width+x)"""
+        return self.flags.translate(flag_mask_table(flag))
+    def _coords(self,data,value):
+        """(x, y) of the bytes equal to value, row by row"""
+        w=self.width
+        if np is not None:
+            index=np.flatnonzero(np.frombuffer(data,dtype=np.uint8)==value)
+            return list(zip((index%w).tolist(),(index//w).tolist()))
+        coords=[]; find=data.find; i=find(value)
+        while i>=0:
+            coords.append((i%w,i//w)); i=find(value,i+1)
+        return coords
+    def coords_with_flag(self,flag):
+        """(x, y) of every tile holding the flag, row by row"""
+        return self._coords(self.mask(flag),1)
+    def walkable_coords(self): return self.coords_with_flag(FLAG_WALKABLE)
+    def tiles_of_type(self,tile):
+        """(x, y) of every tile of the given type, row by row"""
+        return self._coords(self.tiles,tile)
+    def neighbour_mask(self,flag):
+        """Per tile, bit d set when the neighbour in DIRECTIONS[d] holds the flag (flat index y*width+x)
+
+        NumPy uint8 array when NumPy is available, bytearray otherwise.
+        """
+        w,h=self.width,self.height
+        if np is not None:
+            has=(self.flag_array&flag)!=0
+            out=np.zeros((h,w),dtype=np.uint8)
+            out[:,:-1]|=has[:,1:].astype(np.uint8)
+            out[:,1:]|=has[:,:-1].astype(np.uint8)<<1
+            out[:-1,:]|=has[1:,:].astype(np.uint8)<<2
+            out[1:,:]|=has[:-1,:].astype(np.uint8)<<3
+            return out.ravel()
+        has=self.mask(flag); n=w*h
+        out=bytearray(n)
+        j=has.find(1)
+        while j>=0:  # Mark the four tiles around each tile holding the flag
+            x=j%w
+            if x>0: out[j-1]|=1
+            if x+1<w: out[j+1]|=2
+            if j>=w: out[j-w]|=4
+            if j+w<n: out[j+w]|=8
+            j=has.find(1,j+1)
+        return out
@@ -0,0 +1,28 @@
+"""
+Movement profiles for OpenPark
+Who can walk where, declared once per kind of walker: a profile names the
+MapGrid tile flag of its passable tiles, and the pathfinding core, the path
+cache and the batch solver all work from it.
+"""
+
+from dataclasses import dataclass
+
+from .map import FLAG_WALKABLE, FLAG_ENGINEER_WALKABLE, FLAG_MASCOT_WALKABLE, FLAG_GRASS_WALKABLE
+
+
+@dataclass(frozen=True)
+class MovementProfile:
+    """Passability rules of one kind of walker"""
+    name: str                # Key of the profile in path caches and request queues
+    flag: int                # MapGrid tile flag of the passable tiles
+    enter_goal: bool = True  # The goal tile may be impassable (ride and shop entrances, grass spots...)
+    open_grid: bool = False  # Every tile is passable: paths never depend on the tiles
+    jump_points: bool = False  # Mostly open terrain: searched with Jump Point Search instead of A*
+
+
+GUEST = MovementProfile('guest', FLAG_WALKABLE)  # Paths, queues, entrances and exits
+ENGINEER = MovementProfile('engineer', FLAG_ENGINEER_WALKABLE, open_grid=True, jump_points=True)  # Anywhere
+MASCOT = MovementProfile('mascot', FLAG_MASCOT_WALKABLE, enter_goal=False)  # Walk and queue paths only
+GROUNDSKEEPER = MovementProfile('groundskeeper', FLAG_GRASS_WALKABLE, jump_points=True)  # Grass maintenance: grass and walk paths
+
+PROFILES = {profile.name: profile for profile in (GUEST, ENGINEER, MASCOT, GROUNDSKEEPER)}
@@ -0,0 +1,301 @@
+"""
+Navigation graph for OpenPark
+Park paths are mostly 1-tile-wide corridors: the graph keeps junctions,
+dead ends and entrances as nodes and collapses every corridor between two
+of them into a single edge. Guest routing runs A* on this graph and only
+expands tiles at both ends (from the start tile onto its corridor, from the
+corridor to the goal tile), so its cost follows the number of junctions
+rather than the number of path tiles.
+
+The graph follows MapGrid.set through the grid's change log: only the
+edges around changed tiles are retraced.
+
+Paths are the same length as pathfinding.astar's: 4-directional over
+walkable tiles, start and goal tiles may be non-walkable (entrances).
+"""
+
+from heapq import heappush, heappop
+from typing import Dict, List, Optional, Tuple
+
+from .map import TILE_RIDE_ENTRANCE, TILE_RIDE_EXIT, TILE_SHOP_ENTRANCE, TILE_PARK_ENTRANCE, FLAG_WALKABLE
+
+# Walkable tiles always kept as nodes
+ENTRANCE_TILES = (TILE_RIDE_ENTRANCE, TILE_RIDE_EXIT, TILE_SHOP_ENTRANCE, TILE_PARK_ENTRANCE)
+
+DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))  # Same order as pathfinding.astar
+OPPOSITE = (1, 0, 3, 2)
+DEGREE = bytes(bin(bits).count('1') for bits in range(16))  # Walkable neighbours per MapGrid.neighbour_mask value
+
+
+class NavGraph:
+    """Junction / corridor graph of the walkable tiles of one grid"""
+
+    def __init__(self):
+        self.grid = None
+        self.grid_version = 0
+        self.nodes = set()    # Junctions, dead ends, entrances (and one tile per corridor loop)
+        self.forced = set()   # Corridor tiles made nodes to cut loops without junctions
+        self.links: Dict[Tuple[int, int], Dict[int, int]] = {}  # {node: {direction: edge id}}
+        self.edges: Dict[int, tuple] = {}  # {edge id: (node a, node b, corridor tiles from a to b)}
+        self.tile_edge: Dict[Tuple[int, int], Tuple[int, int]] = {}  # {corridor tile: (edge id, index)}
+        self.next_edge_id = 1
+        self.rebuilds = 0
+        self.updates = 0
+
+    # ----- Maintenance -----
+
+    def sync(self, grid):
+        """Catch up with the grid's tile changes since the last call"""
+        if grid is not self.grid:
+            self.grid = grid
+            self.rebuild()
+            return
+        if grid.version == self.grid_version:
+            return
+        changes = grid.changes_since(self.grid_version)
+        if changes is None:
+            self.rebuild()
+        else:
+            self.grid_version = grid.version
+            self.update(changes)
+
+    def _walkable(self, x, y):
+        grid = self.grid
+        return 0 <= x < grid.width and 0 <= y < grid.height and grid.walkable(x, y)
+
+    def _is_node(self, x, y):
+        degree = 0
+        for dx, dy in DIRECTIONS:
+            if self._walkable(x + dx, y + dy):
+                degree += 1
+        return degree != 2 or self.grid.get(x, y) in ENTRANCE_TILES or (x, y) in self.forced
+
+    def rebuild(self):
+        """Build the whole graph from the grid"""
+        grid = self.grid
+        self.grid_version = grid.version
+        self.nodes.clear()
+        self.forced.clear()
+        self.links.clear()
+        self.edges.clear()
+        self.tile_edge.clear()
+        corridor = []
+        width = grid.width
+        tiles = grid.tiles
+        neighbours = grid.neighbour_mask(FLAG_WALKABLE)
+        for x, y in grid.walkable_coords():
+            i = y * width + x
+            if DEGREE[neighbours[i]] != 2 or tiles[i] in ENTRANCE_TILES:
+                self._add_node((x, y))
+            else:
+                corridor.append((x, y))
+        for node in list(self.nodes):
+            self._trace_all(node)
+        self._cut_loops(corridor)
+        self.rebuilds += 1
+
+    def update(self, tiles):
+        """Retrace the graph around changed tiles"""
+        dirty = set()
+        for x, y in tiles:
+            dirty.add((x, y))
+            for dx, dy in DIRECTIONS:
+                if self._walkable(x + dx, y + dy):
+                    dirty.add((x + dx, y + dy))
+
+        # Drop every edge running through or ending on a dirty tile
+        candidates = set(dirty)
+        for tile in dirty:
+            entry = self.tile_edge.get(tile)
+            if entry is not None:
+                self._remove_edge(entry[0], candidates)
+            links = self.links.get(tile)
+            if links:
+                for edge_id in list(links.values()):
+                    if edge_id in self.edges:
+                        self._remove_edge(edge_id, candidates)
+
+        # Node status of dirty tiles may have changed (other candidates keep theirs)
+        for tile in dirty:
+            self.forced.discard(tile)
+            if self._walkable(*tile) and self._is_node(*tile):
+                if tile not in self.nodes:
+                    self._add_node(tile)
+            elif tile in self.nodes:
+                self.nodes.discard(tile)
+                del self.links[tile]
+
+        for tile in candidates:
+            if tile in self.nodes:
+                self._trace_all(tile)
+        self._cut_loops(candidates)
+        self.updates += 1
+
+    def _add_node(self, tile):
+        self.nodes.add(tile)
+        self.links[tile] = {}
+
+    def _remove_edge(self, edge_id, candidates):
+        a, b, corridor = self.edges.pop(edge_id)
+        for tile in corridor:
+            del self.tile_edge[tile]
+            candidates.add(tile)
+        for node in (a, b):
+            candidates.add(node)
+            links = self.links.get(node)
+            if links:
+                for direction in [d for d, e in links.items() if e == edge_id]:
+                    del links[direction]
+
+    def _trace_all(self, node):
+        links = self.links[node]
+        for direction in range(4):
+            if direction not in links:
+                self._trace(node, direction)
+
+    def _trace(self, node, direction):
+        """Follow the corridor leaving node in a direction and store it as an edge"""
+        x, y = node
+        dx, dy = DIRECTIONS[direction]
+        x, y = x + dx, y + dy
+        if not self._walkable(x, y):
+            return
+        first = direction
+        corridor = []
+        while (x, y) not in self.nodes:
+            corridor.append((x, y))
+            # Corridor tile: exactly two walkable neighbours, leave by the one we did not come from
+            for next_direction, (dx, dy) in enumerate(DIRECTIONS):
+                if next_direction != OPPOSITE[direction] and self._walkable(x + dx, y + dy):
+                    direction = next_direction
+                    break
+            x, y = x + dx, y + dy
+        edge_id = self.next_edge_id
+        self.next_edge_id += 1
+        self.edges[edge_id] = (node, (x, y), tuple(corridor))
+        for index, tile in enumerate(corridor):
+            self.tile_edge[tile] = (edge_id, index)
+        self.links[node][first] = edge_id
+        self.links[(x, y)][OPPOSITE[direction]] = edge_id
+
+    def _cut_loops(self, tiles):
+        """Corridor tiles no edge reached are closed loops: make one tile of each a node"""
+        for tile in tiles:
+            if tile not in self.nodes and tile not in self.tile_edge and self._walkable(*tile):
+                self.forced.add(tile)
+                self._add_node(tile)
+                self._trace_all(tile)
+
+    # ----- Routing -----
+
+    def _attachments(self, tile):
+        """[(node, steps, tiles from the tile to the node included)] for a walkable tile"""
+        if tile in self.nodes:
+            return [(tile, 0, [tile])]
+        edge_id, index = self.tile_edge[tile]
+        a, b, corridor = self.edges[edge_id]
+        return [(a, index + 1, list(corridor[index::-1]) + [a]),
+                (b, len(corridor) - index, list(corridor[index:]) + [b])]
+
+    def _ends(self, tile):
+        """[(walkable tile, tiles from `tile` to it)]: the tile itself, or its walkable neighbours"""
+        if self._walkable(*tile):
+            return [(tile, [tile])]
+        x, y = tile
+        return [((x + dx, y + dy), [tile, (x + dx, y + dy)]) for dx, dy in DIRECTIONS
+                if self._walkable(x + dx, y + dy)]
+
+    def find_path(self, grid, start, goal) -> Optional[List[Tuple[int, int]]]:
+        """Shortest 4-directional path from start to goal (both included), None when unreachable"""
+        self.sync(grid)
+        if start == goal:
+            return [start]
+        gx, gy = goal
+        if abs(start[0] - gx) + abs(start[1] - gy) == 1:
+            return [start, goal]  # The goal tile can always be entered
+
+        # Goal side: {node: (steps, tiles from the node to the goal)} and corridors holding a goal end
+        goal_attach: Dict[Tuple[int, int], Tuple[int, list]] = {}
+        goal_edges: Dict[int, list] = {}
+        for end, end_tiles in self._ends(goal):
+            to_goal = end_tiles[::-1]
+            for node, steps, tiles in self._attachments(end):
+                total = steps + len(end_tiles) - 1
+                if node not in goal_attach or total < goal_attach[node][0]:
+                    goal_attach[node] = (total, tiles[::-1] + to_goal[1:])
+            entry = self.tile_edge.get(end)
+            if entry is not None:
+                goal_edges.setdefault(entry[0], []).append((entry[1], to_goal))
+
+        best_len = None
+        best_path = None  # Direct route along a corridor
+        best_node = None  # Or last node of the best route through the graph
+
+        # Start side, plus direct routes along a corridor shared with the goal
+        open_list = []
+        best = {}
+        came = {}
+        for end, end_tiles in self._ends(start):
+            entry = self.tile_edge.get(end)
+            if entry is not None and entry[0] in goal_edges:
+                corridor = self.edges[entry[0]][2]
+                i = entry[1]
+                for j, to_goal in goal_edges[entry[0]]:
+                    middle = corridor[i:j + 1] if j >= i else corridor[j:i + 1][::-1]
+                    path = end_tiles[:-1] + list(middle) + to_goal[1:]
+                    if best_len is None or len(path) - 1 < best_len:
+                        best_len = len(path) - 1
+                        best_path = path
+            for node, steps, tiles in self._attachments(end):
+                total = steps + len(end_tiles) - 1
+                if node not in best or total < best[node]:
+                    best[node] = total
+                    came[node] = (None, end_tiles[:-1] + tiles)
+                    heappush(open_list, (total + abs(node[0] - gx) + abs(node[1] - gy), total, node))
+
+        # A* over the nodes (edge length >= Manhattan distance: the heuristic is consistent)
+        edges = self.edges
+        links = self.links
+        while open_list:
+            f, steps, node = heappop(open_list)
+            if best_len is not None and f >= best_len:
+                break
+            if steps != best[node]:
+                continue
+            attach = goal_attach.get(node)
+            if attach is not None and (best_len is None or steps + attach[0] < best_len):
+                best_len = steps + attach[0]
+                best_node = node
+                best_path = None
+            for edge_id in links[node].values():
+                a, b, corridor = edges[edge_id]
+                other = b if a == node else a
+                if other == node:
+                    continue
+                total = steps + len(corridor) + 1
+                if other not in best or total < best[other]:
+                    best[other] = total
+                    came[other] = (node, edge_id)
+                    heappush(open_list, (total + abs(other[0] - gx) + abs(other[1] - gy), total, other))
+
+        if best_path is not None:
+            return best_path
+        if best_node is None:
+            return None
+        return self._unwind(best_node, came) + goal_attach[best_node][1][1:]
+
+    def _unwind(self, node, came):
+        """Tiles from the start to node"""
+        pieces = []
+        while True:
+            previous, via = came[node]
+            if previous is None:
+                pieces.append(via)
+                break
+            a, b, corridor = self.edges[via]
+            pieces.append(list(corridor) + [b] if a == previous else list(corridor[::-1]) + [a])
+            node = previous
+        path = pieces.pop()
+        while pieces:
+            path.extend(pieces.pop())
+        return path
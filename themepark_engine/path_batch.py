@@ -0,0 +1,285 @@
+"""
+Batch path solver for OpenPark
+Bursts of path requests (park opening, many guests picking a destination at
+once) are solved as one batch spread over a multiprocessing pool. Workers
+read the tile flags from a multiprocessing.shared_memory block published by
+the main process, and send paths back as packed flat tile indices. The main
+process does not wait for them: a submitted PathBatch is polled on later
+frames.
+
+The shared block starts with a header holding a snapshot number: jobs carry
+the snapshot they were made for, and a worker that finds another one (grid
+republished meanwhile) reports the batch as stale instead of returning paths
+for the wrong grid. Stale batches, and every batch when no pool can be
+started, are solved in the main process (a few paths per frame, on a copy
+of the flags taken at submit time) with the same searches (A*, Jump
+Point Search for open-terrain profiles): the paths never depend on the
+number of cores.
+"""
+
+import atexit
+import struct
+from array import array
+from heapq import heappush, heappop
+from time import perf_counter
+from typing import Optional, Sequence, Tuple
+
+from .debug import DebugConfig
+from .jump_points import jps_flat
+from .map import FLAG_WALKABLE
+from .movement import MovementProfile
+from .paths import TilePath
+
+HEADER = struct.Struct('<QII')  # Snapshot number, width, height (then one flags byte per tile)
+
+
+# ==================== A* ON FLAT INDICES ====================
+
+def astar_flat(flags, width: int, height: int, start: int, goal: int,
+               flag: int = FLAG_WALKABLE, enter_goal: bool = True):
+    """Same rules and neighbour order as pathfinding.astar_profile, on flat tile indices (array('i') or None)
+
+    Tiles holding `flag` are passable, the goal too when enter_goal is set.
+    """
+    n = width * height
+    gx, gy = goal % width, goal // width
+    open_list = [(0, start)]
+    came = {start: -1}
+    g = {start: 0}
+    while open_list:
+        _, cur = heappop(open_list)
+        if cur == goal:
+            path = array('i')
+            while cur >= 0:
+                path.append(cur)
+                cur = came[cur]
+            path.reverse()
+            return path
+        d = g[cur] + 1
+        x = cur % width
+        for nxt in (cur + 1 if x + 1 < width else -1, cur - 1 if x > 0 else -1,
+                    cur + width if cur + width < n else -1, cur - width):
+            if nxt < 0 or (not flags[nxt] & flag and not (enter_goal and nxt == goal)):
+                continue
+            if d < g.get(nxt, 1 << 30):
+                g[nxt] = d
+                came[nxt] = cur
+                heappush(open_list, (d + abs(nxt % width - gx) + abs(nxt // width - gy), nxt))
+    return None
+
+
+def decode_path(data: Optional[bytes], width: int) -> Optional[TilePath]:
+    """Packed flat indices -> TilePath (None stays None)"""
+    if data is None:
+        return None
+    return TilePath.from_bytes(data, width)
+
+
+# ==================== WORKER SIDE ====================
+
+_worker_block = None  # SharedMemory attached by this worker
+
+
+def _attach(name):
+    global _worker_block
+    if _worker_block is None or _worker_block.name != name:
+        from multiprocessing import shared_memory
+        if _worker_block is not None:
+            _worker_block.close()
+        _worker_block = shared_memory.SharedMemory(name=name)
+    return _worker_block
+
+
+def _solve(flags, width, height, jobs):
+    """Packed paths for (start, goal, flag, enter_goal, jump_points) jobs"""
+    results = []
+    for start, goal, flag, enter_goal, jump_points in jobs:
+        search = jps_flat if jump_points else astar_flat
+        path = search(flags, width, height, start, goal, flag, enter_goal)
+        results.append(path.tobytes() if path is not None else None)
+    return results
+
+
+def solve_jobs(name: str, snapshot: int, jobs: Sequence[Tuple[int, int, int, bool, bool]]):
+    """Worker entry point: packed paths for (start, goal, flag, enter_goal, jump_points) jobs, None when the snapshot is stale"""
+    buf = _attach(name).buf
+    current, width, height = HEADER.unpack_from(buf, 0)
+    if current != snapshot:
+        return None
+    flags = buf[HEADER.size:HEADER.size + width * height]
+    try:
+        results = _solve(flags, width, height, jobs)
+        # Republished while solving: some paths may mix two grids
+        if HEADER.unpack_from(buf, 0)[0] != snapshot:
+            return None
+        return results
+    finally:
+        flags.release()
+
+
+# ==================== MAIN PROCESS SIDE ====================
+
+class BatchPathSolver:
+    """Solves batches of path requests on a process pool sharing the grid flags"""
+
+    def __init__(self, processes: int = 0):
+        """
+        Args:
+            processes: Pool size (0 = solve batches in this process)
+        """
+        self.processes = processes
+        self.pool = None
+        self.block = None  # SharedMemory: HEADER + flags
+        self.snapshot = 0
+        self.published = None  # (grid, grid version) of the current snapshot
+        self.failed = False  # Pool or shared memory unavailable: solve in this process
+        self.batches = 0
+        self.stale = 0
+        atexit.register(self.close)
+
+    def start(self, grid) -> bool:
+        """Start the pool and the shared block for a grid (done on the first batch otherwise)"""
+        return self._start(HEADER.size + grid.width * grid.height)
+
+    def _start(self, size: int) -> bool:
+        if self.failed or self.processes <= 0:
+            return False
+        try:
+            if self.block is None or self.block.size < size:
+                from multiprocessing import shared_memory
+                if self.block is not None:
+                    self._release_block()
+                self.block = shared_memory.SharedMemory(create=True, size=size)
+                self.published = None
+            if self.pool is None:
+                import multiprocessing
+                # spawn: workers only import this module, whatever the platform (no forked pygame state)
+                self.pool = multiprocessing.get_context('spawn').Pool(self.processes)
+        except (OSError, ValueError, ImportError) as e:
+            DebugConfig.log('pathfinding', "Batch path solver unavailable ({}), solving in process", e)
+            self.failed = True
+            self.close()
+            return False
+        return True
+
+    def publish(self, grid):
+        """Copy the grid flags to shared memory under a new snapshot number (if the grid changed)"""
+        if self.published == (grid, grid.version):
+            return
+        self.snapshot += 1
+        n = grid.width * grid.height
+        buf = self.block.buf
+        HEADER.pack_into(buf, 0, 0, grid.width, grid.height)  # Readers see no valid snapshot while copying
+        buf[HEADER.size:HEADER.size + n] = grid.flags
+        HEADER.pack_into(buf, 0, self.snapshot, grid.width, grid.height)
+        self.published = (grid, grid.version)
+
+    def submit(self, grid, requests: Sequence[Tuple[Tuple[int, int], Tuple[int, int], MovementProfile]]) -> 'PathBatch':
+        """Start solving (start, goal, movement profile) requests without waiting for the paths"""
+        width = grid.width
+        jobs = [(sy * width + sx, gy * width + gx, profile.flag, profile.enter_goal, profile.jump_points)
+                for (sx, sy), (gx, gy), profile in requests]
+        async_result = None
+        chunk = 0
+        if len(jobs) > 1 and self._start(HEADER.size + width * grid.height):
+            self.publish(grid)
+            chunk = -(-len(jobs) // self.processes)
+            chunks = [(self.block.name, self.snapshot, jobs[i:i + chunk]) for i in range(0, len(jobs), chunk)]
+            try:
+                async_result = self.pool.starmap_async(solve_jobs, chunks)
+            except Exception as e:
+                self._fail(e)
+        self.batches += 1
+        return PathBatch(self, grid, jobs, async_result, chunk)
+
+    def solve(self, grid, requests: Sequence[Tuple[Tuple[int, int], Tuple[int, int], MovementProfile]]):
+        """TilePaths for (start, goal, movement profile) requests, in order (None where unreachable); waits for them"""
+        batch = self.submit(grid, requests)
+        batch.ready()
+        return batch.paths()
+
+    def _fail(self, error):
+        """Worker died or pool unusable: give up on the pool"""
+        DebugConfig.log('pathfinding', "Batch path solver failed ({}), solving in process", error)
+        self.failed = True
+        self.close()
+
+    def _release_block(self):
+        try:
+            self.block.close()
+            self.block.unlink()
+        except (OSError, FileNotFoundError):
+            pass
+        self.block = None
+
+    def close(self):
+        """Stop the pool and free the shared memory"""
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+        if self.block is not None:
+            self._release_block()
+        self.published = None
+
+
+class PathBatch:
+    """Paths of a submitted batch, solved in the background
+
+    Jobs run on the pool when there is one, else in this process a few at a
+    time, within the deadline given to each ready() call. The paths are those
+    of the grid at submit time either way: its flags are copied, and chunks
+    found stale by the workers are solved again on the copy.
+    """
+
+    def __init__(self, solver: BatchPathSolver, grid, jobs, async_result=None, chunk: int = 0):
+        self.solver = solver
+        self.flags = bytes(grid.flags)
+        self.width = grid.width
+        self.height = grid.height
+        self.jobs = jobs
+        self.packed = [None] * len(jobs)
+        self.async_result = async_result  # Pool chunks of `chunk` jobs, None once collected
+        self.chunk = chunk
+        self.todo = [] if async_result is not None else list(range(len(jobs)))  # Jobs left to solve here
+
+    def ready(self, deadline: Optional[float] = None) -> bool:
+        """True once every path is solved
+
+        Args:
+            deadline: perf_counter() time to stop solving jobs here at (at least one is solved);
+                      None = wait for the pool and solve everything left
+        """
+        if self.async_result is not None:
+            if deadline is not None and not self.async_result.ready():
+                return False
+            self._collect()
+        todo = self.todo
+        while todo:
+            i = todo.pop()
+            self.packed[i] = _solve(self.flags, self.width, self.height, self.jobs[i:i + 1])[0]
+            if deadline is not None and todo and perf_counter() >= deadline:
+                return False
+        return True
+
+    def _collect(self):
+        """Take the pool results; stale or failed chunks go to the jobs solved here"""
+        try:
+            results = self.async_result.get()
+        except Exception as e:
+            self.solver._fail(e)
+            results = [None] * -(-len(self.jobs) // self.chunk)
+        else:
+            self.solver.stale += sum(result is None for result in results)
+        self.async_result = None
+        for c, result in enumerate(results):
+            lo = c * self.chunk
+            hi = min(lo + self.chunk, len(self.jobs))
+            if result is None:
+                self.todo.extend(range(lo, hi))
+            else:
+                self.packed[lo:hi] = result
+
+    def paths(self):
+        """TilePaths in job order (None where unreachable), once ready()"""
+        return [decode_path(data, self.width) for data in self.packed]
@@ -1,166 +1,355 @@
 """
 Pathfinding module with A* algorithm and optimizations
-Includes caching and frame-limited processing for better performance
+Includes caching and time-budgeted asynchronous requests for better performance
 """
 
+import os
+from collections import OrderedDict
 from heapq import heappush, heappop
-from typing import Tuple, List, Optional, Callable
+from time import perf_counter
+from typing import Tuple, Optional, Callable
+
+from .jump_points import jps_flat
+from .movement import MovementProfile, PROFILES, GUEST, ENGINEER, GROUNDSKEEPER
+from .nav_graph import NavGraph
+from .path_batch import BatchPathSolver
+from .paths import TilePath
 
 
 # ==================== PATHFINDING CACHE ====================
 
 class PathCache:
-    """Cache for pathfinding results to avoid recalculating the same paths"""
+    """Cache for pathfinding results to avoid recalculating the same paths
+
+    Paths are keyed by movement profile as well as start and goal, so a
+    path is only ever served to walkers of the profile it was computed for.
+    They are immutable TilePaths, shared with the walkers following them
+    through PathCursors.
+    Entries never expire on their own: the cache follows the grid's change
+    version and, when tiles change, drops the paths crossing them (tile ->
+    paths reverse index) plus the paths a tile newly passable for their
+    profile could shorten. Open-grid profiles (engineers) ignore tile types
+    and are never invalidated.
+    """
 
-    def __init__(self, max_size: int = 1000, max_age: int = 120):
+    def __init__(self, max_size: int = 8192):
         """
         Args:
-            max_size: Maximum number of cached paths
-            max_age: Maximum age in frames before cache entry expires
+            max_size: Maximum number of cached paths (least recently used evicted first)
         """
-        self.cache = {}  # {(start, goal): (path, age)}
+        self.cache = OrderedDict()  # {(start, goal, profile name): TilePath}, least recently used first
+        self.by_tile = {}  # {(x, y): set of keys of the tile-dependent paths crossing that tile}
         self.max_size = max_size
-        self.max_age = max_age
-        self.current_frame = 0
-
-    def get(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
-        """Get cached path if available and not expired"""
-        key = (start, goal)
-        if key in self.cache:
-            path, frame_created = self.cache[key]
-            age = self.current_frame - frame_created
-
-            if age < self.max_age:
-                return path
-            else:
-                # Expired, remove from cache
-                del self.cache[key]
-
-        return None
-
-    def put(self, start: Tuple[int, int], goal: Tuple[int, int], path: List[Tuple[int, int]]):
+        self.grid = None  # Grid the paths were computed on
+        self.grid_version = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    def sync(self, grid):
+        """Catch up with the grid's tile changes since the last call"""
+        if grid is not self.grid:
+            self.clear()
+            self.grid = grid
+            self.grid_version = grid.version
+            return
+        if grid.version == self.grid_version:
+            return
+        changes = grid.changes_since(self.grid_version)
+        self.grid_version = grid.version
+        if changes is None:
+            self.clear()  # Too many changes to follow (map loaded, ...)
+        else:
+            self.invalidate_tiles(changes)
+
+    def get(self, start: Tuple[int, int], goal: Tuple[int, int],
+            profile: MovementProfile = GUEST) -> Optional[TilePath]:
+        """Get cached path if available"""
+        key = (start, goal, profile.name)
+        path = self.cache.get(key)
+        if path is None:
+            self.misses += 1
+            return None
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return path
+
+    def put(self, start: Tuple[int, int], goal: Tuple[int, int], path: TilePath,
+            profile: MovementProfile = GUEST):
         """Store path in cache"""
-        key = (start, goal)
-
-        # If cache is full, remove oldest entries
-        if len(self.cache) >= self.max_size:
-            self._evict_oldest()
-
-        self.cache[key] = (path, self.current_frame)
-
-    def _evict_oldest(self):
-        """Remove 10% oldest entries to make room"""
-        if not self.cache:
+        key = (start, goal, profile.name)
+        if key in self.cache:
+            self._remove(key)
+        elif len(self.cache) >= self.max_size:
+            self._remove(next(iter(self.cache)))  # Least recently used
+
+        self.cache[key] = path
+        if not profile.open_grid:
+            by_tile = self.by_tile
+            for tile in path:
+                keys = by_tile.get(tile)
+                if keys is None:
+                    by_tile[tile] = {key}
+                else:
+                    keys.add(key)
+
+    def _remove(self, key):
+        path = self.cache.pop(key)
+        if PROFILES[key[2]].open_grid:
+            return
+        by_tile = self.by_tile
+        for tile in path:
+            keys = by_tile.get(tile)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del by_tile[tile]
+
+    def invalidate_tiles(self, tiles):
+        """Drop the paths crossing changed tiles, or that a tile newly passable for their profile could shorten"""
+        grid = self.grid
+        opened = []  # (x, y, tile flags)
+        for tile in set(tiles):
+            keys = self.by_tile.get(tile)
+            if keys:
+                for key in list(keys):
+                    self._remove(key)
+                    self.invalidated += 1
+            if grid is not None and grid.in_bounds(*tile):
+                opened.append((tile[0], tile[1], grid.flags[grid.idx(*tile)]))
+        if not opened:
             return
 
-        # Sort by age and remove oldest 10%
-        sorted_items = sorted(self.cache.items(), key=lambda x: x[1][1])
-        num_to_remove = max(1, len(sorted_items) // 10)
-
-        for i in range(num_to_remove):
-            del self.cache[sorted_items[i][0]]
+        # A detour through a new tile t can only beat a path if |start - t| + |t - goal| is shorter
+        stale = []
+        for key, path in self.cache.items():
+            start, goal, name = key
+            profile = PROFILES[name]
+            if profile.open_grid:
+                continue
+            flag = profile.flag
+            length = len(path) - 1
+            for tx, ty, tile_flags in opened:
+                if tile_flags & flag and abs(start[0] - tx) + abs(start[1] - ty) + abs(goal[0] - tx) + abs(goal[1] - ty) < length:
+                    stale.append(key)
+                    break
+        for key in stale:
+            self._remove(key)
+        self.invalidated += len(stale)
 
     def invalidate_around(self, x: int, y: int, radius: int = 3):
-        """Invalidate cache entries near a position (when grid changes)"""
-        to_remove = []
-
-        for (start, goal) in self.cache.keys():
-            # Check if start or goal is near the changed position
-            if (abs(start[0] - x) <= radius and abs(start[1] - y) <= radius) or \
-               (abs(goal[0] - x) <= radius and abs(goal[1] - y) <= radius):
-                to_remove.append((start, goal))
-
-        for key in to_remove:
-            del self.cache[key]
+        """Invalidate cache entries crossing the square around a position"""
+        self.invalidate_tiles([(tx, ty) for tx in range(x - radius, x + radius + 1)
+                               for ty in range(y - radius, y + radius + 1)])
 
     def clear(self):
         """Clear all cache"""
         self.cache.clear()
+        self.by_tile.clear()
+
+    def stats(self) -> dict:
+        """Hit / miss counters since the last clear_stats()"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.cache),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'invalidated': self.invalidated,
+        }
 
-    def tick(self):
-        """Call once per frame to update frame counter"""
-        self.current_frame += 1
+    def clear_stats(self):
+        self.hits = self.misses = self.invalidated = 0
 
 
 # ==================== PATHFINDING QUEUE ====================
 
 class PathfindingQueue:
-    """Queue system to limit pathfinding calculations per frame"""
+    """Path requests solved over several frames within a time budget
+
+    Requests are keyed by (start, goal, movement profile): identical requests
+    made before the first one is solved share one computation and every
+    requester gets its callback. Lowest priority number first, then first
+    come first served. When many requests are pending they are solved in
+    batches by a BatchPathSolver (process pool on a shared-memory grid): a
+    batch is submitted, and its callbacks are called all at once by the
+    first process() call that finds it solved. One batch at a time, and
+    nothing else is solved while it is in flight, so requests are always
+    answered in queue order.
+    """
 
-    def __init__(self, max_per_frame: int = 10):
+    def __init__(self, budget_ms: float = 2.0, batch_solver: Optional[BatchPathSolver] = None,
+                 batch_threshold: int = 32, batch_size: int = 64):
         """
         Args:
-            max_per_frame: Maximum number of paths to calculate per frame
+            budget_ms: Time spent solving requests per process() call (at least one request is solved,
+                       unless a batch is in flight)
+            batch_solver: Solver for bursts of requests (None = one by one)
+            batch_threshold: Pending requests from which they are solved in batches
+            batch_size: Requests per batch
         """
-        self.queue = []  # List of (priority, entity, start, goal, callback)
-        self.max_per_frame = max_per_frame
+        self.batch_solver = batch_solver
+        self.batch_threshold = batch_threshold
+        self.batch_size = batch_size
+        self.heap = []  # (priority, sequence number, key), stale entries skipped when popped
+        self.pending = {}  # {key: [priority, [(entity, callback), ...]]}
+        self.batch = None  # (PathBatch, [(key, entry, cached path), ...], (grid, grid version)) in flight
+        self.in_flight = {}  # {key: entry} of the batch in flight
+        self.budget_ms = budget_ms
         self.next_id = 0  # For FIFO ordering when priorities are equal
+        self.solved = 0
+        self.merged = 0  # Requests answered by another identical request
 
     def request_path(self, entity, start: Tuple[int, int], goal: Tuple[int, int],
-                    callback: Callable, priority: int = 0):
+                     callback: Callable, priority: int = 0, profile: MovementProfile = GUEST):
         """
         Request a path calculation
 
         Args:
-            entity: The entity requesting the path (for reference)
+            entity: The entity requesting the path (passed back to the callback)
             start: Start position
             goal: Goal position
-            callback: Function to call with (entity, path) when done
+            callback: Function to call with (entity, path) when done (path is None if unreachable)
             priority: Lower number = higher priority (0 = highest)
+            profile: Movement profile of the walker
+
+        Returns:
+            Key of the request: (start, goal, profile)
         """
-        # Use negative priority for heapq (min-heap)
-        self.queue.append((-priority, self.next_id, entity, start, goal, callback))
+        key = (start, goal, profile)
+        entry = self.pending.get(key)
+        if entry is None and key in self.in_flight:
+            self.in_flight[key][1].append((entity, callback))  # Answered with the batch
+            self.merged += 1
+            return key
+        if entry is None:
+            self.pending[key] = [priority, [(entity, callback)]]
+        else:
+            entry[1].append((entity, callback))
+            self.merged += 1
+            if priority >= entry[0]:
+                return key
+            entry[0] = priority  # Moved forward: the older heap entry becomes stale
+        heappush(self.heap, (priority, self.next_id, key))
         self.next_id += 1
+        return key
 
-    def process(self, grid, path_cache: PathCache, astar_func: Callable) -> int:
+    def process(self, grid, path_cache: PathCache, route: Callable,
+                budget_ms: Optional[float] = None, max_requests: Optional[int] = None) -> int:
         """
-        Process up to max_per_frame path requests
+        Solve pending requests until the time budget is spent
+
+        Args:
+            route: Function(grid, start, goal, profile) -> TilePath or None
+            budget_ms: Time budget (default: self.budget_ms)
+            max_requests: Answer exactly this many requests (replays use the recorded count):
+                          a batch in flight is then waited for when the count includes it
 
         Returns:
-            Number of paths calculated this frame
+            Number of requests answered this call
         """
-        if not self.queue:
+        if not self.pending and self.batch is None:
             return 0
+        if budget_ms is None:
+            budget_ms = self.budget_ms
+        deadline = perf_counter() + budget_ms / 1000.0 if max_requests is None else None
 
-        # Sort by priority (highest first)
-        self.queue.sort()
-
+        heap = self.heap
+        pending = self.pending
         processed = 0
-
-        while self.queue and processed < self.max_per_frame:
-            _, _, entity, start, goal, callback = self.queue.pop(0)
-
-            # Try to get from cache first
-            path = path_cache.get(start, goal)
-
+        path_cache.sync(grid)
+        if self.batch is not None:
+            if max_requests == 0 or not self.batch[0].ready(deadline):
+                return 0
+            processed = self._deliver_batch(path_cache)
+
+        while heap:
+            # Submitting takes no time: decided before the count, as replays must too
+            if self.batch_solver is not None and len(pending) >= self.batch_threshold:
+                self._submit_batch(grid, path_cache, deadline)
+                break
+            if max_requests is not None and processed >= max_requests:
+                break
+
+            priority, _, key = heappop(heap)
+            entry = pending.get(key)
+            if entry is None or entry[0] != priority:
+                continue  # Already solved, or moved forward by a later request
+            del pending[key]
+            start, goal, profile = key
+
+            path = path_cache.get(start, goal, profile)
             if path is None:
-                # Calculate new path
-                path = astar_func(grid, start, goal)
-
-                # Cache it
+                path = route(grid, start, goal, profile)
                 if path:
-                    path_cache.put(start, goal, path)
+                    path_cache.put(start, goal, path, profile)
 
-            # Call callback with result
-            callback(entity, path)
+            # Callbacks share the path (immutable: walkers take a cursor on it)
+            for entity, callback in entry[1]:
+                callback(entity, path)
             processed += 1
+            if deadline is not None and perf_counter() >= deadline:
+                break
 
+        self.solved += processed
         return processed
 
+    def _submit_batch(self, grid, path_cache: PathCache, deadline: Optional[float]):
+        """Send the next batch_size requests to the batch solver"""
+        heap = self.heap
+        pending = self.pending
+        entries = []
+        while heap and len(entries) < self.batch_size:
+            priority, _, key = heappop(heap)
+            entry = pending.get(key)
+            if entry is None or entry[0] != priority:
+                continue
+            del pending[key]
+            entries.append((key, entry, path_cache.get(*key)))
+            self.in_flight[key] = entry
+
+        batch = self.batch_solver.submit(grid, [key for key, _, path in entries if path is None])
+        self.batch = (batch, entries, (grid, grid.version))
+        if deadline is not None:
+            batch.ready(deadline)  # Rest of the budget (batches solved in this process)
+
+    def _deliver_batch(self, path_cache: PathCache) -> int:
+        """Call the callbacks of the solved batch in flight"""
+        batch, entries, submitted = self.batch
+        self.batch = None
+        self.in_flight.clear()
+        # Paths of a grid changed since the batch was submitted are answered but not cached
+        cacheable = submitted == (path_cache.grid, path_cache.grid_version)
+        solved = iter(batch.paths())
+        for key, entry, path in entries:
+            if path is None:
+                path = next(solved)
+                if path and cacheable:
+                    path_cache.put(key[0], key[1], path, key[2])
+            for entity, callback in entry[1]:
+                callback(entity, path)
+        return len(entries)
+
     def clear(self):
-        """Clear all pending requests"""
-        self.queue.clear()
+        """Clear all pending requests (and forget the batch in flight)"""
+        self.heap.clear()
+        self.pending.clear()
+        self.batch = None
+        self.in_flight.clear()
 
     def size(self) -> int:
-        """Get number of pending requests"""
-        return len(self.queue)
+        """Get number of pending requests (batch in flight included)"""
+        return len(self.pending) + len(self.in_flight)
 
 
 # ==================== GLOBAL INSTANCES ====================
 
 # Global cache and queue instances
-_path_cache = PathCache(max_size=1000, max_age=120)
-_pathfinding_queue = PathfindingQueue(max_per_frame=10)
+_path_cache = PathCache(max_size=8192)
+# Bursts of requests are solved on the other cores (the main thread keeps one)
+_batch_solver = BatchPathSolver(processes=min(4, max(0, (os.cpu_count() or 1) - 1)))
+_pathfinding_queue = PathfindingQueue(budget_ms=2.0, batch_solver=_batch_solver)
+_nav_graph = NavGraph()  # Junction / corridor graph of the last grid routed on
 
 
 # ==================== A* ALGORITHM ====================
@@ -170,18 +359,24 @@ def heuristic(a, b):
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
-def astar(grid, start, goal):
+def astar_profile(grid, start, goal, profile: MovementProfile = GUEST):
     """
-    Standard A* pathfinding for regular entities
+    A* pathfinding over the tiles passable for a movement profile
 
     Args:
         grid: MapGrid instance
-        start: (x, y) start position
-        goal: (x, y) goal position
+        start: (x, y) start position (may be impassable)
+        goal: (x, y) goal position (may be impassable if profile.enter_goal)
+        profile: Movement profile of the walker
 
     Returns:
         List of (x, y) positions from start to goal, or None if no path found
     """
+    flags = grid.flags
+    width, height = grid.width, grid.height
+    flag = profile.flag
+    enter_goal = profile.enter_goal
+    gx, gy = goal
     open = [(0, start)]
     came = {start: None}
     g = {start: 0}
@@ -198,68 +393,78 @@ def astar(grid, start, goal):
             return list(reversed(path))
 
         x, y = cur
+        ng = g[cur] + 1
 
         # 4-directional movement (no diagonals - authentic 90s style!)
         for nx, ny in ((x+1, y), (x-1, y), (x, y+1), (x, y-1)):
-            if not grid.in_bounds(nx, ny) or (not grid.walkable(nx, ny) and (nx, ny) != goal):
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            if not flags[ny * width + nx] & flag and not (enter_goal and nx == gx and ny == gy):
                 continue
-
-            ng = g[cur] + 1
 
             if ng < g.get((nx, ny), 10**9):
                 g[(nx, ny)] = ng
-                heappush(open, (ng + heuristic((nx, ny), goal), (nx, ny)))
+                heappush(open, (ng + abs(nx - gx) + abs(ny - gy), (nx, ny)))
                 came[(nx, ny)] = cur
 
     return None
 
 
-def astar_for_engineers(grid, start, goal):
-    """
-    A* pathfinding specifically for engineers who can walk on any tile
-
-    Args:
-        grid: MapGrid instance
-        start: (x, y) start position
-        goal: (x, y) goal position
-
-    Returns:
-        List of (x, y) positions from start to goal, or None if no path found
-    """
-    open = [(0, start)]
-    came = {start: None}
-    g = {start: 0}
+def astar(grid, start, goal):
+    """Standard A* pathfinding for regular entities (guest profile)"""
+    return astar_profile(grid, start, goal, GUEST)
 
-    while open:
-        _, cur = heappop(open)
 
-        if cur == goal:
-            path = []
-            while cur is not None:
-                path.append(cur)
-                cur = came[cur]
-            return list(reversed(path))
+def astar_for_engineers(grid, start, goal):
+    """A* pathfinding specifically for engineers who can walk on any tile"""
+    return astar_profile(grid, start, goal, ENGINEER)
 
-        x, y = cur
 
-        for nx, ny in ((x+1, y), (x-1, y), (x, y+1), (x, y-1)):
-            if not grid.in_bounds(nx, ny):
-                continue
+def jump_point_path(grid, start, goal, profile: MovementProfile = GROUNDSKEEPER) -> Optional[TilePath]:
+    """
+    Jump Point Search over the tiles passable for a movement profile (same rules and lengths as astar_profile)
 
-            ng = g[cur] + 1
+    Returns:
+        TilePath from start to goal, or None if no path found
+    """
+    if not (grid.in_bounds(*start) and grid.in_bounds(*goal)):
+        return None
+    width = grid.width
+    tiles = jps_flat(grid.flags, width, grid.height, start[1] * width + start[0], goal[1] * width + goal[0],
+                     profile.flag, profile.enter_goal)
+    return TilePath(tiles, width) if tiles is not None else None
+
+
+def manhattan_path(start, goal):
+    """Straight path on an open grid: horizontal leg first, then vertical (both ends included)"""
+    x, y = start
+    gx, gy = goal
+    step = 1 if gx > x else -1
+    path = [(cx, y) for cx in range(x, gx + step, step)]
+    step = 1 if gy > y else -1
+    path.extend((gx, cy) for cy in range(y + step, gy + step, step))
+    return path
 
-            if ng < g.get((nx, ny), 10**9):
-                g[(nx, ny)] = ng
-                heappush(open, (ng + heuristic((nx, ny), goal), (nx, ny)))
-                came[(nx, ny)] = cur
 
-    return None
+# ==================== OPTIMIZED API ====================
 
+def _route(grid, start, goal, profile=GUEST) -> Optional[TilePath]:
+    """Compute a path with the fastest search of the profile"""
+    if profile is GUEST:
+        path = _nav_graph.find_path(grid, start, goal)  # Junction / corridor graph
+    elif profile.open_grid:
+        if not (grid.in_bounds(*start) and grid.in_bounds(*goal)):
+            return None
+        path = manhattan_path(start, goal)  # Nothing to search around
+    elif profile.jump_points:
+        return jump_point_path(grid, start, goal, profile)  # Open terrain: few jump points
+    else:
+        path = astar_profile(grid, start, goal, profile)
+    return TilePath.from_coords(path, grid.width) if path is not None else None
 
-# ==================== OPTIMIZED API ====================
 
 def get_path_cached(grid, start: Tuple[int, int], goal: Tuple[int, int],
-                   for_engineers: bool = False) -> Optional[List[Tuple[int, int]]]:
+                   profile: MovementProfile = GUEST) -> Optional[TilePath]:
     """
     Get path with caching (synchronous)
 
@@ -267,28 +472,27 @@ def get_path_cached(grid, start: Tuple[int, int], goal: Tuple[int, int],
         grid: MapGrid instance
         start: Start position
         goal: Goal position
-        for_engineers: Use engineer pathfinding (can walk on any tile)
+        profile: Movement profile of the walker (GUEST, ENGINEER, MASCOT, GROUNDSKEEPER)
 
     Returns:
-        Path as list of positions, or None if no path
+        TilePath shared with the cache (follow it with path.cursor(1)), or None if no path
     """
     # Try cache first
-    path = _path_cache.get(start, goal)
+    _path_cache.sync(grid)
+    path = _path_cache.get(start, goal, profile)
 
     if path is None:
-        # Calculate new path
-        astar_func = astar_for_engineers if for_engineers else astar
-        path = astar_func(grid, start, goal)
+        path = _route(grid, start, goal, profile)
 
         # Cache result
         if path:
-            _path_cache.put(start, goal, path)
+            _path_cache.put(start, goal, path, profile)
 
     return path
 
 
 def request_path_async(entity, start: Tuple[int, int], goal: Tuple[int, int],
-                      callback: Callable, priority: int = 0, for_engineers: bool = False):
+                      callback: Callable, priority: int = 0, profile: MovementProfile = GUEST):
     """
     Request path asynchronously (will be calculated over multiple frames)
 
@@ -296,43 +500,58 @@ def request_path_async(entity, start: Tuple[int, int], goal: Tuple[int, int],
         entity: Entity requesting the path
         start: Start position
         goal: Goal position
-        callback: Function(entity, path) to call when path is ready
+        callback: Function(entity, path) to call when path is ready (shared TilePath, None if unreachable)
         priority: Lower number = higher priority (0 = highest)
-        for_engineers: Use engineer pathfinding
-    """
-    astar_func = astar_for_engineers if for_engineers else astar
+        profile: Movement profile of the walker
 
-    # Wrap the astar function to match the queue's expected signature
-    def wrapped_astar(grid, start, goal):
-        return astar_func(grid, start, goal)
-
-    _pathfinding_queue.request_path(entity, start, goal, callback, priority)
+    Returns:
+        Key of the request: (start, goal, profile)
+    """
+    return _pathfinding_queue.request_path(entity, start, goal, callback, priority, profile)
 
 
-def process_pathfinding_queue(grid) -> int:
+def process_pathfinding_queue(grid, budget_ms: Optional[float] = None, max_requests: Optional[int] = None) -> int:
     """
     Process pathfinding queue (call once per frame)
 
+    Args:
+        budget_ms: Time budget for this frame (default: the queue's budget_ms)
+        max_requests: Solve exactly this many requests (at most) instead of timing them
+
     Returns:
         Number of paths calculated this frame
     """
-    # Use astar as default (queue will specify if engineer pathfinding needed)
-    return _pathfinding_queue.process(grid, _path_cache, astar)
-
-
-def tick_pathfinding():
-    """Call once per frame to update cache age"""
-    _path_cache.tick()
+    return _pathfinding_queue.process(grid, _path_cache, _route, budget_ms, max_requests)
 
 
 def invalidate_cache_around(x: int, y: int, radius: int = 3):
-    """Invalidate cache when grid changes"""
+    """Invalidate cache around a position (grid changes are picked up automatically)"""
     _path_cache.invalidate_around(x, y, radius)
 
 
 def clear_pathfinding_cache():
-    """Clear all cached paths"""
+    """Clear all cached paths (and the hit / miss counters)"""
     _path_cache.clear()
+    _path_cache.clear_stats()
+
+
+def clear_pathfinding_queue():
+    """Drop all pending path requests (their callbacks are never called)"""
+    _pathfinding_queue.clear()
+
+
+def start_batch_solver(grid) -> bool:
+    """Start the batch solver's worker pool for a grid, so the first burst of requests does not wait for it
+
+    Returns:
+        False when batches are solved in this process (single core, no pool available)
+    """
+    return _batch_solver.start(grid)
+
+
+def get_cache_stats() -> dict:
+    """Path cache counters (size, hits, misses, hit_rate, invalidated)"""
+    return _path_cache.stats()
 
 
 def get_queue_size() -> int:
@@ -0,0 +1,97 @@
+"""
+Shared paths for OpenPark
+A computed path is stored once, as a TilePath (flat tile indices packed in
+an array('i'), never modified), and shared by the path cache and by every
+walker following it. Walkers hold a PathCursor on it (the path plus the
+index of the next tile to step on): stepping is O(1) and nobody slices or
+copies paths any more.
+"""
+
+from array import array
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+
+class TilePath:
+    """Immutable path (start and goal included), packed as flat tile indices y*width+x
+
+    Reads like a sequence of (x, y) tiles: len(), path[i] (negative indices
+    too) and iteration; no slicing, take a cursor instead.
+    """
+
+    __slots__ = ('tiles', 'width')
+
+    def __init__(self, tiles: array, width: int):
+        self.tiles = tiles  # array('i') of flat indices, owned by the path
+        self.width = width
+
+    @classmethod
+    def from_coords(cls, coords: Iterable[Tuple[int, int]], width: int) -> 'TilePath':
+        """Pack a list of (x, y) tiles"""
+        return cls(array('i', [y * width + x for x, y in coords]), width)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, width: int) -> 'TilePath':
+        """Unpack flat indices sent as array('i').tobytes()"""
+        tiles = array('i')
+        tiles.frombytes(data)
+        return cls(tiles, width)
+
+    def __len__(self) -> int:
+        return len(self.tiles)
+
+    def __getitem__(self, index: int) -> Tuple[int, int]:
+        i = self.tiles[index]
+        return (i % self.width, i // self.width)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        width = self.width
+        for i in self.tiles:
+            yield (i % width, i // width)
+
+    def __repr__(self):
+        return f"TilePath({list(self)})"
+
+    def cursor(self, index: int = 0) -> 'PathCursor':
+        """Cursor on the path, next tile at `index` (1 = skip the start tile)"""
+        return PathCursor(self, index)
+
+
+_NO_TILES = TilePath(array('i'), 1)
+
+
+class PathCursor:
+    """Walker's progress along a shared path: the tiles left to step on
+
+    Any sequence of (x, y) tiles can be followed (TilePath, or a list built
+    for one walker). Empty cursors are falsy, like an empty list.
+    """
+
+    __slots__ = ('path', 'index')
+
+    def __init__(self, path: Optional[Sequence[Tuple[int, int]]] = None, index: int = 0):
+        self.path = path if path is not None else _NO_TILES
+        self.index = index  # Position of the next tile in path
+
+    def __len__(self) -> int:
+        """Tiles left"""
+        return max(0, len(self.path) - self.index)
+
+    def peek(self) -> Tuple[int, int]:
+        """Next tile (IndexError when the path is finished)"""
+        if self.index >= len(self.path):
+            raise IndexError('path finished')
+        return self.path[self.index]
+
+    def advance(self) -> Tuple[int, int]:
+        """Next tile, which the cursor then moves past (IndexError when the path is finished)"""
+        tile = self.peek()
+        self.index += 1
+        return tile
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        path = self.path
+        for index in range(self.index, len(path)):
+            yield path[index]
+
+    def __repr__(self):
+        return f"PathCursor({list(self)})"
@@ -0,0 +1,89 @@
+"""
+Frame profiler for OpenPark
+Lightweight lap timers around the update() phases and draw() passes,
+with rolling averages / p95 and periodic CSV export
+"""
+
+import csv
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+class FrameProfiler:
+    """Per-phase timers (lap based: each lap measures the time since the previous one)"""
+
+    def __init__(self, window: int = 120, enabled: bool = False):
+        self.enabled = enabled
+        self.window = window  # Number of samples kept per phase
+        self.samples: Dict[str, deque] = {}  # phase -> deque of seconds (insertion order = phase order)
+        self.frame_count = 0
+        self._last = 0.0
+
+        # CSV export
+        self.csv_path: Optional[Path] = None
+        self.export_every = 0  # Export every N frames (0 = disabled)
+
+    def begin(self):
+        """Start timing a sequence of phases (update() or draw())"""
+        if self.enabled:
+            self._last = time.perf_counter()
+
+    def lap(self, phase: str):
+        """Close the current phase: time elapsed since begin() or the previous lap"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        samples = self.samples.get(phase)
+        if samples is None:
+            samples = self.samples[phase] = deque(maxlen=self.window)
+        samples.append(now - self._last)
+        self._last = now
+
+    def end_frame(self):
+        """Mark the end of a displayed frame (triggers the periodic CSV export)"""
+        if not self.enabled:
+            return
+        self.frame_count += 1
+        if self.csv_path and self.export_every > 0 and self.frame_count % self.export_every == 0:
+            self.export_csv(self.csv_path)
+
+    def set_enabled(self, enabled: bool):
+        self.enabled = enabled
+        if not enabled:
+            self.reset()
+
+    def reset(self):
+        self.samples.clear()
+        self.frame_count = 0
+
+    def start_csv_export(self, path, every_n_frames: int = 300):
+        """Append the phase statistics to a CSV file every N frames"""
+        self.csv_path = Path(path)
+        self.export_every = every_n_frames
+
+    def stats(self) -> List[Tuple[str, float, float]]:
+        """Rolling statistics per phase: (phase, avg_ms, p95_ms)"""
+        result = []
+        for phase, samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            avg = sum(ordered) / len(ordered)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            result.append((phase, avg * 1000.0, p95 * 1000.0))
+        return result
+
+    def export_csv(self, path) -> Path:
+        """Append one row per phase (frame, phase, avg_ms, p95_ms, samples) to a CSV file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        new_file = not path.exists()
+        with open(path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(['frame', 'phase', 'avg_ms', 'p95_ms', 'samples'])
+            for phase, avg_ms, p95_ms in self.stats():
+                writer.writerow([self.frame_count, phase, f"{avg_ms:.4f}", f"{p95_ms:.4f}", len(self.samples[phase])])
+        return path
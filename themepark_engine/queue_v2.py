@@ -7,7 +7,6 @@ Features:
 - Connection validation
 """
 
-from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple, Set, TYPE_CHECKING
 from enum import Enum
 from .map import TILE_QUEUE_PATH, TILE_WALK, TILE_RIDE_ENTRANCE
@@ -32,17 +31,24 @@ class QueueDirection(Enum):
     UNKNOWN = "?"
 
 
-@dataclass
 class QueueTileV2:
     """Enhanced queue tile with direction and flow"""
-    x: int
-    y: int
-    direction: QueueDirection = QueueDirection.UNKNOWN
-    visitors: List['Guest'] = field(default_factory=list)
-    next_tile: Optional['QueueTileV2'] = None  # Tile suivante dans la queue
-    prev_tile: Optional['QueueTileV2'] = None  # Tile précédente dans la queue
-    is_entrance: bool = False  # Première tile (connectée au walk path)
-    is_exit: bool = False  # Dernière tile (proche du ride)
+    __slots__ = ('x', 'y', 'direction', 'visitors', 'next_tile', 'prev_tile', 'is_entrance', 'is_exit')
+
+    def __init__(self, x: int, y: int, direction: QueueDirection = QueueDirection.UNKNOWN,
+                 visitors: Optional[List['Guest']] = None, next_tile: Optional['QueueTileV2'] = None,
+                 prev_tile: Optional['QueueTileV2'] = None, is_entrance: bool = False, is_exit: bool = False):
+        self.x = x
+        self.y = y
+        self.direction = direction
+        self.visitors: List['Guest'] = visitors if visitors is not None else []
+        self.next_tile = next_tile  # Tile suivante dans la queue
+        self.prev_tile = prev_tile  # Tile précédente dans la queue
+        self.is_entrance = is_entrance  # Première tile (connectée au walk path)
+        self.is_exit = is_exit  # Dernière tile (proche du ride)
+
+    def __repr__(self):
+        return f"QueueTileV2({self.x}, {self.y}, {self.direction})"
 
     def get_capacity(self) -> int:
         """Get tile capacity based on direction"""
@@ -107,7 +113,7 @@ class QueuePathV2:
     def add_visitor(self, visitor: 'Guest') -> bool:
         """Add visitor to the queue"""
         if not self.can_enter():
-            DebugConfig.log('queues', f"Queue full, cannot add visitor {visitor.id}")
+            DebugConfig.log('queues', "Queue full, cannot add visitor {}", visitor.id)
             return False
 
         # Add to visitors list
@@ -129,7 +135,7 @@ class QueuePathV2:
         visitor.target_y = float(entrance_tile.y)
         visitor.is_moving = False
 
-        DebugConfig.log('queues', f"Visitor {visitor.id} entered queue at ENTRANCE tile ({entrance_tile.x}, {entrance_tile.y})")
+        DebugConfig.log('queues', "Visitor {} entered queue at ENTRANCE tile ({}, {})", visitor.id, entrance_tile.x, entrance_tile.y)
 
         # Start walking toward exit immediately
         self._update_visitor_target(visitor)
@@ -151,7 +157,7 @@ class QueuePathV2:
                 if not v.is_moving:
                     self._update_visitor_target(v)
 
-            DebugConfig.log('queues', f"Visitor {visitor.id} removed from queue")
+            DebugConfig.log('queues', "Visitor {} removed from queue", visitor.id)
 
     def _update_visitor_target(self, visitor: 'Guest'):
         """Update where the visitor should walk to next in the queue"""
@@ -166,7 +172,7 @@ class QueuePathV2:
                 break
 
         if current_tile_index is None:
-            DebugConfig.log('queues', f"Warning: Visitor {visitor.id} current_queue_tile not found in tiles")
+            DebugConfig.log('queues', "Warning: Visitor {} current_queue_tile not found in tiles", visitor.id)
             return
 
         # Try to find next available tile to walk to
@@ -177,17 +183,17 @@ class QueuePathV2:
             if not next_tile.is_full():
                 # Yes! Start walking there
                 visitor._start_movement_to(next_tile.x, next_tile.y)
-                DebugConfig.log('queues', f"Visitor {visitor.id} starting walk from tile {current_tile_index} to tile {next_index}")
+                DebugConfig.log('queues', "Visitor {} starting walk from tile {} to tile {}", visitor.id, current_tile_index, next_index)
                 return
             else:
                 # Tile is full, check if there's someone there
                 if len(next_tile.visitors) > 0:
                     # Someone is blocking, stop here
-                    DebugConfig.log('queues', f"Visitor {visitor.id} blocked at tile {current_tile_index}, tile {next_index} is full")
+                    DebugConfig.log('queues', "Visitor {} blocked at tile {}, tile {} is full", visitor.id, current_tile_index, next_index)
                     return
 
         # Reached the end, stay at current position
-        DebugConfig.log('queues', f"Visitor {visitor.id} at tile {current_tile_index}, no further movement needed")
+        DebugConfig.log('queues', "Visitor {} at tile {}, no further movement needed", visitor.id, current_tile_index)
 
     def get_entrance_position(self) -> Optional[Tuple[int, int]]:
         """Get entrance position"""
@@ -231,7 +237,7 @@ class QueuePathV2:
                             # Add to new tile
                             tile.add_visitor(visitor)
                             visitor.current_queue_tile = tile
-                            DebugConfig.log('queues', f"Visitor {visitor.id} reached tile ({tile.x}, {tile.y})")
+                            DebugConfig.log('queues', "Visitor {} reached tile ({}, {})", visitor.id, tile.x, tile.y)
 
                             # Update target for next movement
                             self._update_visitor_target(visitor)
@@ -353,52 +359,51 @@ class QueueManagerV2:
         paths = []
 
         # Find all queue tiles and create tile objects
-        for y in range(grid.height):
-            for x in range(grid.width):
-                if grid.get(x, y) == TILE_QUEUE_PATH and (x, y) not in visited:
-                    # Start a new path from this tile
-                    path_tiles = self._trace_queue_path(grid, x, y, visited)
-                    if path_tiles:
-                        # Order tiles from ENTRANCE (near walk path) to EXIT (near ride)
-                        path_tiles = self._order_queue_tiles(path_tiles, grid)
-
-                        # Detect directions for all tiles based on ordered flow
-                        for i, tile in enumerate(path_tiles):
-                            tile.direction = self._detect_flow_direction(path_tiles, i)
-                            self.tile_map[(tile.x, tile.y)] = tile
-
-                        queue_path = QueuePathV2(path_tiles)
-
-                        # Try to restore visitors and ride connection from old path
-                        if preserve_visitors:
-                            tile_positions = tuple(sorted((tile.x, tile.y) for tile in path_tiles))
-                            if tile_positions in old_paths_by_tiles:
-                                old_path = old_paths_by_tiles[tile_positions]
-                                # Restore visitors
-                                queue_path.visitors = old_path.visitors
-                                # Update visitor references to new tiles
-                                for visitor in queue_path.visitors:
-                                    visitor.current_queue = queue_path
-                                    # Find the tile the visitor is on
-                                    for tile in queue_path.tiles:
-                                        if (tile.x, tile.y) == (visitor.grid_x, visitor.grid_y):
-                                            visitor.current_queue_tile = tile
-                                            # Add visitor to tile's visitors list
-                                            if visitor not in tile.visitors:
-                                                tile.visitors.append(visitor)
-                                            break
-                                # Restore ride connection
-                                queue_path.connected_ride = old_path.connected_ride
-                                if old_path.connected_ride:
-                                    self.ride_queues[old_path.connected_ride] = queue_path
-                                # Update movement targets for all visitors
-                                for visitor in queue_path.visitors:
-                                    if not visitor.is_moving:
-                                        queue_path._update_visitor_target(visitor)
-                                DebugConfig.log('queues', f"Restored {len(queue_path.visitors)} visitors to queue path")
-
-                        paths.append(queue_path)
-                        DebugConfig.log('queues', f"Found queue path with {len(path_tiles)} tiles")
+        for x, y in grid.tiles_of_type(TILE_QUEUE_PATH):
+            if (x, y) not in visited:
+                # Start a new path from this tile
+                path_tiles = self._trace_queue_path(grid, x, y, visited)
+                if path_tiles:
+                    # Order tiles from ENTRANCE (near walk path) to EXIT (near ride)
+                    path_tiles = self._order_queue_tiles(path_tiles, grid)
+
+                    # Detect directions for all tiles based on ordered flow
+                    for i, tile in enumerate(path_tiles):
+                        tile.direction = self._detect_flow_direction(path_tiles, i)
+                        self.tile_map[(tile.x, tile.y)] = tile
+
+                    queue_path = QueuePathV2(path_tiles)
+
+                    # Try to restore visitors and ride connection from old path
+                    if preserve_visitors:
+                        tile_positions = tuple(sorted((tile.x, tile.y) for tile in path_tiles))
+                        if tile_positions in old_paths_by_tiles:
+                            old_path = old_paths_by_tiles[tile_positions]
+                            # Restore visitors
+                            queue_path.visitors = old_path.visitors
+                            # Update visitor references to new tiles
+                            for visitor in queue_path.visitors:
+                                visitor.current_queue = queue_path
+                                # Find the tile the visitor is on
+                                for tile in queue_path.tiles:
+                                    if (tile.x, tile.y) == (visitor.grid_x, visitor.grid_y):
+                                        visitor.current_queue_tile = tile
+                                        # Add visitor to tile's visitors list
+                                        if visitor not in tile.visitors:
+                                            tile.visitors.append(visitor)
+                                        break
+                            # Restore ride connection
+                            queue_path.connected_ride = old_path.connected_ride
+                            if old_path.connected_ride:
+                                self.ride_queues[old_path.connected_ride] = queue_path
+                            # Update movement targets for all visitors
+                            for visitor in queue_path.visitors:
+                                if not visitor.is_moving:
+                                    queue_path._update_visitor_target(visitor)
+                            DebugConfig.log('queues', "Restored {} visitors to queue path", len(queue_path.visitors))
+
+                    paths.append(queue_path)
+                    DebugConfig.log('queues', "Found queue path with {} tiles", len(path_tiles))
 
         self.queue_paths = paths
         return paths
@@ -474,13 +479,13 @@ class QueueManagerV2:
                 if (has_outgoing and not has_incoming) or (has_incoming and not has_outgoing):
                     # This is a chain endpoint, use it as entrance
                     entrance_tile = candidate
-                    DebugConfig.log('queues', f"Selected entrance at ({candidate.x}, {candidate.y}) from {len(potential_entrances)} candidates")
+                    DebugConfig.log('queues', "Selected entrance at ({}, {}) from {} candidates", candidate.x, candidate.y, len(potential_entrances))
                     break
 
             # Fallback: if we couldn't determine from links, use first candidate
             if not entrance_tile:
                 entrance_tile = potential_entrances[0]
-                DebugConfig.log('queues', f"Could not determine entrance from links, using first candidate at ({entrance_tile.x}, {entrance_tile.y})")
+                DebugConfig.log('queues', "Could not determine entrance from links, using first candidate at ({}, {})", entrance_tile.x, entrance_tile.y)
         elif len(potential_entrances) > 1:
             # No placement links, just use first
             entrance_tile = potential_entrances[0]
@@ -513,7 +518,7 @@ class QueueManagerV2:
 
             # If entrance is at the END of the chain (reverse construction)
             if has_incoming and not has_outgoing:
-                DebugConfig.log('queues', f"Detected reverse construction - inverting placement links")
+                DebugConfig.log('queues', "Detected reverse construction - inverting placement links")
 
                 # Follow the reversed chain to collect all tiles in this path
                 temp_ordered = []
@@ -529,9 +534,9 @@ class QueueManagerV2:
 
                 # Check if we got all tiles in this queue path
                 if len(temp_ordered) != len(tiles):
-                    DebugConfig.log('queues', f"WARNING: Reverse chain only found {len(temp_ordered)}/{len(tiles)} tiles - some tiles not linked properly")
+                    DebugConfig.log('queues', "WARNING: Reverse chain only found {}/{} tiles - some tiles not linked properly", len(temp_ordered), len(tiles))
                     # Don't invert if we didn't get all tiles - fall back to BFS instead
-                    DebugConfig.log('queues', f"Falling back to BFS due to incomplete reverse chain")
+                    DebugConfig.log('queues', "Falling back to BFS due to incomplete reverse chain")
                 else:
                     # Now we have all tiles in correct order (entrance→exit)
                     # Update placement_links to point in the correct direction
@@ -548,7 +553,7 @@ class QueueManagerV2:
                         # Add correct forward link
                         self.placement_links[curr_pos_tuple] = next_pos_tuple
 
-                    DebugConfig.log('queues', f"Successfully inverted {len(temp_ordered)} tiles from reverse construction")
+                    DebugConfig.log('queues', "Successfully inverted {} tiles from reverse construction", len(temp_ordered))
                     return temp_ordered
 
             # Normal construction: follow forward links
@@ -572,15 +577,15 @@ class QueueManagerV2:
 
             # If we successfully ordered using placement links, return
             if len(ordered_tiles) == len(tiles):
-                DebugConfig.log('queues', f"Ordered {len(ordered_tiles)} queue tiles using placement links")
+                DebugConfig.log('queues', "Ordered {} queue tiles using placement links", len(ordered_tiles))
                 return ordered_tiles
             else:
-                DebugConfig.log('queues', f"Placement links only covered {len(ordered_tiles)}/{len(tiles)} tiles, falling back to BFS")
+                DebugConfig.log('queues', "Placement links only covered {}/{} tiles, falling back to BFS", len(ordered_tiles), len(tiles))
 
         # Fallback: Use BFS (old method)
         # Note: entrance_tile and exit_tile already found above
         if not entrance_tile or not exit_tile:
-            DebugConfig.log('queues', f"Warning: Could not find entrance or exit tile for queue path")
+            DebugConfig.log('queues', "Warning: Could not find entrance or exit tile for queue path")
             return tiles
 
         # Order tiles from entrance to exit using BFS
@@ -617,14 +622,14 @@ class QueueManagerV2:
             if tile_pos not in visited_positions:
                 ordered_tiles.append(tile)
 
-        DebugConfig.log('queues', f"Ordered {len(ordered_tiles)} queue tiles using BFS fallback")
+        DebugConfig.log('queues', "Ordered {} queue tiles using BFS fallback", len(ordered_tiles))
         return ordered_tiles
 
     def connect_queue_to_ride(self, queue_path: QueuePathV2, ride: 'Ride'):
         """Connect a queue to a ride"""
         queue_path.connected_ride = ride
         self.ride_queues[ride] = queue_path
-        DebugConfig.log('queues', f"Connected queue to ride {ride.defn.name}")
+        DebugConfig.log('queues', "Connected queue to ride {}", ride.defn.name)
 
     def update_queue_system(self, grid: 'MapGrid'):
         """Update the queue system"""
@@ -648,7 +653,7 @@ class QueueManagerV2:
         if prev_x is not None and prev_y is not None:
             # Link previous tile to this new tile
             self.placement_links[(prev_x, prev_y)] = (x, y)
-            DebugConfig.log('queues', f"Linked queue tile ({prev_x}, {prev_y}) -> ({x}, {y})")
+            DebugConfig.log('queues', "Linked queue tile ({}, {}) -> ({}, {})", prev_x, prev_y, x, y)
 
     # Compatibility methods for engine.py placement system
     def can_orient_waypoint(self, grid: 'MapGrid', x: int, y: int, direction: str) -> bool:
@@ -673,13 +678,13 @@ class QueueManagerV2:
             del self.tile_map[(x, y)]
 
         # The queue paths will be rebuilt on next update_queue_system call
-        DebugConfig.log('queues', f"Removed queue waypoint at ({x}, {y})")
+        DebugConfig.log('queues', "Removed queue waypoint at ({}, {})", x, y)
 
     def evacuate_queue_for_broken_ride(self, ride: 'Ride'):
         """Evacuate all visitors from a queue when ride breaks down"""
         queue_path = self.get_queue_for_ride(ride)
         if queue_path:
-            DebugConfig.log('queues', f"Evacuating queue for broken ride {ride.defn.name}")
+            DebugConfig.log('queues', "Evacuating queue for broken ride {}", ride.defn.name)
             # Remove all visitors from the queue
             visitors_to_evacuate = queue_path.visitors.copy()
             for visitor in visitors_to_evacuate:
@@ -690,7 +695,7 @@ class QueueManagerV2:
                 visitor.current_queue = None
                 visitor.current_queue_tile = None
                 visitor.queue_position = -1
-                DebugConfig.log('queues', f"Evacuated visitor {visitor.id} from broken ride queue")
+                DebugConfig.log('queues', "Evacuated visitor {} from broken ride queue", visitor.id)
 
     def can_visitor_board_ride(self, visitor: 'Guest') -> bool:
         """Check if visitor can board their ride (compatibility method)"""
@@ -722,7 +727,7 @@ class QueueManagerV2:
             # Board the ride
             ride.board_visitor(visitor)
 
-            DebugConfig.log('queues', f"Visitor {visitor.id} boarded ride {ride.defn.name}")
+            DebugConfig.log('queues', "Visitor {} boarded ride {}", visitor.id, ride.defn.name)
             return True
 
         return False
@@ -80,23 +80,23 @@ class SimpleQueuePath:
     
     def add_visitor(self, visitor: 'Guest') -> bool:
         """Ajoute un visiteur à la queue"""
-        DebugConfig.log('queues', f"SimpleQueuePath.add_visitor called for visitor {visitor.id}")
-        DebugConfig.log('queues', f"Queue capacity: {self.max_capacity}, current visitors: {len(self.visitors)}")
+        DebugConfig.log('queues', "SimpleQueuePath.add_visitor called for visitor {}", visitor.id)
+        DebugConfig.log('queues', "Queue capacity: {}, current visitors: {}", self.max_capacity, len(self.visitors))
         
         if not self.can_enter():
-            DebugConfig.log('queues', f"Queue cannot accept visitor {visitor.id}")
+            DebugConfig.log('queues', "Queue cannot accept visitor {}", visitor.id)
             return False
         
         self.visitors.append(visitor)
         visitor.queue_position = len(self.visitors) - 1
         visitor.current_queue = self
         
-        DebugConfig.log('queues', f"Visitor {visitor.id} added to visitors list, total: {len(self.visitors)}")
+        DebugConfig.log('queues', "Visitor {} added to visitors list, total: {}", visitor.id, len(self.visitors))
         
         # Réorganiser tous les visiteurs dans les tuiles
         self._distribute_visitors_across_tiles()
         
-        DebugConfig.log('queues', f"Visitor {visitor.id} entered queue at position {visitor.queue_position}")
+        DebugConfig.log('queues', "Visitor {} entered queue at position {}", visitor.id, visitor.queue_position)
         return True
     
     def remove_visitor(self, visitor: 'Guest'):
@@ -116,11 +116,11 @@ class SimpleQueuePath:
             # Déplacer les visiteurs vers l'avant
             self._move_visitors_forward()
             
-            DebugConfig.log('queues', f"Visitor {visitor.id} removed from queue")
+            DebugConfig.log('queues', "Visitor {} removed from queue", visitor.id)
     
     def _distribute_visitors_across_tiles(self):
         """Distribue tous les visiteurs dans les tuiles disponibles"""
-        DebugConfig.log('queues', f"Distributing {len(self.visitors)} visitors across {len(self.tiles)} tiles")
+        DebugConfig.log('queues', "Distributing {} visitors across {} tiles", len(self.visitors), len(self.tiles))
         
         # Vider toutes les tuiles
         for tile in self.tiles:
@@ -129,7 +129,7 @@ class SimpleQueuePath:
         # Distribuer les visiteurs dans les tuiles
         visitor_index = 0
         for tile_index, tile in enumerate(self.tiles):
-            DebugConfig.log('queues', f"Tile {tile_index} at ({tile.x}, {tile.y}) - capacity: {tile.get_capacity()}")
+            DebugConfig.log('queues', "Tile {} at ({}, {}) - capacity: {}", tile_index, tile.x, tile.y, tile.get_capacity())
             # Remplir cette tuile avec les visiteurs suivants
             while visitor_index < len(self.visitors) and len(tile.visitors) < tile.get_capacity():
                 visitor = self.visitors[visitor_index]
@@ -144,12 +144,12 @@ class SimpleQueuePath:
                 visitor.x = float(tile.x)
                 visitor.y = float(tile.y)
                 
-                DebugConfig.log('queues', f"Visitor {visitor.id} placed on tile {tile_index} at ({tile.x}, {tile.y}) - position {visitor.tile_position}/{tile.get_capacity()}")
+                DebugConfig.log('queues', "Visitor {} placed on tile {} at ({}, {}) - position {}/{}", visitor.id, tile_index, tile.x, tile.y, visitor.tile_position, tile.get_capacity())
                 visitor_index += 1
         
         # Vérifier la distribution finale
         for tile_index, tile in enumerate(self.tiles):
-            DebugConfig.log('queues', f"Final tile {tile_index} has {len(tile.visitors)} visitors")
+            DebugConfig.log('queues', "Final tile {} has {} visitors", tile_index, len(tile.visitors))
     
     def _move_visitors_forward(self):
         """Déplace tous les visiteurs vers l'avant dans la queue"""
@@ -221,7 +221,7 @@ class SimpleQueueManager:
         if connected_ride:
             self.ride_queues[connected_ride] = queue_path
         
-        DebugConfig.log('queues', f"Created queue path with {length} tiles starting at {start_pos}")
+        DebugConfig.log('queues', "Created queue path with {} tiles starting at {}", length, start_pos)
         return queue_path
     
     def _get_or_create_tile(self, x: int, y: int) -> SimpleQueueTile:
@@ -237,27 +237,21 @@ class SimpleQueueManager:
         
         visited = set()
         queue_paths = []
-        queue_tile_count = 0
         
-        # Compter les tuiles de queue
-        for y in range(grid.height):
-            for x in range(grid.width):
-                if grid.get(x, y) == TILE_QUEUE_PATH:
-                    queue_tile_count += 1
+        # Tuiles de queue de la grille (ligne par ligne)
+        queue_tiles = grid.tiles_of_type(TILE_QUEUE_PATH)
+        # DebugConfig.log('queues', f"Found {len(queue_tiles)} queue tiles in grid")  # Too frequent
         
-        # DebugConfig.log('queues', f"Found {queue_tile_count} queue tiles in grid")  # Too frequent
-        
-        for y in range(grid.height):
-            for x in range(grid.width):
-                if grid.get(x, y) == TILE_QUEUE_PATH and (x, y) not in visited:
-                    DebugConfig.log('queues', f"Starting new queue path at ({x}, {y})")
-                    # Trouver un nouveau chemin de queue
-                    tiles = self._trace_queue_path(grid, x, y, visited)
-                    if tiles:
-                        DebugConfig.log('queues', f"Created queue path with {len(tiles)} tiles")
-                        # Créer le chemin de queue
-                        queue_path = SimpleQueuePath(tiles)
-                        queue_paths.append(queue_path)
+        for x, y in queue_tiles:
+            if (x, y) not in visited:
+                DebugConfig.log('queues', "Starting new queue path at ({}, {})", x, y)
+                # Trouver un nouveau chemin de queue
+                tiles = self._trace_queue_path(grid, x, y, visited)
+                if tiles:
+                    DebugConfig.log('queues', "Created queue path with {} tiles", len(tiles))
+                    # Créer le chemin de queue
+                    queue_path = SimpleQueuePath(tiles)
+                    queue_paths.append(queue_path)
         
         # Mettre à jour la liste des chemins
         self.queue_paths = queue_paths
@@ -324,19 +318,19 @@ class SimpleQueueManager:
     
     def get_queue_for_ride(self, ride: 'Ride') -> Optional[SimpleQueuePath]:
         """Retourne la file d'attente pour une attraction"""
-        DebugConfig.log('queues', f"Looking for queue for ride {ride.defn.name}")
+        DebugConfig.log('queues', "Looking for queue for ride {}", ride.defn.name)
         queue_path = self.ride_queues.get(ride)
         if queue_path:
-            DebugConfig.log('queues', f"Found queue for ride {ride.defn.name}")
+            DebugConfig.log('queues', "Found queue for ride {}", ride.defn.name)
         else:
-            DebugConfig.log('queues', f"No queue found for ride {ride.defn.name}")
+            DebugConfig.log('queues', "No queue found for ride {}", ride.defn.name)
         return queue_path
     
     def connect_queue_to_ride(self, queue_path: SimpleQueuePath, ride: 'Ride'):
         """Connecte une file d'attente à une attraction"""
         queue_path.connected_ride = ride
         self.ride_queues[ride] = queue_path
-        DebugConfig.log('queues', f"Connected queue to ride {ride.defn.name}")
+        DebugConfig.log('queues', "Connected queue to ride {}", ride.defn.name)
     
     def can_visitor_enter_queue(self, ride: 'Ride') -> bool:
         """Vérifie si un visiteur peut entrer dans la queue d'une attraction"""
@@ -347,17 +341,17 @@ class SimpleQueueManager:
     
     def add_visitor_to_queue(self, visitor: 'Guest', ride: 'Ride') -> bool:
         """Ajoute un visiteur à la queue d'une attraction"""
-        DebugConfig.log('queues', f"Attempting to add visitor {visitor.id} to queue for ride {ride.defn.name}")
+        DebugConfig.log('queues', "Attempting to add visitor {} to queue for ride {}", visitor.id, ride.defn.name)
         queue_path = self.get_queue_for_ride(ride)
         if not queue_path:
-            DebugConfig.log('queues', f"No queue found for ride {ride.defn.name}")
+            DebugConfig.log('queues', "No queue found for ride {}", ride.defn.name)
             return False
-        DebugConfig.log('queues', f"Found queue for ride {ride.defn.name}, adding visitor {visitor.id}")
+        DebugConfig.log('queues', "Found queue for ride {}, adding visitor {}", ride.defn.name, visitor.id)
         success = queue_path.add_visitor(visitor)
         if success:
-            DebugConfig.log('queues', f"Visitor {visitor.id} successfully added to queue")
+            DebugConfig.log('queues', "Visitor {} successfully added to queue", visitor.id)
         else:
-            DebugConfig.log('queues', f"Failed to add visitor {visitor.id} to queue")
+            DebugConfig.log('queues', "Failed to add visitor {} to queue", visitor.id)
         return success
     
     def remove_visitor_from_queue(self, visitor: 'Guest'):
@@ -395,7 +389,7 @@ class SimpleQueueManager:
                 visitor.current_ride = ride
                 visitor.state = "riding"
                 visitor.ride_timer = 0.0
-                DebugConfig.log('queues', f"Visitor {visitor.id} boarded ride {ride.defn.name}")
+                DebugConfig.log('queues', "Visitor {} boarded ride {}", visitor.id, ride.defn.name)
                 return True
         
         return False
@@ -427,13 +421,13 @@ class SimpleQueueManager:
             if tile.visitor:
                 self.remove_visitor_from_queue(tile.visitor)
             del self.tile_cache[pos]
-            DebugConfig.log('queues', f"Removed queue tile at {pos}")
+            DebugConfig.log('queues', "Removed queue tile at {}", pos)
     
     def orient_queue_waypoint(self, grid, x: int, y: int, direction: str):
         """Orient un waypoint de queue (pour compatibilité)"""
         # Pour compatibilité avec l'ancien système
         # Dans le système simple, l'orientation n'est pas nécessaire
-        DebugConfig.log('queues', f"Orientation not needed in simple queue system at ({x}, {y})")
+        DebugConfig.log('queues', "Orientation not needed in simple queue system at ({}, {})", x, y)
     
     def can_orient_waypoint(self, grid, x: int, y: int, direction: str) -> bool:
         """Vérifie si un waypoint peut être orienté (pour compatibilité)"""
@@ -453,11 +447,11 @@ class SimpleQueueManager:
                 visitor.current_queue_tile = None
                 visitor.queue_position = -1
                 visitor.tile_position = -1
-                DebugConfig.log('queues', f"Evacuating visitor {visitor.id} from queue due to ride breakdown")
+                DebugConfig.log('queues', "Evacuating visitor {} from queue due to ride breakdown", visitor.id)
             
             # Vider la queue
             queue_path.visitors.clear()
             for tile in queue_path.tiles:
                 tile.visitors.clear()
             
-            DebugConfig.log('queues', f"Evacuated queue for broken ride {ride.defn.name}")
\ No newline at end of file
+            DebugConfig.log('queues', "Evacuated queue for broken ride {}", ride.defn.name)
\ No newline at end of file
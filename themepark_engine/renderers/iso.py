@@ -167,6 +167,18 @@ class IsoRenderer:
         gx = (ox / tw) - gy * self._skew
         return round(gx), round(gy)
 
+    def visible_grid_bounds(self, margin:int=0):
+        """Grid bounding box (x0, y0, x1, y1) of the tiles covered by the screen, margin in tiles"""
+        tw, th = self.tile_size()
+        w, h = self.screen.get_size()
+        xs = []; ys = []
+        for sx, sy in ((0, 0), (w, 0), (0, h), (w, h)):
+            oy = (sy + self.camera.y - self.origin[1]) / th
+            ys.append(oy)
+            xs.append((sx + self.camera.x - self.origin[0]) / tw - oy * self._skew)
+        return (math.floor(min(xs)) - margin, math.floor(min(ys)) - margin,
+                math.ceil(max(xs)) + margin, math.ceil(max(ys)) + margin)
+
     # --- Depth ordering ---
     def _depth_key(self, x:int, y:int):
         # oblique: draw by increasing y then x for stability
@@ -0,0 +1,37 @@
+"""
+Null Renderer - Renderer sans affichage pour le mode headless
+
+Keeps the IsoRenderer camera / projection maths (screen_to_grid, grid_to_screen,
+tile_size...) so the rest of the engine can keep using them, but never builds
+tile surfaces and never draws anything.
+"""
+from __future__ import annotations
+from .iso import IsoRenderer
+
+
+class NullRenderer(IsoRenderer):
+    """Renderer that only keeps the camera state (used by headless games)"""
+
+    def _rebuild_surfaces(self):
+        pass
+
+    def draw_map(self, grid, queue_directions=None):
+        pass
+
+    def draw_objects(self, objects):
+        pass
+
+    def draw_highlight(self, gx, gy, ok=True, preview=False):
+        pass
+
+    def draw_ride_preview(self, gx, gy, width, height, ok=True):
+        pass
+
+    def draw_queue_arrows(self, queue_paths, show_arrows=True):
+        pass
+
+    def draw_cardinal_points(self):
+        pass
+
+    def draw_direction_legend(self):
+        pass
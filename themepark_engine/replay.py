@@ -0,0 +1,94 @@
+"""
+Input recording and replay for OpenPark
+Logs player inputs with the simulation tick they were applied at, so that a
+session can be replayed exactly (same seed + same inputs = same simulation)
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPLAY_VERSION = 1
+
+
+class InputRecorder:
+    """Records player inputs (placements, price changes, speed changes...) per simulation tick"""
+
+    def __init__(self, seed, start_tick: int = 0):
+        self.seed = seed
+        self.start_tick = start_tick
+        self.events: List[Dict] = []
+
+    def record(self, tick: int, action: str, params: Dict):
+        """Record an input applied before simulation step `tick`"""
+        self.events.append({'tick': tick, 'action': action, 'params': dict(params)})
+
+    def to_dict(self) -> Dict:
+        return {
+            'version': REPLAY_VERSION,
+            'seed': self.seed,
+            'start_tick': self.start_tick,
+            'events': self.events,
+        }
+
+    def save(self, path) -> Path:
+        """Save the recording as JSON"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=1)
+        return path
+
+
+class InputReplayer:
+    """Feeds recorded inputs back into a Game at the recorded ticks"""
+
+    def __init__(self, data: Dict):
+        if data.get('version') != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {data.get('version')}")
+        self.seed = data['seed']
+        self.start_tick = data.get('start_tick', 0)
+        self.events: List[Dict] = sorted(data.get('events', []), key=lambda ev: ev['tick'])
+        self.index = 0
+
+    @classmethod
+    def load(cls, path) -> 'InputReplayer':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @property
+    def finished(self) -> bool:
+        return self.index >= len(self.events)
+
+    @property
+    def last_tick(self) -> Optional[int]:
+        """Tick of the last recorded input (None if the recording is empty)"""
+        return self.events[-1]['tick'] if self.events else None
+
+    def apply_due(self, game):
+        """Apply every input recorded for the game's current tick (and any missed before it)"""
+        while self.index < len(self.events) and self.events[self.index]['tick'] <= game.sim_tick:
+            event = self.events[self.index]
+            self.index += 1
+            game.apply_input(event['action'], event['params'])
+
+
+def replay_session(path, extra_ticks: int = 0):
+    """Replay a recorded session headlessly
+
+    Args:
+        path: Recording saved with Game.save_input_recording()
+        extra_ticks: Ticks to keep simulating after the last recorded input
+
+    Returns:
+        The Game instance after the replay
+    """
+    from .engine import Game
+
+    replayer = InputReplayer.load(path)
+    game = Game(headless=True, seed=replayer.seed)
+    game.start_replay(replayer)
+    last_tick = replayer.last_tick or 0
+    while game.sim_tick <= last_tick + extra_ticks:
+        game.step()
+    return game
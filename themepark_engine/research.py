@@ -156,12 +156,12 @@ class ResearchBureau:
                 )
                 self.upgrades.append(upgrade)
 
-        DebugConfig.log('research', f"Loaded {len(self.upgrades)} research upgrades")
+        DebugConfig.log('research', "Loaded {} research upgrades", len(self.upgrades))
 
     def set_monthly_budget(self, amount: int):
         """Définit le budget mensuel de R&D (modifiable à tout moment, max $5000)"""
         self.monthly_budget = max(0, min(amount, self.MAX_MONTHLY_BUDGET))
-        DebugConfig.log('research', f"R&D monthly budget set to ${self.monthly_budget}")
+        DebugConfig.log('research', "R&D monthly budget set to ${}", self.monthly_budget)
 
     def set_category_allocation(self, category: str, percentage: float):
         """Définit l'allocation d'une catégorie (0.0 à 1.0)"""
@@ -194,9 +194,9 @@ class ResearchBureau:
                     points_added = category.add_daily_points(self.monthly_budget, points_cap)
 
                     if points_added > 0:
-                        DebugConfig.log('research', f"{category.name}: +{points_added:.2f} pts (total: {category.points:.2f}/{points_cap})")
+                        DebugConfig.log('research', "{}: +{:.2f} pts (total: {:.2f}/{})", category.name, points_added, category.points, points_cap)
                     elif category.points >= points_cap:
-                        DebugConfig.log('research', f"{category.name}: ⚠️ LIMITE ATTEINTE ({category.points:.0f}/{points_cap}) - Débloquez une amélioration!")
+                        DebugConfig.log('research', "{}: ⚠️ LIMITE ATTEINTE ({:.0f}/{}) - Débloquez une amélioration!", category.name, category.points, points_cap)
         elif player_cash <= 0:
             DebugConfig.log('research', "⚠️ R&D suspended: No cash available - No points accumulated today")
 
@@ -215,7 +215,7 @@ class ResearchBureau:
             self.last_deduction_month = self.last_deduction_month % 12 + 1
             self.total_spent_this_month = self.monthly_budget
 
-            DebugConfig.log('research', f"R&D budget deducted: ${self.monthly_budget}")
+            DebugConfig.log('research', "R&D budget deducted: ${}", self.monthly_budget)
             return True, f"R&D budget deducted: ${self.monthly_budget}"
         else:
             # Pas assez de cash : suspension + reset
@@ -259,7 +259,7 @@ class ResearchBureau:
         upgrade.unlocked = True
         self.unlocked_ids.add(upgrade.id)
 
-        DebugConfig.log('research', f"🔬 MANUALLY UNLOCKED: {upgrade.name} ({upgrade.category})")
+        DebugConfig.log('research', "🔬 MANUALLY UNLOCKED: {} ({})", upgrade.name, upgrade.category)
         return True, f"✅ {upgrade.name} débloqué!"
 
     def _check_and_unlock_upgrades(self):
@@ -390,4 +390,4 @@ class ResearchBureau:
             if upgrade.id in self.unlocked_ids:
                 upgrade.unlocked = True
 
-        DebugConfig.log('research', f"Research bureau restored - {len(self.unlocked_ids)} upgrades unlocked")
+        DebugConfig.log('research', "Research bureau restored - {} upgrades unlocked", len(self.unlocked_ids))
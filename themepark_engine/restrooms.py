@@ -19,6 +19,7 @@ class Restroom:
     y: int
     connected_to_path: bool = False
     current_users: List = None  # List of guests currently using this restroom
+    id: int = 0  # Entity id, assigned by the game's restroom registry
 
     def __post_init__(self):
         if self.current_users is None:
@@ -2,6 +2,10 @@
 from dataclasses import dataclass
 from typing import List, Tuple, Optional, TYPE_CHECKING
 from .debug import DebugConfig
+from .events import guest_events, GuestEventType
+from .rng import SimRandom
+
+_rng = SimRandom.stream(SimRandom.RIDES)
 
 if TYPE_CHECKING:
     from .agents import Guest
@@ -40,6 +44,7 @@ class Ride:
         self.defn = defn
         self.x = x
         self.y = y
+        self.id = 0  # Entity id, assigned by the game's ride registry
         self.entrance: Optional[RideEntrance] = None
         self.exit: Optional[RideExit] = None
         self.operational = True
@@ -53,6 +58,7 @@ class Ride:
         self.is_broken = False
         self.being_repaired = False
         self.breakdown_timer = 0.0
+        self.queue_evacuated = False  # Queue emptied after a breakdown (until repaired)
         
     def get_bounds(self) -> Tuple[int, int, int, int]:
         """Return (min_x, min_y, max_x, max_y) bounds of the ride"""
@@ -147,14 +153,14 @@ class Ride:
         """Check if a visitor can board the ride"""
         # Cannot board if ride is broken or being repaired
         if self.is_broken or self.being_repaired:
-            DebugConfig.log('rides', f"Ride {self.defn.name} can_board: False (broken: {self.is_broken}, being_repaired: {self.being_repaired})")
+            DebugConfig.log('rides', "Ride {} can_board: False (broken: {}, being_repaired: {})", self.defn.name, self.is_broken, self.being_repaired)
             return False
 
         # Use the ride's actual capacity from its definition
         result = len(self.current_visitors) < self.defn.capacity and not self.is_launched
-        DebugConfig.log('rides', f"Ride {self.defn.name} can_board: {result} (visitors: {len(self.current_visitors)}/{self.defn.capacity}, launched: {self.is_launched})")
-        if len(self.current_visitors) > 0:
-            DebugConfig.log('rides', f"Ride {self.defn.name} has visitors: {[v.id for v in self.current_visitors]}")
+        DebugConfig.log('rides', "Ride {} can_board: {} (visitors: {}/{}, launched: {})", self.defn.name, result, len(self.current_visitors), self.defn.capacity, self.is_launched)
+        if self.current_visitors and DebugConfig.is_enabled('rides'):
+            DebugConfig.log('rides', "Ride {} has visitors: {}", self.defn.name, [v.id for v in self.current_visitors])
         return result
     
     def board_visitor(self, visitor: 'Guest') -> bool:
@@ -175,7 +181,7 @@ class Ride:
             visitor.target_y = float(ride_center_y)
             visitor.is_moving = False  # Stop any movement
 
-            DebugConfig.log('rides', f"Visitor {visitor.id} boarded ride {self.defn.name} at center ({ride_center_x}, {ride_center_y}). Total visitors: {len(self.current_visitors)}")
+            DebugConfig.log('rides', "Visitor {} boarded ride {} at center ({}, {}). Total visitors: {}", visitor.id, self.defn.name, ride_center_x, ride_center_y, len(self.current_visitors))
 
             # Check if ride should launch now (launch when at least 50% full)
             if len(self.current_visitors) >= max(1, self.defn.capacity // 2):
@@ -184,10 +190,10 @@ class Ride:
                 # Start waiting timer if not launched yet
                 if not self.is_launched and self.waiting_timer == 0.0:
                     self.waiting_timer = 0.0  # Reset timer
-                    DebugConfig.log('rides', f"Ride {self.defn.name} waiting for more visitors ({len(self.current_visitors)}/{self.defn.capacity})")
+                    DebugConfig.log('rides', "Ride {} waiting for more visitors ({}/{})", self.defn.name, len(self.current_visitors), self.defn.capacity)
 
             return True
-        DebugConfig.log('rides', f"Visitor {visitor.id} cannot board ride {self.defn.name}. Current visitors: {len(self.current_visitors)}")
+        DebugConfig.log('rides', "Visitor {} cannot board ride {}. Current visitors: {}", visitor.id, self.defn.name, len(self.current_visitors))
         return False
     
     def launch_ride(self):
@@ -197,7 +203,7 @@ class Ride:
             self.is_launched = True
             self.ride_timer = 0.0
             self.waiting_timer = 0.0  # Reset waiting timer
-            DebugConfig.log('rides', f"Ride {self.defn.name} launched with {len(self.current_visitors)} visitors (capacity: {self.defn.capacity})")
+            DebugConfig.log('rides', "Ride {} launched with {} visitors (capacity: {})", self.defn.name, len(self.current_visitors), self.defn.capacity)
     
     def _handle_breakdown(self):
         """Handle ride breakdown - evacuate visitors IMMEDIATELY and clear queue"""
@@ -212,7 +218,7 @@ class Ride:
                 visitor.target_x = float(self.exit.x)
                 visitor.target_y = float(self.exit.y)
                 visitor.is_moving = False
-                DebugConfig.log('rides', f"Visitor {visitor.id} evacuated IMMEDIATELY to exit ({self.exit.x}, {self.exit.y}) due to breakdown")
+                DebugConfig.log('rides', "Visitor {} evacuated IMMEDIATELY to exit ({}, {}) due to breakdown", visitor.id, self.exit.x, self.exit.y)
 
             # Reset visitor state
             visitor.state = "wandering"
@@ -236,10 +242,10 @@ class Ride:
             visitor.current_queue_tile = None
             visitor.queue_position = -1
             visitor.tile_position = -1
-            DebugConfig.log('rides', f"Clearing waiting visitor {visitor.id} due to breakdown")
+            DebugConfig.log('rides', "Clearing waiting visitor {} due to breakdown", visitor.id)
 
         self.waiting_visitors.clear()
-        DebugConfig.log('rides', f"Ride {self.defn.name} evacuated all visitors IMMEDIATELY due to breakdown")
+        DebugConfig.log('rides', "Ride {} evacuated all visitors IMMEDIATELY due to breakdown", self.defn.name)
     
     def tick(self, dt: float):
         """Update ride state"""
@@ -247,11 +253,10 @@ class Ride:
         if not self.is_broken and not self.being_repaired:
             self.breakdown_timer += dt
             if self.breakdown_timer >= 1.0:  # Check every second
-                import random
-                if random.random() < self.defn.breakdown_chance:
+                if _rng.random() < self.defn.breakdown_chance:
                     self.is_broken = True
                     self._handle_breakdown()
-                    DebugConfig.log('rides', f"Ride {self.defn.name} has broken down!")
+                    DebugConfig.log('rides', "Ride {} has broken down!", self.defn.name)
                 self.breakdown_timer = 0.0
         
         # Don't operate if broken
@@ -262,24 +267,25 @@ class Ride:
         if not self.is_launched and len(self.current_visitors) > 0:
             self.waiting_timer += dt
             if self.waiting_timer >= self.max_wait_time:
-                DebugConfig.log('rides', f"Ride {self.defn.name} launching due to timeout ({len(self.current_visitors)} visitors)")
+                DebugConfig.log('rides', "Ride {} launching due to timeout ({} visitors)", self.defn.name, len(self.current_visitors))
                 self.launch_ride()
         
         if self.is_launched:
             self.ride_timer += dt
             if self.ride_timer >= self.ride_duration:
                 # Ride finished, move visitors to exit
-                DebugConfig.log('rides', f"Ride {self.defn.name} finished. Visitors exiting: {len(self.current_visitors)}")
+                DebugConfig.log('rides', "Ride {} finished. Visitors exiting: {}", self.defn.name, len(self.current_visitors))
                 for visitor in self.current_visitors:
                     visitor.state = "exiting"
+                    guest_events.emit(GuestEventType.RIDE_COMPLETED, visitor, ride=self)
                     visitor.current_ride = None
                     visitor.target_ride = None
                     # Set exit position for visitor
                     if self.exit:
                         visitor.ride_exit_pos = (self.exit.x, self.exit.y)
-                        DebugConfig.log('rides', f"Visitor {visitor.id} exiting ride to position {visitor.ride_exit_pos}")
+                        DebugConfig.log('rides', "Visitor {} exiting ride to position {}", visitor.id, visitor.ride_exit_pos)
                     else:
-                        DebugConfig.log('rides', f"Visitor {visitor.id} exiting ride but no exit defined")
+                        DebugConfig.log('rides', "Visitor {} exiting ride but no exit defined", visitor.id)
                 
                 self.current_visitors.clear()
                 self.is_launched = False
@@ -0,0 +1,55 @@
+"""
+Deterministic random streams for OpenPark
+One seeded random.Random per subsystem so that two runs with the same seed
+(and the same player inputs) produce exactly the same simulation
+"""
+
+import random
+
+
+class SimRandom:
+    """Registry of seeded random streams, one per subsystem"""
+
+    # Stream names
+    GUESTS = 'guests'         # Guest creation (preferences, budget, needs) and guest behaviour
+    ENGINE = 'engine'         # Engine decisions (attraction choice, wandering goals, purchases, spawn offsets)
+    RIDES = 'rides'           # Ride breakdowns
+    WEATHER = 'weather'       # Weather changes
+    EMPLOYEES = 'employees'   # Employee ids, patrols, work durations
+    LITTER = 'litter'         # Litter placement and types
+    ECONOMY = 'economy'       # Deliveries, inflation, salary negotiations
+    PARTICLES = 'particles'   # Visual only (weather particles), never affects the simulation
+
+    ALL_STREAMS = [GUESTS, ENGINE, RIDES, WEATHER, EMPLOYEES, LITTER, ECONOMY, PARTICLES]
+
+    seed_value = None
+    _streams = {name: random.Random() for name in ALL_STREAMS}
+
+    @classmethod
+    def stream(cls, name: str) -> random.Random:
+        """Get the random stream of a subsystem (the same object for the whole process)"""
+        rng = cls._streams.get(name)
+        if rng is None:
+            rng = random.Random()
+            if cls.seed_value is not None:
+                rng.seed(f"{cls.seed_value}:{name}")
+            cls._streams[name] = rng
+        return rng
+
+    @classmethod
+    def seed(cls, seed=None):
+        """Reseed every stream in place (streams keep their identity)
+
+        Args:
+            seed: Master seed (int or str). None picks a fresh random seed.
+
+        Returns:
+            The master seed actually used (store it to replay the session)
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2**31)
+        cls.seed_value = seed
+        for name, rng in cls._streams.items():
+            # Each subsystem gets an independent sequence derived from the master seed
+            rng.seed(f"{seed}:{name}")
+        return seed
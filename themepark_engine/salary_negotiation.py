@@ -6,7 +6,9 @@ Employees negotiate salary increases once per year, with consequences for refusa
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 from enum import Enum
-import random
+from .rng import SimRandom
+
+_rng = SimRandom.stream(SimRandom.ECONOMY)
 
 
 class NegotiationStage(Enum):
@@ -74,23 +76,23 @@ class SalaryNegotiationManager:
         # Day 1 = Month 1, Day 2 = Month 2, ..., Day 12 = Month 12, Day 13 = Month 1 again
         current_month = ((current_day - 1) % 12) + 1
 
-        DebugConfig.log('engine', f"    {employee_type}: current_month={current_month}, required_month={self.negotiation_months.get(employee_type, 0)}")
+        DebugConfig.log('engine', "    {}: current_month={}, required_month={}", employee_type, current_month, self.negotiation_months.get(employee_type, 0))
 
         # Check if it's the right month for this type
         if current_month != self.negotiation_months.get(employee_type, 0):
-            DebugConfig.log('engine', f"    {employee_type}: Wrong month, skipping")
+            DebugConfig.log('engine', "    {}: Wrong month, skipping", employee_type)
             return False
 
-        DebugConfig.log('engine', f"    {employee_type}: last_negotiation_year={self.last_negotiation_year.get(employee_type, 0)}, current_year={current_year}")
+        DebugConfig.log('engine', "    {}: last_negotiation_year={}, current_year={}", employee_type, self.last_negotiation_year.get(employee_type, 0), current_year)
 
         # Check if already negotiated this year
         if self.last_negotiation_year.get(employee_type, 0) >= current_year:
-            DebugConfig.log('engine', f"    {employee_type}: Already negotiated this year, skipping")
+            DebugConfig.log('engine', "    {}: Already negotiated this year, skipping", employee_type)
             return False
 
         # Check if there's already an active negotiation
         if employee_type in self.active_negotiations:
-            DebugConfig.log('engine', f"    {employee_type}: Active negotiation exists, skipping")
+            DebugConfig.log('engine', "    {}: Active negotiation exists, skipping", employee_type)
             return False
 
         # Calculate probability based on park profit
@@ -104,7 +106,7 @@ class SalaryNegotiationManager:
             chance = 0.1  # Losing money = very rare demands
 
         # Production mode: probability based on park profit
-        return random.random() < chance
+        return _rng.random() < chance
 
     def start_negotiation(self, employee_type: str, affected_employees: List[int],
                          current_salary: int, year: int, month: int, day: int) -> NegotiationState:
@@ -115,7 +117,7 @@ class SalaryNegotiationManager:
 
         # Calculate demanded salary (15% to 30% increase)
         base_increase = 0.15
-        variable_increase = random.uniform(0.0, 0.15)
+        variable_increase = _rng.uniform(0.0, 0.15)
         demanded_salary = int(current_salary * (1 + base_increase + variable_increase))
 
         # Calculate next negotiation date (1 day later)
@@ -188,11 +190,11 @@ class SalaryNegotiationManager:
             return True, f"Negotiation accepted! New salary: ${player_offer}/day", False
         else:
             # Below threshold - 20% chance of acceptance anyway
-            luck_roll = random.random()
+            luck_roll = _rng.random()
             if luck_roll < 0.20:
                 # Lucky! They accepted even though it was below threshold
                 from .debug import DebugConfig
-                DebugConfig.log('engine', f"Lucky acceptance! Offer ${player_offer} was below threshold ${int(acceptance_threshold)}, but accepted anyway (roll: {luck_roll:.2f})")
+                DebugConfig.log('engine', "Lucky acceptance! Offer ${} was below threshold ${}, but accepted anyway (roll: {:.2f})", player_offer, int(acceptance_threshold), luck_roll)
                 self._end_negotiation(employee_type, accepted=True, new_salary=player_offer)
                 return True, f"Negotiation accepted! (Lucky!) New salary: ${player_offer}/day", False
             else:
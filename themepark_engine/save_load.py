@@ -111,12 +111,17 @@ class SaveLoadManager:
         return False
 
 
+# Guest attributes referencing a ride, shop or restroom (saved as <name>_id / _x / _y)
+GUEST_REFERENCES = ('current_shop', 'target_shop', 'current_ride', 'target_ride',
+                    'target_restroom', 'target_food', 'target_drink')
+
+
 def serialize_grid(grid) -> Dict[str, Any]:
     """Serialize grid to JSON-compatible format"""
     return {
         'width': grid.width,
         'height': grid.height,
-        'tiles': [[grid.get(x, y) for y in range(grid.height)] for x in range(grid.width)]
+        'tiles': [list(grid.tiles[x::grid.width]) for x in range(grid.width)]  # Columns (tiles[x][y])
     }
 
 
@@ -124,6 +129,7 @@ def serialize_ride(ride) -> Dict[str, Any]:
     """Serialize a ride to JSON-compatible format"""
     return {
         'id': ride.defn.id,
+        'entity_id': ride.id,
         'x': ride.x,
         'y': ride.y,
         'operational': ride.operational,
@@ -146,6 +152,7 @@ def serialize_shop(shop) -> Dict[str, Any]:
     """Serialize a shop to JSON-compatible format"""
     return {
         'id': shop.defn.id,
+        'entity_id': shop.id,
         'x': shop.x,
         'y': shop.y,
         'entrance': {'x': shop.entrance.x, 'y': shop.entrance.y} if shop.entrance else None,
@@ -174,7 +181,8 @@ def serialize_employee(employee) -> Dict[str, Any]:
 
     # Save target ride reference for Engineers
     if hasattr(employee, 'target_object') and employee.target_object is not None:
-        # Save the ride's position as identifier
+        # Save the ride's entity id (and position, for older versions)
+        data['target_ride_id'] = employee.target_object.id
         data['target_ride_x'] = employee.target_object.x
         data['target_ride_y'] = employee.target_object.y
 
@@ -213,28 +221,13 @@ def serialize_guest(guest) -> Dict[str, Any]:
         'shop_timer': guest.shop_timer
     }
 
-    # Save references to shops, rides, restrooms by position
-    if guest.current_shop:
-        data['current_shop_x'] = guest.current_shop.x
-        data['current_shop_y'] = guest.current_shop.y
-    if guest.target_shop:
-        data['target_shop_x'] = guest.target_shop.x
-        data['target_shop_y'] = guest.target_shop.y
-    if guest.current_ride:
-        data['current_ride_x'] = guest.current_ride.x
-        data['current_ride_y'] = guest.current_ride.y
-    if guest.target_ride:
-        data['target_ride_x'] = guest.target_ride.x
-        data['target_ride_y'] = guest.target_ride.y
-    if guest.target_restroom:
-        data['target_restroom_x'] = guest.target_restroom.x
-        data['target_restroom_y'] = guest.target_restroom.y
-    if guest.target_food:
-        data['target_food_x'] = guest.target_food.x
-        data['target_food_y'] = guest.target_food.y
-    if guest.target_drink:
-        data['target_drink_x'] = guest.target_drink.x
-        data['target_drink_y'] = guest.target_drink.y
+    # Save references to shops, rides, restrooms by entity id (and position, for older versions)
+    for key in GUEST_REFERENCES:
+        target = getattr(guest, key)
+        if target:
+            data[key + '_id'] = target.id
+            data[key + '_x'] = target.x
+            data[key + '_y'] = target.y
 
     return data
 
@@ -265,6 +258,7 @@ def serialize_restroom(restroom) -> Dict[str, Any]:
     """Serialize a restroom to JSON-compatible format"""
     return {
         'id': restroom.defn.id,
+        'entity_id': restroom.id,
         'x': restroom.x,
         'y': restroom.y,
         'current_occupancy': len(restroom.current_users),  # Count of current users
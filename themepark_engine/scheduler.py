@@ -0,0 +1,87 @@
+"""
+Agent scheduler for OpenPark
+Guests and employees in a timed state (eating, shopping, riding, repairing,
+cleaning...) only count a timer down. Instead of ticking them every frame, the
+engine puts them to sleep until their timer expires (priority queue of wake-up
+times) and ticks them once on wake-up with the whole elapsed time.
+"""
+
+import heapq
+import itertools
+import math
+
+
+class SleepEntry:
+    """Sleep record of one agent (stored on the agent as agent.sleep_entry)"""
+    __slots__ = ('agent', 'state', 'since', 'wake_time', 'due', 'cancelled')
+
+    def __init__(self, agent, state, since, wake_time):
+        self.agent = agent
+        self.state = state          # State the agent fell asleep in (a change wakes it up)
+        self.since = since          # Scheduler time of the agent's last tick
+        self.wake_time = wake_time  # math.inf = until its state is changed from outside
+        self.due = False
+        self.cancelled = False
+
+
+class AgentScheduler:
+    """Priority queue of sleeping agents, keyed by wake-up time (simulation seconds)"""
+
+    EPSILON = 1e-9
+
+    def __init__(self):
+        self.now = 0.0
+        self._heap = []
+        self._seq = itertools.count()  # Tie-breaker: agents are not comparable
+        self.sleeping = 0
+
+    def advance(self, dt: float):
+        """Advance the scheduler clock and flag the agents whose timer expired"""
+        self.now += dt
+        heap = self._heap
+        limit = self.now + self.EPSILON
+        while heap and heap[0][0] <= limit:
+            entry = heapq.heappop(heap)[2]
+            if not entry.cancelled:
+                entry.due = True
+
+    def maybe_sleep(self, agent, dt: float) -> bool:
+        """Put an agent to sleep if it is in a timed state lasting longer than the next tick
+
+        Args:
+            agent: Guest or employee with a timed_state_remaining() method
+            dt: Duration of a tick (sleeping for less than that saves nothing)
+        """
+        remaining = agent.timed_state_remaining()
+        if remaining is None or remaining <= dt:
+            return False
+        entry = SleepEntry(agent, agent.state, self.now, self.now + remaining)
+        agent.sleep_entry = entry
+        self.sleeping += 1
+        if remaining != math.inf:
+            heapq.heappush(self._heap, (entry.wake_time, next(self._seq), entry))
+        return True
+
+    @staticmethod
+    def is_asleep(agent) -> bool:
+        """True while the agent can be skipped (not due, state unchanged)"""
+        entry = agent.sleep_entry
+        return entry is not None and not entry.due and agent.state == entry.state
+
+    def wake(self, agent) -> float:
+        """Wake an agent up
+
+        Returns:
+            Simulation time elapsed since its last tick (the dt to tick it with)
+        """
+        entry = agent.sleep_entry
+        if entry is None:
+            return 0.0
+        entry.cancelled = True  # Left in the heap, skipped when popped
+        agent.sleep_entry = None
+        self.sleeping -= 1
+        return self.now - entry.since
+
+    def clear(self):
+        self._heap.clear()
+        self.sleeping = 0
@@ -29,3 +29,4 @@ class Shop:
     facing: str = 'S'
     entrance: Optional[ShopEntrance] = None
     connected_to_path: bool = False
+    id: int = 0  # Entity id, assigned by the game's shop registry
@@ -90,7 +90,7 @@ class NegotiationModal:
         # Debug: Log when counter offer changes significantly
         if abs(self.counter_offer - old_offer) > 1:
             from .debug import DebugConfig
-            DebugConfig.log('engine', f"Slider moved: ${old_offer} -> ${self.counter_offer} (ratio={ratio:.2f})")
+            DebugConfig.log('engine', "Slider moved: ${} -> ${} (ratio={:.2f})", old_offer, self.counter_offer, ratio)
 
     def draw(self, screen):
         """Draw the negotiation modal"""
@@ -3,14 +3,18 @@ import pygame
 from ..debug import DebugConfig
 
 class DebugMenu:
-    def __init__(self, font, proj_presets, current_proj=0, oblique_tilt=10.0):
+    PROFILER_CSV = 'profile_stats.csv'
+    PROFILER_CSV_EVERY = 300  # Frames between two CSV exports
+
+    def __init__(self, font, proj_presets, current_proj=0, oblique_tilt=10.0, profiler=None):
         self.font=font; self.visible=False
+        self.profiler = profiler  # FrameProfiler (optional)
         self.proj_presets=proj_presets; self.index_proj=current_proj
         self.oblique_tilt=float(oblique_tilt)
         self.show_queue_arrows = True  # Toggle pour les flèches de queue (activé par défaut)
         # layout
         self.width=420; self.pad=8; self.row_h=26; self.header_h=24; self.slider_h=24
-        self.rect = pygame.Rect(0,0,self.width, 230 + 30*len(self.proj_presets))
+        self.rect = pygame.Rect(0,0,self.width, 290 + 30*len(self.proj_presets))
         self.rect.topright=(1280-16,56)
         # sliders
         self.slider_tilt  = pygame.Rect(0,0,self.width-2*self.pad, 8)
@@ -20,6 +24,9 @@ class DebugMenu:
         self.arrow_toggle_rect = pygame.Rect(0,0,self.width-2*self.pad, 24)
         # bouton pour les logs de debug
         self.debug_logs_toggle_rect = pygame.Rect(0,0,self.width-2*self.pad, 24)
+        # boutons du profiler (timers par phase + export CSV)
+        self.profiler_toggle_rect = pygame.Rect(0,0,self.width-2*self.pad, 24)
+        self.profiler_csv_toggle_rect = pygame.Rect(0,0,self.width-2*self.pad, 24)
 
     def toggle(self): self.visible = not self.visible
 
@@ -69,6 +76,45 @@ class DebugMenu:
         debug_text = "Debug Logs: ON" if DebugConfig.ENABLED else "Debug Logs: OFF"
         screen.blit(self.font.render(debug_text, True, (255,255,255)), (self.debug_logs_toggle_rect.x + 8, self.debug_logs_toggle_rect.y + 4))
 
+        # Boutons du profiler
+        if self.profiler is None: return
+        prof_on = self.profiler.enabled
+        csv_on = self.profiler.csv_path is not None and self.profiler.export_every > 0
+        y += 30
+        self._draw_toggle(screen, self.profiler_toggle_rect, y, prof_on, "Frame Profiler: ON" if prof_on else "Frame Profiler: OFF")
+        y += 30
+        csv_text = f"Profiler CSV ({self.PROFILER_CSV_EVERY} frames): ON" if csv_on else f"Profiler CSV ({self.PROFILER_CSV_EVERY} frames): OFF"
+        self._draw_toggle(screen, self.profiler_csv_toggle_rect, y, csv_on, csv_text)
+        if prof_on:
+            self._draw_profiler_panel(screen)
+
+    def _draw_toggle(self, screen, rect, y, on, text):
+        rect.x = self.rect.x + self.pad
+        rect.y = y
+        pygame.draw.rect(screen, (60,60,60) if on else (40,40,40), rect)
+        pygame.draw.rect(screen, (220,220,0) if on else (120,120,120), rect, 1)
+        screen.blit(self.font.render(text, True, (255,255,255)), (rect.x + 8, rect.y + 4))
+
+    def _draw_profiler_panel(self, screen):
+        """Per-phase timings (rolling avg / p95 in ms), drawn left of the debug menu"""
+        stats = self.profiler.stats()
+        line_h = 18
+        panel = pygame.Rect(0, 0, 300, self.header_h + 2*self.pad + line_h * (len(stats) + 1))
+        panel.topright = (self.rect.x - 8, self.rect.y)
+        pygame.draw.rect(screen,(20,20,20),panel); pygame.draw.rect(screen,(200,200,200),panel,1)
+        x = panel.x + self.pad; y = panel.y + self.pad
+        screen.blit(self.font.render('Frame Profiler (ms)',True,(255,255,255)), (x,y)); y+=self.header_h
+        screen.blit(self.font.render('phase',True,(200,200,200)), (x,y))
+        screen.blit(self.font.render('avg',True,(200,200,200)), (x+190,y))
+        screen.blit(self.font.render('p95',True,(200,200,200)), (x+240,y)); y+=line_h
+        for phase, avg_ms, p95_ms in stats:
+            # Rouge si la phase dépasse 4ms en moyenne (1/4 du budget d'une frame à 60 FPS)
+            color = (255,120,120) if avg_ms > 4.0 else (255,255,255)
+            screen.blit(self.font.render(phase,True,color), (x,y))
+            screen.blit(self.font.render(f"{avg_ms:.2f}",True,color), (x+190,y))
+            screen.blit(self.font.render(f"{p95_ms:.2f}",True,color), (x+240,y))
+            y+=line_h
+
     def handle_mouse(self, event):
         if not self.visible: return None
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -90,13 +136,22 @@ class DebugMenu:
                 self.show_queue_arrows = not self.show_queue_arrows
                 return ('toggle_arrows', self.show_queue_arrows)
             
-            # debug logs toggle button
+            # debug logs toggle button (master switch, category flags are kept)
             if self.debug_logs_toggle_rect.collidepoint(event.pos):
-                if DebugConfig.ENABLED:
-                    DebugConfig.disable_all()
-                else:
-                    DebugConfig.enable_all()
+                DebugConfig.set_enabled(not DebugConfig.ENABLED)
                 return ('debug_logs_toggle', DebugConfig.ENABLED)
+
+            # profiler toggle buttons
+            if self.profiler is not None:
+                if self.profiler_toggle_rect.collidepoint(event.pos):
+                    self.profiler.set_enabled(not self.profiler.enabled)
+                    return ('profiler_toggle', self.profiler.enabled)
+                if self.profiler_csv_toggle_rect.collidepoint(event.pos):
+                    if self.profiler.export_every > 0:
+                        self.profiler.export_every = 0
+                    else:
+                        self.profiler.start_csv_export(self.PROFILER_CSV, self.PROFILER_CSV_EVERY)
+                    return ('profiler_csv_toggle', self.profiler.export_every > 0)
         elif event.type == pygame.MOUSEMOTION:
             if self.drag_tilt:
                 x0=self.slider_tilt.x; x1=self.slider_tilt.x+self.slider_tilt.w
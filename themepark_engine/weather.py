@@ -4,8 +4,11 @@ Manages weather conditions with seasonal probabilities
 """
 
 from enum import Enum
-import random
 from typing import Dict, Tuple
+from .rng import SimRandom
+
+_rng = SimRandom.stream(SimRandom.WEATHER)
+_particle_rng = SimRandom.stream(SimRandom.PARTICLES)  # Visual only
 
 
 class WeatherType(Enum):
@@ -107,7 +110,7 @@ class WeatherSystem:
         probabilities = self.SEASONAL_PROBABILITIES[season]
 
         # Generate random weather based on probabilities
-        rand = random.random()
+        rand = _rng.random()
         cumulative = 0.0
 
         for weather_type, probability in probabilities.items():
@@ -178,6 +181,7 @@ class WeatherSystem:
 
 class WeatherParticle:
     """Single weather particle (rain drop or snowflake)"""
+    __slots__ = ('x', 'y', 'weather_type', 'speed_y', 'speed_x', 'size', 'color')
 
     def __init__(self, x: float, y: float, weather_type: WeatherType):
         self.x = x
@@ -186,14 +190,14 @@ class WeatherParticle:
 
         # Particle properties based on weather
         if weather_type == WeatherType.RAIN:
-            self.speed_y = random.uniform(300, 400)  # Fast falling
-            self.speed_x = random.uniform(-20, 20)   # Slight horizontal drift
-            self.size = random.randint(1, 2)
+            self.speed_y = _particle_rng.uniform(300, 400)  # Fast falling
+            self.speed_x = _particle_rng.uniform(-20, 20)   # Slight horizontal drift
+            self.size = _particle_rng.randint(1, 2)
             self.color = (150, 150, 200, 180)  # Semi-transparent blue
         else:  # SNOW
-            self.speed_y = random.uniform(50, 100)   # Slow falling
-            self.speed_x = random.uniform(-30, 30)   # More drift
-            self.size = random.randint(2, 4)
+            self.speed_y = _particle_rng.uniform(50, 100)   # Slow falling
+            self.speed_x = _particle_rng.uniform(-30, 30)   # More drift
+            self.size = _particle_rng.randint(2, 4)
             self.color = (255, 255, 255, 200)  # Semi-transparent white
 
     def update(self, dt: float):
@@ -229,8 +233,8 @@ class WeatherParticleSystem:
             for _ in range(particles_to_spawn):
                 if len(self.particles) < self.max_particles:
                     # Spawn above screen
-                    x = random.uniform(0, screen_width)
-                    y = random.uniform(-50, 0)
+                    x = _particle_rng.uniform(0, screen_width)
+                    y = _particle_rng.uniform(-50, 0)
                     self.particles.append(WeatherParticle(x, y, weather_type))
 
     def clear(self):